@@ -1,5 +1,7 @@
 from osbot_fast_api.api.middlewares.Middleware__Request_ID                      import Middleware__Request_ID
 from osbot_fast_api.api.routes.Fast_API__Route__Helper                          import Fast_API__Route__Helper
+from osbot_fast_api.api.routes.Fast_API__Route__Dispatcher                      import Fast_API__Route__Dispatcher
+from osbot_fast_api.api.routes.Fast_API__Route__Manifest                        import Fast_API__Route__Manifest
 from osbot_fast_api.api.schemas.Schema__Fast_API__Config                        import Schema__Fast_API__Config
 from osbot_utils.type_safe.Type_Safe                                            import Type_Safe
 from osbot_utils.decorators.lists.index_by                                      import index_by
@@ -7,6 +9,7 @@ from osbot_utils.decorators.methods.cache_on_self
 from osbot_utils.type_safe.primitives.domains.identifiers.Random_Guid           import Random_Guid
 from osbot_utils.utils.Json                                                     import json_loads, json_dumps
 from starlette.staticfiles                                                      import StaticFiles
+from osbot_fast_api.api.Fast_API__OpenAPI__Cache                                import Fast_API__OpenAPI__Cache
 from osbot_fast_api.api.Fast_API__Offline_Docs                                  import Fast_API__Offline_Docs, FILE_PATH__STATIC__DOCS, URL__STATIC__DOCS, NAME__STATIC__DOCS
 from osbot_fast_api.api.routes.Routes__Config                                   import Routes__Config
 from osbot_fast_api.api.routes.Routes__Set_Cookie                               import Routes__Set_Cookie
@@ -25,7 +28,29 @@ class Fast_API(Type_Safe):
 
     @cache_on_self
     def route_helper(self):
-        return Fast_API__Route__Helper()
+        route_helper = Fast_API__Route__Helper()
+        route_helper.route_registration.wrapper_creator.response_mode = self.config.response_mode
+        route_helper.route_registration.wrapper_creator.body_mode     = self.config.body_mode
+        route_helper.route_registration.route_manifest                = self.route_manifest()
+        return route_helper
+
+    @cache_on_self
+    def route_manifest(self):                                                           # Cached route analysis (None when config.route_manifest is not set)
+        if self.config.route_manifest:
+            return Fast_API__Route__Manifest(path=self.config.route_manifest).load()
+        return None
+
+    @cache_on_self
+    def rate_limiter(self):                                                             # Token buckets per client (see Middleware__Rate_Limit), stats() has its counters
+        from osbot_fast_api.api.Fast_API__Rate_Limiter              import Fast_API__Rate_Limiter
+        from osbot_fast_api.api.Fast_API__Rate_Limit__Buckets__SQLite import Fast_API__Rate_Limit__Buckets__SQLite
+
+        kwargs = dict(rate          = self.config.rate_limit_per_second ,
+                      burst         = self.config.rate_limit_burst      ,
+                      api_key_check = self.config.enable_api_key        )
+        if self.config.rate_limit_sqlite:
+            kwargs['buckets'] = Fast_API__Rate_Limit__Buckets__SQLite(db_path=self.config.rate_limit_sqlite)
+        return Fast_API__Rate_Limiter(**kwargs)
 
     # todo: improve the error handling of validation errors (namely from Type_Safe_Primitive)
     #       see code example in https://claude.ai/chat/f443e322-fa43-487f-9dd9-2d4cfb261b1e
@@ -81,6 +106,13 @@ class Fast_API(Type_Safe):
         return self
 
     def add_routes(self, class_routes, **kwargs):
+        kwargs.setdefault('response_mode'     , self.config.response_mode     )
+        kwargs.setdefault('body_mode'         , self.config.body_mode         )
+        kwargs.setdefault('lazy_routes'       , self.config.lazy_routes       )
+        kwargs.setdefault('route_manifest'    , self.route_manifest()         )
+        kwargs.setdefault('batch_route'       , self.config.batch_routes      )
+        kwargs.setdefault('batch_max_requests', self.config.batch_max_requests)
+        kwargs.setdefault('batch_concurrency' , self.config.batch_concurrency )
         class_routes(app=self.app(), **kwargs).setup()
         return self
 
@@ -141,7 +173,10 @@ class Fast_API(Type_Safe):
         self.setup_default_routes         ()
         self.setup_static_routes          ()
         self.setup_static_routes_docs     ()
+        self.setup_openapi_cache          ()
         self.setup_routes                 ()        # overwrite to add routes
+        self.setup_route_manifest         ()
+        self.setup_radix_router           ()
         return self
 
     @index_by
@@ -173,20 +208,36 @@ class Fast_API(Type_Safe):
         return self.routes_paths(include_default=True, expand_mounts=True)
 
     def setup_middlewares(self):                 # overwrite to add more middlewares    (NOTE: the middleware execution is the reverse of the order they are added)
+        self.setup_middleware__rate_limit       ()                                      # (runs after the others, i.e. after the api key check)
+        if self.config.fused_middleware:
+            self.setup_middleware__fused        ()
+            return self.setup_middleware__compression()
         self.setup_middleware__detect_disconnect()
         self.setup_middleware__cors             ()
         self.setup_middleware__api_key_check    ()
         self.setup_middleware__request_id       ()                                      # sets the 'fast-api-request-id' headers
+        self.setup_middleware__compression      ()                                      # (runs first, so that it compresses the final response)
         return self
 
     def setup_routes     (self): return self     # overwrite to add rules
 
+    def setup_route_manifest(self):                                                     # save the analysis of the routes added by this setup (if anything changed)
+        route_manifest = self.route_manifest()
+        if route_manifest:
+            route_manifest.save()
+        return self
+
+    def setup_radix_router(self):                                                       # routes added after setup are also indexed (the trie is rebuilt when app.routes changes)
+        if self.config.radix_router:
+            Fast_API__Route__Dispatcher(router=self.app_router()).install()
+        return self
+
     def setup_default_routes(self):
 
         if self.config.default_routes:
             self.setup_add_root_route        ()
             self.setup_offline_docs          ()
-            self.add_routes(Routes__Config    )
+            self.add_routes(Routes__Config    , llm_tools_route=self.config.llm_tools_route)
             self.add_routes(Routes__Set_Cookie)
 
     def setup_add_root_route(self):
@@ -201,6 +252,11 @@ class Fast_API(Type_Safe):
             Fast_API__Offline_Docs(app=self.app()).setup()
         return self
 
+    def setup_openapi_cache(self):
+        if self.config.openapi_cache:
+            Fast_API__OpenAPI__Cache(app=self.app()).setup()
+        return self
+
     def setup_static_routes(self):
         path_static_folder = self.path_static_folder()
         if path_static_folder:
@@ -221,27 +277,69 @@ class Fast_API(Type_Safe):
             self.app().add_middleware(Middleware__Check_API_Key,
                                       env_var__api_key__name  = env_var__api_key_name  ,
                                       env_var__api_key__value = env_var__api_key_value ,
-                                      allow_cors              = self.config.enable_cors)
+                                      allow_cors              = self.config.enable_cors  ,
+                                      api_keys_file           = self.config.api_keys_file)
         return self
 
     def setup_middleware__cors(self):               # todo: double check that this is working see bug test
         from starlette.middleware.cors import CORSMiddleware
 
         if self.config.enable_cors:
-            self.app().add_middleware(CORSMiddleware,
-                                      allow_origins     = ["*"]                         ,
-                                      allow_credentials = True                          ,
-                                      allow_methods     = ["GET", "POST", "HEAD"]       ,
-                                      allow_headers     = ["Content-Type", "X-Requested-With", "Origin", "Accept", "Authorization"],
-                                      expose_headers    = ["Content-Type", "X-Requested-With", "Origin", "Accept", "Authorization"])
+            self.app().add_middleware(CORSMiddleware, **self.middleware__cors__kwargs())
+
+    def middleware__cors__kwargs(self):
+        return dict(allow_origins     = ["*"]                         ,
+                    allow_credentials = True                          ,
+                    allow_methods     = ["GET", "POST", "HEAD"]       ,
+                    allow_headers     = ["Content-Type", "X-Requested-With", "Origin", "Accept", "Authorization"],
+                    expose_headers    = ["Content-Type", "X-Requested-With", "Origin", "Accept", "Authorization"])
 
     def setup_middleware__detect_disconnect(self):
         from osbot_fast_api.api.middlewares.Middleware__Detect_Disconnect import Middleware__Detect_Disconnect
 
         self.app().add_middleware(Middleware__Detect_Disconnect)
 
+    def setup_middleware__compression(self):
+        from osbot_fast_api.api.middlewares.Middleware__Compression import Middleware__Compression, COMPRESSION__CONTENT_TYPES
+
+        if self.config.compression:
+            content_types = tuple(self.config.compression_content_types) or COMPRESSION__CONTENT_TYPES
+            self.app().add_middleware(Middleware__Compression,
+                                      minimum_size   = self.config.compression_min_size,
+                                      compress_level = self.config.compression_level   ,
+                                      content_types  = content_types                   )
+        return self
+
+    def setup_middleware__rate_limit(self):
+        from osbot_fast_api.api.middlewares.Middleware__Rate_Limit import Middleware__Rate_Limit
+
+        if self.config.rate_limit:
+            self.app().add_middleware(Middleware__Rate_Limit, rate_limiter=self.rate_limiter())
+        return self
+
     def setup_middleware__request_id(self):
-        self.app().add_middleware(Middleware__Request_ID)
+        self.app().add_middleware(Middleware__Request_ID, request_id=self.request_id())
+
+    def request_id(self):                                                               # request id strategy for the request id middlewares (see Fast_API__Request_Id)
+        from osbot_fast_api.utils.Fast_API__Request_Id import Fast_API__Request_Id
+        return Fast_API__Request_Id(mode          = self.config.request_id_mode   ,
+                                    reuse_inbound = self.config.request_id_inbound)
+
+    def setup_middleware__fused(self, http_events=None,                                 # same behaviour as the default middlewares (and the http events one, when http_events is provided)
+                                      env_var__api_key_name :str=ENV_VAR__FAST_API__AUTH__API_KEY__NAME, env_var__api_key_value:str=ENV_VAR__FAST_API__AUTH__API_KEY__VALUE):
+        from osbot_fast_api.api.middlewares.Middleware__Fused import Middleware__Fused
+
+        cors_kwargs = self.middleware__cors__kwargs() if self.config.enable_cors else None
+        self.app().add_middleware(Middleware__Fused,
+                                  enable_api_key          = self.config.enable_api_key ,
+                                  env_var__api_key__name  = env_var__api_key_name      ,
+                                  env_var__api_key__value = env_var__api_key_value     ,
+                                  allow_cors              = self.config.enable_cors    ,
+                                  api_keys_file           = self.config.api_keys_file  ,
+                                  cors_kwargs             = cors_kwargs                ,
+                                  http_events             = http_events                ,
+                                  request_id              = self.request_id()          )
+        return self
 
     def user_middlewares(self, include_params=True):
         import types
@@ -0,0 +1,88 @@
+import hashlib
+import os
+import re
+import threading
+import time
+from osbot_utils.type_safe.Type_Safe                                            import Type_Safe
+from osbot_utils.type_safe.primitives.domains.files.safe_str.Safe_Str__File__Path import Safe_Str__File__Path
+from osbot_utils.utils.Json                                                     import json_load_file
+from osbot_fast_api.api.schemas.auth.Schema__Fast_API__API_Key                  import Schema__Fast_API__API_Key
+
+REGEX__API_KEY__HASH = re.compile(r'^[0-9a-f]{64}$')
+
+
+class Fast_API__API_Keys(Type_Safe):                                                    # API keys (stored as sha256) with their metadata, hot reloaded from a JSON file when it changes
+    keys_file       : Safe_Str__File__Path = None                                       # JSON file: {"keys": [{"key_hash": <sha256 hex>, "name": .., "tenant": .., "scopes": [..]}, ..]}
+    reload_interval : float                = 1.0                                        # Seconds between the checks for changes in keys_file (stat only)
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        object.__setattr__(self, 'keys'        , {})                                    # (not a Type_Safe field) key_hash → Schema__Fast_API__API_Key (replaced on each reload, so lookups need no lock)
+        object.__setattr__(self, 'keys__added' , {})                                    # (not a Type_Safe field) keys added via add_key (i.e. from env vars), kept on reloads
+        object.__setattr__(self, 'file_stat'   , None)                                  # (not a Type_Safe field) (mtime_ns, size) of the loaded keys_file
+        object.__setattr__(self, 'next_check'  , 0.0 )                                  # (not a Type_Safe field) time.monotonic() of the next keys_file check
+        object.__setattr__(self, 'lock'        , threading.Lock())                      # (not a Type_Safe field) only one thread reloads the file
+
+    def api_key(self, api_key : str                                                     # API key sent by the client
+                 ) -> Schema__Fast_API__API_Key:                                        # Returns the key's metadata (None if it is not a valid key)
+        if not api_key:
+            return None
+        if self.keys_file and time.monotonic() >= self.next_check:
+            self.reload_if_changed()
+        return self.keys.get(self.hash_key(api_key))                                    # (dict lookup of the sha256, so the time taken doesn't depend on how much of the key matches)
+
+    def add_key(self, api_key: str, name: str = None, tenant: str = None, scopes: list = None):
+        return self.add_key_hash(self.hash_key(api_key), name=name, tenant=tenant, scopes=scopes)
+
+    def add_key_hash(self, key_hash: str, name: str = None, tenant: str = None, scopes: list = None):
+        key_data = Schema__Fast_API__API_Key(key_hash=key_hash, name=name, tenant=tenant, scopes=scopes or [])
+        self.keys__added[key_hash] = key_data
+        object.__setattr__(self, 'keys', {**self.keys, key_hash: key_data})
+        return key_data
+
+    def hash_key(self, api_key: str) -> str:
+        return hashlib.sha256(api_key.encode()).hexdigest()
+
+    def keys_count(self) -> int:
+        if self.keys_file and time.monotonic() >= self.next_check:
+            self.reload_if_changed()
+        return len(self.keys)
+
+    def reload_if_changed(self):                                                        # Reloads keys_file if its mtime or size changed (keeps the current keys if it is missing or invalid)
+        if not self.lock.acquire(blocking=False):                                       # (another thread is already checking)
+            return self
+        try:
+            object.__setattr__(self, 'next_check', time.monotonic() + self.reload_interval)
+            try:
+                stat      = os.stat(self.keys_file)
+                file_stat = (stat.st_mtime_ns, stat.st_size)
+            except OSError:
+                return self
+            if file_stat != self.file_stat:
+                keys = self.load_keys()
+                if keys is not None:
+                    object.__setattr__(self, 'keys'     , {**keys, **self.keys__added})
+                    object.__setattr__(self, 'file_stat', file_stat)
+        finally:
+            self.lock.release()
+        return self
+
+    def load_keys(self) -> dict:                                                        # Returns key_hash → Schema__Fast_API__API_Key from keys_file (None if the file is not valid, i.e. while it is being written)
+        data = json_load_file(self.keys_file)
+        if type(data) is not dict or type(data.get('keys')) is not list:
+            return None
+        keys = {}
+        for item in data['keys']:
+            if type(item) is not dict:
+                continue
+            key_hash = str(item.get('key_hash', '')).lower()
+            if REGEX__API_KEY__HASH.match(key_hash) is None:                             # (entries without a valid sha256 are ignored)
+                continue
+            try:
+                keys[key_hash] = Schema__Fast_API__API_Key(key_hash = key_hash              ,
+                                                           name     = item.get('name'  )    ,
+                                                           tenant   = item.get('tenant')    ,
+                                                           scopes   = item.get('scopes') or [])
+            except (TypeError, ValueError):                                             # (entries with invalid metadata are ignored)
+                continue
+        return keys
@@ -0,0 +1,52 @@
+import json
+from fastapi                                        import FastAPI
+from starlette.requests                             import Request
+from starlette.responses                            import Response
+from starlette.routing                              import Route
+from osbot_utils.type_safe.Type_Safe                import Type_Safe
+from osbot_fast_api.utils.Fast_API__Static_Content  import Fast_API__Static_Content
+
+
+class Fast_API__OpenAPI__Cache(Type_Safe):                                              # Serves the app's openapi_url from pre-serialized (and pre-gzip'd) bytes, with ETag / If-None-Match support
+    app   : FastAPI
+    cache : dict                                                                        # routes (at build time), spec and Fast_API__Static_Content of the last build
+
+    def setup(self):                                                                    # Replace FastAPI's openapi route (which re-encodes the whole spec on every request)
+        openapi_url = self.app.openapi_url
+        if openapi_url:
+            routes = self.app.router.routes
+            for index, route in enumerate(routes):
+                if isinstance(route, Route) and route.path == openapi_url:
+                    routes[index] = Route(openapi_url, self.openapi_json, name=route.name, include_in_schema=False)
+                    break
+        return self
+
+    def content(self) -> Fast_API__Static_Content:                                      # Serialized spec, rebuilt when the app's routes (or its openapi dict) change
+        app    = self.app
+        cache  = self.cache
+        routes = tuple(app.router.routes)
+        if cache.get('routes') != routes:                                               # (tuple compare checks identity first, so this is cheap when nothing changed)
+            if 'routes' in cache:
+                app.openapi_schema = None                                               # FastAPI never invalidates its own copy
+            cache.clear()
+            cache['routes'] = routes
+        spec = app.openapi()
+        if cache.get('spec') is not spec:
+            content_bytes    = json.dumps(spec, ensure_ascii=False, allow_nan=False, indent=None, separators=(',', ':')).encode('utf-8')   # (same bytes as FastAPI's JSONResponse)
+            cache['content'] = Fast_API__Static_Content(content=content_bytes, media_type='application/json').setup()
+            cache['spec'   ] = spec
+        return cache['content']
+
+    def invalidate(self):
+        self.cache.clear()
+        self.app.openapi_schema = None
+        return self
+
+    async def openapi_json(self, request: Request) -> Response:
+        root_path = request.scope.get('root_path', '').rstrip('/')                      # same servers logic as FastAPI's openapi route
+        if root_path and self.app.root_path_in_servers:
+            server_urls = {server.get('url') for server in self.app.servers}
+            if root_path not in server_urls:
+                self.app.servers.insert(0, {'url': root_path})                          # (FastAPI's spec holds this list, so the spec changed in place)
+                self.invalidate()
+        return self.content().response(request)
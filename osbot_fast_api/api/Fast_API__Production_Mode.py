@@ -0,0 +1,53 @@
+from osbot_utils.type_safe.Type_Safe                                import Type_Safe
+from osbot_utils.type_safe.type_safe_core.decorators.type_safe      import type_safe
+
+TYPE_SAFE__WRAPPER__CODE = type_safe(lambda: None).__code__                             # all @type_safe wrappers share this code object (which is how we tell them apart from other decorators)
+
+
+class Fast_API__Production_Mode(Type_Safe):                                             # Removes the @type_safe checks from the framework internals (process wide, so it is an explicit opt-in, see enable)
+    unwrapped : dict                                                                    # (class, method name) → @type_safe wrapper (so that disable() can put it back)
+
+    def internal_classes(self):                                                         # Classes only called by osbot_fast_api itself (user facing ones, like Fast_API__Routes.add_route_*, keep their checks)
+        from osbot_fast_api.api.routes.Fast_API__Route__Parser                  import Fast_API__Route__Parser
+        from osbot_fast_api.api.routes.type_safe.Type_Safe__Route__Analyzer     import Type_Safe__Route__Analyzer
+        from osbot_fast_api.api.routes.type_safe.Type_Safe__Route__Converter    import Type_Safe__Route__Converter
+        from osbot_fast_api.api.routes.type_safe.Type_Safe__Route__Registration import Type_Safe__Route__Registration
+        from osbot_fast_api.api.routes.type_safe.Type_Safe__Route__Wrapper      import Type_Safe__Route__Wrapper
+        from osbot_fast_api.api.transformers.BaseModel__To__Dataclass           import BaseModel__To__Dataclass
+        from osbot_fast_api.api.transformers.BaseModel__To__Type_Safe           import BaseModel__To__Type_Safe
+        from osbot_fast_api.api.transformers.Dataclass__To__BaseModel           import Dataclass__To__BaseModel
+        from osbot_fast_api.api.transformers.Dataclass__To__Type_Safe           import Dataclass__To__Type_Safe
+        from osbot_fast_api.api.transformers.Type_Safe__To__BaseModel           import Type_Safe__To__BaseModel
+        from osbot_fast_api.api.transformers.Type_Safe__To__Dataclass           import Type_Safe__To__Dataclass
+        from osbot_fast_api.api.transformers.Type_Safe__To__Json                import Type_Safe__To__Json
+        from osbot_fast_api.api.transformers.Type_Safe__To__OpenAPI             import Type_Safe__To__OpenAPI
+        from osbot_fast_api.client.Fast_API__Route__Extractor                   import Fast_API__Route__Extractor
+
+        return [Fast_API__Route__Parser       , Type_Safe__Route__Analyzer  , Type_Safe__Route__Converter, Type_Safe__Route__Registration,
+                Type_Safe__Route__Wrapper     , BaseModel__To__Dataclass    , BaseModel__To__Type_Safe   , Dataclass__To__BaseModel      ,
+                Dataclass__To__Type_Safe      , Type_Safe__To__BaseModel    , Type_Safe__To__Dataclass   , Type_Safe__To__Json           ,
+                Type_Safe__To__OpenAPI        , Fast_API__Route__Extractor  ]
+
+    def enable(self):                                                                   # bind the undecorated implementations (affects all Fast_API apps and direct users of the transformers in this process,
+                                                                                        #  so only call it from the app's entry point, when all the apps in the process are production ones)
+        for target_class in self.internal_classes():
+            for method_name, method in list(vars(target_class).items()):
+                if self.is_type_safe_wrapper(method):
+                    self.unwrapped[(target_class, method_name)] = method
+                    setattr(target_class, method_name, method.__wrapped__)
+        return self
+
+    def disable(self):                                                                  # put the @type_safe wrappers back
+        for (target_class, method_name), method in self.unwrapped.items():
+            setattr(target_class, method_name, method)
+        self.unwrapped.clear()
+        return self
+
+    def enabled(self) -> bool:
+        return len(self.unwrapped) > 0
+
+    def is_type_safe_wrapper(self, method) -> bool:
+        return getattr(method, '__code__', None) is TYPE_SAFE__WRAPPER__CODE and hasattr(method, '__wrapped__')
+
+
+fast_api__production_mode = Fast_API__Production_Mode()                                # Singleton (the mode is process wide, since it changes the classes)
@@ -0,0 +1,60 @@
+import threading
+import time
+from collections                                                                import OrderedDict
+from osbot_utils.type_safe.Type_Safe                                            import Type_Safe
+
+
+class Fast_API__Rate_Limit__Buckets(Type_Safe):                                         # Token buckets in memory (per process), split in shards with a lock each
+    shards_count : int  = 16
+    max_buckets  : int  = 100_000                                                       # Above this (per shard: max_buckets / shards_count) the least recently used buckets are removed
+    blocking     : bool = False                                                         # True if take can block (i.e. on a file lock), so it must not run on the event loop
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        object.__setattr__(self, 'shards'          , [OrderedDict() for _ in range(self.shards_count)])         # (not a Type_Safe field) key → [tokens, updated] (in least recently used order)
+        object.__setattr__(self, 'locks'           , [threading.Lock() for _ in range(self.shards_count)])      # (not a Type_Safe field) one lock per shard
+        object.__setattr__(self, 'max_shard_size'  , max(1, self.max_buckets // self.shards_count))             # (not a Type_Safe field)
+
+    def take(self, key   : str  ,                                                       # Bucket (i.e. client and route)
+                   rate  : float,                                                       # Tokens added per second
+                   burst : int                                                          # Bucket size
+              ) -> float:                                                               # Returns 0.0 if a token was taken, or the seconds until one is available
+        index   = hash(key) % self.shards_count
+        buckets = self.shards[index]
+        now     = time.monotonic()
+        with self.locks[index]:
+            bucket = buckets.get(key)
+            if bucket is None:
+                if len(buckets) >= self.max_shard_size:
+                    buckets.popitem(last=False)                                         # (O(1), the least recently used bucket is the one most likely to be full again)
+                buckets[key] = [burst - 1, now]
+                return 0.0
+            buckets.move_to_end(key)
+            tokens = min(burst, bucket[0] + (now - bucket[1]) * rate)
+            if tokens >= 1:
+                tokens -= 1
+                retry_after = 0.0
+            else:
+                retry_after = (1 - tokens) / rate
+            bucket[0] = tokens
+            bucket[1] = now
+            return retry_after
+
+    def refund(self, key   : str,                                                       # Bucket used in take
+                     burst : int                                                        # Bucket size
+                ):                                                                      # Gives back the token taken by take (i.e. when another bucket rejected the same request)
+        index = hash(key) % self.shards_count
+        with self.locks[index]:
+            bucket = self.shards[index].get(key)
+            if bucket is not None:
+                bucket[0] = min(burst, bucket[0] + 1)
+        return self
+
+    def buckets_count(self) -> int:
+        return sum(len(buckets) for buckets in self.shards)
+
+    def clear(self):
+        for buckets, lock in zip(self.shards, self.locks):
+            with lock:
+                buckets.clear()
+        return self
@@ -0,0 +1,67 @@
+import sqlite3
+import threading
+import time
+from osbot_utils.type_safe.primitives.domains.files.safe_str.Safe_Str__File__Path import Safe_Str__File__Path
+from osbot_fast_api.api.Fast_API__Rate_Limit__Buckets                           import Fast_API__Rate_Limit__Buckets
+
+SQL__RATE_LIMIT__CREATE_TABLE = """CREATE TABLE IF NOT EXISTS rate_limit_buckets (key     TEXT PRIMARY KEY,
+                                                                                   tokens  REAL NOT NULL   ,
+                                                                                   updated REAL NOT NULL   ,
+                                                                                   allowed INTEGER NOT NULL)"""
+SQL__RATE_LIMIT__TAKE         = """INSERT INTO rate_limit_buckets (key, tokens, updated, allowed) VALUES (:key, :burst - 1, :now, 1)
+                                   ON CONFLICT(key) DO UPDATE SET
+                                       tokens  = min(:burst, tokens + max(0, :now - updated) * :rate) - (min(:burst, tokens + max(0, :now - updated) * :rate) >= 1),
+                                       allowed =                                                         (min(:burst, tokens + max(0, :now - updated) * :rate) >= 1),
+                                       updated = :now
+                                   RETURNING tokens, allowed"""                         # (one statement, so the read and the update are atomic across processes)
+SQL__RATE_LIMIT__REFUND       = "UPDATE rate_limit_buckets SET tokens = min(:burst, tokens + 1) WHERE key = :key"
+SQL__RATE_LIMIT__REMOVE_IDLE  = "DELETE FROM rate_limit_buckets WHERE updated < ?"
+SQL__RATE_LIMIT__COUNT        = "SELECT count(*) FROM rate_limit_buckets"
+
+
+class Fast_API__Rate_Limit__Buckets__SQLite(Fast_API__Rate_Limit__Buckets):             # Token buckets in a local SQLite file, shared by all the worker processes that use it
+    db_path        : Safe_Str__File__Path = None
+    idle_seconds   : float                = 3600.0                                      # Buckets not used for this long are removed (checked every cleanup_every takes, per process)
+    cleanup_every  : int                  = 10_000
+    blocking       : bool                 = True                                        # (waits up to 5 secs for the other processes' write locks)
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        object.__setattr__(self, 'local'        , threading.local())                    # (not a Type_Safe field) one connection per thread
+        object.__setattr__(self, 'takes_count'  , 0)                                    # (not a Type_Safe field) takes since the last cleanup
+
+    def connection(self) -> sqlite3.Connection:
+        connection = getattr(self.local, 'connection', None)
+        if connection is None:
+            connection = sqlite3.connect(self.db_path, timeout=5, isolation_level=None, check_same_thread=False)   # (autocommit)
+            connection.execute('PRAGMA journal_mode=WAL')
+            connection.execute('PRAGMA synchronous=OFF' )                               # (counters, not data: losing the last updates on a power failure is ok)
+            connection.execute(SQL__RATE_LIMIT__CREATE_TABLE)
+            self.local.connection = connection
+        return connection
+
+    def take(self, key: str, rate: float, burst: int) -> float:                         # (same as Fast_API__Rate_Limit__Buckets.take, with the time from the wall clock, which is the same in all processes)
+        now = time.time()
+        tokens, allowed = self.connection().execute(SQL__RATE_LIMIT__TAKE, dict(key=key, rate=rate, burst=burst, now=now)).fetchone()
+        object.__setattr__(self, 'takes_count', self.takes_count + 1)
+        if self.takes_count >= self.cleanup_every:
+            self.remove_idle_buckets(now)
+        if allowed:
+            return 0.0
+        return (1 - tokens) / rate
+
+    def refund(self, key: str, burst: int):
+        self.connection().execute(SQL__RATE_LIMIT__REFUND, dict(key=key, burst=burst))
+        return self
+
+    def remove_idle_buckets(self, now: float = None):
+        object.__setattr__(self, 'takes_count', 0)
+        self.connection().execute(SQL__RATE_LIMIT__REMOVE_IDLE, ((now or time.time()) - self.idle_seconds,))
+        return self
+
+    def buckets_count(self) -> int:
+        return self.connection().execute(SQL__RATE_LIMIT__COUNT).fetchone()[0]
+
+    def clear(self):
+        self.connection().execute('DELETE FROM rate_limit_buckets')
+        return self
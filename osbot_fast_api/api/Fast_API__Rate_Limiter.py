@@ -0,0 +1,66 @@
+from osbot_utils.type_safe.Type_Safe                                            import Type_Safe
+from osbot_fast_api.api.Fast_API__Rate_Limit__Buckets                           import Fast_API__Rate_Limit__Buckets
+
+
+class Fast_API__Rate_Limiter(Type_Safe):                                                # Token bucket per client (validated API key, or ip if there is no key) and per client+route (for the routes in route_limits)
+    rate          : float                          = 10.0                               # Requests per second, per client
+    burst         : int                            = 20                                 # Requests allowed at once, per client
+    route_limits  : dict                                                                # path → (rate, burst), per client (paths ending in '/' match all paths below them)
+    api_key_check : bool                           = False                              # True when the API key check runs before: clients with a valid key get their own buckets (by the key's sha256)
+    buckets       : Fast_API__Rate_Limit__Buckets                                       # (in memory, or Fast_API__Rate_Limit__Buckets__SQLite to share them between processes)
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        object.__setattr__(self, 'counters'     , dict(requests_allowed=0, requests_limited=0))      # (not a Type_Safe field) for monitoring (see stats)
+        self.compile_route_limits()
+
+    def add_route_limit(self, path: str, rate: float, burst: int):
+        self.route_limits[path] = (rate, burst)
+        return self.compile_route_limits()
+
+    def compile_route_limits(self):                                                     # exact paths in a dict, prefixes in a tuple
+        route_limits = {path: tuple(limit) for path, limit in self.route_limits.items()}
+        object.__setattr__(self, 'route_limits__exact'   , {path: limit for path, limit in route_limits.items() if not path.endswith('/')})        # (not a Type_Safe field)
+        object.__setattr__(self, 'route_limits__prefixes', tuple((path, limit) for path, limit in route_limits.items() if path.endswith('/')))    # (not a Type_Safe field)
+        return self
+
+    def check(self, scope: dict                                                         # ASGI scope of the request
+               ) -> float:                                                              # Returns 0.0 if the request is allowed, or the seconds until it would be
+        client_key  = self.client_key(scope)
+        route_limit = self.route_limit(scope['path'])
+        route_key   = None
+        if route_limit:
+            route, (rate, burst) = route_limit
+            route_key   = f'{client_key}|{route}'
+            retry_after = self.buckets.take(route_key, rate, burst)
+            if retry_after:
+                self.counters['requests_limited'] += 1
+                return retry_after
+        retry_after = self.buckets.take(client_key, self.rate, self.burst)
+        if retry_after:
+            if route_key:                                                               # (rejected requests don't use the route's tokens)
+                self.buckets.refund(route_key, burst)
+            self.counters['requests_limited'] += 1
+        else:
+            self.counters['requests_allowed'] += 1
+        return retry_after
+
+    def client_key(self, scope: dict) -> str:
+        if self.api_key_check:                                                          # only keys validated by the api key check (unchecked header values could be rotated to get new buckets)
+            key_data = scope.get('state', {}).get('api_key')
+            if key_data is not None:
+                return 'key:' + str(key_data.key_hash)[:32]
+        client = scope.get('client')
+        return 'ip:' + (client[0] if client else '')
+
+    def route_limit(self, path: str) -> tuple:                                          # Returns (route_limits entry, (rate, burst)) for path, None if there isn't one
+        limit = self.route_limits__exact.get(path)
+        if limit:
+            return path, limit
+        for prefix, limit in self.route_limits__prefixes:
+            if path.startswith(prefix):
+                return prefix, limit
+        return None
+
+    def stats(self) -> dict:
+        return dict(**self.counters, buckets=self.buckets.buckets_count())
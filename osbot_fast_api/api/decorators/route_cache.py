@@ -0,0 +1,5 @@
+def route_cache(ttl_seconds: float = 60.0, max_entries: int = 1000):  # Decorator to cache the route's responses (by params), for deterministic routes
+    def decorator(func):
+        func.__route_cache__ = dict(ttl_seconds=float(ttl_seconds), max_entries=max_entries)  # Store cache config as function attribute
+        return func
+    return decorator
@@ -0,0 +1,3 @@
+def route_coalesce(func):  # Decorator to run only one execution at a time per route params (concurrent identical calls share its result)
+    func.__route_coalesce__ = True                                                      # Store flag as function attribute
+    return func
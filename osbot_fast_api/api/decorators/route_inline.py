@@ -0,0 +1,3 @@
+def route_inline(func):  # Decorator to run a (fast, non-blocking) sync route directly on the event loop, instead of in the threadpool
+    func.__route_inline__ = True                                                        # Store flag as function attribute
+    return func
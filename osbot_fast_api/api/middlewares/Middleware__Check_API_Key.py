@@ -4,6 +4,7 @@ from starlette.responses                            import Response
 from osbot_utils.utils.Env                          import get_env
 from osbot_utils.utils.Json                         import to_json_str
 from osbot_utils.utils.Status                       import status_error
+from osbot_fast_api.api.Fast_API__API_Keys          import Fast_API__API_Keys
 from osbot_fast_api.api.schemas.consts.consts__Fast_API import AUTH__EXCLUDED_PATHS
 
 ERROR_MESSAGE__NO_KEY_NAME_SETUP   = f"Server does not have API key name setup"
@@ -17,12 +18,20 @@ class Middleware__Check_API_Key(BaseHTTPMiddleware):
 
     def __init__(self, app, env_var__api_key__name,
                        env_var__api_key__value    ,
-                       allow_cors : bool          = False):
+                       allow_cors     : bool      = False ,
+                       api_keys_file  : str       = None  ,                                 # JSON file with the (sha256 of the) API keys and their metadata, reloaded when it changes (see Fast_API__API_Keys)
+                       excluded_paths : list      = None  ):                                # paths that don't need an API key (entries ending in '/' match all paths below them)
 
         super().__init__(app)
-        self.api_key__name  = get_env(env_var__api_key__name )
-        self.api_key__value = get_env(env_var__api_key__value)
-        self.allow_cors     = allow_cors
+        self.api_key__name      = get_env(env_var__api_key__name )
+        self.api_key__value     = get_env(env_var__api_key__value)
+        self.allow_cors         = allow_cors
+        self.api_keys           = Fast_API__API_Keys(keys_file=api_keys_file)
+        if self.api_key__value:
+            self.api_keys.add_key(self.api_key__value, name=env_var__api_key__value)
+        excluded_paths          = AUTH__EXCLUDED_PATHS if excluded_paths is None else excluded_paths
+        self.excluded_paths     = frozenset(path for path in excluded_paths if not path.endswith('/'))     # (exact matches)
+        self.excluded_prefixes  = tuple    (path for path in excluded_paths if     path.endswith('/'))     # (str.startswith accepts the tuple)
 
     def return_error(self, error_message):
         content = to_json_str(status_error(error_message))
@@ -30,9 +39,22 @@ class Middleware__Check_API_Key(BaseHTTPMiddleware):
                         status_code = status.HTTP_401_UNAUTHORIZED  ,
                         media_type  = "application/json"            )
 
+    def is_excluded_path(self, path: str) -> bool:
+        return path in self.excluded_paths or (bool(self.excluded_prefixes) and path.startswith(self.excluded_prefixes))
+
+    def check_api_key(self, api_key: str):                                                          # Returns (key metadata, None) if api_key is valid, (None, error response) if not
+        if not self.api_keys.keys_count():
+            return None, self.return_error(ERROR_MESSAGE__NO_KEY_VALUE_SETUP)
+        if not api_key:                                                                             # If the API key is missing or invalid, return appropriate error response
+            return None, self.return_error(ERROR_MESSAGE__API_KEY_MISSING)
+        key_data = self.api_keys.api_key(api_key)
+        if key_data is None:
+            return None, self.return_error(ERROR_MESSAGE__API_KEY_INVALID)
+        return key_data, None
+
     async def dispatch(self, request: Request, call_next) -> Response:
 
-        if request.url.path in AUTH__EXCLUDED_PATHS:                                                 # allow for the seeing the docs and accessing the methods to set the cookie
+        if self.is_excluded_path(request.url.path):                                                 # allow for the seeing the docs and accessing the methods to set the cookie
             return await call_next(request)
         if request.method == 'OPTIONS' and self.allow_cors:
             return self.create_allow_cors_response(request=request)
@@ -43,14 +65,10 @@ class Middleware__Check_API_Key(BaseHTTPMiddleware):
         api_key_cookie = request.cookies.get(self.api_key__name) if not api_key_header else None     # Check for API key in cookies as fallback
         api_key        = api_key_header or api_key_cookie
 
-        if not self.api_key__value:
-            return self.return_error(ERROR_MESSAGE__NO_KEY_VALUE_SETUP)
-
-        if not api_key:                                                                             # If the API key is missing or invalid, return appropriate error response
-            return self.return_error(ERROR_MESSAGE__API_KEY_MISSING)
-
-        if api_key != self.api_key__value:
-            return self.return_error(ERROR_MESSAGE__API_KEY_INVALID)
+        key_data, error_response = self.check_api_key(api_key)
+        if error_response:
+            return error_response
+        request.state.api_key = key_data                                                            # key metadata (i.e. tenant and scopes) for the route handlers
 
         response = await call_next(request)                                                         # If API key is valid, continue with the request
         return response
@@ -0,0 +1,116 @@
+import zlib
+from osbot_fast_api.utils.Fast_API__Static_Content                    import accepts_gzip
+
+COMPRESSION__CONTENT_TYPES  = ('application/json'       ,                                   # content type prefixes that are worth compressing (images, archives, etc. are already compressed)
+                               'application/javascript' ,
+                               'application/xml'        ,
+                               'application/x-ndjson'   ,
+                               'image/svg+xml'          ,
+                               'text/'                  )
+COMPRESSION__LEVEL          = 6                                                             # (zlib's default: most of level 9's ratio, at a fraction of its CPU cost)
+COMPRESSION__MINIMUM_SIZE   = 1024                                                          # smaller bodies are not worth compressing
+COMPRESSION__GZIP_WBITS     = 16 + zlib.MAX_WBITS                                           # (gzip header and trailer)
+
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from starlette.types                         import ASGIApp, Receive, Scope, Send
+
+
+class Middleware__Compression:                                                              # Pure ASGI gzip compression of the responses (streaming responses are flushed chunk by chunk)
+
+    def __init__(self, app            : 'ASGIApp'                                ,
+                       minimum_size   : int   = COMPRESSION__MINIMUM_SIZE        ,          # (bytes) smaller responses are sent as they are
+                       compress_level : int   = COMPRESSION__LEVEL               ,          # 1 (fastest) to 9 (smallest)
+                       content_types  : tuple = COMPRESSION__CONTENT_TYPES       ):         # content type prefixes to compress
+        self.app            = app
+        self.minimum_size   = minimum_size
+        self.compress_level = compress_level
+        self.content_types  = tuple(content_types)
+
+    async def __call__(self, scope: 'Scope', receive: 'Receive', send: 'Send'):
+        if scope['type'] != 'http' or scope['method'] == 'HEAD' or not accepts_gzip(self.header_value(scope['headers'], b'accept-encoding')):
+            await self.app(scope, receive, send)
+            return
+
+        start_message = None                                                                # response start (held until the first body message, if the response can be compressed)
+        compressor    = None
+
+        async def send_compressed(message):
+            nonlocal start_message, compressor
+            message_type = message['type']
+            if message_type == 'http.response.start':
+                if self.is_compressible(message):
+                    start_message = message
+                else:
+                    await send(message)
+                return
+            if compressor:                                                                  # (rest of a compressed response)
+                if message_type == 'http.response.body':
+                    message['body'] = self.compress(compressor, message.get('body', b''), message.get('more_body', False))
+                await send(message)
+                return
+            if start_message is None:                                                       # (not compressed)
+                await send(message)
+                return
+            body      = message.get('body', b'')
+            more_body = message.get('more_body', False)
+            if message_type != 'http.response.body' or (not more_body and len(body) < self.minimum_size):
+                await send(start_message)
+                start_message = None
+                await send(message)
+                return
+            compressor               = zlib.compressobj(self.compress_level, zlib.DEFLATED, COMPRESSION__GZIP_WBITS)
+            message['body']          = self.compress(compressor, body, more_body)
+            start_message['headers'] = self.compressed_headers(start_message.get('headers', ()), None if more_body else len(message['body']))
+            await send(start_message)
+            await send(message)
+
+        await self.app(scope, receive, send_compressed)
+
+    def compress(self, compressor, body: bytes, more_body: bool) -> bytes:
+        if not more_body:
+            return compressor.compress(body) + compressor.flush(zlib.Z_FINISH)
+        if body:
+            return compressor.compress(body) + compressor.flush(zlib.Z_SYNC_FLUSH)         # (so that each streamed chunk is sent now, not when zlib's buffer is full)
+        return b''
+
+    def compressed_headers(self, headers: list, content_length: int) -> list:              # content-encoding, vary, content-length (None for streamed responses) and weak ETag (the bytes are not the same)
+        compressed_headers = [(b'content-encoding', b'gzip')]
+        vary               = None
+        for name, value in headers:
+            if name == b'content-length':
+                continue
+            if name == b'etag' and value.startswith(b'"'):
+                value = b'W/' + value
+            elif name == b'vary':
+                vary = value
+                continue
+            compressed_headers.append((name, value))
+        if vary is None:
+            vary = b'accept-encoding'
+        elif b'accept-encoding' not in vary.lower() and vary != b'*':
+            vary += b', accept-encoding'
+        compressed_headers.append((b'vary', vary))
+        if content_length is not None:
+            compressed_headers.append((b'content-length', str(content_length).encode()))
+        return compressed_headers
+
+    def header_value(self, headers: list, name: bytes) -> str:                             # first value of header (name in lower case, as in the ASGI headers)
+        for key, value in headers:
+            if key == name:
+                return value.decode('latin-1')
+        return ''
+
+    def is_compressible(self, start_message: dict) -> bool:
+        status = start_message['status']
+        if status < 200 or status in (204, 304):
+            return False
+        headers = start_message.get('headers', ())
+        if self.header_value(headers, b'content-encoding'):                                 # (already compressed, i.e. the cached /openapi.json)
+            return False
+        if 'no-transform' in self.header_value(headers, b'cache-control'):
+            return False
+        content_length = self.header_value(headers, b'content-length')
+        if content_length.isdigit() and int(content_length) < self.minimum_size:
+            return False
+        return self.header_value(headers, b'content-type').lower().startswith(self.content_types)
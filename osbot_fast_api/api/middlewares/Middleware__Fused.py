@@ -0,0 +1,125 @@
+from starlette.background                                             import BackgroundTasks
+from starlette.middleware.cors                                        import CORSMiddleware
+from starlette.requests                                               import Request, cookie_parser
+from starlette.responses                                              import Response
+from osbot_fast_api.api.middlewares.Middleware__Check_API_Key         import Middleware__Check_API_Key, ERROR_MESSAGE__NO_KEY_NAME_SETUP
+from osbot_fast_api.utils.Fast_API__Request_Id                        import Fast_API__Request_Id, HEADER_NAME__FAST_API_REQUEST_ID
+
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from starlette.types                         import ASGIApp, Receive, Scope, Send
+    from osbot_fast_api.events.Fast_API__Http_Events import Fast_API__Http_Events
+
+
+class Middleware__Fused:                                                                    # Pure ASGI version of the default middleware stack (Request_ID → Check_API_Key → CORS → Detect_Disconnect → Http_Request) in a single layer
+                                                                                            # (BaseHTTPMiddleware adds a task group, a response body streaming bridge and extra Request/Response objects per layer)
+    def __init__(self, app                     : 'ASGIApp'                        ,
+                       enable_api_key          : bool                     = False ,
+                       env_var__api_key__name  : str                      = None  ,
+                       env_var__api_key__value : str                      = None  ,
+                       allow_cors              : bool                     = False ,
+                       cors_kwargs             : dict                     = None  ,         # CORSMiddleware options (None: no CORS)
+                       http_events             : 'Fast_API__Http_Events'  = None  ,         # (None: no http events capture)
+                       request_id              : Fast_API__Request_Id     = None  ,         # request id strategy (None: new Random_Guid, or the valid inbound id)
+                       api_keys_file           : str                      = None  ,         # (see Middleware__Check_API_Key)
+                       excluded_paths          : list                     = None  ):        # (None: AUTH__EXCLUDED_PATHS)
+        self.app            = app
+        self.request_id     = request_id or Fast_API__Request_Id()
+        self.http_events    = http_events
+        self.api_key_check  = None
+        if enable_api_key:
+            self.api_key_check = Middleware__Check_API_Key(app, env_var__api_key__name, env_var__api_key__value, allow_cors=allow_cors,        # (for its api keys, excluded paths and error/cors responses)
+                                                           api_keys_file=api_keys_file, excluded_paths=excluded_paths)
+        if cors_kwargs:
+            self.app_after_api_key = CORSMiddleware(self.app_with_events, **cors_kwargs)   # CORS stays between the api key check and the disconnect/events steps (as in the default stack)
+        else:
+            self.app_after_api_key = self.app_with_events
+
+    async def __call__(self, scope: 'Scope', receive: 'Receive', send: 'Send'):
+        if scope['type'] != 'http':                                                         # (BaseHTTPMiddleware and CORSMiddleware only handle http)
+            await self.app_with_events(scope, receive, send)
+            return
+
+        request_id                   = self.request_id.request_id(scope['headers'])         # request id: in state, in the request headers and in the response headers
+        request_id_header            = (HEADER_NAME__FAST_API_REQUEST_ID, request_id.encode())
+        scope.setdefault('state', {})['request_id'] = request_id
+        scope['headers']             = self.request_id.with_request_id_header(scope['headers'], request_id)
+
+        async def send_with_request_id(message):
+            if message['type'] == 'http.response.start':
+                headers = [header for header in message.get('headers', ()) if header[0] != HEADER_NAME__FAST_API_REQUEST_ID]
+                headers.append(request_id_header)
+                message['headers'] = headers
+            await send(message)
+
+        if self.api_key_check:
+            error_response = self.check_api_key(scope)
+            if error_response:
+                await error_response(scope, receive, send_with_request_id)
+                return
+        await self.app_after_api_key(scope, receive, send_with_request_id)
+
+    def check_api_key(self, scope: 'Scope'                                                  # Same checks (and order) as Middleware__Check_API_Key.dispatch
+                       ) -> Response:                                                       # Returns error (or cors) response, None if the request is allowed
+        api_key_check = self.api_key_check
+        if api_key_check.is_excluded_path(scope['path']):
+            return None
+        if scope['method'] == 'OPTIONS' and api_key_check.allow_cors:
+            return api_key_check.create_allow_cors_response(request=Request(scope))
+        if not api_key_check.api_key__name:
+            return api_key_check.return_error(ERROR_MESSAGE__NO_KEY_NAME_SETUP)
+        api_key = self.header_value(scope, api_key_check.api_key__name.lower().encode('latin-1'))
+        if not api_key:                                                                     # cookie as fallback
+            cookie  = self.header_value(scope, b'cookie')
+            api_key = cookie_parser(cookie).get(api_key_check.api_key__name) if cookie else None
+        key_data, error_response = api_key_check.check_api_key(api_key)
+        if error_response is None:
+            scope['state']['api_key'] = key_data
+        return error_response
+
+    def header_value(self, scope: 'Scope', name: bytes):                                    # first value of header (name in lower case, like Headers.get)
+        for key, value in scope['headers']:
+            if key == name:
+                return value.decode('latin-1')
+        return None
+
+    async def app_with_events(self, scope: 'Scope', receive: 'Receive', send: 'Send'):     # disconnect detection (see Middleware__Detect_Disconnect) and http events capture (see Middleware__Http_Request)
+        state = scope.setdefault('state', {})
+        state['is_disconnected'] = False
+
+        async def receive_with_disconnect():
+            message = await receive()
+            if message['type'] == 'http.disconnect':
+                state['is_disconnected'] = True
+            return message
+
+        if self.http_events is None or scope['type'] != 'http':
+            await self.app(scope, receive_with_disconnect, send)
+        else:
+            await self.app_with_http_events(scope, receive_with_disconnect, send)
+
+    async def app_with_http_events(self, scope: 'Scope', receive: 'Receive', send: 'Send'):
+        http_events = self.http_events
+        request     = Request(scope, receive)
+        response    = None
+        http_events.on_http_request(request)
+
+        async def send_with_http_events(message):
+            nonlocal response
+            if message['type'] == 'http.response.start':                                    # response (status and headers) is captured when it starts (like BaseHTTPMiddleware's call_next)
+                response             = Response(status_code=message['status'])
+                response.raw_headers = message['headers'] = list(message.get('headers', ()))    # (changes made by the http events, i.e. cache-control, are sent)
+                http_events.on_http_response(request, response)
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_http_events)
+        finally:
+            if response is None:
+                http_events.on_http_response(request, None)
+
+        if http_events.background_tasks:                                                    # after the response was sent
+            background_tasks = BackgroundTasks()
+            for background_task in http_events.background_tasks:
+                background_tasks.add_task(background_task, request=request, response=response)
+            await background_tasks()
@@ -0,0 +1,37 @@
+import math
+from fastapi                                                          import status
+from starlette.concurrency                                            import run_in_threadpool
+from starlette.responses                                              import Response
+from osbot_utils.utils.Json                                           import to_json_str
+from osbot_utils.utils.Status                                         import status_error
+from osbot_fast_api.api.Fast_API__Rate_Limiter                        import Fast_API__Rate_Limiter
+
+ERROR_MESSAGE__RATE_LIMIT_EXCEEDED = "Rate limit exceeded, please retry later"
+
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from starlette.types                         import ASGIApp, Receive, Scope, Send
+
+
+class Middleware__Rate_Limit:                                                               # Pure ASGI middleware (so that the check costs a few µs): 429 with Retry-After when the client's token bucket is empty (see Fast_API__Rate_Limiter)
+
+    def __init__(self, app: 'ASGIApp', rate_limiter: Fast_API__Rate_Limiter):
+        self.app          = app
+        self.rate_limiter = rate_limiter
+
+    async def __call__(self, scope: 'Scope', receive: 'Receive', send: 'Send'):
+        if scope['type'] == 'http':
+            if self.rate_limiter.buckets.blocking:                                          # (i.e. SQLite buckets: checked in the threadpool, so that lock waits don't block the event loop)
+                retry_after = await run_in_threadpool(self.rate_limiter.check, scope)
+            else:
+                retry_after = self.rate_limiter.check(scope)
+            if retry_after:
+                await self.return_error(retry_after)(scope, receive, send)
+                return
+        await self.app(scope, receive, send)
+
+    def return_error(self, retry_after: float) -> Response:
+        return Response(content     = to_json_str(status_error(ERROR_MESSAGE__RATE_LIMIT_EXCEEDED)),
+                        status_code = status.HTTP_429_TOO_MANY_REQUESTS                               ,
+                        media_type  = "application/json"                                              ,
+                        headers     = {'Retry-After': str(max(1, math.ceil(retry_after)))}            )   # (whole seconds)
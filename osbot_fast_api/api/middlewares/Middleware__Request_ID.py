@@ -1,20 +1,22 @@
 from fastapi                                                          import Request, Response
-from osbot_utils.utils.Misc                                           import str_to_bytes
 from starlette.middleware.base                                        import BaseHTTPMiddleware
-from osbot_utils.type_safe.primitives.domains.identifiers.Random_Guid import Random_Guid
+from osbot_fast_api.utils.Fast_API__Request_Id                        import Fast_API__Request_Id
 
 
 class Middleware__Request_ID(BaseHTTPMiddleware):                                           # Lightweight middleware for request ID generation and propagation
 
+    def __init__(self, app, request_id: Fast_API__Request_Id = None):                       # request id strategy (None: new Random_Guid, or the valid inbound id)
+        super().__init__(app)
+        self.request_id = request_id or Fast_API__Request_Id()
+
     async def dispatch(self, request: Request, call_next) -> Response:
-        request_id               = Random_Guid()                                            # Generate request ID once
+        request_id               = self.request_id.request_id(request.scope['headers'])     # Reuse inbound id (if valid) or generate request ID once
         request.state.request_id = request_id                                               # Make available during request processing
 
-
-        request.headers._list.append((b'fast-api-request-id', str_to_bytes(request_id)))    # Also add to request headers for consistency (though request.state is the preferred access method)
+        request.scope['headers'] = self.request_id.with_request_id_header(request.scope['headers'], request_id)      # Also add to request headers for consistency (though request.state is the preferred access method)
 
         response = await call_next(request)                                                 # Process request
 
         response.headers['fast-api-request-id'] = str(request_id)                           # Add to response headers for client
 
-        return response
\ No newline at end of file
+        return response
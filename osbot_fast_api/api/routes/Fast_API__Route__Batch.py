@@ -0,0 +1,135 @@
+import asyncio
+import inspect
+import json
+import logging
+from contextlib                                                         import AsyncExitStack
+from urllib.parse                                                       import urlencode
+from fastapi                                                            import Request
+from fastapi.exceptions                                                 import HTTPException as Route__HTTPException      # (raised by the route, starlette's one is caught from the calls)
+from starlette.exceptions                                               import HTTPException
+from starlette.routing                                                  import Match
+from osbot_utils.type_safe.Type_Safe                                    import Type_Safe
+from osbot_fast_api.api.routes.Fast_API__Route__Lazy                    import Fast_API__Route__Lazy
+from osbot_fast_api.api.schemas.routes.Schema__Route__Batch__Item       import Schema__Route__Batch__Item
+from osbot_fast_api.api.schemas.routes.Schema__Route__Batch__Request    import Schema__Route__Batch__Request
+from osbot_fast_api.api.schemas.routes.Schema__Route__Batch__Result     import Schema__Route__Batch__Result
+from osbot_fast_api.api.schemas.routes.Schema__Route__Batch__Response   import Schema__Route__Batch__Response
+
+BATCH__SCOPE_KEYS = ('type', 'asgi', 'http_version', 'scheme', 'server', 'client', 'root_path', 'extensions',      # what each call keeps from the /batch request scope
+                     'state', 'app', 'router', 'starlette.exception_handlers')                                       # (the exception handlers turn HTTPException / validation errors into their usual responses)
+BATCH__SKIP_HEADERS    = (b'content-length', b'content-type')
+BATCH__MAX_REQUESTS    = 100                                                            # calls allowed in one /batch request (more: 413)
+BATCH__MAX_CONCURRENCY = 10                                                             # calls running at the same time (when concurrent=True)
+
+logger = logging.getLogger(__name__)
+
+
+class Fast_API__Route__Batch(Type_Safe):                                                # /batch route: runs many calls to the routes of one Fast_API__Routes class in one request
+    fast_api_routes : object = None                                                     # Fast_API__Routes whose routes can be called
+    max_requests    : int    = BATCH__MAX_REQUESTS                                      # (the calls don't go through the middlewares, i.e. the rate limit only sees the /batch request)
+    max_concurrency : int    = BATCH__MAX_CONCURRENCY
+
+    async def batch(self, batch   : Schema__Route__Batch__Request ,                     # Calls to make
+                          request : Request                                             # The /batch request (its scope is reused by each call)
+                     ) -> Schema__Route__Batch__Response:                               # Returns one result per call (same order)
+        if len(batch.requests) > self.max_requests:
+            raise Route__HTTPException(status_code=413, detail=f"too many calls in batch: {len(batch.requests)} (max {self.max_requests})")
+        scope = request.scope
+        if batch.concurrent:
+            semaphore = asyncio.Semaphore(max(1, self.max_concurrency))
+            async def call_route(item):
+                async with semaphore:
+                    return await self.call_route(scope, item)
+            results = await asyncio.gather(*[call_route(item) for item in batch.requests])
+        else:
+            results = [await self.call_route(scope, item) for item in batch.requests]
+        return Schema__Route__Batch__Response(results=results)
+
+    async def call_route(self, scope : dict                       ,                     # Scope of the /batch request
+                               item  : Schema__Route__Batch__Item                       # Call to make
+                          ) -> Schema__Route__Batch__Result:                            # Calls the route's ASGI handler directly (no HTTP and no middlewares)
+        item_scope, body = self.item_scope(scope, item)
+        route            = None
+        partial          = None
+        for candidate in self.fast_api_routes.app.router.routes:
+            if not self.is_batch_route(candidate):
+                continue
+            match, child_scope = candidate.matches(item_scope)
+            if match == Match.FULL:
+                route = candidate
+                item_scope.update(child_scope)
+                break
+            if match == Match.PARTIAL and partial is None:
+                partial, partial_scope = candidate, child_scope
+        if route is None and partial is not None:                                       # i.e. 405 Method Not Allowed
+            route = partial
+            item_scope.update(partial_scope)
+        if route is None:
+            return Schema__Route__Batch__Result(status_code=404, body={'detail': 'Not Found'})
+
+        messages     = []
+        body_pending = [True]
+        async def receive():
+            if body_pending[0]:
+                body_pending[0] = False
+                return {'type': 'http.request', 'body': body, 'more_body': False}
+            return {'type': 'http.disconnect'}
+        async def send(message):
+            messages.append(message)
+        try:
+            async with AsyncExitStack() as exit_stack:                                  # (set by FastAPI's AsyncExitStackMiddleware for normal requests, i.e. to close uploaded files)
+                item_scope['fastapi_middleware_astack'] = exit_stack
+                await route.handle(item_scope, receive, send)
+        except HTTPException as error:                                                  # raised outside the endpoint (i.e. 405 by a partial match)
+            return Schema__Route__Batch__Result(status_code=error.status_code, body={'detail': error.detail})
+        except Exception:                                                               # (the exception is only logged, its text is not sent back to the client)
+            logger.exception(f"batch call failed: {item.method.upper()} {item.path}")
+            return Schema__Route__Batch__Result(status_code=500, body={'detail': 'An unexpected error occurred.'})
+        return self.item_result(messages)
+
+    def item_scope(self, scope : dict                       ,                           # Scope of the /batch request
+                         item  : Schema__Route__Batch__Item                             # Call to make
+                    ) -> tuple:                                                         # Returns (scope, body bytes) for the call
+        body       = b'' if item.body is None else json.dumps(item.body).encode()
+        headers    = [(name, value) for name, value in scope.get('headers', []) if name not in BATCH__SKIP_HEADERS]    # (auth and cookies headers are kept)
+        if item.body is not None:
+            headers += [(b'content-type', b'application/json'), (b'content-length', str(len(body)).encode())]
+        path       = scope.get('root_path', '') + item.path
+        item_scope = {key: scope[key] for key in BATCH__SCOPE_KEYS if key in scope}
+        item_scope.update(method       = item.method.upper()                              ,
+                          path         = path                                             ,
+                          raw_path     = path.encode()                                    ,
+                          query_string = urlencode(item.params, doseq=True).encode()      ,
+                          headers      = headers                                          )
+        return item_scope, body
+
+    def item_result(self, messages : list                                               # ASGI messages sent by the route
+                     ) -> Schema__Route__Batch__Result:
+        status_code  = 500
+        content_type = ''
+        chunks       = []
+        for message in messages:
+            if message['type'] == 'http.response.start':
+                status_code = message['status']
+                for name, value in message.get('headers', []):
+                    if name == b'content-type':
+                        content_type = value.decode()
+            elif message['type'] == 'http.response.body':
+                chunks.append(message.get('body', b''))
+        content = b''.join(chunks)
+        if content and content_type.startswith('application/json'):
+            body = json.loads(content)
+        elif content:
+            body = content.decode('utf-8', errors='replace')
+        else:
+            body = None
+        return Schema__Route__Batch__Result(status_code=status_code, body=body)
+
+    def is_batch_route(self, route) -> bool:                                            # Only the routes of fast_api_routes can be called (not other classes, and not /batch itself)
+        if type(route) is Fast_API__Route__Lazy:
+            return route.fast_api_routes is self.fast_api_routes
+        endpoint = getattr(route, 'endpoint', None)
+        if endpoint is None:
+            return False
+        function = inspect.unwrap(endpoint)                                             # route wrappers keep the original (bound) method in __wrapped__
+        return getattr(function, '__self__', None) is self.fast_api_routes
@@ -0,0 +1,153 @@
+import functools
+import inspect
+import threading
+import time
+from typing                                                             import Any, Callable
+from fastapi.encoders                                                   import jsonable_encoder
+from pydantic                                                           import BaseModel, TypeAdapter, ValidationError
+from starlette.background                                               import BackgroundTasks
+from starlette.requests                                                 import HTTPConnection
+from starlette.responses                                                import Response, StreamingResponse, FileResponse, JSONResponse
+from osbot_utils.type_safe.Type_Safe                                    import Type_Safe
+from osbot_utils.type_safe.Type_Safe__Primitive                         import Type_Safe__Primitive
+
+ROUTE_CACHE__MISS            = object()                                                 # returned by get() when there is no (valid) entry (None is a valid route result)
+ROUTE_CACHE__NO_CACHE_PARAMS = (HTTPConnection, Response, BackgroundTasks)              # params that make the response depend on more than the params (Request) or have side effects (Response headers, tasks)
+
+
+class Fast_API__Route__Cache(Type_Safe):                                                # TTL + LRU cache of one route's results, keyed by the route's (converted) params
+    ttl_seconds : float = 60.0                                                          # How long a result is reused
+    max_entries : int   = 1000                                                          # Least recently used results are evicted above this
+    entries     : dict                                                                  # key → (expires_at, (status_code, body, raw_headers)), in LRU order (oldest first)
+    stats       : dict                                                                  # hits, misses and evictions counters
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self.stats.update(hits=0, misses=0, evictions=0)
+        object.__setattr__(self, 'lock'   , threading.Lock())                           # (not a Type_Safe field) def routes run concurrently in the threadpool
+        object.__setattr__(self, 'encoder', self.compile_encoder(None))                 # (not a Type_Safe field) set by wrap, for the route's response_model
+
+    def cache_key(self, args   : tuple ,                                                # Positional args the route is called with
+                        kwargs : dict                                                   # Params the route is called with (after the Type_Safe conversions)
+                   ) -> tuple:                                                          # Returns hashable key (same key for Safe_Id('abc') and 'abc')
+        return tuple(self.key_value(value) for value in args) + tuple(sorted((name, self.key_value(value)) for name, value in kwargs.items()))
+
+    def key_value(self, value):
+        if isinstance(value, Type_Safe__Primitive):
+            return (value.__primitive_base__ or str)(value)
+        if isinstance(value, Type_Safe):
+            return (type(value), repr(value.json()))
+        if isinstance(value, (str, int, float, bool, type(None))):
+            return value
+        return repr(jsonable_encoder(value))                                            # dicts, lists, BaseModels, ...
+
+    def get(self, key : tuple                                                           # Key from cache_key
+             ):                                                                         # Returns a new Response with the cached body and headers (or ROUTE_CACHE__MISS)
+        with self.lock:
+            entry = self.entries.get(key)
+            if entry is not None and entry[0] < time.monotonic():                       # expired
+                del self.entries[key]
+                entry = None
+            if entry is None:
+                self.stats['misses'] += 1
+                return ROUTE_CACHE__MISS
+            del self.entries[key]                                                       # most recently used go to the end
+            self.entries[key] = entry
+            self.stats['hits'] += 1
+        return self.new_response(entry[1])
+
+    def new_response(self, response_parts : tuple                                       # (status_code, body, raw_headers)
+                      ) -> Response:                                                    # Returns a new Response (a Response can only be sent once, and FastAPI sends it as it is)
+        status_code, body, raw_headers = response_parts
+        response             = Response(content=body, status_code=status_code)
+        response.raw_headers = list(raw_headers)
+        return response
+
+    def store(self, key    : tuple ,                                                    # Key from cache_key
+                    result                                                              # Route result (after the return conversion)
+               ):                                                                       # Returns the response to send (the result if it can't be cached)
+        if isinstance(result, (StreamingResponse, FileResponse)):                       # (no body to cache)
+            return result
+        if isinstance(result, Response):                                                # i.e. JSON_BYTES response mode (sent as it is by FastAPI)
+            if result.status_code >= 400 or result.background is not None:
+                return result
+            response_parts = (result.status_code, result.body, tuple(result.raw_headers))
+        else:                                                                           # values are encoded once (with the route's response_model), so hits skip FastAPI's validation and serialization
+            try:
+                body = self.encoder(result)
+            except (ValidationError, ValueError, TypeError):                            # (not cached: FastAPI reports the error, like for an uncached call)
+                return result
+            response       = Response(content=body, media_type='application/json')
+            response_parts = (response.status_code, body, tuple(response.raw_headers))
+        with self.lock:
+            self.entries.pop(key, None)
+            self.entries[key] = (time.monotonic() + self.ttl_seconds, response_parts)
+            while len(self.entries) > self.max_entries:
+                del self.entries[next(iter(self.entries))]
+                self.stats['evictions'] += 1
+        return result if isinstance(result, Response) else self.new_response(response_parts)
+
+    def compile_encoder(self, response_type : Any                                       # Route's response_model (None: no response_model)
+                         ) -> Callable:                                                 # Returns function(result) → JSON bytes, serialized as FastAPI does it
+        if response_type is None or (isinstance(response_type, type) and issubclass(response_type, Response)):
+            return lambda result: JSONResponse(content=jsonable_encoder(result)).body
+        adapter = TypeAdapter(response_type)
+        def encoder(result):
+            value = adapter.validate_python(self.response_content(result))              # (filters out the fields that are not in the response_model)
+            return JSONResponse(content=adapter.dump_python(value, mode='json', by_alias=True)).body
+        return encoder
+
+    def response_content(self, value):                                                  # BaseModels (at any depth) as dicts, so that they are validated against the response_model (as FastAPI does)
+        if isinstance(value, BaseModel):
+            return value.model_dump(by_alias=True)
+        if isinstance(value, list):
+            return [self.response_content(item) for item in value]
+        if isinstance(value, dict):
+            return {key: self.response_content(item) for key, item in value.items()}
+        return value
+
+    def clear(self):                                                                    # Invalidate all the cached responses
+        with self.lock:
+            self.entries.clear()
+        return self
+
+    def invalidate(self, *args, **kwargs) -> bool:                                      # Invalidate the response cached for these params (returns True if there was one)
+        key = self.cache_key(args, kwargs)
+        with self.lock:
+            return self.entries.pop(key, None) is not None
+
+    def info(self) -> dict:                                                             # Returns the counters and the number of cached responses
+        with self.lock:
+            return dict(self.stats, entries=len(self.entries), ttl_seconds=self.ttl_seconds, max_entries=self.max_entries)
+
+    def wrap(self, function         : Callable        ,                                 # Route function
+                   return_converter : Callable        ,                                 # Return value converter (or None)
+                   is_async         : bool            ,                                 # async def route
+                   response_type    : Any      = None                                   # Route's response_model (used to encode the results)
+              ) -> Callable:                                                            # Returns function with the same signature that returns the cached responses
+        self.check_params(function)
+        object.__setattr__(self, 'encoder', self.compile_encoder(response_type))
+        if is_async:
+            @functools.wraps(function)
+            async def cached_function(*args, **kwargs):
+                key    = self.cache_key(args, kwargs)
+                result = self.get(key)
+                if result is ROUTE_CACHE__MISS:
+                    result = await function(*args, **kwargs)
+                    result = self.store(key, return_converter(result) if return_converter else result)
+                return result
+        else:
+            @functools.wraps(function)
+            def cached_function(*args, **kwargs):
+                key    = self.cache_key(args, kwargs)
+                result = self.get(key)
+                if result is ROUTE_CACHE__MISS:
+                    result = function(*args, **kwargs)
+                    result = self.store(key, return_converter(result) if return_converter else result)
+                return result
+        return cached_function
+
+    def check_params(self, function : Callable):                                        # Raises ValueError if the route has params that can't be part of the cache key
+        for param in inspect.signature(function).parameters.values():
+            if isinstance(param.annotation, type) and issubclass(param.annotation, ROUTE_CACHE__NO_CACHE_PARAMS):
+                raise ValueError(f"@route_cache can't be used on route '{function.__name__}', since its '{param.name}' param ({param.annotation.__name__}) is not part of the cache key")
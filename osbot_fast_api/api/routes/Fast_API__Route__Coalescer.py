@@ -0,0 +1,136 @@
+import asyncio
+import copy
+import functools
+import threading
+from typing                                                             import Callable
+from starlette.responses                                                import StreamingResponse
+from osbot_utils.type_safe.Type_Safe                                    import Type_Safe
+from osbot_fast_api.api.routes.Fast_API__Route__Cache                   import Fast_API__Route__Cache
+
+
+class Fast_API__Route__Coalescer(Type_Safe):                                            # Single-flight: one in-flight execution of a route per (converted) params, shared by the concurrent identical calls
+    in_flight : dict                                                                    # key → asyncio.Future (async routes) or (threading.Event, outcome) (def routes)
+    stats     : dict                                                                    # executions and collapsed counters
+
+    cache_key = Fast_API__Route__Cache.cache_key                                        # (same keys as @route_cache)
+    key_value = Fast_API__Route__Cache.key_value
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self.stats.update(executions=0, collapsed=0)
+        object.__setattr__(self, 'lock', threading.Lock())                              # (not a Type_Safe field) def routes run concurrently in the threadpool
+
+    def info(self) -> dict:                                                             # Returns the counters and the number of in-flight executions
+        with self.lock:
+            return dict(self.stats, in_flight=len(self.in_flight))
+
+    def shared(self, outcome : tuple                                                    # (succeeded, result or error) of the leader's execution
+                ) -> bool:                                                              # Returns True if the followers can use it
+        succeeded, value = outcome
+        if succeeded:
+            return not isinstance(value, StreamingResponse)                             # (a stream can only be sent once)
+        return not isinstance(value, asyncio.CancelledError)                            # (leader's request cancelled, i.e. client disconnected)
+
+    def outcome_value(self, outcome : tuple):                                           # Returns the leader's result (or raises the leader's error)
+        succeeded, value = outcome
+        if succeeded:
+            return value
+        raise value
+
+    def follower_value(self, outcome : tuple):                                          # Returns a copy of the shared result (or raises a copy of the shared error)
+        succeeded, value = outcome                                                      # (so that a follower can't change the leader's objects, or add its frames to the leader's traceback)
+        if succeeded:
+            try:
+                return copy.deepcopy(value)
+            except (TypeError, copy.Error):                                             # (results that can't be copied, i.e. holding a lock, are shared)
+                return value
+        try:
+            error = copy.copy(value)
+        except Exception:                                                               # (exceptions whose __init__ doesn't take their args can't be copied)
+            error = value
+        raise error.with_traceback(value.__traceback__)
+
+    def wrap(self, function         : Callable ,                                        # Route function
+                   return_converter : Callable ,                                        # Return value converter (or None)
+                   is_async         : bool                                              # async def route
+              ) -> Callable:                                                            # Returns function with the same signature, that coalesces the concurrent identical calls
+        if is_async:
+            @functools.wraps(function)
+            async def coalesced_function(*args, **kwargs):
+                key    = self.cache_key(args, kwargs)
+                future = self.in_flight.get(key)                                        # (no lock needed: only the event loop thread uses async entries)
+                if future is not None:
+                    self.stats['collapsed'] += 1
+                    outcome = await asyncio.shield(future)
+                    if self.shared(outcome):
+                        return self.follower_value(outcome)
+                    if not outcome[0]:                                                  # leader cancelled: one of the followers becomes the new leader
+                        return await coalesced_function(*args, **kwargs)
+                    return await self.execute_async(function, return_converter, args, kwargs, key=None)
+                return await self.execute_async(function, return_converter, args, kwargs, key=key)
+        else:
+            @functools.wraps(function)
+            def coalesced_function(*args, **kwargs):
+                key = self.cache_key(args, kwargs)
+                with self.lock:
+                    flight = self.in_flight.get(key)
+                    if flight is None:
+                        flight = (threading.Event(), [])
+                        self.in_flight[key] = flight
+                        leader = True
+                    else:
+                        self.stats['collapsed'] += 1
+                        leader = False
+                event, outcome = flight
+                if leader:
+                    return self.execute_sync(function, return_converter, args, kwargs, key, event, outcome)
+                event.wait()
+                if self.shared(outcome[0]):
+                    return self.follower_value(outcome[0])
+                return self.execute_sync(function, return_converter, args, kwargs, None, None, [])
+        return coalesced_function
+
+    async def execute_async(self, function         : Callable ,                         # Route function
+                                  return_converter : Callable ,                         # Return value converter (or None)
+                                  args             : tuple    ,
+                                  kwargs           : dict     ,
+                                  key                                                   # In-flight key (None: result not shared, i.e. after an unshareable outcome)
+                             ):                                                         # Returns the (converted) route result
+        future = None
+        if key is not None:
+            future = asyncio.get_running_loop().create_future()
+            self.in_flight[key] = future
+        with self.lock:
+            self.stats['executions'] += 1
+        try:
+            result  = await function(*args, **kwargs)
+            result  = return_converter(result) if return_converter else result
+            outcome = (True, result)
+        except BaseException as error:                                                  # (shared as a result, so that the future never has an unretrieved exception)
+            outcome = (False, error)
+        if future is not None:
+            del self.in_flight[key]
+            future.set_result(outcome)
+        return self.outcome_value(outcome)
+
+    def execute_sync(self, function         : Callable ,                                # Route function
+                           return_converter : Callable ,                                # Return value converter (or None)
+                           args             : tuple    ,
+                           kwargs           : dict     ,
+                           key                         ,                                # In-flight key (None: result not shared)
+                           event                       ,                                # threading.Event set when the outcome is ready
+                           outcome          : list                                      # Receives the (succeeded, result or error) outcome
+                      ):                                                                # Returns the (converted) route result
+        with self.lock:
+            self.stats['executions'] += 1
+        try:
+            result = function(*args, **kwargs)
+            result = return_converter(result) if return_converter else result
+            outcome.append((True, result))
+        except BaseException as error:
+            outcome.append((False, error))
+        if key is not None:
+            with self.lock:
+                del self.in_flight[key]
+            event.set()
+        return self.outcome_value(outcome[0])
@@ -0,0 +1,110 @@
+from starlette._utils                                                   import get_route_path
+from starlette.datastructures                                           import URL
+from starlette.responses                                                import RedirectResponse
+from starlette.routing                                                  import Router, Match
+from osbot_utils.type_safe.Type_Safe                                    import Type_Safe
+
+
+class Routes__List(list):                                                               # router.routes list that counts its changes (so that the trie is rebuilt when routes are added, removed or replaced)
+    changes = 0
+
+    def __setitem__(self, *args): self.changes += 1; return super().__setitem__(*args)
+    def __delitem__(self, *args): self.changes += 1; return super().__delitem__(*args)
+    def __iadd__   (self, *args): self.changes += 1; return super().__iadd__   (*args)
+    def __imul__   (self, *args): self.changes += 1; return super().__imul__   (*args)
+    def append     (self, *args): self.changes += 1; return super().append     (*args)
+    def clear      (self, *args): self.changes += 1; return super().clear      (*args)
+    def extend     (self, *args): self.changes += 1; return super().extend     (*args)
+    def insert     (self, *args): self.changes += 1; return super().insert     (*args)
+    def pop        (self, *args): self.changes += 1; return super().pop        (*args)
+    def remove     (self, *args): self.changes += 1; return super().remove     (*args)
+    def reverse    (self, *args): self.changes += 1; return super().reverse    (*args)
+    def sort       (self, **kwargs): self.changes += 1; return super().sort    (**kwargs)
+
+
+class Fast_API__Route__Dispatcher(Type_Safe):                                           # Replaces Router.app: only tries the routes whose static path prefix matches the request (prefix trie on the path segments)
+    router         : Router = None                                                      # Router whose routes are dispatched (i.e. app.router)
+    routes         : list   = None                                                      # router.routes list the trie was built from
+    routes_changes : int    = 0                                                         # routes.changes when the trie was built
+    trie           : tuple  = None                                                      # root node: (route indexes, {static segment: node})
+
+    def install(self):                                                                  # Use this dispatcher for all requests to the router
+        if self.router.middleware_stack == self.router.app:                             # (router level middleware would be skipped, so those routers keep the default dispatch)
+            self.router.middleware_stack = self
+        return self
+
+    def build(self):                                                                    # Index each route on the static segments at the start of its path
+        if type(self.router.routes) is not Routes__List:
+            self.router.routes = Routes__List(self.router.routes)
+        routes = self.router.routes
+        trie   = ([], {})
+        for index, route in enumerate(routes):
+            path = getattr(route, 'path', None)
+            node = trie
+            if isinstance(path, str) and path.startswith('/'):
+                for segment in path[1:].split('/'):
+                    if '{' in segment:                                                  # parameters are matched by the route's own regex
+                        break
+                    node = node[1].setdefault(segment, ([], {}))
+            node[0].append(index)
+        self.routes         = routes
+        self.routes_changes = routes.changes
+        self.trie           = trie
+        return self
+
+    def candidate_routes(self, route_path : str                                         # Request path (without root_path)
+                          ) -> list:                                                    # Returns the routes that could match, in the router's order
+        routes = self.router.routes
+        if routes is not self.routes or routes.changes != self.routes_changes:          # rebuilt when the routes (or the routes list) changed
+            self.build()
+            routes = self.routes
+        node_indexes, children = self.trie
+        indexes                = list(node_indexes)
+        for segment in route_path[1:].split('/'):
+            node = children.get(segment)
+            if node is None:
+                break
+            node_indexes, children = node
+            indexes.extend(node_indexes)
+        indexes.sort()                                                                  # same order (and so the same first match) as Router.app
+        return [routes[index] for index in indexes]
+
+    async def __call__(self, scope, receive, send):                                     # same logic as starlette's Router.app, over the candidate routes
+        router = self.router
+        if scope['type'] == 'lifespan':
+            await router.app(scope, receive, send)
+            return
+        if 'router' not in scope:
+            scope['router'] = router
+
+        route_path = get_route_path(scope)
+        partial    = None
+        for route in self.candidate_routes(route_path):
+            match, child_scope = route.matches(scope)
+            if match == Match.FULL:
+                scope.update(child_scope)
+                await route.handle(scope, receive, send)
+                return
+            elif match == Match.PARTIAL and partial is None:
+                partial       = route
+                partial_scope = child_scope
+
+        if partial is not None:                                                         # i.e. 405 Method Not Allowed
+            scope.update(partial_scope)
+            await partial.handle(scope, receive, send)
+            return
+
+        if scope['type'] == 'http' and router.redirect_slashes and route_path != '/':
+            redirect_scope = dict(scope)
+            if route_path.endswith('/'):
+                redirect_scope['path'] = redirect_scope['path'].rstrip('/')
+            else:
+                redirect_scope['path'] = redirect_scope['path'] + '/'
+            for route in self.candidate_routes(get_route_path(redirect_scope)):
+                match, child_scope = route.matches(redirect_scope)
+                if match != Match.NONE:
+                    response = RedirectResponse(url=str(URL(scope=redirect_scope)))
+                    await response(scope, receive, send)
+                    return
+
+        await router.default(scope, receive, send)
@@ -0,0 +1,49 @@
+from typing                                 import Callable, List
+from fastapi                                import APIRouter, FastAPI
+from starlette.routing                      import Route
+
+
+class Fast_API__Route__Lazy(Route):                                                     # Placeholder route: matched like the real route, but only built (analysis, wrapper, BaseModels) on first use
+    def __init__(self, path            : str      ,                                     # Full path (including the router prefix)
+                       function        : Callable ,                                     # Route function (as passed to add_route)
+                       methods         : List[str],                                     # HTTP methods
+                       fast_api_routes            ):                                    # Fast_API__Routes that owns the route (builds the real APIRoute)
+        super().__init__(path, endpoint=function, methods=methods, name=function.__name__)
+        self.methods         = {method.upper() for method in methods}                   # same as APIRoute (Route would also add HEAD to GET routes)
+        self.function        = function
+        self.methods_list    = methods
+        self.fast_api_routes = fast_api_routes
+        self.api_route       = None
+
+    def materialize(self, router : APIRouter = None                                     # Router that has this placeholder (replaced in place by the real route)
+                     ):                                                                 # Returns the APIRoute built for this route
+        if self.api_route is None:
+            self.api_route = self.fast_api_routes.materialize_route(self.function, self.methods_list)
+        if router is not None:
+            for index, route in enumerate(router.routes):
+                if route is self:
+                    router.routes[index] = self.api_route
+                    break
+        return self.api_route
+
+    async def handle(self, scope, receive, send):                                       # first request: build the route, swap it into the app router and let it handle the request
+        api_route         = self.materialize(self.fast_api_routes.app.router)
+        scope['endpoint'] = api_route.endpoint
+        await api_route.handle(scope, receive, send)
+
+
+def materialize_lazy_routes(app : FastAPI):                                            # Builds all pending lazy routes (i.e. before generating the OpenAPI schema)
+    for route in list(app.router.routes):
+        if isinstance(route, Fast_API__Route__Lazy):
+            route.materialize(app.router)
+
+
+def setup_lazy_routes_openapi(app : FastAPI):                                          # Make app.openapi() materialize the lazy routes first (only needs to be done once per app)
+    if getattr(app, '__lazy_routes_openapi__', False):
+        return
+    openapi = app.openapi
+    def openapi_with_lazy_routes():
+        materialize_lazy_routes(app)
+        return openapi()
+    app.openapi                 = openapi_with_lazy_routes
+    app.__lazy_routes_openapi__ = True
@@ -0,0 +1,404 @@
+import importlib
+import importlib.util
+from enum                                                                       import Enum
+from typing                                                                     import Callable, Optional, Type, Union, Dict, List, get_origin, get_args
+from pydantic                                                                   import BaseModel, Field, create_model
+from pydantic_core                                                              import PydanticUndefined
+from osbot_utils.type_safe.Type_Safe                                            import Type_Safe
+from osbot_utils.type_safe.Type_Safe__Primitive                                 import Type_Safe__Primitive
+from osbot_utils.type_safe.primitives.domains.files.safe_str.Safe_Str__File__Path import Safe_Str__File__Path
+from osbot_utils.type_safe.primitives.domains.identifiers.safe_str.Safe_Str__Id import Safe_Str__Id
+from osbot_utils.type_safe.type_safe_core.shared.Type_Safe__Cache               import type_safe_cache
+from osbot_utils.utils.Files                                                    import file_exists, file_contents_sha256
+from osbot_utils.utils.Json                                                     import json_save_file, json_load_file
+from osbot_fast_api.api.schemas.routes.Schema__Route__Parameter                 import Schema__Route__Parameter
+from osbot_fast_api.api.schemas.routes.Schema__Route__Signature                 import Schema__Route__Signature
+from osbot_fast_api.api.transformers.Type_Safe__To__BaseModel                   import type_safe__to__basemodel
+from osbot_fast_api.utils.Version                                               import version__osbot_fast_api
+
+JSON_VALUE_TYPES = (type(None), bool, int, float, str)                                  # default values that survive the JSON round trip as they are
+
+
+class Fast_API__Route__Manifest(Type_Safe):                                             # On-disk cache of the route analysis (paths, signatures and BaseModel field specs)
+    path            : Safe_Str__File__Path = None                                       # Manifest file (JSON)
+    data            : dict                                                              # {'version', 'modules', 'routes', 'models'} (as stored in the file)
+    dirty           : bool                 = False                                      # New entries that are not saved yet
+    module_hashes   : dict                                                              # module name → sha256 of its source file (or None), computed once per manifest
+    schema_defaults : dict                                                              # schema class → (default values, collection fields), used by new_schema
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self.reset()
+
+    # -------------------- File --------------------
+
+    def load(self):                                                                     # Load the manifest (only used if the fingerprint still matches the current code)
+        if self.path and file_exists(self.path):
+            data = json_load_file(self.path)
+            if type(data) is dict and self.is_valid(data):
+                self.data  = data
+                self.dirty = False
+        return self
+
+    def save(self):                                                                     # Save the manifest (if there were changes)
+        if self.path and self.dirty:
+            json_save_file(self.data, self.path)
+            self.dirty = False
+        return self
+
+    def reset(self):
+        self.data = dict(version = version__osbot_fast_api ,
+                         modules = {}                      ,
+                         routes  = {}                      ,
+                         models  = {}                      )
+        return self
+
+    def is_valid(self, data : dict                                                      # Manifest data (from the file)
+                  ) -> bool:                                                            # Returns True if created by this osbot_fast_api version from the current sources
+        if data.get('version') != version__osbot_fast_api:
+            return False
+        for key in ('modules', 'routes', 'models'):
+            if type(data.get(key)) is not dict:
+                return False
+        for module_name, module_hash in data['modules'].items():
+            if self.module_hash(module_name) != module_hash:
+                return False
+        return True
+
+    def module_hash(self, module_name : str                                             # Module to fingerprint
+                     ) -> Optional[str]:                                                # Returns sha256 of the module's source file (None for builtins)
+        if module_name not in self.module_hashes:
+            module_hash = None
+            try:
+                spec = importlib.util.find_spec(module_name)
+                if spec and spec.origin and file_exists(spec.origin):
+                    module_hash = file_contents_sha256(spec.origin)
+            except (ImportError, ValueError):
+                pass
+            self.module_hashes[module_name] = module_hash
+        return self.module_hashes[module_name]
+
+    def add_module(self, module_name : str):                                            # Include module in the fingerprint
+        if module_name not in self.data['modules']:
+            self.data['modules'][module_name] = self.module_hash(module_name)
+
+    # -------------------- Routes --------------------
+
+    def route_key(self, function : Callable                                             # Route function
+                   ) -> Optional[str]:                                                  # Returns key used in the manifest, or None if the function can't be cached
+        module_name = getattr(function, '__module__'  , None)
+        qualname    = getattr(function, '__qualname__', None)
+        if not module_name or not qualname or '<locals>' in qualname:                   # functions created at runtime can't be found again by name
+            return None
+        if self.module_hash(module_name) is None:
+            return None
+        return f"{module_name}.{qualname}"
+
+    def route_path(self, function : Callable                                            # Route function
+                    ) -> Optional[str]:                                                 # Returns the cached route path (or None)
+        route_key = self.route_key(function)
+        return self.data['routes'].get(route_key, {}).get('path') if route_key else None
+
+    def record_route_path(self, function : Callable ,                                   # Route function
+                                path     : str                                          # Route path (from @route_path or Fast_API__Route__Parser)
+                           ):
+        route_key = self.route_key(function)
+        if route_key:
+            self.data['routes'].setdefault(route_key, {})['path'] = str(path)
+            self.add_module(function.__module__)
+            self.dirty = True
+
+    def route_signature(self, function : Callable                                       # Route function
+                         ) -> Optional[Schema__Route__Signature]:                       # Returns the cached (not yet enriched) signature, with its BaseModels loaded
+        route_key = self.route_key(function)
+        if route_key is None:
+            return None
+        signature_data = self.data['routes'].get(route_key, {}).get('signature')
+        if signature_data is None:
+            return None
+        try:
+            signature = self.decode_signature(signature_data)
+        except KeyError:                                                                # stored by an older manifest format (analysed again, and recorded in the new one)
+            return None
+        for type_safe_class in self.signature_models(signature):
+            self.load_model(type_safe_class)
+        return signature
+
+    def record_route_signature(self, function  : Callable                 ,             # Route function
+                                     signature : Schema__Route__Signature               # Signature from Type_Safe__Route__Analyzer (before enrichment)
+                                ):
+        route_key = self.route_key(function)
+        if route_key is None:
+            return
+        modules = set()
+        try:
+            signature_data = self.encode_signature(signature, modules)
+        except (ValueError, TypeError):                                                 # not everything can be stored (i.e. local classes or custom default values)
+            return
+        self.data['routes'].setdefault(route_key, {})['signature'] = signature_data
+        for module_name in sorted(modules | {function.__module__}):
+            self.add_module(module_name)
+        self.dirty = True
+
+    def signature_models(self, signature : Schema__Route__Signature                     # Signature to check
+                          ) -> List[Type]:                                              # Returns the Type_Safe classes that will be converted to BaseModels
+        classes = [param_info.param_type for param_info in signature.parameters if param_info.is_type_safe and not param_info.is_primitive]
+        classes.extend(param_info.stream_item_type for param_info in signature.parameters if param_info.is_stream)
+        if signature.return_needs_conversion:
+            classes.append(signature.return_type)
+        return classes
+
+    def encode_signature(self, signature : Schema__Route__Signature ,                   # Signature to encode
+                               modules   : set                                          # Collects the modules of the referenced classes
+                          ) -> dict:                                                    # Returns JSON data (raises ValueError if the signature can't be stored)
+        if signature.type_safe_conversions or signature.primitive_field_types or signature.return_converted_type:
+            raise ValueError("only signatures that were not enriched can be stored")
+        parameters = []
+        for param_info in signature.parameters:
+            if type(param_info.default_value) not in JSON_VALUE_TYPES or param_info.converted_type is not None:
+                raise ValueError(f"parameter '{param_info.name}' can't be stored")
+            nested_fields = param_info.nested_primitive_fields
+            if nested_fields is not None:
+                nested_fields = {field_name: self.encode_class(field_class, modules) for field_name, field_class in nested_fields.items()}
+            parameters.append(dict(name                    = str(param_info.name)                                ,
+                                   param_type              = self.encode_class(param_info.param_type    , modules),
+                                   is_primitive            = param_info.is_primitive                             ,
+                                   is_type_safe            = param_info.is_type_safe                             ,
+                                   primitive_base          = self.encode_class(param_info.primitive_base, modules),
+                                   requires_conversion     = param_info.requires_conversion                      ,
+                                   default_value           = param_info.default_value                            ,
+                                   has_default             = param_info.has_default                              ,
+                                   is_stream               = param_info.is_stream                                ,
+                                   is_async_stream         = param_info.is_async_stream                          ,
+                                   stream_item_type        = self.encode_class(param_info.stream_item_type, modules),
+                                   nested_primitive_fields = nested_fields                                       ))
+        primitive_conversions = {param_name: [self.encode_class(primitive_class, modules), self.encode_class(base_class, modules)]
+                                 for param_name, (primitive_class, base_class) in signature.primitive_conversions.items()}
+        return dict(function_name           = str(signature.function_name)                         ,
+                    parameters              = parameters                                           ,
+                    return_type             = self.encode_class(signature.return_type, modules)    ,
+                    return_needs_conversion = signature.return_needs_conversion                    ,
+                    has_body_params         = signature.has_body_params                            ,
+                    has_path_params         = signature.has_path_params                            ,
+                    has_query_params        = signature.has_query_params                           ,
+                    is_async                = signature.is_async                                   ,
+                    is_inline               = signature.is_inline                                  ,
+                    primitive_conversions   = primitive_conversions                                )
+
+    def decode_signature(self, signature_data : dict                                    # Data created by encode_signature
+                          ) -> Schema__Route__Signature:                                # Returns same signature Type_Safe__Route__Analyzer would have created
+        decode_class = self.decode_class
+        signature    = self.new_schema(Schema__Route__Signature                                                    ,
+                                       function_name           = Safe_Str__Id(signature_data['function_name'])    ,
+                                       return_type             = decode_class(signature_data['return_type'])      ,
+                                       return_needs_conversion = signature_data['return_needs_conversion']        ,
+                                       has_body_params         = signature_data['has_body_params']                ,
+                                       has_path_params         = signature_data['has_path_params']                ,
+                                       has_query_params        = signature_data['has_query_params']               ,
+                                       is_async                = signature_data['is_async']                       ,
+                                       is_inline               = signature_data['is_inline']                      )
+        for param_data in signature_data['parameters']:
+            nested_fields = param_data['nested_primitive_fields']
+            if nested_fields is not None:
+                nested_fields = {field_name: decode_class(class_ref) for field_name, class_ref in nested_fields.items()}
+            param_info = self.new_schema(Schema__Route__Parameter                                                  ,
+                                         name                    = Safe_Str__Id(param_data['name'])               ,
+                                         param_type              = decode_class(param_data['param_type'])         ,
+                                         is_primitive            = param_data['is_primitive']                     ,
+                                         is_type_safe            = param_data['is_type_safe']                     ,
+                                         primitive_base          = decode_class(param_data['primitive_base'])     ,
+                                         requires_conversion     = param_data['requires_conversion']              ,
+                                         default_value           = param_data['default_value']                    ,
+                                         has_default             = param_data['has_default']                      ,
+                                         is_stream               = param_data['is_stream']                        ,
+                                         is_async_stream         = param_data['is_async_stream']                  ,
+                                         stream_item_type        = decode_class(param_data['stream_item_type'])   ,
+                                         nested_primitive_fields = nested_fields                                  )
+            list.append(signature.parameters, param_info)
+        for param_name, (primitive_ref, base_ref) in signature_data['primitive_conversions'].items():
+            dict.__setitem__(signature.primitive_conversions, param_name, (decode_class(primitive_ref), decode_class(base_ref)))
+        return signature
+
+    def new_schema(self, schema_class : Type[Type_Safe],                                # Schema to create
+                         **values                                                       # Field values (already of the right type)
+                    ) -> Type_Safe:                                                     # Returns instance created without the per-field Type_Safe checks (the values were checked when the manifest was created)
+        if schema_class not in self.schema_defaults:
+            template        = schema_class()
+            factory_fields  = {field_name: field_type for field_name, field_type in type_safe_cache.get_class_annotations(schema_class)
+                                                       if isinstance(template.__dict__.get(field_name), (list, dict, set))}
+            self.schema_defaults[schema_class] = (template.__dict__, factory_fields)
+        defaults, factory_fields = self.schema_defaults[schema_class]
+        instance_values          = defaults.copy()
+        for field_name, field_type in factory_fields.items():                           # (new collections for each instance)
+            instance_values[field_name] = schema_class.__default__value__(field_type)
+        instance_values.update(values)
+        instance = object.__new__(schema_class)
+        object.__setattr__(instance, '__dict__', instance_values)
+        return instance
+
+    # -------------------- Models --------------------
+
+    def load_model(self, type_safe_class : Type[Type_Safe]                              # Class that needs a BaseModel
+                    ) -> Optional[Type[BaseModel]]:                                     # Returns BaseModel built from the cached field specs (and adds it to type_safe__to__basemodel.model_cache)
+        model_cache = type_safe__to__basemodel.model_cache
+        if type_safe_class in model_cache:
+            return model_cache[type_safe_class]
+        model_data = self.data['models'].get(self.model_ref(type_safe_class))
+        if model_data is None:
+            return None
+        pydantic_fields = {}
+        for field_name, type_data, default_data, required in model_data['fields']:
+            field_type = self.decode_type(type_data)
+            if required:
+                pydantic_fields[field_name] = (field_type, Field(...))
+            else:
+                pydantic_fields[field_name] = (field_type, self.decode_value(default_data))
+        base_model_class = create_model(model_data['name'], **pydantic_fields, __base__=BaseModel)
+        model_cache[type_safe_class] = base_model_class
+        return base_model_class
+
+    def record_models(self, signature : Schema__Route__Signature                        # Enriched signature (its BaseModels are in type_safe__to__basemodel.model_cache)
+                       ):
+        type_safe_classes = [type_safe_class for type_safe_class in self.signature_models(signature)
+                                             if self.model_ref(type_safe_class) not in self.data['models']]
+        if type_safe_classes:                                                           # (nothing to do when booting from the manifest)
+            models = {model: type_safe_class for type_safe_class, model in type_safe__to__basemodel.model_cache.items()}
+            for type_safe_class in type_safe_classes:
+                self.record_model(type_safe_class, models)
+
+    def model_ref(self, type_safe_class : Type[Type_Safe]                               # Class converted by Type_Safe__To__BaseModel
+                   ) -> Optional[str]:                                                  # Returns the key of its field specs (None if the class can't be stored)
+        try:
+            return self.encode_class(type_safe_class, set())
+        except ValueError:
+            return None
+
+    def record_model(self, type_safe_class : Type[Type_Safe] ,                          # Class converted by Type_Safe__To__BaseModel
+                           models          : dict                                       # BaseModel → Type_Safe class
+                      ):
+        model_cache = type_safe__to__basemodel.model_cache
+        if type_safe_class not in model_cache:
+            return
+        modules = set()
+        try:
+            model_ref = self.encode_class(type_safe_class, modules)
+            if model_ref in self.data['models']:
+                return
+            self.annotations_modules(type_safe_class, modules)
+            fields         = []
+            nested_classes = []
+            for field_name, field_info in model_cache[type_safe_class].model_fields.items():
+                type_data = self.encode_type(field_info.annotation, models, modules, nested_classes)
+                if self.decode_type(type_data) != field_info.annotation:                 # only keep what can be rebuilt exactly
+                    raise ValueError(f"field '{field_name}' can't be stored")
+                required = field_info.default is PydanticUndefined
+                fields.append([field_name, type_data, None if required else self.encode_value(field_info.default, modules), required])
+        except (ValueError, TypeError, AttributeError, ImportError):
+            return
+        self.data['models'][model_ref] = dict(name=model_cache[type_safe_class].__name__, fields=fields)
+        for module_name in sorted(modules):
+            self.add_module(module_name)
+        self.dirty = True
+        for nested_class in nested_classes:
+            self.record_model(nested_class, models)
+
+    # -------------------- Types and values --------------------
+
+    def encode_class(self, target  : Optional[type] ,                                   # Class to reference
+                           modules : set                                                # Collects the class module
+                      ) -> Optional[str]:                                               # Returns 'module:qualname' (raises ValueError if it can't be imported back)
+        if target is None:
+            return None
+        module_name = getattr(target, '__module__'  , None)
+        qualname    = getattr(target, '__qualname__', None)
+        if not isinstance(target, type) or not module_name or not qualname:
+            raise ValueError(f"{target} is not a class")
+        class_ref = f"{module_name}:{qualname}"
+        if self.decode_class(class_ref) is not target:
+            raise ValueError(f"{class_ref} can't be imported")
+        for base_class in target.__mro__:                                               # (a change to a base class, in any module, changes this class)
+            modules.add(base_class.__module__)
+        return class_ref
+
+    def annotations_modules(self, type_safe_class : Type[Type_Safe] ,                   # Class converted by Type_Safe__To__BaseModel
+                                  modules         : set                                 # Collects the modules of the classes used by its fields (i.e. primitives mapped to plain types in the BaseModel)
+                             ):
+        for base_class in type_safe_class.__mro__:
+            for annotation in vars(base_class).get('__annotations__', {}).values():
+                self.annotation_modules(annotation, modules)
+
+    def annotation_modules(self, annotation, modules : set):                            # Adds the modules of the classes in annotation (and in its type args)
+        if isinstance(annotation, type):
+            for base_class in annotation.__mro__:
+                modules.add(base_class.__module__)
+        for arg in get_args(annotation):
+            self.annotation_modules(arg, modules)
+
+    def decode_class(self, class_ref : Optional[str]                                    # 'module:qualname'
+                      ) -> Optional[type]:
+        if class_ref is None:
+            return None
+        module_name, qualname = class_ref.split(':', 1)
+        try:
+            target = importlib.import_module(module_name)
+            for name in qualname.split('.'):
+                target = getattr(target, name)
+        except (ImportError, AttributeError):
+            return None
+        return target
+
+    def encode_type(self, field_type     ,                                              # Annotation used in the BaseModel
+                          models         : dict ,                                       # BaseModel → Type_Safe class
+                          modules        : set  ,                                       # Collects the modules of the referenced classes
+                          nested_classes : list                                         # Collects the Type_Safe classes of nested BaseModels
+                     ):                                                                 # Returns JSON data
+        origin = get_origin(field_type)
+        if field_type is type(None):
+            return 'None'
+        if origin in (list, dict, Union):
+            return {origin.__name__ if origin is not Union else 'union': [self.encode_type(arg, models, modules, nested_classes) for arg in get_args(field_type)]}
+        if field_type in models:
+            nested_classes.append(models[field_type])
+            return {'model': self.encode_class(models[field_type], modules)}
+        return self.encode_class(field_type, modules)
+
+    def decode_type(self, type_data):                                                   # Returns the annotation encoded by encode_type
+        if type_data == 'None':
+            return type(None)
+        if type(type_data) is str:
+            return self.decode_class(type_data)
+        if 'model' in type_data:
+            type_safe_class = self.decode_class(type_data['model'])
+            return self.load_model(type_safe_class) or type_safe__to__basemodel.convert_class(type_safe_class)
+        if 'list' in type_data:
+            return List[self.decode_type(type_data['list'][0])]
+        if 'dict' in type_data:
+            key_type, value_type = (self.decode_type(item) for item in type_data['dict'])
+            return Dict[key_type, value_type]
+        return Union[tuple(self.decode_type(item) for item in type_data['union'])]
+
+    def encode_value(self, value   ,                                                    # BaseModel field default
+                           modules : set                                                # Collects the modules of the referenced classes
+                      ):                                                                # Returns JSON data (raises ValueError for values that can't be rebuilt exactly)
+        if isinstance(value, Type_Safe__Primitive) and type(value).__primitive_base__:
+            return {'primitive': self.encode_class(type(value), modules), 'value': type(value).__primitive_base__(value)}
+        if isinstance(value, Enum):
+            return {'enum': self.encode_class(type(value), modules), 'name': value.name}
+        if type(value) is list:
+            return {'list': [self.encode_value(item, modules) for item in value]}
+        if type(value) is dict and all(type(key) is str for key in value):
+            return {'dict': {key: self.encode_value(item, modules) for key, item in value.items()}}
+        if type(value) in JSON_VALUE_TYPES:
+            return {'value': value}
+        raise ValueError(f"default value of type {type(value)} can't be stored")
+
+    def decode_value(self, value_data : dict):                                          # Returns the value encoded by encode_value
+        if 'primitive' in value_data:
+            return self.decode_class(value_data['primitive'])(value_data['value'])
+        if 'enum' in value_data:
+            return self.decode_class(value_data['enum'])[value_data['name']]
+        if 'list' in value_data:
+            return [self.decode_value(item) for item in value_data['list']]
+        if 'dict' in value_data:
+            return {key: self.decode_value(item) for key, item in value_data['dict'].items()}
+        return value_data['value']
@@ -1,11 +1,16 @@
 from typing                                                                      import Callable
 from fastapi                                                                     import APIRouter, FastAPI
+from osbot_fast_api.api.schemas.enums.Enum__Fast_API__Body__Mode                 import Enum__Fast_API__Body__Mode
+from osbot_fast_api.api.schemas.enums.Enum__Fast_API__Response__Mode             import Enum__Fast_API__Response__Mode
 from osbot_fast_api.api.schemas.safe_str.Safe_Str__Fast_API__Route__Prefix       import Safe_Str__Fast_API__Route__Prefix
 from osbot_fast_api.api.schemas.safe_str.Safe_Str__Fast_API__Route__Tag          import Safe_Str__Fast_API__Route__Tag
 from osbot_utils.type_safe.Type_Safe                                             import Type_Safe
 from osbot_utils.decorators.lists.index_by                                       import index_by
 from osbot_utils.type_safe.type_safe_core.decorators.type_safe                   import type_safe
 from osbot_fast_api.api.routes.type_safe.Type_Safe__Route__Registration          import Type_Safe__Route__Registration
+from osbot_fast_api.api.routes.Fast_API__Route__Lazy                             import Fast_API__Route__Lazy, setup_lazy_routes_openapi
+from osbot_fast_api.api.routes.Fast_API__Route__Manifest                         import Fast_API__Route__Manifest
+from osbot_fast_api.api.routes.Fast_API__Route__Batch                            import Fast_API__Route__Batch, BATCH__MAX_REQUESTS, BATCH__MAX_CONCURRENCY
 
 
 class Fast_API__Routes(Type_Safe):                                       # Base class for defining FastAPI route collections with Type_Safe support
@@ -14,12 +19,22 @@ class Fast_API__Routes(Type_Safe):                                       # Base
     prefix             : Safe_Str__Fast_API__Route__Prefix = None
     tag                : Safe_Str__Fast_API__Route__Tag
     filter_tag         : bool                             = True
+    response_mode      : Enum__Fast_API__Response__Mode   = Enum__Fast_API__Response__Mode.BASEMODEL
+    body_mode          : Enum__Fast_API__Body__Mode       = Enum__Fast_API__Body__Mode.BASEMODEL
+    lazy_routes        : bool                             = False        # Only build routes (analysis, wrappers, BaseModels) on first request or OpenAPI generation
+    route_manifest     : Fast_API__Route__Manifest        = None         # Cached route analysis (shared by all routes classes of the Fast_API)
+    batch_route        : bool                             = False        # Add a POST /batch route that calls many of this class's routes in one request
+    batch_max_requests : int                              = BATCH__MAX_REQUESTS        # Calls allowed in one /batch request (more: 413)
+    batch_concurrency  : int                              = BATCH__MAX_CONCURRENCY     # Calls of a /batch request running at the same time
     route_registration : Type_Safe__Route__Registration                  # Unified route registration system
 
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
         if not self.prefix:                                              # Auto-generate prefix from tag
             self.prefix = Safe_Str__Fast_API__Route__Prefix(self.tag)
+        self.route_registration.wrapper_creator.response_mode = self.response_mode      # How Type_Safe return values are encoded
+        self.route_registration.wrapper_creator.body_mode     = self.body_mode          # How JSON bodies are decoded into Type_Safe params
+        self.route_registration.route_manifest                = self.route_manifest     # Where the route analysis is cached
 
     # -------------------- Core Route Registration Methods --------------------
 
@@ -27,7 +42,11 @@ class Fast_API__Routes(Type_Safe):                                       # Base
     def add_route(self, function : Callable,                            # Function to register
                         methods   : list                                # HTTP methods
                       ):                                                 # Register route with specified methods
-        self.route_registration.register_route(self.router, function, methods)
+        if self.lazy_routes:                                             # Only record the route (path and methods), see materialize_route
+            path = self.route_registration.route_path(function)
+            self.router.routes.append(Fast_API__Route__Lazy(path, function, methods, fast_api_routes=self))
+        else:
+            self.route_registration.register_route(self.router, function, methods)
         return self
 
     @type_safe
@@ -101,17 +120,67 @@ class Fast_API__Routes(Type_Safe):                                       # Base
     def routes_paths(self):                                              # Get sorted list of route paths
         return sorted(list(self.routes(index_by='http_path')))
 
+    # -------------------- Response Cache and Coalescing --------------------
+
+    def route_caches(self):                                              # Get the caches of the @route_cache routes (by function name, only once the route is built)
+        return self.route_registration.wrapper_creator.route_caches
+
+    def cache_clear(self, function : Callable = None                     # Route to invalidate (None: all cached routes)
+                     ):
+        for function_name, route_cache in self.route_caches().items():
+            if function is None or function.__name__ == function_name:
+                route_cache.clear()
+        return self
+
+    def cache_invalidate(self, function : Callable ,                     # Cached route
+                               **params                                  # All the route's params (as passed by FastAPI)
+                          ) -> bool:                                     # Returns True if a cached response was removed
+        route_cache = self.route_caches().get(function.__name__)
+        return route_cache.invalidate(**params) if route_cache else False
+
+    def cache_stats(self) -> dict:                                       # Get hits, misses, evictions and entries of each cached route
+        return {function_name: route_cache.info() for function_name, route_cache in self.route_caches().items()}
+
+    def coalesce_stats(self) -> dict:                                    # Get executions and collapsed calls of each @route_coalesce route
+        return {function_name: route_coalescer.info() for function_name, route_coalescer in self.route_registration.wrapper_creator.route_coalescers.items()}
+
     # -------------------- Setup and Lifecycle --------------------
 
     def setup(self):                                                     # Setup routes and register with app
         self.setup_routes()
+        if self.batch_route:
+            route_batch = Fast_API__Route__Batch(fast_api_routes=self, max_requests=self.batch_max_requests, max_concurrency=self.batch_concurrency)
+            self.add_route_post(route_batch.batch)
+
+        routes      = self.router.routes
+        lazy_routes = [route for route in routes if type(route) is Fast_API__Route__Lazy]
+        if lazy_routes:                                                  # include_router would turn the placeholders into plain Routes
+            self.router.routes = [route for route in routes if type(route) is not Fast_API__Route__Lazy]
+        self.include_router(self.router)
+        self.router.routes = routes
+
+        for lazy_route in lazy_routes:                                   # placeholders go straight into the app router (with the prefix)
+            path = lazy_route.path if self.prefix == '/' else self.prefix + lazy_route.path
+            self.app.router.routes.append(Fast_API__Route__Lazy(path, lazy_route.function, lazy_route.methods_list, fast_api_routes=self))
+        if lazy_routes:
+            setup_lazy_routes_openapi(self.app)
+
+        return self
 
+    def include_router(self, router : APIRouter                         # Router to add to the app
+                        ):
         if self.prefix == '/':                                           # Root-level routes
-            self.app.include_router(self.router, tags=[self.tag])
+            self.app.include_router(router, tags=[self.tag])
         else:                                                            # Prefixed routes
-            self.app.include_router(self.router, prefix=self.prefix, tags=[self.tag])
-
-        return self
+            self.app.include_router(router, prefix=self.prefix, tags=[self.tag])
+
+    def materialize_route(self, function : Callable ,                    # Function recorded by a lazy add_route
+                                methods  : list                          # HTTP methods
+                           ):                                            # Returns the APIRoute exactly as the eager setup would have added it to the app
+        router = APIRouter()
+        self.route_registration.register_route(router, function, methods)
+        self.include_router(router)
+        return self.app.router.routes.pop()
 
     def setup_routes(self):                                              # Override this to define routes
         pass
\ No newline at end of file
@@ -1,9 +1,12 @@
-from fastapi                                             import Response
-from osbot_fast_api.api.decorators.route_path            import route_path
-from osbot_fast_api.api.routes.Fast_API__Routes          import Fast_API__Routes
-from osbot_fast_api.api.transformers.OpenAPI__To__Python import OpenAPI__To__Python
-from osbot_fast_api.utils.Fast_API__Server_Info          import fast_api__server_info
-from osbot_fast_api.utils.Version                        import version__osbot_fast_api
+import json
+from fastapi                                                      import HTTPException, Request
+from osbot_fast_api.api.decorators.route_path                     import route_path
+from osbot_fast_api.api.routes.Fast_API__Routes                   import Fast_API__Routes
+from osbot_fast_api.api.transformers.OpenAPI__To__Python          import OpenAPI__To__Python
+from osbot_fast_api.api.transformers.Type_Safe__To__LLM_Tools     import Type_Safe__To__LLM_Tools, LLM_TOOLS__PROVIDERS
+from osbot_fast_api.utils.Fast_API__Server_Info                   import fast_api__server_info
+from osbot_fast_api.utils.Fast_API__Static_Content                import Fast_API__Static_Content
+from osbot_fast_api.utils.Version                                 import version__osbot_fast_api
 
 # todo: these are actually routes, so we should move them into a better location
 #       maybe 'default_routes' or something similar
@@ -14,7 +17,11 @@ ROUTES_PATHS__CONFIG = ['/config/info'          ,
                         '/config/version'       ]
 
 class Routes__Config(Fast_API__Routes):
-    tag  = 'config'
+    tag                   = 'config'
+    llm_tools_route       : bool = False                                        # add GET /config/llm-tools (off by default: it describes every route of the app)
+    openapi_python__cache : dict                                                # last generated client: spec (by identity), spec_hash and Fast_API__Static_Content
+    llm_tools__cache      : dict                                                # provider → (catalogue, Fast_API__Static_Content)
+    llm_tools__converter  : Type_Safe__To__LLM_Tools                            # (caches the catalogues until the app's routes change)
 
     def info(self):
         return fast_api__server_info.json()
@@ -26,15 +33,42 @@ class Routes__Config(Fast_API__Routes):
         return {'version': version__osbot_fast_api}
 
     @route_path('/openapi.py')
-    def openapi_python(self):
-        open_api_to_python = OpenAPI__To__Python()
-        client_python_code = open_api_to_python.generate_from_app(app=self.app)
+    def openapi_python(self, request: Request):
+        return self.openapi_python__content().response(request)
 
-        return Response(content    = client_python_code,
-                        media_type = "text/x-python"   )
+    def openapi_python__content(self) -> Fast_API__Static_Content:             # Client code is only generated when the app's spec changes
+        spec  = self.app.openapi()                                              # (FastAPI keeps returning the same dict, until its openapi_schema is reset)
+        cache = self.openapi_python__cache
+        if cache.get('spec') is not spec:
+            open_api_to_python = OpenAPI__To__Python()
+            spec_hash          = open_api_to_python.spec_hash(spec)
+            if cache.get('spec_hash') != spec_hash:
+                client_python_code = open_api_to_python.generate_from_dict(spec)
+                cache['content'  ] = Fast_API__Static_Content(content    = client_python_code.encode(),
+                                                              media_type = 'text/x-python'            ,
+                                                              etag       = f'{spec_hash}-{version__osbot_fast_api}').setup()   # (same spec and generator → same ETag across restarts and instances)
+                cache['spec_hash'] = spec_hash
+            cache['spec'] = spec
+        return cache['content']
+
+    def llm_tools(self, request: Request, provider: str = 'openai'):
+        return self.llm_tools__content(provider).response(request)
+
+    def llm_tools__content(self, provider : str) -> Fast_API__Static_Content:  # Tool definitions of all the app's routes (only rebuilt when the routes change)
+        if provider not in LLM_TOOLS__PROVIDERS:
+            raise HTTPException(status_code=400, detail=f"Unsupported provider '{provider}', supported providers are: {', '.join(LLM_TOOLS__PROVIDERS)}")
+        catalogue = self.llm_tools__converter.app_tools(self.app, provider)
+        cached    = self.llm_tools__cache.get(provider)
+        if cached is None or cached[0] is not catalogue:
+            content = Fast_API__Static_Content(content    = json.dumps(catalogue, separators=(',', ':')).encode(),
+                                               media_type = 'application/json'                                  ).setup()
+            cached  = self.llm_tools__cache[provider] = (catalogue, content)
+        return cached[1]
 
     def setup_routes(self):
         self.add_route_get(self.info          )
         self.add_route_get(self.status        )
         self.add_route_get(self.version       )
-        self.add_route_get(self.openapi_python)
\ No newline at end of file
+        self.add_route_get(self.openapi_python)
+        if self.llm_tools_route:
+            self.add_route_get(self.llm_tools )
\ No newline at end of file
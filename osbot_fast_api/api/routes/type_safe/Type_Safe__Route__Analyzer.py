@@ -1,5 +1,6 @@
 import inspect
-from typing import get_type_hints, Callable, Type
+import collections.abc
+from typing import get_type_hints, get_origin, get_args, Callable, Type
 from osbot_utils.type_safe.Type_Safe                                             import Type_Safe
 from osbot_utils.type_safe.Type_Safe__Primitive                                  import Type_Safe__Primitive
 from osbot_utils.type_safe.type_safe_core.decorators.type_safe                   import type_safe
@@ -8,6 +9,8 @@ from osbot_utils.type_safe.primitives.domains.identifiers.safe_str.Safe_Str__Id
 from osbot_fast_api.api.schemas.routes.Schema__Route__Parameter                  import Schema__Route__Parameter
 from osbot_fast_api.api.schemas.routes.Schema__Route__Signature                  import Schema__Route__Signature
 
+STREAM_ORIGINS       = (collections.abc.Iterator     , collections.abc.Iterable     )   # Iterator[Type_Safe] params: JSON array body decoded item by item
+ASYNC_STREAM_ORIGINS = (collections.abc.AsyncIterator, collections.abc.AsyncIterable)
 
 
 class Type_Safe__Route__Analyzer(Type_Safe):                            # Analyzes function signatures to extract type information for route creation
@@ -20,7 +23,9 @@ class Type_Safe__Route__Analyzer(Type_Safe):                            # Analyz
         sig           = inspect.signature(function)
         type_hints    = get_type_hints(function)
 
-        signature = Schema__Route__Signature(function_name = function_name)
+        signature = Schema__Route__Signature(function_name = function_name                                       ,
+                                             is_async      = inspect.iscoroutinefunction(function)               ,
+                                             is_inline     = getattr(function, '__route_inline__', False) is True)
 
         for param_name, param in sig.parameters.items():                 # Analyze each parameter
             if param_name == 'self':                                     # Skip self parameter
@@ -36,6 +41,9 @@ class Type_Safe__Route__Analyzer(Type_Safe):                            # Analyz
                 if param_name not in signature.primitive_conversions:
                     signature.primitive_conversions[param_name] = (param_info.param_type, param_info.primitive_base)
 
+            elif param_info.is_stream:
+                signature.has_body_params = True                         # streamed items come from the body (a JSON array)
+
             elif param_info.is_type_safe:
                 signature.has_body_params = True                         # Type_Safe objects go in body
                 if param_info.requires_conversion:
@@ -65,7 +73,15 @@ class Type_Safe__Route__Analyzer(Type_Safe):                            # Analyz
             param_info.has_default    = True
             param_info.default_value  = param.default
 
-        if self.is_primitive_class(param_type):                          # Check if Type_Safe__Primitive
+        stream_item_type = self.get_stream_item_type(param_type)
+        if stream_item_type:                                             # Check if (Async)Iterator of Type_Safe items
+            param_info.is_stream               = True
+            param_info.is_async_stream         = get_origin(param_type) in ASYNC_STREAM_ORIGINS
+            param_info.stream_item_type        = stream_item_type
+            param_info.requires_conversion     = True
+            param_info.nested_primitive_fields = self.extract_primitive_fields(stream_item_type)
+
+        elif self.is_primitive_class(param_type):                        # Check if Type_Safe__Primitive
             param_info.is_primitive       = True
             param_info.requires_conversion = True
             param_info.primitive_base     = self.get_primitive_base(param_type)
@@ -101,6 +117,16 @@ class Type_Safe__Route__Analyzer(Type_Safe):                            # Analyz
             pass
         return False
 
+    @type_safe
+    def get_stream_item_type(self, param_type                            # Type to check
+                              ):                                         # Returns the Type_Safe item class of Iterator[...] / AsyncIterator[...] (or None)
+        if get_origin(param_type) not in STREAM_ORIGINS + ASYNC_STREAM_ORIGINS:
+            return None
+        item_types = get_args(param_type)
+        if len(item_types) == 1 and self.is_type_safe_class(item_types[0]) and not self.is_primitive_class(item_types[0]):
+            return item_types[0]
+        return None
+
     @type_safe
     def get_primitive_base(self, primitive_class                         # Type_Safe__Primitive class
                             ):                                           # Returns base type (str, int, float)
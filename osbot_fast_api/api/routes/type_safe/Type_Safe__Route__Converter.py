@@ -1,9 +1,16 @@
 
-from osbot_utils.type_safe.Type_Safe                              import Type_Safe
-from osbot_utils.type_safe.Type_Safe__Primitive                   import Type_Safe__Primitive
-from osbot_utils.type_safe.type_safe_core.decorators.type_safe    import type_safe
-from osbot_fast_api.api.transformers.Type_Safe__To__BaseModel     import type_safe__to__basemodel
-from osbot_fast_api.api.schemas.routes.Schema__Route__Signature   import Schema__Route__Signature
+from typing                                                                 import Callable
+from pydantic                                                               import BaseModel
+from osbot_utils.type_safe.Type_Safe                                        import Type_Safe
+from osbot_utils.type_safe.Type_Safe__Primitive                             import Type_Safe__Primitive
+from osbot_utils.type_safe.type_safe_core.decorators.type_safe              import type_safe
+from starlette.responses                                                    import Response
+from osbot_fast_api.api.transformers.Type_Safe__To__BaseModel               import type_safe__to__basemodel
+from osbot_fast_api.api.transformers.Type_Safe__To__Json_Bytes              import type_safe__to__json_bytes
+from osbot_fast_api.api.transformers.Json__To__Type_Safe                    import json__to__type_safe
+from osbot_fast_api.api.schemas.routes.Schema__Route__Parameter             import Schema__Route__Parameter
+from osbot_fast_api.api.schemas.routes.Schema__Route__Signature             import Schema__Route__Signature
+from osbot_fast_api.api.routes.type_safe.Type_Safe__Route__Primitive_Cache  import type_safe__route__primitive_cache
 
 
 class Type_Safe__Route__Converter(Type_Safe):                           # Handles conversion between Type_Safe and BaseModel for FastAPI routes
@@ -20,6 +27,13 @@ class Type_Safe__Route__Converter(Type_Safe):                           # Handle
 
                 signature.type_safe_conversions[param_name] = (param_info.param_type, basemodel_class)
 
+            elif param_info.is_stream:                                   # streamed items: BaseModel of the item class (for the OpenAPI schema)
+                basemodel_class              = type_safe__to__basemodel.convert_class(param_info.stream_item_type)
+                param_info.converted_type    = basemodel_class
+                param_name                   = str(param_info.name)
+
+                signature.stream_conversions[param_name] = (param_info.stream_item_type, basemodel_class)
+
         if signature.return_needs_conversion:                            # Convert return type to BaseModel
             basemodel_return                   = type_safe__to__basemodel.convert_class(signature.return_type)
             signature.return_converted_type    = basemodel_return
@@ -34,7 +48,7 @@ class Type_Safe__Route__Converter(Type_Safe):                           # Handle
 
         if param_name in signature.primitive_conversions:                # Handle Type_Safe__Primitive conversion
             type_safe_primitive_class, _ = signature.primitive_conversions[param_name]
-            return type_safe_primitive_class(param_value)
+            return type_safe__route__primitive_cache.convert(type_safe_primitive_class, param_value)
 
         elif param_name in signature.type_safe_conversions:              # Handle Type_Safe class conversion
             type_safe_class, _ = signature.type_safe_conversions[param_name]
@@ -74,6 +88,116 @@ class Type_Safe__Route__Converter(Type_Safe):                           # Handle
 
         return result                                                    # No conversion needed
 
+    @type_safe
+    def compile_param_converters(self, signature : Schema__Route__Signature       # Signature with conversion info
+                                  ) -> tuple:                                     # Returns ((param_name, converter), ...) plan used per request
+        param_converters = []                                                     # only the params that need conversion get a slot (no per-request searches or @type_safe checks)
+        for param_info in signature.parameters:
+            param_name = str(param_info.name)
+            if param_name in signature.primitive_conversions:
+                type_safe_primitive_class, _ = signature.primitive_conversions[param_name]
+                converter                    = type_safe__route__primitive_cache.converter(type_safe_primitive_class)   # hot ids are only validated once
+                param_converters.append((param_name, converter))
+            elif param_name in signature.type_safe_conversions:
+                type_safe_class, _ = signature.type_safe_conversions[param_name]
+                converter          = self.compile_type_safe_converter(type_safe_class, param_info.nested_primitive_fields)
+                param_converters.append((param_name, converter))
+        return tuple(param_converters)
+
+    def compile_type_safe_converter(self, type_safe_class         ,               # Type_Safe class to create
+                                          nested_primitive_fields                 # {field_name: primitive_class} or None
+                                     ) -> Callable:                               # Returns converter from dict/BaseModel to Type_Safe
+        nested_fields = tuple(nested_primitive_fields.items()) if nested_primitive_fields else ()
+
+        def convert_type_safe(param_value):
+            if isinstance(param_value, dict):                                                     # From JSON dict
+                data = param_value
+            elif isinstance(param_value, BaseModel):                                              # or BaseModel instance
+                data = param_value.model_dump()
+            else:                                                                                 # (i.e. a JSON array or string body: reported as a validation error, not a 500)
+                raise TypeError(f"expected a {type_safe_class.__name__} object but got '{type(param_value).__name__}'")
+            for field_name, primitive_class in nested_fields:                                     # Convert nested primitive fields
+                if field_name in data:
+                    data[field_name] = primitive_class(data[field_name])
+            return type_safe_class(**data)
+
+        return convert_type_safe
+
+    @type_safe
+    def compile_param_decoders(self, signature : Schema__Route__Signature         # Signature with conversion info
+                                ) -> tuple:                                       # Returns ((param_name, converter), ...) plan, with Type_Safe params decoded straight from the JSON dict
+        param_converters = []
+        for param_name, param_converter in self.compile_param_converters(signature):
+            if param_name in signature.type_safe_conversions:
+                type_safe_class, _ = signature.type_safe_conversions[param_name]
+                param_converter    = self.compile_type_safe_decoder(type_safe_class, param_converter)
+            param_converters.append((param_name, param_converter))
+        return tuple(param_converters)
+
+    def compile_type_safe_decoder(self, type_safe_class    ,                      # Type_Safe class to create
+                                        fallback_converter                        # Converter used when the compiled decoder can't handle the data
+                                   ) -> Callable:                                 # Returns converter from JSON dict to Type_Safe
+        decoder = json__to__type_safe.decoder_for_class(type_safe_class)
+        if decoder is None:                                                       # class not supported by the compiled decoder
+            return fallback_converter
+
+        def decode_type_safe(param_value):
+            if type(param_value) is dict:
+                try:
+                    return decoder(param_value)
+                except Exception:                                                 # let Type_Safe handle it (and raise its own errors)
+                    pass
+            return fallback_converter(param_value)
+
+        return decode_type_safe
+
+    @type_safe
+    def compile_stream_item_decoder(self, param_info : Schema__Route__Parameter   # Streamed (Iterator[Type_Safe]) parameter
+                                     ) -> Callable:                               # Returns converter from each JSON array item to the Type_Safe item class
+        item_class       = param_info.stream_item_type
+        converter        = self.compile_type_safe_converter(item_class, param_info.nested_primitive_fields)
+        decode_type_safe = self.compile_type_safe_decoder(item_class, converter)
+
+        def decode_item(value):
+            if type(value) is not dict:
+                raise TypeError(f"expected a {item_class.__name__} object but got '{type(value).__name__}'")
+            return decode_type_safe(value)
+
+        return decode_item
+
+    @type_safe
+    def compile_return_converter(self, signature : Schema__Route__Signature       # Signature with conversion info
+                                  ) -> Callable:                                  # Returns converter applied to the route's return value
+        to_dict = type_safe__to__basemodel.to_dict                                # (FastAPI validates and serializes the dict with the route's response_model)
+
+        def convert_primitive(result):
+            if isinstance(result, Type_Safe__Primitive):                          # Convert primitive to base type
+                primitive_base = result.__primitive_base__ or type(result).__bases__[0]
+                return primitive_base(result)
+            return result
+
+        def convert_type_safe(result):
+            if isinstance(result, Type_Safe):
+                return to_dict(result)
+            return convert_primitive(result)
+
+        if signature.return_needs_conversion:
+            return convert_type_safe
+        return convert_primitive
+
+    @type_safe
+    def compile_return_encoder(self, signature : Schema__Route__Signature         # Signature with conversion info
+                                ) -> Callable:                                    # Returns converter that encodes Type_Safe results straight to a JSON Response
+        to_bytes          = type_safe__to__json_bytes.to_bytes
+        convert_primitive = self.compile_return_converter(Schema__Route__Signature())   # no return conversion, only primitives → base type
+
+        def encode_type_safe(result):
+            if isinstance(result, Type_Safe):                                     # returning a Response makes FastAPI skip the response_model validation and re-encoding
+                return Response(content=to_bytes(result), media_type='application/json')
+            return convert_primitive(result)
+
+        return encode_type_safe
+
     @type_safe
     def find_parameter(self, signature   : Schema__Route__Signature    ,# Signature to search
                             param_name   : str                          # Parameter name to find
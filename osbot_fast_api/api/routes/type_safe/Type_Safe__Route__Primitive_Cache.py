@@ -0,0 +1,77 @@
+import threading
+from typing                                                             import Callable, Type
+from osbot_utils.type_safe.Type_Safe                                    import Type_Safe
+from osbot_utils.type_safe.Type_Safe__Primitive                         import Type_Safe__Primitive
+
+PRIMITIVE_CACHE__MAX_ENTRIES    = 1024                                                  # per primitive class
+PRIMITIVE_CACHE__MAX_VALUE_SIZE = 256                                                   # longer raw strings are converted but not cached
+
+
+class Type_Safe__Route__Primitive_Cache(Type_Safe):                                     # Interning (LRU) cache of the Type_Safe__Primitive path/query params: raw value → validated primitive
+    enabled        : bool = True
+    max_entries    : int  = PRIMITIVE_CACHE__MAX_ENTRIES
+    max_value_size : int  = PRIMITIVE_CACHE__MAX_VALUE_SIZE
+    entries        : dict                                                               # primitive class → {(raw type, raw value): primitive}, in LRU order (oldest first)
+    counters       : dict                                                               # primitive class → [hits, misses, evictions]
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        object.__setattr__(self, 'lock', threading.Lock())                              # (not a Type_Safe field) def routes convert their params in the threadpool
+
+    def converter(self, primitive_class : Type[Type_Safe__Primitive]                    # Primitive class of the param
+                   ) -> Callable:                                                       # Returns function(raw value) -> primitive (the class itself, if the cache is disabled)
+        if not self.enabled:
+            return primitive_class
+        with self.lock:
+            entries  = self.entries .setdefault(primitive_class, {})
+            counters = self.counters.setdefault(primitive_class, [0, 0, 0])
+        lock           = self.lock
+        max_entries    = self.max_entries
+        max_value_size = self.max_value_size
+
+        def convert_primitive(raw_value):
+            key = (raw_value.__class__, raw_value)                                      # (the raw type is part of the key: 1, True and '1' are different inputs)
+            with lock:
+                value = entries.pop(key, None)
+                if value is not None:
+                    entries[key] = value                                                # most recently used go to the end
+                    counters[0] += 1
+                    return value
+                counters[1] += 1
+            value = primitive_class(raw_value)                                          # (raises the usual ValueError/TypeError for invalid values, which are not cached)
+            if isinstance(raw_value, str) and len(raw_value) > max_value_size:
+                return value
+            with lock:
+                entries[key] = value
+                if len(entries) > max_entries:
+                    del entries[next(iter(entries))]
+                    counters[2] += 1
+            return value
+
+        return convert_primitive
+
+    def convert(self, primitive_class : Type[Type_Safe__Primitive],                     # Primitive class of the param
+                      raw_value                                                         # Value received by FastAPI (str, int, float, ...)
+                 ) -> Type_Safe__Primitive:
+        return self.converter(primitive_class)(raw_value)
+
+    def clear(self):
+        with self.lock:
+            for entries in self.entries.values():
+                entries.clear()
+        return self
+
+    def stats(self) -> dict:                                                            # Returns {primitive class name: hits, misses, evictions, entries and hit_ratio}
+        stats = {}
+        with self.lock:
+            for primitive_class, (hits, misses, evictions) in self.counters.items():
+                calls = hits + misses
+                stats[primitive_class.__name__] = dict(hits      = hits                                     ,
+                                                       misses    = misses                                   ,
+                                                       evictions = evictions                                ,
+                                                       entries   = len(self.entries[primitive_class])       ,
+                                                       hit_ratio = round(hits / calls, 4) if calls else 0.0 )
+        return stats
+
+
+type_safe__route__primitive_cache = Type_Safe__Route__Primitive_Cache()                 # Singleton instance (shared by all routes, so that hot ids are only validated once per app)
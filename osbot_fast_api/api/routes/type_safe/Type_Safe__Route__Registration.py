@@ -6,6 +6,8 @@ from osbot_fast_api.api.routes.type_safe.Type_Safe__Route__Analyzer     import T
 from osbot_fast_api.api.routes.type_safe.Type_Safe__Route__Converter    import Type_Safe__Route__Converter
 from osbot_fast_api.api.routes.type_safe.Type_Safe__Route__Wrapper      import Type_Safe__Route__Wrapper
 from osbot_fast_api.api.routes.Fast_API__Route__Parser                  import Fast_API__Route__Parser
+from osbot_fast_api.api.routes.Fast_API__Route__Manifest                import Fast_API__Route__Manifest
+from osbot_fast_api.api.schemas.routes.Schema__Route__Signature         import Schema__Route__Signature
 
 
 class Type_Safe__Route__Registration(Type_Safe):                        # Unified system for registering routes with Type_Safe support
@@ -13,6 +15,7 @@ class Type_Safe__Route__Registration(Type_Safe):                        # Unifie
     converter      : Type_Safe__Route__Converter
     wrapper_creator: Type_Safe__Route__Wrapper
     route_parser   : Fast_API__Route__Parser
+    route_manifest : Fast_API__Route__Manifest = None                   # Cached route analysis (used instead of re-analysing the route functions)
 
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
@@ -24,17 +27,42 @@ class Type_Safe__Route__Registration(Type_Safe):                        # Unifie
                              methods   : List[str]                          # HTTP methods (GET, POST, etc)
                          ):                                                 # Register a route with full Type_Safe support
 
-        signature = self.analyzer.analyze_function                  (function           )   # Analyze function signature
-        signature = self.converter.enrich_signature_with_conversions(signature          )   # Add conversion metadata
+        signature = self.route_signature                            (function           )   # Analyze function signature (with conversion metadata)
         wrapper   = self.wrapper_creator.create_wrapper             (function, signature)   # Create wrapper function
+        path      = self.route_path                                 (function           )
+
+        router.add_api_route(path          = path                                       ,   # Register with FastAPI
+                             endpoint      = wrapper                                    ,
+                             methods       = methods                                    ,
+                             openapi_extra = getattr(wrapper, '__openapi_extra__', None))   # (i.e. body schema of streamed routes)
+
+    @type_safe
+    def route_path(self, function : Callable                                # Function to get the path for
+                    ) -> str:                                               # Returns the route path (without the router prefix)
         if hasattr(function, '__route_path__'):                                             # if @route_path has been used
-            path = function.__route_path__
-        else:                                                                               # If not, use parser to generate from function name
-            path  = self.route_parser.parse_route_path              (function           )   # Parse route path from function name
+            return function.__route_path__
+        if self.route_manifest:
+            path = self.route_manifest.route_path(function)
+            if path is None:
+                path = self.route_parser.parse_route_path(function)
+                self.route_manifest.record_route_path(function, path)
+            return path
+        return self.route_parser.parse_route_path(function)                                 # If not, use parser to generate from function name
+
+    @type_safe
+    def route_signature(self, function : Callable                           # Function to analyze
+                         ) -> Schema__Route__Signature:                     # Returns signature enriched with the conversion metadata
+        if self.route_manifest is None:
+            signature = self.analyzer.analyze_function(function)
+            return self.converter.enrich_signature_with_conversions(signature)
 
-        router.add_api_route(path     = path    ,                       # Register with FastAPI
-                            endpoint = wrapper  ,
-                            methods  = methods  )
+        signature = self.route_manifest.route_signature(function)                           # cached analysis (also loads the BaseModels from their field specs)
+        if signature is None:
+            signature = self.analyzer.analyze_function(function)
+            self.route_manifest.record_route_signature(function, signature)
+        signature = self.converter.enrich_signature_with_conversions(signature)
+        self.route_manifest.record_models(signature)
+        return signature
 
     @type_safe
     def register_route_any(self, router   : Router   ,                  # FastAPI router
@@ -45,12 +73,12 @@ class Type_Safe__Route__Registration(Type_Safe):                        # Unifie
         methods = ['GET', 'POST', 'PUT', 'DELETE', 'PATCH', 'HEAD', 'OPTIONS']
 
         if path:                                                         # Use explicit path if provided
-            signature = self.analyzer.analyze_function(function)
-            signature = self.converter.enrich_signature_with_conversions(signature)
+            signature = self.route_signature(function)
             wrapper   = self.wrapper_creator.create_wrapper(function, signature)
 
-            router.add_api_route(path     = path    ,
-                                endpoint = wrapper  ,
-                                methods  = methods  )
+            router.add_api_route(path          = path                                       ,
+                                 endpoint      = wrapper                                    ,
+                                 methods       = methods                                    ,
+                                 openapi_extra = getattr(wrapper, '__openapi_extra__', None))
         else:
             self.register_route(router, function, methods)               # Use standard path parsing
\ No newline at end of file
@@ -1,28 +1,46 @@
 import functools
 import inspect
-from typing                                                          import Callable, get_type_hints
-from fastapi                                                         import HTTPException
+import json
+import warnings
+import anyio.from_thread
+from typing                                                          import Callable, Annotated, get_type_hints
+from fastapi                                                         import HTTPException, Request
+from pydantic                                                        import SkipValidation
+from pydantic.json_schema                                            import PydanticJsonSchemaWarning
 from fastapi.exceptions                                              import RequestValidationError
 from osbot_utils.type_safe.Type_Safe                                 import Type_Safe
 from osbot_utils.type_safe.type_safe_core.decorators.type_safe       import type_safe
 from osbot_fast_api.api.routes.type_safe.Type_Safe__Route__Converter import Type_Safe__Route__Converter
+from osbot_fast_api.api.schemas.enums.Enum__Fast_API__Body__Mode     import Enum__Fast_API__Body__Mode
+from osbot_fast_api.api.schemas.enums.Enum__Fast_API__Response__Mode import Enum__Fast_API__Response__Mode
 from osbot_fast_api.api.schemas.routes.Schema__Route__Signature      import Schema__Route__Signature
+from osbot_fast_api.api.transformers.Json__Array__To__Type_Safe      import Json__Array__To__Type_Safe
+from osbot_fast_api.api.routes.Fast_API__Route__Cache                import Fast_API__Route__Cache
+from osbot_fast_api.api.routes.Fast_API__Route__Coalescer            import Fast_API__Route__Coalescer
+
+STREAM__REQUEST__PARAM = '_stream_request'                                 # name of the Request param that replaces the streamed param in the wrapper signature
 
 
 class Type_Safe__Route__Wrapper(Type_Safe):                             # Creates wrapper functions that handle Type_Safe conversions for FastAPI routes
-    converter : Type_Safe__Route__Converter
+    converter     : Type_Safe__Route__Converter
+    response_mode : Enum__Fast_API__Response__Mode = Enum__Fast_API__Response__Mode.BASEMODEL
+    body_mode     : Enum__Fast_API__Body__Mode     = Enum__Fast_API__Body__Mode.BASEMODEL
+    route_caches     : dict                                                # function name → Fast_API__Route__Cache (for the @route_cache routes)
+    route_coalescers : dict                                                # function name → Fast_API__Route__Coalescer (for the @route_coalesce routes)
 
     @type_safe
     def create_wrapper(self, function  : Callable                 ,         # Original function to wrap
                              signature : Schema__Route__Signature           # Signature with conversion info
                         ) -> Callable:                                      # Returns wrapper function
 
-        if not signature.primitive_conversions and not signature.type_safe_conversions and not signature.return_needs_conversion:
-            if signature.return_type is not None:                                           # Even if no conversions needed, preserve return type for OpenAPI
+        if not signature.primitive_conversions and not signature.type_safe_conversions and not signature.stream_conversions and not signature.return_needs_conversion:
+            if signature.return_type is not None or signature.is_inline or hasattr(function, '__route_cache__') or hasattr(function, '__route_coalesce__'):   # Even if no conversions needed, preserve return type for OpenAPI (and run inline routes on the event loop, or cache/coalesce the calls)
                 return self.create_passthrough_wrapper(function, signature)                 # Create minimal wrapper that preserves return type annotation
-            return function                                                                 # No return type - return original
+            return function                                                                 # No return type - return original (FastAPI handles both def and async def)
 
-        if signature.has_body_params:                                                   # Different wrappers for different scenarios
+        if signature.stream_conversions:                                                # Different wrappers for different scenarios
+            wrapper_function = self.create_stream_wrapper(function, signature)
+        elif signature.has_body_params:
             wrapper_function = self.create_body_wrapper(function, signature)
         else:
             wrapper_function = self.create_query_wrapper(function, signature)
@@ -30,10 +48,13 @@ class Type_Safe__Route__Wrapper(Type_Safe):                             # Create
         if signature.return_type is not None:
             wrapper_function.__original_return_type__ = signature.return_type           # Preserve original return type metadata for route extractors
 
+        if self.response_mode == Enum__Fast_API__Response__Mode.JSON_BYTES and signature.return_needs_conversion:    # publish the BaseModel schema as response_model (FastAPI doesn't validate Response objects returned by the encoder)
+            wrapper_function.__signature__ = wrapper_function.__signature__.replace(return_annotation=signature.return_converted_type)
+
         if hasattr(function, '__route_path__'):                                         # Also preserve route_path decorator if it exists
             wrapper_function.__route_path__ = function.__route_path__
 
-        if signature.type_safe_conversions or signature.primitive_conversions:
+        if signature.type_safe_conversions or signature.primitive_conversions or signature.stream_conversions:
             wrapper_function.__original_param_types__ = {}
             for param_info in signature.parameters:
                 wrapper_function.__original_param_types__[str(param_info.name)] = param_info.param_type
@@ -46,9 +67,7 @@ class Type_Safe__Route__Wrapper(Type_Safe):                             # Create
                                          signature : Schema__Route__Signature      # Signature info
                                     ) -> Callable:                                 # Returns minimal wrapper that preserves annotations
 
-        @functools.wraps(function)
-        def wrapper(*args, **kwargs):
-            return function(*args, **kwargs)                                        # Simply pass through to the original function
+        wrapper = self.create_route_wrapper(function, signature, convert_kwargs=None, return_converter=None, handler_errors_as_400=False)
 
         wrapper.__signature__ = inspect.signature(function)                         # Preserve the original signature
 
@@ -73,24 +92,11 @@ class Type_Safe__Route__Wrapper(Type_Safe):                             # Create
                                   signature : Schema__Route__Signature      # Signature info
                              ) -> Callable:                                 # Returns wrapper for POST/PUT/DELETE routes
 
-        @functools.wraps(function)
-        def wrapper(**kwargs):
-            converted_kwargs = {}                                           # Convert each parameter
-
-            for param_name, param_value in kwargs.items():
-                converted_value                = self.converter.convert_parameter_value(param_name, param_value, signature)
-                converted_kwargs[param_name]   = converted_value
-
-            try:                                                         # Execute original function
-                result = function(**converted_kwargs)
-            except HTTPException:
-                raise                                                    # Re-raise HTTP exceptions
-            except RequestValidationError:
-                raise                                                    # Re-raise validation errors
-            except Exception as e:
-                raise HTTPException(status_code=400, detail=f"{type(e).__name__}: {e}")
-
-            return self.converter.convert_return_value(result, signature)# Convert return value
+        param_converters = self.compile_param_converters(signature)                 # Conversion plan compiled once, at registration time
+        return_converter = self.compile_return_converter(signature)
+        body_errors      = (ValueError, TypeError) if self.body_mode == Enum__Fast_API__Body__Mode.TYPE_SAFE else ()   # without a BaseModel validating the body first, Type_Safe errors are reported as validation errors
+        convert_kwargs   = self.compile_kwargs_converter(param_converters, 'body', body_errors)
+        wrapper          = self.create_route_wrapper(function, signature, convert_kwargs, return_converter, handler_errors_as_400=True)
 
         new_params              = self.build_wrapper_parameters(function, signature)            # Update function signature for FastAPI
         wrapper.__signature__   = inspect.Signature(parameters=new_params)
@@ -98,41 +104,216 @@ class Type_Safe__Route__Wrapper(Type_Safe):                             # Create
 
         return wrapper
 
+    @type_safe
+    def create_stream_wrapper(self, function  : Callable                ,   # Function to wrap
+                                    signature : Schema__Route__Signature    # Signature info (with one streamed param)
+                               ) -> Callable:                               # Returns wrapper that reads the JSON array body item by item (instead of buffering and validating it as one model)
+        if len(signature.stream_conversions) != 1 or signature.type_safe_conversions:
+            raise ValueError(f"route '{signature.function_name}' can only have one streamed body parameter (and no other body parameters)")
+        (param_name, _), = signature.stream_conversions.items()
+        param_info       = self.converter.find_parameter(signature, param_name)
+        if param_info.is_async_stream and not signature.is_async:
+            raise ValueError(f"AsyncIterator parameter '{param_name}' needs an async def route (use Iterator in def routes)")
+        if not param_info.is_async_stream and (signature.is_async or signature.is_inline):
+            raise ValueError(f"Iterator parameter '{param_name}' needs a def route (use AsyncIterator in async def routes)")
+
+        param_converters = self.converter.compile_param_converters(signature)  # the other (path/query) params
+        convert_params   = self.compile_kwargs_converter(param_converters, 'query', (ValueError, TypeError))
+        stream_items     = self.compile_stream_items(param_name, self.converter.compile_stream_item_decoder(param_info), param_info.is_async_stream)
+
+        def convert_kwargs(kwargs):
+            request = kwargs.pop(STREAM__REQUEST__PARAM)
+            convert_params(kwargs)
+            kwargs[param_name] = stream_items(request)
+
+        return_converter = self.compile_return_converter(signature)
+        wrapper          = self.create_route_wrapper(function, signature, convert_kwargs, return_converter, handler_errors_as_400=True)
+
+        new_params              = self.build_wrapper_parameters(function, signature)
+        wrapper.__signature__   = inspect.Signature(parameters=new_params)
+        wrapper.__annotations__ = self.build_wrapper_annotations(function, signature)
+        wrapper.__openapi_extra__ = self.stream_openapi_extra(param_info.converted_type)    # the body is read by the wrapper, so FastAPI doesn't know its schema
+        return wrapper
+
+    def compile_stream_items(self, param_name   : str      ,                    # Streamed param (for the validation errors loc)
+                                   item_decoder : Callable ,                    # JSON value → Type_Safe item
+                                   is_async     : bool                          # AsyncIterator (event loop) or Iterator (threadpool)
+                              ) -> Callable:                                    # Returns function(request) -> (async) iterator of Type_Safe items
+        def stream_error(parser, error):                                        # same validation error formats as FastAPI (and the body wrapper)
+            if isinstance(error, json.JSONDecodeError):
+                return RequestValidationError([{ 'type' : 'json_invalid'                  ,
+                                                 'loc'  : ('body', error.pos)             ,
+                                                 'msg'  : 'JSON decode error'             ,
+                                                 'input': {}                              ,
+                                                 'ctx'  : {'error': error.msg}            }])
+            return RequestValidationError([{ 'type' : 'value_error'                           ,
+                                             'loc'  : ('body', param_name, parser.items_count),
+                                             'msg'  : str(error)                              ,
+                                             'input': None                                    }])
+
+        if is_async:
+            async def async_stream_items(request):
+                parser = Json__Array__To__Type_Safe(item_decoder=item_decoder)
+                try:
+                    async for item in parser.async_items(request.stream()):
+                        yield item
+                except (ValueError, TypeError) as error:                        # (JSONDecodeError is a ValueError)
+                    raise stream_error(parser, error)
+            return async_stream_items
+
+        def stream_items(request):                                              # def routes run in the threadpool, so the body chunks are pulled from the event loop
+            parser  = Json__Array__To__Type_Safe(item_decoder=item_decoder)
+            body    = request.stream()
+            async def next_chunk():
+                return await body.__anext__()
+            def chunks():
+                while True:
+                    try:
+                        yield anyio.from_thread.run(next_chunk)
+                    except StopAsyncIteration:
+                        return
+            try:
+                yield from parser.items(chunks())
+            except (ValueError, TypeError) as error:
+                raise stream_error(parser, error)
+        return stream_items
+
+    def stream_openapi_extra(self, basemodel_class                             # BaseModel of the streamed items
+                              ) -> dict:                                        # Returns the requestBody (JSON array of items) for the OpenAPI schema
+        with warnings.catch_warnings():                                         # (Type_Safe__Primitive defaults are not JSON serializable, and are left out of the schema)
+            warnings.simplefilter('ignore', PydanticJsonSchemaWarning)
+            schema = basemodel_class.model_json_schema()
+        defs = schema.pop('$defs', {})
+
+        def inline_refs(value, seen):                                           # nested models are inlined (the $defs are not part of the components)
+            if isinstance(value, list):
+                return [inline_refs(item, seen) for item in value]
+            if not isinstance(value, dict):
+                return value
+            ref = value.get('$ref', '')
+            if ref.startswith('#/$defs/'):
+                name = ref[len('#/$defs/'):]
+                if name in seen:                                                # self referencing models
+                    return {'type': 'object', 'title': name}
+                return inline_refs(defs[name], seen | {name})
+            return {key: inline_refs(item, seen) for key, item in value.items()}
+
+        items_schema = inline_refs(schema, {basemodel_class.__name__})
+        return {'requestBody': {'required': True,
+                                'content' : {'application/json': {'schema': {'type': 'array', 'items': items_schema}}}}}
+
     @type_safe
     def create_query_wrapper(self, function  : Callable                 ,       # Function to wrap
                                    signature  : Schema__Route__Signature        # Signature info
                               ) -> Callable:                                    # Returns wrapper for GET routes
 
-        @functools.wraps(function)
-        def wrapper(*args, **kwargs):
-            converted_kwargs   = {}
-            validation_errors  = []
+        param_converters = self.converter.compile_param_converters(signature)  # Conversion plan compiled once, at registration time
+        return_converter = self.compile_return_converter(signature)
+        convert_kwargs   = self.compile_kwargs_converter(param_converters, 'query', (ValueError, TypeError))
+        wrapper          = self.create_route_wrapper(function, signature, convert_kwargs, return_converter, handler_errors_as_400=False)
+
+        new_params              = self.build_wrapper_parameters(function, signature)        # Update function signature
+        wrapper.__signature__   = inspect.Signature(parameters=new_params)
+        wrapper.__annotations__ = self.build_wrapper_annotations(function, signature)
+
+        return wrapper
 
-            for param_name, param_value in kwargs.items():                      # Convert parameters with validation error tracking
+    def compile_kwargs_converter(self, param_converters : tuple ,                   # ((param_name, converter), ...) plan
+                                       error_location   : str   ,                   # 'body' or 'query' (loc of the validation errors)
+                                       param_errors     : tuple                     # Exception types reported as validation errors
+                                  ) -> Callable:                                    # Returns function(kwargs) that converts the params in place
+        def convert_kwargs(kwargs):
+            validation_errors = []
+            for param_name, param_converter in param_converters:                    # Convert only the params that need it
+                if param_name not in kwargs:
+                    continue
+                param_value = kwargs[param_name]
                 try:
-                    converted_value                = self.converter.convert_parameter_value(param_name, param_value, signature)
-                    converted_kwargs[param_name]   = converted_value
-                except (ValueError, TypeError) as e:
-                    validation_errors.append({ 'type' : 'value_error'        ,              # Format as FastAPI validation error
-                                               'loc'  : ('query', param_name),
-                                               'msg'  : str(e)               ,
-                                               'input': param_value          })
-
-            if validation_errors:                                               # Raise validation errors
+                    kwargs[param_name] = param_converter(param_value)
+                except param_errors as e:
+                    validation_errors.append({ 'type' : 'value_error'                  ,    # Format as FastAPI validation error
+                                               'loc'  : (error_location, param_name)   ,
+                                               'msg'  : str(e)                         ,
+                                               'input': param_value                    })
+            if validation_errors:
                 raise RequestValidationError(validation_errors)
 
-            if args:                                                            # Call with positional args if present
-                result = function(*args, **converted_kwargs)
-            else:
-                result = function(**converted_kwargs)
+        return convert_kwargs
+
+    def create_route_wrapper(self, function              : Callable ,               # Function to wrap
+                                   signature             : Schema__Route__Signature,# Signature info (is_async / is_inline)
+                                   convert_kwargs        : Callable ,               # Params converter (or None)
+                                   return_converter      : Callable ,               # Return value converter (or None)
+                                   handler_errors_as_400 : bool                     # Map unexpected handler errors to HTTPException(400)
+                              ) -> Callable:                                        # Returns def wrapper (threadpool) or async def wrapper (event loop)
+
+        if getattr(function, '__route_coalesce__', False):                          # @route_coalesce: concurrent identical calls share one execution (and its converted result)
+            route_coalescer  = Fast_API__Route__Coalescer()
+            function         = route_coalescer.wrap(function, return_converter, signature.is_async)
+            return_converter = None
+            self.route_coalescers[function.__name__] = route_coalescer
+
+        route_cache_config = getattr(function, '__route_cache__', None)
+        if route_cache_config:                                                      # @route_cache: the cache calls the function (and converts and serializes its result) on misses
+            response_type    = signature.return_converted_type if signature.return_needs_conversion else signature.return_type
+            route_cache      = Fast_API__Route__Cache(**route_cache_config)
+            function         = route_cache.wrap(function, return_converter, signature.is_async, response_type)
+            return_converter = None
+            self.route_caches[function.__name__] = route_cache
+
+        def handler_error(error):
+            if handler_errors_as_400 and not isinstance(error, (HTTPException, RequestValidationError)):
+                return HTTPException(status_code=400, detail=f"{type(error).__name__}: {error}")
+            return error
+
+        if signature.is_async:                                                      # async def routes are awaited on the event loop
+            @functools.wraps(function)
+            async def wrapper(*args, **kwargs):
+                if convert_kwargs:
+                    convert_kwargs(kwargs)
+                try:
+                    result = await function(*args, **kwargs)
+                except Exception as error:
+                    raise handler_error(error)
+                return return_converter(result) if return_converter else result
+
+        elif signature.is_inline:                                                   # @route_inline sync routes run on the event loop (no threadpool hop)
+            @functools.wraps(function)
+            async def wrapper(*args, **kwargs):
+                if convert_kwargs:
+                    convert_kwargs(kwargs)
+                try:
+                    result = function(*args, **kwargs)
+                except Exception as error:
+                    raise handler_error(error)
+                return return_converter(result) if return_converter else result
+
+        else:                                                                       # default: FastAPI runs def routes in the threadpool
+            @functools.wraps(function)
+            def wrapper(*args, **kwargs):
+                if convert_kwargs:
+                    convert_kwargs(kwargs)
+                try:
+                    result = function(*args, **kwargs)
+                except Exception as error:
+                    raise handler_error(error)
+                return return_converter(result) if return_converter else result
 
-            return self.converter.convert_return_value(result, signature)# Convert return value
+        return wrapper
 
-        new_params              = self.build_wrapper_parameters(function, signature)        # Update function signature
-        wrapper.__signature__   = inspect.Signature(parameters=new_params)
-        wrapper.__annotations__ = self.build_wrapper_annotations(function, signature)
+    @type_safe
+    def compile_param_converters(self, signature : Schema__Route__Signature         # Signature info
+                                  ) -> tuple:                                       # Returns the params conversion plan for the current body_mode
+        if self.body_mode == Enum__Fast_API__Body__Mode.TYPE_SAFE:
+            return self.converter.compile_param_decoders(signature)
+        return self.converter.compile_param_converters(signature)
 
-        return wrapper
+    @type_safe
+    def compile_return_converter(self, signature : Schema__Route__Signature         # Signature info
+                                  ) -> Callable:                                    # Returns the return value converter for the current response_mode
+        if self.response_mode == Enum__Fast_API__Response__Mode.JSON_BYTES and signature.return_needs_conversion:
+            return self.converter.compile_return_encoder(signature)
+        return self.converter.compile_return_converter(signature)
 
     @type_safe
     def build_wrapper_parameters(self, function  : Callable                 ,       # Original function
@@ -148,11 +329,13 @@ class Type_Safe__Route__Wrapper(Type_Safe):                             # Create
 
             param_info = self.converter.find_parameter(signature, param.name)
 
+            if param_info and param_info.is_stream:                      # Replaced by the Request (added at the end)
+                continue
             if param_info:
                 if param_info.is_primitive:                              # Replace Type_Safe__Primitive with base type
                     new_param_type = param_info.primitive_base
                 elif param_info.is_type_safe:                            # Replace Type_Safe with BaseModel
-                    new_param_type = param_info.converted_type
+                    new_param_type = self.body_param_type(param_info)
                 else:
                     new_param_type = param.annotation
 
@@ -163,8 +346,17 @@ class Type_Safe__Route__Wrapper(Type_Safe):                             # Create
             else:
                 new_params.append(param)                                 # Keep unchanged
 
+        if signature.stream_conversions:                                 # streamed body is read from the Request by the wrapper
+            new_params.append(inspect.Parameter(name       = STREAM__REQUEST__PARAM       ,
+                                                kind       = inspect.Parameter.KEYWORD_ONLY,
+                                                annotation = Request                      ))
         return new_params
 
+    def body_param_type(self, param_info):                                       # Type FastAPI sees for a Type_Safe param
+        if self.body_mode == Enum__Fast_API__Body__Mode.TYPE_SAFE:              # keep the BaseModel for the OpenAPI schema, but get the JSON decoded dict (no BaseModel validation)
+            return Annotated[param_info.converted_type, SkipValidation()]
+        return param_info.converted_type
+
     @type_safe
     def build_wrapper_annotations(self, function  : Callable                 ,  # Original function
                                         signature  : Schema__Route__Signature   # Signature info
@@ -181,11 +373,13 @@ class Type_Safe__Route__Wrapper(Type_Safe):                             # Create
 
             param_info = self.converter.find_parameter(signature, param_name)
 
-            if param_info:
+            if param_info and param_info.is_stream:
+                annotations[STREAM__REQUEST__PARAM] = Request
+            elif param_info:
                 if param_info.is_primitive:
                     annotations[param_name] = param_info.primitive_base
                 elif param_info.is_type_safe:
-                    annotations[param_name] = param_info.converted_type
+                    annotations[param_name] = self.body_param_type(param_info)
                 else:
                     annotations[param_name] = param_type
             else:
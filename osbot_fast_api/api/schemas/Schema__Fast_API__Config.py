@@ -1,18 +1,45 @@
+from typing                                                                     import List
+from osbot_fast_api.api.schemas.enums.Enum__Fast_API__Body__Mode                import Enum__Fast_API__Body__Mode
+from osbot_fast_api.api.schemas.enums.Enum__Fast_API__Response__Mode            import Enum__Fast_API__Response__Mode
+from osbot_fast_api.api.schemas.enums.Enum__Fast_API__Request_Id__Mode          import Enum__Fast_API__Request_Id__Mode
 from osbot_fast_api.api.schemas.safe_str.Safe_Str__Fast_API__Route__Prefix      import Safe_Str__Fast_API__Route__Prefix
 from osbot_fast_api.utils.Version                                               import version__osbot_fast_api
 from osbot_utils.type_safe.primitives.domains.common.safe_str.Safe_Str__Text    import Safe_Str__Text
 from osbot_utils.type_safe.primitives.domains.common.safe_str.Safe_Str__Version import Safe_Str__Version
 from osbot_fast_api.api.schemas.safe_str.Safe_Str__Fast_API__Name               import Safe_Str__Fast_API__Name
 from osbot_utils.type_safe.Type_Safe                                            import Type_Safe
+from osbot_utils.type_safe.primitives.domains.files.safe_str.Safe_Str__File__Path import Safe_Str__File__Path
 
 
 class Schema__Fast_API__Config(Type_Safe):
-    base_path      : Safe_Str__Fast_API__Route__Prefix = '/'
-    add_admin_ui   : bool                              = False
-    docs_offline   : bool                              = True
-    enable_cors    : bool                              = False
-    enable_api_key : bool                              = False
-    default_routes : bool                              = True
-    name           : Safe_Str__Fast_API__Name          = None
-    version        : Safe_Str__Version                 = version__osbot_fast_api
-    description    : Safe_Str__Text                    = None
+    base_path                 : Safe_Str__Fast_API__Route__Prefix = '/'
+    add_admin_ui              : bool                              = False
+    docs_offline              : bool                              = True
+    enable_cors               : bool                              = False
+    enable_api_key            : bool                              = False
+    default_routes            : bool                              = True
+    llm_tools_route           : bool                              = False                                          # Add GET /config/llm-tools to the default routes (tool definitions of all the app's routes, see Type_Safe__To__LLM_Tools)
+    name                      : Safe_Str__Fast_API__Name          = None
+    version                   : Safe_Str__Version                 = version__osbot_fast_api
+    description               : Safe_Str__Text                    = None
+    response_mode             : Enum__Fast_API__Response__Mode    = Enum__Fast_API__Response__Mode.BASEMODEL
+    body_mode                 : Enum__Fast_API__Body__Mode        = Enum__Fast_API__Body__Mode.BASEMODEL
+    lazy_routes               : bool                              = False
+    route_manifest            : Safe_Str__File__Path              = None                                           # JSON file with the cached route analysis (loaded if its fingerprint matches, saved after setup)
+    radix_router              : bool                              = False                                          # Dispatch requests via a prefix trie of the routes' static segments (see Fast_API__Route__Dispatcher)
+    batch_routes              : bool                              = False                                          # Add a POST /batch route to each Fast_API__Routes class (see Fast_API__Route__Batch)
+    batch_max_requests        : int                               = 100                                            # Calls allowed in one /batch request (more: 413)
+    batch_concurrency         : int                               = 10                                             # Calls of a /batch request running at the same time
+    openapi_cache             : bool                              = False                                          # Serve /openapi.json from pre-serialized (and gzip'd) bytes with an ETag (see Fast_API__OpenAPI__Cache)
+    fused_middleware          : bool                              = False                                          # Install the default middlewares as a single pure ASGI layer, instead of a BaseHTTPMiddleware per feature (see Middleware__Fused)
+    request_id_mode           : Enum__Fast_API__Request_Id__Mode  = Enum__Fast_API__Request_Id__Mode.RANDOM_GUID   # How new request ids are generated (see Fast_API__Request_Id)
+    request_id_inbound        : bool                              = False                                          # Reuse the request id sent by the client ('fast-api-request-id' or the 'traceparent' trace id), when valid (opt-in: the client chooses the id)
+    api_keys_file             : Safe_Str__File__Path              = None                                           # JSON file with the (sha256 of the) API keys, tenants and scopes, reloaded when it changes (see Fast_API__API_Keys)
+    rate_limit                : bool                              = False                                          # Token bucket per client (valid API key when enable_api_key is set, else ip), 429 with Retry-After when empty (see Fast_API__Rate_Limiter)
+    rate_limit_per_second     : float                             = 10.0                                           # Requests per second, per client
+    rate_limit_burst          : int                               = 20                                             # Requests allowed at once, per client
+    rate_limit_sqlite         : Safe_Str__File__Path              = None                                           # SQLite file to share the buckets between worker processes (default: in memory, per process)
+    compression               : bool                              = False                                          # gzip the responses (JSON, text, js, ...) for clients that accept it (see Middleware__Compression)
+    compression_min_size      : int                               = 1024                                           # (bytes) smaller responses are not compressed
+    compression_level         : int                               = 6                                              # 1 (fastest) to 9 (smallest)
+    compression_content_types : List[str]                                                                          # Content type prefixes to compress (empty: JSON, text, js, xml and svg, see COMPRESSION__CONTENT_TYPES)
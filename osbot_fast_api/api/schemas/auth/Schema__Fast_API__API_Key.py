@@ -0,0 +1,9 @@
+from typing                                                                     import List
+from osbot_utils.type_safe.Type_Safe                                            import Type_Safe
+
+
+class Schema__Fast_API__API_Key(Type_Safe):                             # API key metadata (the key itself is only stored as its sha256)
+    key_hash                : str                                       # sha256 (hex) of the API key
+    name                    : str                         = None        # i.e. 'acme - ci pipeline'
+    tenant                  : str                         = None        # Tenant the key belongs to
+    scopes                  : List[str]                                 # i.e. ['read', 'write']
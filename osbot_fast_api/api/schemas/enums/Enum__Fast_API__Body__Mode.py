@@ -0,0 +1,6 @@
+from enum import Enum
+
+
+class Enum__Fast_API__Body__Mode(str, Enum):
+    BASEMODEL = "basemodel"                 # JSON → BaseModel (validated by FastAPI) → dict → Type_Safe (default)
+    TYPE_SAFE = "type_safe"                 # JSON → Type_Safe via per-class compiled decoder (no BaseModel instance, Type_Safe does the validation)
@@ -0,0 +1,6 @@
+from enum import Enum
+
+
+class Enum__Fast_API__Request_Id__Mode(str, Enum):
+    RANDOM_GUID = "random_guid"             # uuid4 per request (default)
+    SEQUENTIAL  = "sequential"              # per-process prefix + counter, in guid format (time ordered within a process, no uuid/validation cost)
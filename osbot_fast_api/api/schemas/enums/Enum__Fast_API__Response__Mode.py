@@ -0,0 +1,6 @@
+from enum import Enum
+
+
+class Enum__Fast_API__Response__Mode(str, Enum):
+    BASEMODEL  = "basemodel"                # Type_Safe → BaseModel → dict, then validated and encoded by FastAPI (default)
+    JSON_BYTES = "json_bytes"               # Type_Safe → JSON bytes via per-class compiled encoder (no runtime response validation)
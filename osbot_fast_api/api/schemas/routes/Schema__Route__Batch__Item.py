@@ -0,0 +1,9 @@
+from typing                                                                      import Any
+from osbot_utils.type_safe.Type_Safe                                             import Type_Safe
+
+
+class Schema__Route__Batch__Item(Type_Safe):                            # One call inside a /batch request
+    method : str  = 'GET'                                               # HTTP method
+    path   : str                                                        # Route path, as called directly (i.e. '/items/item/123')
+    params : dict                                                       # Query string params
+    body   : Any  = None                                                # JSON body (None for no body)
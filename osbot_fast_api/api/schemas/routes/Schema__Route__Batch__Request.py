@@ -0,0 +1,8 @@
+from typing                                                                      import List
+from osbot_utils.type_safe.Type_Safe                                             import Type_Safe
+from osbot_fast_api.api.schemas.routes.Schema__Route__Batch__Item                import Schema__Route__Batch__Item
+
+
+class Schema__Route__Batch__Request(Type_Safe):                         # Body of a /batch request
+    requests   : List[Schema__Route__Batch__Item]                       # Calls to make (results are returned in the same order)
+    concurrent : bool = True                                            # Run the calls concurrently (False: one after the other)
@@ -0,0 +1,7 @@
+from typing                                                                      import List
+from osbot_utils.type_safe.Type_Safe                                             import Type_Safe
+from osbot_fast_api.api.schemas.routes.Schema__Route__Batch__Result              import Schema__Route__Batch__Result
+
+
+class Schema__Route__Batch__Response(Type_Safe):                        # Response of a /batch request
+    results : List[Schema__Route__Batch__Result]                        # One result per call (same order as the requests)
@@ -0,0 +1,7 @@
+from typing                                                                      import Any
+from osbot_utils.type_safe.Type_Safe                                             import Type_Safe
+
+
+class Schema__Route__Batch__Result(Type_Safe):                          # Result of one call inside a /batch request
+    status_code : int                                                   # HTTP status the call would have returned
+    body        : Any = None                                            # Response body (JSON decoded, or text for non JSON responses)
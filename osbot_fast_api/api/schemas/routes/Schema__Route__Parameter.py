@@ -13,5 +13,8 @@ class Schema__Route__Parameter(Type_Safe):                              # Repres
     requires_conversion     : bool                        = False       # Needs Type_Safe → BaseModel conversion
     default_value           : Any                         = None        # Default value if provided
     has_default             : bool                        = False       # Whether parameter has default
+    is_stream               : bool                        = False       # Is an Iterator/AsyncIterator of Type_Safe items (JSON array body, decoded item by item)
+    is_async_stream         : bool                        = False       # Is an AsyncIterator/AsyncIterable (items are read with async for)
+    stream_item_type        : Optional[Type]              = None        # Type_Safe class of the streamed items
     # todo: see what is the types we should be using in the dict below
     nested_primitive_fields : dict                        = None        # Map of field_name → primitive_class for Type_Safe classes
\ No newline at end of file
@@ -14,8 +14,11 @@ class Schema__Route__Signature(Type_Safe):                              # Comple
     has_body_params         : bool                        = False       # Has parameters that go in request body
     has_path_params         : bool                        = False       # Has parameters in URL path
     has_query_params        : bool                        = False       # Has query string parameters
+    is_async                : bool                        = False       # Function is a coroutine (async def)
+    is_inline               : bool                        = False       # Sync function marked with @route_inline (runs on the event loop)
     # todo: change these tuple to Type_Safe class (so that we have a strong type on them)
     primitive_conversions   : Dict[str, Tuple[Type,Type]]                          # param_name → (Type_Safe__Primitive, base_type)
     type_safe_conversions   : Dict[str, Tuple[Type,Type]]                          # param_name → (Type_Safe, BaseModel)
+    stream_conversions      : Dict[str, Tuple[Type,Type]]                          # param_name → (Type_Safe item class, BaseModel) for streamed JSON array bodies
     # todo: change this dict to leverage a Type_Safe or Type_Safe__Primitive base classes
     primitive_field_types   : Dict[str, dict ]                          # param_name → {field_name → primitive_class}
\ No newline at end of file
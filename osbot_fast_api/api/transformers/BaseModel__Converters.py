@@ -0,0 +1,62 @@
+from contextlib                                                       import nullcontext
+from typing                                                           import Any, Callable, Optional, Type, get_args
+from osbot_utils.type_safe.type_safe_core.decorators.type_safe        import type_safe
+from pydantic                                                         import BaseModel
+from osbot_fast_api.api.transformers.Compiled__Converters             import Compiled__Converters
+
+
+class BaseModel__Converters(Compiled__Converters):                                      # Compiled BaseModel instance converters, shared by BaseModel__To__Type_Safe and BaseModel__To__Dataclass (which provide convert_class)
+
+    @type_safe
+    def convert_instances(self, basemodel_instances : list                              # BaseModel instances to convert (i.e. rows from an upstream service)
+                           ) -> list:                                                   # Returns converted instances (same order)
+        converters = {}                                                                 # (local lookup, most lists hold a single class)
+        results    = []
+        with self.convert_instances__context():
+            for basemodel_instance in basemodel_instances:
+                basemodel_class = basemodel_instance.__class__
+                converter       = converters.get(basemodel_class)
+                if converter is None:
+                    if not issubclass(basemodel_class, BaseModel):
+                        raise ValueError(f"Items of 'basemodel_instances' expected type {BaseModel}, but got {basemodel_class}")
+                    converter = converters[basemodel_class] = self.converter_for_class(basemodel_class)
+                results.append(converter(basemodel_instance))
+        return results
+
+    def convert_instances__context(self):                                               # Context used while converting (i.e. to skip validations)
+        return nullcontext()
+
+    def compile_converter(self, basemodel_class : Type[BaseModel]                       # BaseModel class to compile converter for
+                           ) -> Callable:                                               # Returns generated function with the field names baked in (no model_dump, no per field introspection)
+        target_class = self.convert_class(basemodel_class)
+        kwargs       = []
+        for field_name, field_info in basemodel_class.model_fields.items():
+            if self.field_uses_to_value(field_info.annotation):
+                kwargs.append(f"{field_name}=to_value(instance.{field_name})")
+            else:                                                                       # everything else is handled by the target class constructor
+                kwargs.append(f"{field_name}=instance.{field_name}")
+        source = f"def convert(instance):\n    return target_class({', '.join(kwargs)})\n"
+        return self.compile_function(source, 'convert', f"convert__{basemodel_class.__name__}", target_class=target_class, to_value=self.to_value)
+
+    def field_uses_to_value(self, annotation : Any                                      # Field annotation
+                             ) -> bool:                                                 # Returns True if the field's values go through to_value
+        return self.has_basemodel(annotation)                                           # nested models (at any depth)
+
+    def has_basemodel(self, annotation : Any                                            # Field annotation to check
+                       ) -> bool:                                                       # Returns True if a BaseModel class is used (at any depth)
+        if isinstance(annotation, type) and issubclass(annotation, BaseModel):
+            return True
+        return any(self.has_basemodel(arg) for arg in get_args(annotation))
+
+    def compile_value_converter(self, value_type : type                                 # Type of the value to convert
+                                 ) -> Optional[Callable]:                               # Returns converter for values of this type (None: used as-is)
+        to_value = self.to_value
+        if issubclass(value_type, BaseModel):
+            return self.converter_for_class(value_type)
+        if issubclass(value_type, list):
+            return lambda items: [to_value(item) for item in items]
+        if issubclass(value_type, dict):
+            return lambda items: {key: to_value(item) for key, item in items.items()}
+        if issubclass(value_type, set):
+            return lambda items: {to_value(item) for item in items}
+        return None
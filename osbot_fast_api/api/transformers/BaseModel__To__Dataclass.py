@@ -3,12 +3,12 @@ from typing                                              import Type, Dict, Any,
 from osbot_utils.type_safe.type_safe_core.decorators.type_safe          import type_safe
 from pydantic                                            import BaseModel
 from pydantic_core                                       import PydanticUndefined
-from osbot_utils.type_safe.Type_Safe                     import Type_Safe
 from osbot_utils.type_safe.type_safe_core.shared.Type_Safe__Cache       import type_safe_cache
+from osbot_fast_api.api.transformers.BaseModel__Converters       import BaseModel__Converters
 
 
-class BaseModel__To__Dataclass(Type_Safe):
-    class_cache: Dict[Type[BaseModel], Type]                                             # Cache for generated dataclasses
+class BaseModel__To__Dataclass(BaseModel__Converters):                                   # (convert_instances and the compiled converters are in BaseModel__Converters)
+    class_cache     : Dict[Type[BaseModel], Type]                                        # Cache for generated dataclasses
 
     @type_safe
     def convert_class(self, basemodel_class : Type[BaseModel]                            # BaseModel class to convert
@@ -78,6 +78,10 @@ class BaseModel__To__Dataclass(Type_Safe):
             filtered_data = {k: v for k, v in instance_data.items() if k in valid_fields}
             return dataclass_type(**filtered_data)
 
+    def field_uses_to_value(self, annotation : Any                                       # Field annotation
+                             ) -> bool:                                                  # nested models and typed collections (copied, like extract_basemodel_data) → to_value
+        return self.has_basemodel(annotation) or type_safe_cache.get_origin(annotation) in (list, dict, set)
+
     def convert_field_type(self, pydantic_type : Any                                     # Pydantic type to convert
                             ) -> Any:                                                    # Returns dataclass-compatible type
         origin = type_safe_cache.get_origin(pydantic_type)
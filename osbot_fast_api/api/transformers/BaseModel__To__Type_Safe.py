@@ -1,15 +1,17 @@
 from typing                                                                     import Type, Dict, Any, Optional, get_args, Union, List
 from osbot_utils.type_safe.Type_Safe__Primitive                                 import Type_Safe__Primitive
+from osbot_utils.type_safe.type_safe_core.config.Type_Safe__Config              import Type_Safe__Config
 from osbot_utils.type_safe.type_safe_core.decorators.type_safe                  import type_safe
 from osbot_utils.type_safe.type_safe_core.shared.Type_Safe__Shared__Variables   import IMMUTABLE_TYPES
 from pydantic                                                                   import BaseModel
 from pydantic_core                                                              import PydanticUndefined
 from osbot_utils.type_safe.Type_Safe                                            import Type_Safe
 from osbot_utils.type_safe.type_safe_core.shared.Type_Safe__Cache               import type_safe_cache
+from osbot_fast_api.api.transformers.BaseModel__Converters                       import BaseModel__Converters
 
 
-class BaseModel__To__Type_Safe(Type_Safe):
-    class_cache: Dict[Type[BaseModel], Type[Type_Safe]]                                  # Cache for mapped classes
+class BaseModel__To__Type_Safe(BaseModel__Converters):                                   # (convert_instances and the compiled converters are in BaseModel__Converters)
+    class_cache     : Dict[Type[BaseModel], Type[Type_Safe]]                             # Cache for mapped classes
 
     @type_safe
     def convert_class(self, basemodel_class : Type[BaseModel]                            # BaseModel class to convert
@@ -71,6 +73,9 @@ class BaseModel__To__Type_Safe(Type_Safe):
 
         return instance
 
+    def convert_instances__context(self):                                                # values were already validated by Pydantic (collections are still converted to Type_Safe collections)
+        return Type_Safe__Config(skip_validation=True)
+
     def is_immutable_default(self, value : Any                                           # Value to check
                             ) -> bool:                                                   # Returns True if immutable
         """Check if a value is safe to use as a class-level default in Type_Safe."""
@@ -0,0 +1,43 @@
+from typing                                                           import Any, Callable, Optional
+from osbot_utils.type_safe.Type_Safe                                  import Type_Safe
+
+
+class Compiled__Converters(Type_Safe):                                                  # Base of the transformers that compile one converter function per class (and pick one converter per value type)
+    converter_cache : dict                                                              # class → compiled converter function (plain dict, so the cached functions are returned by identity)
+    value_cache     : dict                                                              # value type → converter used by to_value (None: value used as-is)
+
+    def converter_for_class(self, source_class : type                                   # Class to compile converter for
+                             ) -> Callable:                                             # Returns function(instance) -> converted instance
+        converter = self.converter_cache.get(source_class)
+        if converter is None:
+            converter = self.compile_converter(source_class)
+            self.converter_cache[source_class] = converter
+        return converter
+
+    def compile_converter(self, source_class : type                                     # Class to compile converter for
+                           ) -> Callable:                                               # Returns generated function with the field names baked in
+        raise NotImplementedError()
+
+    def compile_function(self, source        : str  ,                                   # Source code of the function
+                               function_name : str  ,                                   # Name of the function defined in source
+                               qualname      : str  ,                                   # Name shown in tracebacks and profiles
+                               **namespace                                              # Globals used by the function
+                          ) -> Callable:                                                # Returns the function defined in source
+        exec(source, namespace)
+        function              = namespace[function_name]
+        function.__qualname__ = qualname
+        return function
+
+    def to_value(self, value : Any                                                      # Field (or item) value
+                  ) -> Any:                                                             # Returns converted value
+        value_type = value.__class__
+        try:
+            converter = self.value_cache[value_type]
+        except KeyError:
+            converter = self.compile_value_converter(value_type)
+            self.value_cache[value_type] = converter
+        return converter(value) if converter else value
+
+    def compile_value_converter(self, value_type : type                                 # Type of the value to convert
+                                 ) -> Optional[Callable]:                               # Returns converter for values of this type (None: used as-is)
+        return None
@@ -0,0 +1,98 @@
+import codecs
+import json
+from typing                                                                     import Callable, Iterable, AsyncIterable, Iterator, AsyncIterator
+from osbot_utils.type_safe.Type_Safe                                            import Type_Safe
+
+STATE__START        = 'start'                                                           # expecting '['
+STATE__FIRST_ITEM   = 'first_item'                                                      # expecting an item or ']'
+STATE__ITEM         = 'item'                                                            # expecting an item (after ',')
+STATE__COMMA_OR_END = 'comma_or_end'                                                    # expecting ',' or ']'
+STATE__END          = 'end'                                                             # array closed (only whitespace allowed)
+JSON_WHITESPACE     = ' \t\n\r'
+
+
+class Json__Array__To__Type_Safe(Type_Safe):                                            # Incremental decoder of a JSON array (i.e. a streamed request body) into Type_Safe items, one item at a time
+    item_decoder : Callable = None                                                      # function(JSON value) -> Type_Safe item
+    buffer       : str                                                                  # text received but not parsed yet (at most one partial item)
+    state        : str      = STATE__START
+    items_count  : int                                                                  # items decoded so far (i.e. the index of the item being decoded)
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        object.__setattr__(self, 'utf8_decoder', codecs.getincrementaldecoder('utf-8')())  # (not a Type_Safe field: keeps the state of multi-byte chars split across chunks)
+        object.__setattr__(self, 'json_decoder', json.JSONDecoder())
+
+    def feed(self, chunk : bytes                                                        # Next chunk of the body
+              ) -> list:                                                                # Returns the items completed by this chunk
+        return self.parse(self.buffer + self.utf8_decoder.decode(chunk), final=False)
+
+    def close(self) -> list:                                                            # End of the body: returns the last items (raises JSONDecodeError if the array is incomplete)
+        items = self.parse(self.buffer + self.utf8_decoder.decode(b'', final=True), final=True)
+        if self.state != STATE__END:
+            raise json.JSONDecodeError('Expecting value' if self.state != STATE__COMMA_OR_END else "Expecting ',' delimiter", self.buffer, len(self.buffer))
+        return items
+
+    def parse(self, text  : str ,                                                       # Buffered text plus the new chunk
+                    final : bool                                                        # No more data is coming
+               ) -> list:
+        raw_decode   = self.json_decoder.raw_decode
+        item_decoder = self.item_decoder
+        state        = self.state
+        items_count  = self.items_count
+        items        = []
+        position     = 0
+        size         = len(text)
+        try:
+            while True:
+                while position < size and text[position] in JSON_WHITESPACE:
+                    position += 1
+                if position == size:
+                    break
+                char = text[position]
+                if state == STATE__START:
+                    if char != '[':
+                        raise json.JSONDecodeError('Expecting array', text, position)
+                    position += 1
+                    state     = STATE__FIRST_ITEM
+                elif state == STATE__COMMA_OR_END or (state == STATE__FIRST_ITEM and char == ']'):
+                    if char == ']':
+                        state = STATE__END
+                    elif char == ',':
+                        state = STATE__ITEM
+                    else:
+                        raise json.JSONDecodeError("Expecting ',' delimiter", text, position)
+                    position += 1
+                elif state == STATE__END:
+                    raise json.JSONDecodeError('Extra data', text, position)
+                else:
+                    try:
+                        value, end = raw_decode(text, position)
+                    except json.JSONDecodeError:
+                        if final:
+                            raise
+                        break                                                           # item not complete yet (or invalid, which close() will report)
+                    if end == size and not final:                                       # a number (or literal) might continue in the next chunk
+                        break
+                    items.append(item_decoder(value) if item_decoder else value)        # (if the item_decoder raises, items_count is the index of that item)
+                    items_count += 1
+                    position = end
+                    state    = STATE__COMMA_OR_END
+        finally:
+            self.buffer      = text[position:]
+            self.state       = state
+            self.items_count = items_count
+        return items
+
+    def items(self, chunks : Iterable[bytes]                                            # Body chunks (i.e. from a sync stream)
+               ) -> Iterator[Type_Safe]:                                                # Yields the decoded items as soon as they are complete
+        for chunk in chunks:
+            yield from self.feed(chunk)
+        yield from self.close()
+
+    async def async_items(self, chunks : AsyncIterable[bytes]                           # Body chunks (i.e. request.stream())
+                           ) -> AsyncIterator[Type_Safe]:                               # Yields the decoded items as soon as they are complete
+        async for chunk in chunks:
+            for item in self.feed(chunk):
+                yield item
+        for item in self.close():
+            yield item
@@ -0,0 +1,182 @@
+import json
+from enum                                                                       import Enum
+from typing                                                                     import Type, Callable, Optional, Union, ForwardRef, get_origin, get_args
+from osbot_utils.type_safe.Type_Safe                                            import Type_Safe
+from osbot_utils.type_safe.Type_Safe__Primitive                                 import Type_Safe__Primitive
+from osbot_utils.type_safe.type_safe_core.collections.Type_Safe__Dict           import Type_Safe__Dict
+from osbot_utils.type_safe.type_safe_core.collections.Type_Safe__List           import Type_Safe__List
+from osbot_utils.type_safe.type_safe_core.shared.Type_Safe__Cache               import type_safe_cache
+
+MISSING = object()                                                                      # marker for class attributes that don't exist
+
+
+class Json__To__Type_Safe(Type_Safe):                                                   # Decodes JSON data straight into Type_Safe instances (no BaseModel validation step)
+    decoder_cache : dict                                                                # Type_Safe class → compiled decoder or None (plain dict, so the cached functions are returned by identity)
+
+    def decoder_for_class(self, type_safe_class : Type[Type_Safe]                       # Class to compile decoder for
+                           ) -> Optional[Callable]:                                     # Returns function(data) -> instance, or None if the class is not supported
+        if type_safe_class not in self.decoder_cache:
+            self.decoder_cache[type_safe_class] = None                                  # placeholder, so that self-referencing classes don't recurse forever
+            self.decoder_cache[type_safe_class] = self.compile_decoder(type_safe_class)
+        return self.decoder_cache[type_safe_class]
+
+    def compile_decoder(self, type_safe_class : Type[Type_Safe]                         # Class to compile decoder for
+                         ) -> Optional[Callable]:                                       # Returns decoder that raises on any value it can't map 1:1, or None
+        if type_safe_class.__init__     is not Type_Safe.__init__    :                  # custom constructors / setters have their own logic, so they always take the Type_Safe path
+            return None
+        if type_safe_class.__setattr__  is not Type_Safe.__setattr__ :
+            return None
+
+        field_decoders = {}
+        for field_name, field_type in type_safe_cache.get_class_annotations(type_safe_class):
+            field_decoder = self.compile_field_decoder(field_type, type_safe_class)
+            if field_decoder is None:
+                return None
+            field_decoders[field_name] = field_decoder
+
+        fields      = []                                                                # (field_name, field_decoder, factory_type) in the order Type_Safe.__init__ assigns them
+        annotations = dict(type_safe_cache.get_class_annotations(type_safe_class))
+        for field_name, default_value in type_safe_class.__cls_kwargs__().items():
+            if field_name not in annotations:
+                return None
+            class_value = getattr(type_safe_class, field_name, MISSING)
+            if class_value is not MISSING and (class_value is default_value or class_value == default_value):
+                factory_type = None                                                     # class level default (read from the class when decoding, i.e. the value Type_Safe.__init__ would assign)
+            else:
+                factory_type = annotations[field_name]                                  # default created per instance (collections, Safe_Id, nested objects, ...)
+            fields.append((field_name, field_decoders[field_name], factory_type))
+
+        field_names     = frozenset(field_name for field_name, _, _ in fields)
+        default_factory = type_safe_class.__default__value__
+        new_instance    = object.__new__
+
+        def decode(data):
+            if not field_names.issuperset(data):
+                raise KeyError('unknown field')                                         # (Type_Safe reports which one)
+            values = {}
+            for field_name, field_decoder, factory_type in fields:
+                field_value = data.get(field_name)
+                if field_value is not None:
+                    values[field_name] = field_decoder(field_value)
+                elif factory_type is None:                                              # missing fields get the class defaults (None doesn't override defaults in Type_Safe either)
+                    values[field_name] = getattr(type_safe_class, field_name)
+                else:
+                    values[field_name] = default_factory(factory_type)
+            instance = new_instance(type_safe_class)
+            object.__setattr__(instance, '__dict__', values)
+            return instance
+
+        decode.__qualname__ = f"decode__{type_safe_class.__name__}"
+        return decode
+
+    def compile_field_decoder(self, field_type                 ,                        # Annotation to compile the value decoder for
+                                    owner_class : Type = None                           # Class that has the field (for List['Self'] forward refs)
+                               ) -> Optional[Callable]:                                 # Returns function(value) -> Type_Safe value (raises on mismatch), or None if not supported
+        origin = get_origin(field_type)
+
+        if field_type in (str, int, bool):
+            def decode_exact(value):
+                if type(value) is not field_type:
+                    raise TypeError(f"expected {field_type.__name__}")
+                return value
+            return decode_exact
+
+        if field_type is float:
+            def decode_float(value):                                                    # Type_Safe keeps ints assigned to float fields as they are
+                if type(value) is not float and type(value) is not int:
+                    raise TypeError("expected float")
+                return value
+            return decode_float
+
+        if isinstance(field_type, type) and issubclass(field_type, Type_Safe__Primitive):
+            primitive_base = field_type.__primitive_base__ or str
+            def decode_primitive(value):
+                if type(value) is not primitive_base:
+                    raise TypeError(f"expected {primitive_base.__name__}")
+                return field_type(value)
+            return decode_primitive
+
+        if isinstance(field_type, type) and issubclass(field_type, Enum):
+            members       = field_type.__members__
+            value_to_enum = field_type._value2member_map_
+            def decode_enum(value):                                                     # same lookup order as Type_Safe: by name first, then by value
+                if type(value) is not str:
+                    raise TypeError(f"expected {field_type.__name__}")
+                if value in members:
+                    return members[value]
+                return value_to_enum[value]
+            return decode_enum
+
+        if isinstance(field_type, type) and issubclass(field_type, Type_Safe):
+            if issubclass(field_type, (Type_Safe__List, Type_Safe__Dict)):
+                return None
+            self.decoder_for_class(field_type)                                          # compiled now, looked up per call (the class might be referencing itself)
+            def decode_nested(value):
+                if type(value) is not dict:
+                    raise TypeError(f"expected {field_type.__name__}")
+                nested_decoder = self.decoder_cache.get(field_type)
+                if nested_decoder is None:
+                    raise TypeError(f"{field_type.__name__} is not supported")
+                return nested_decoder(value)
+            return decode_nested
+
+        if origin is Union:                                                             # Optional[T] (None values never reach the decoders)
+            args = [arg for arg in get_args(field_type) if arg is not type(None)]
+            if len(args) != 1 or len(get_args(field_type)) != 2:
+                return None
+            if not (isinstance(args[0], type) and issubclass(args[0], Type_Safe)) and args[0] not in (str, int, bool):
+                return None
+            return self.compile_field_decoder(args[0], owner_class)
+
+        if origin is list:
+            (item_type,) = get_args(field_type) or (None,)
+            if isinstance(item_type, ForwardRef) and owner_class and item_type.__forward_arg__ == owner_class.__name__:
+                item_type = owner_class                                                 # same self reference resolution as Type_Safe
+            item_decoder = self.compile_field_decoder(item_type, owner_class) if item_type is not None else None
+            if item_decoder is None:
+                return None
+            def decode_list(value):
+                if type(value) is not list:
+                    raise TypeError("expected list")
+                type_safe_list = Type_Safe__List(expected_type=item_type)
+                list.extend(type_safe_list, [item_decoder(item) for item in value])
+                return type_safe_list
+            return decode_list
+
+        if origin is dict:
+            key_type, value_type = get_args(field_type) or (None, None)
+            if get_origin(value_type) in (list, set, tuple, dict):                      # nested collections have their own conversion rules in Type_Safe
+                return None
+            key_decoder   = self.compile_field_decoder(key_type  , owner_class) if key_type   is not None else None
+            value_decoder = self.compile_field_decoder(value_type, owner_class) if value_type is not None else None
+            if key_decoder is None or value_decoder is None:
+                return None
+            def decode_dict(value):
+                if type(value) is not dict:
+                    raise TypeError("expected dict")
+                type_safe_dict = Type_Safe__Dict(expected_key_type=key_type, expected_value_type=value_type)
+                for item_key, item_value in value.items():
+                    dict.__setitem__(type_safe_dict, key_decoder(item_key), value_decoder(item_value))
+                return type_safe_dict
+            return decode_dict
+
+        return None                                                                     # Any, Set, Tuple, Type, Decimal, forward refs, ...
+
+    def decode(self, type_safe_class : Type[Type_Safe] ,                                # Class to create
+                     data            : dict                                             # JSON decoded data
+                ) -> Type_Safe:                                                         # Returns Type_Safe instance (same result and errors as type_safe_class(**data))
+        decoder = self.decoder_for_class(type_safe_class)
+        if decoder is not None and type(data) is dict:
+            try:
+                return decoder(data)
+            except Exception:                                                           # anything unexpected (wrong types, unknown fields, ...) is handled by Type_Safe itself
+                pass
+        return type_safe_class(**data)
+
+    def from_bytes(self, type_safe_class : Type[Type_Safe] ,                            # Class to create
+                         json_bytes      : bytes                                        # Raw JSON (i.e. request body)
+                    ) -> Type_Safe:
+        return self.decode(type_safe_class, json.loads(json_bytes))
+
+
+json__to__type_safe = Json__To__Type_Safe()                                             # Singleton instance (shared decoder_cache)
@@ -69,6 +69,9 @@ class OpenAPI__To__Python(Type_Safe):
         content  = self._render_client(ir, raw_spec=spec)
         return content
 
+    def spec_hash(self, spec: dict) -> str:                                         # Stable hash of the normalized spec (same spec → same generated client)
+        return hashlib.sha1(json.dumps(spec, sort_keys=True, separators=(',', ':')).encode()).hexdigest()
+
     # ------------- IR building -------------
 
     def _build_ir(self, spec: dict) -> IR_Spec:
@@ -77,8 +80,7 @@ class OpenAPI__To__Python(Type_Safe):
         servers   = [IR_Server(url=Safe_Str(s.get('url', '/')), variables=s.get('variables', {}))
                      for s in spec.get('servers', [])] or [IR_Server(url=Safe_Str('/'))]
 
-        # Compute stable hash of normalized spec
-        spec_hash = hashlib.sha1(json.dumps(spec, sort_keys=True, separators=(',', ':')).encode()).hexdigest()
+        spec_hash = self.spec_hash(spec)
 
         ops: List[IR_Operation] = []
         paths = spec.get('paths', {})
@@ -1,4 +1,4 @@
-from typing                                                           import Type, Dict, Any, Optional, get_args, Union, List
+from typing                                                           import Type, Dict, Any, Optional, get_args, Union, List, Callable
 from osbot_utils.type_safe.Type_Safe__Primitive                       import Type_Safe__Primitive
 from osbot_utils.type_safe.type_safe_core.collections.Type_Safe__Dict import Type_Safe__Dict
 from osbot_utils.type_safe.type_safe_core.collections.Type_Safe__List import Type_Safe__List
@@ -7,10 +7,14 @@ from osbot_utils.type_safe.type_safe_core.decorators.type_safe        import typ
 from pydantic                                                         import BaseModel, Field, create_model
 from osbot_utils.type_safe.Type_Safe                                  import Type_Safe
 from osbot_utils.type_safe.type_safe_core.shared.Type_Safe__Cache     import type_safe_cache
+from osbot_fast_api.api.transformers.Compiled__Converters             import Compiled__Converters
 
 
-class Type_Safe__To__BaseModel(Type_Safe):
-    model_cache: Dict[Type, Type[BaseModel]]                                        # Cache for generated models
+PLAIN_VALUE_TYPES = (str, int, float, bool, type(None))                                 # values used as-is by the compiled to_dict functions
+
+
+class Type_Safe__To__BaseModel(Compiled__Converters):                              # (converter_cache has the compiled to_dict functions, see Compiled__Converters)
+    model_cache   : Dict[Type, Type[BaseModel]]                                     # Cache for generated models
 
     @type_safe
     def convert_class(self, type_safe_class: Type[Type_Safe]                        # Type_Safe class to convert
@@ -55,7 +59,7 @@ class Type_Safe__To__BaseModel(Type_Safe):
     def convert_instance(self, type_safe_instance: Type_Safe                # Type_Safe instance to convert
                           ) -> BaseModel:                                   # Returns BaseModel instance
         base_model_class = self.convert_class(type(type_safe_instance))     # Get or create BaseModel class
-        instance_data    = self.extract_instance_data(type_safe_instance)   # Get instance data
+        instance_data    = self.to_dict(type_safe_instance)                 # Get instance data (plain dicts at all depths, validated once by the BaseModel)
         return base_model_class(**instance_data)                            # Create and return BaseModel
 
     def convert_type(self, type_safe_type: Any                              # Type annotation to convert
@@ -114,56 +118,50 @@ class Type_Safe__To__BaseModel(Type_Safe):
 
     def extract_instance_data(self, type_safe_instance: Type_Safe                       # Instance to extract data from
                                ) -> Dict[str, Any]:                                     # Returns dict of instance data
-        data = {}
-        instance_locals = type_safe_instance.__locals__()                               # Get all fields from instance
-
-        for field_name, field_value in instance_locals.items():
-            if isinstance(field_value, Type_Safe__Primitive):                           # Convert Type_Safe__Primitive to its base type value
-                data[field_name] = field_value.__primitive_base__(field_value)
-            elif isinstance(field_value, Type_Safe__List):                                # Convert Type_Safe collections
-                data[field_name] = self.convert_list(field_value)
-            elif isinstance(field_value, Type_Safe__Dict):
-                data[field_name] = self.convert_dict(field_value)
-            elif isinstance(field_value, Type_Safe__Set):
-                data[field_name] = list(field_value)                                    # Convert to list for Pydantic
-            elif isinstance(field_value, Type_Safe):
-                data[field_name] = self.convert_instance(field_value).model_dump()      # Recursively convert nested
-            else:
-                data[field_name] = field_value
-
-        return data
+        return self.to_dict(type_safe_instance)
+
+    def to_dict(self, type_safe_instance: Type_Safe                                     # Instance to convert
+                 ) -> Dict[str, Any]:                                                   # Returns plain dict (at all depths) with primitives mapped to their base types
+        return self.converter_for_class(type(type_safe_instance))(type_safe_instance)
+
+    def compile_converter(self, type_safe_class: Type[Type_Safe]                        # Class to compile to_dict for
+                           ) -> Callable:                                               # Returns generated to_dict function with the field names baked in (single pass, no BaseModel per level)
+        field_names = [field_name for field_name, _ in type_safe_cache.get_class_annotations(type_safe_class)]
+        items       = ', '.join(f"{field_name!r}: to_value(instance.{field_name})" for field_name in field_names)
+        source      = f"def to_dict(instance):\n    return {{{items}}}\n"
+        return self.compile_function(source, 'to_dict', f"to_dict__{type_safe_class.__name__}", to_value=self.to_value)
+
+    def compile_value_converter(self, value_type: type                                  # Type of the value to convert
+                                 ) -> Optional[Callable]:                               # Returns converter for values of this type (None: used as-is)
+        if value_type in PLAIN_VALUE_TYPES:
+            return None
+        to_value = self.to_value
+        if issubclass(value_type, Type_Safe__Primitive):                                # primitives → their base type (None for other bases, i.e. Decimal: handled by Pydantic)
+            return value_type.__primitive_base__ or next((base for base in value_type.__mro__ if base in PLAIN_VALUE_TYPES), None)
+        if issubclass(value_type, Type_Safe):                                           # nested objects → their compiled to_dict
+            return self.converter_for_class(value_type)
+        if issubclass(value_type, (list, tuple)):                                       # (including Type_Safe__List)
+            return lambda items: [to_value(item) for item in items]
+        if issubclass(value_type, dict):                                                # (including Type_Safe__Dict)
+            to_key = self.to_key
+            return lambda items: {to_key(key): to_value(item) for key, item in items.items()}
+        if issubclass(value_type, (set, frozenset)):                                    # (including Type_Safe__Set) Pydantic uses lists for sets
+            return lambda items: [to_value(item) for item in items]
+        return None                                                                     # enums, datetimes, ... (handled by Pydantic)
+
+    def to_key(self, key: Any                                                           # Dict key
+                ) -> Any:                                                               # Returns hashable plain key (Type_Safe keys use their str value)
+        if isinstance(key, Type_Safe):
+            return str(key)
+        return self.to_value(key)
 
     def convert_list(self, type_safe_list: Type_Safe__List                              # List to convert
                       ) -> list:                                                        # Returns regular list
-        result = []
-        for item in type_safe_list:
-            if isinstance(item, Type_Safe):
-                result.append(self.convert_instance(item).dict())
-            elif isinstance(item, Type_Safe__List):
-                result.append(self.convert_list(item))
-            elif isinstance(item, Type_Safe__Dict):
-                result.append(self.convert_dict(item))
-            else:
-                result.append(item)
-        return result
+        return [self.to_value(item) for item in type_safe_list]
 
     def convert_dict(self, type_safe_dict: Type_Safe__Dict                              # Dict to convert
                       ) -> dict:                                                        # Returns regular dict
-        result = {}
-        for key, value in type_safe_dict.items():
-            if isinstance(key, Type_Safe):                                              # Convert key if needed
-                key = str(key)                                                          # Simple string conversion
-
-            if isinstance(value, Type_Safe):                                            # Convert value
-                result[key] = self.convert_instance(value).model_dump()
-            elif isinstance(value, Type_Safe__List):
-                result[key] = self.convert_list(value)
-            elif isinstance(value, Type_Safe__Dict):
-                result[key] = self.convert_dict(value)
-            else:
-                result[key] = value
-
-        return result
+        return {self.to_key(key): self.to_value(value) for key, value in type_safe_dict.items()}
 
     def normalize_default_value(self, value: Any                                   # Default value to normalize
                                   ) -> Any:                                         # Returns normalized value
@@ -1,4 +1,6 @@
-from typing                                                         import Type, Dict, Any, get_args, Union, Optional, Tuple
+import copy
+import inspect
+from typing                                                         import Type, Dict, Any, get_args, get_type_hints, Union, Optional, Tuple
 from osbot_utils.type_safe.Type_Safe                                import Type_Safe
 from osbot_utils.type_safe.Type_Safe__Primitive                     import Type_Safe__Primitive
 from osbot_utils.type_safe.primitives.core.Safe_Str                 import Safe_Str
@@ -6,33 +8,42 @@ from osbot_utils.type_safe.primitives.core.Safe_Int                 import Safe_
 from osbot_utils.type_safe.primitives.core.Safe_Float               import Safe_Float
 from osbot_utils.type_safe.type_safe_core.decorators.type_safe      import type_safe
 from osbot_utils.type_safe.type_safe_core.shared.Type_Safe__Cache   import type_safe_cache
+from osbot_fast_api.utils.Frozen_Dict                               import freeze
 
 
 class Type_Safe__To__Json(Type_Safe):       # Converts Type_Safe classes to JSON Schema (draft-07 compatible)
-    schema_cache     : Dict[Tuple[Type, bool], Dict[str, Any]]
+    schema_cache     : dict                                                     # (class, is_nested, title, description, include_defaults, strict_mode) → frozen schema (plain dict, so the cached schemas are returned by identity)
+    field_cache      : dict                                                     # (field type, include_defaults, strict_mode)           → frozen schema
     include_defaults : bool = True
     include_examples : bool = False
     strict_mode      : bool = False                                             # If True, includes all Type_Safe constraints
 
-    # todo: the @type_safe here breaks some of the cache behaviour below since the @type_safe will
-    #       convert the Dict to Type_Safe__Dict which means the returned objects are not the same (but from the cached value, so the performance implications might not be that big)
-    #       (see if this has any side effects or main performance implications)
     @type_safe
     def convert_class(self, type_safe_class : Type[Type_Safe]        ,          # Type_Safe class to convert
                             title           : str             = None ,          # Optional schema title
                             description     : str             = None ,          # Optional schema description
                             is_nested       : bool            = False
-                       ) -> Dict[str, Any]:                                     # Returns JSON Schema
+                       ) -> dict:                                               # Returns JSON Schema (mutable copy of the cached schema)
+        return copy.deepcopy(self.convert_class__frozen(type_safe_class, title, description, is_nested))
 
+    @type_safe
+    def convert_class__frozen(self, type_safe_class : Type[Type_Safe]        ,  # Type_Safe class to convert
+                                    title           : str             = None ,  # Optional schema title
+                                    description     : str             = None ,  # Optional schema description
+                                    is_nested       : bool            = False
+                               ) -> dict:                                       # Returns JSON Schema (read-only and shared: use convert_class for a mutable copy)
+        cache_key = (type_safe_class, is_nested, title, description, self.include_defaults, self.strict_mode)
+        schema    = self.schema_cache.get(cache_key)
+        if schema is None:
+            schema = freeze(self.build_class_schema(type_safe_class, title, description, is_nested))
+            self.schema_cache[cache_key] = schema
+        return schema
 
-        cache_key = (type_safe_class, is_nested)                                            # Create a cache key that includes whether it's nested
-
-        if cache_key in self.schema_cache:
-            return self.schema_cache[cache_key]
-
-        if type_safe_class in self.schema_cache:                                            # Check cache first
-            return self.schema_cache[type_safe_class]
-
+    def build_class_schema(self, type_safe_class : Type[Type_Safe],               # Type_Safe class to convert
+                                 title           : str            ,               # Optional schema title
+                                 description     : str            ,               # Optional schema description
+                                 is_nested       : bool                           # Nested schemas have no $schema
+                            ) -> dict:                                            # Returns new (mutable) schema, that shares the (frozen) field schemas
         schema = { "type"                 : "object"                                  ,
                    "title"                : title or type_safe_class.__name__         ,
                    "additionalProperties" : False                                     }     # Type_Safe classes are strict
@@ -48,15 +59,14 @@ class Type_Safe__To__Json(Type_Safe):       # Converts Type_Safe classes to JSON
 
         annotations = type_safe_cache.get_class_annotations(type_safe_class)
         cls_kwargs  = type_safe_class.__cls_kwargs__()
+        comments    = getattr(type_safe_class, '__annotations_comments__', None) or {}
 
         for field_name, field_type in annotations:
-            property_schema         = self.convert_field_type(field_type)
-            properties[field_name] = property_schema
+            property_schema = self.convert_field_type__frozen(field_type)
+            extra_keywords  = {}
 
-            if hasattr(type_safe_class, '__annotations_comments__'):                                # Add description from docstring if available
-                comments = type_safe_class.__annotations_comments__
-                if field_name in comments:
-                    property_schema["description"] = comments[field_name]
+            if field_name in comments:                                                              # Add description from docstring if available
+                extra_keywords["description"] = comments[field_name]
 
             if field_name not in cls_kwargs:                                                        # Check if field is required (no default value)
                 required.append(field_name)
@@ -64,18 +74,37 @@ class Type_Safe__To__Json(Type_Safe):       # Converts Type_Safe classes to JSON
                 default_value = cls_kwargs[field_name]
                 if self.include_defaults and default_value is not None:
                     if isinstance(default_value, (str, int, float, bool)):                          # Add default to schema if it's a simple type
-                        property_schema["default"] = default_value
+                        extra_keywords["default"] = default_value
+
+            if extra_keywords:                                                                      # (the field schemas are shared, so these go in a copy)
+                property_schema = {**property_schema, **extra_keywords}
+            properties[field_name] = property_schema
 
         schema["properties"] = properties
         if required:
             schema["required"] = required
-
-        self.schema_cache[cache_key] = schema
         return schema
 
     @type_safe
     def convert_field_type(self, field_type : Any                               # Field type to convert
-                           ) -> Dict[str, Any]:                                 # Returns JSON Schema for field
+                           ) -> dict:                                           # Returns JSON Schema for field (mutable copy of the cached schema)
+        return copy.deepcopy(self.convert_field_type__frozen(field_type))
+
+    @type_safe
+    def convert_field_type__frozen(self, field_type : Any                       # Field type to convert
+                                   ) -> dict:                                   # Returns JSON Schema for field (read-only and shared: use convert_field_type for a mutable copy)
+        try:
+            cache_key = (field_type, self.include_defaults, self.strict_mode)
+            schema    = self.field_cache.get(cache_key)
+        except TypeError:                                                       # unhashable type annotation
+            return freeze(self.build_field_schema(field_type))
+        if schema is None:
+            schema = freeze(self.build_field_schema(field_type))
+            self.field_cache[cache_key] = schema
+        return schema
+
+    def build_field_schema(self, field_type : Any                               # Field type to convert
+                            ) -> dict:                                          # Returns new schema for field (nested schemas are shared)
 
         origin = type_safe_cache.get_origin(field_type)
 
@@ -95,15 +124,15 @@ class Type_Safe__To__Json(Type_Safe):       # Converts Type_Safe classes to JSON
         if origin is list:                                                                          # Handle list/array types
             args = get_args(field_type)
             if args:
-                return { "type"  : "array"                           ,
-                        "items" : self.convert_field_type(args[0])   }
+                return { "type"  : "array"                                   ,
+                        "items" : self.convert_field_type__frozen(args[0])   }
             return {"type": "array"}
 
         if origin is dict:
             args = get_args(field_type)                                                             # Handle dict/object types
             if len(args) == 2:
-                return { "type"                 : "object"                      ,                   # JSON Schema doesn't support typed dict keys, so we use additionalProperties
-                        "additionalProperties" : self.convert_field_type(args[1]) }
+                return { "type"                 : "object"                              ,           # JSON Schema doesn't support typed dict keys, so we use additionalProperties
+                        "additionalProperties" : self.convert_field_type__frozen(args[1]) }
             return {"type": "object"}
 
         if origin is set:                                                                           # Handle set types (convert to array with uniqueItems)
@@ -111,7 +140,7 @@ class Type_Safe__To__Json(Type_Safe):       # Converts Type_Safe classes to JSON
             schema = { "type"        : "array" ,
                       "uniqueItems" : True      }
             if args:
-                schema["items"] = self.convert_field_type(args[0])
+                schema["items"] = self.convert_field_type__frozen(args[0])
             return schema
 
         if origin in (Union, Optional):                                         # Handle Union/Optional types
@@ -120,20 +149,68 @@ class Type_Safe__To__Json(Type_Safe):       # Converts Type_Safe classes to JSON
             if type(None) in args:                                                      # Special case for Optional (Union with None)
                 non_none_args = [arg for arg in args if arg is not type(None)]
                 if len(non_none_args) == 1:
-                    schema            = self.convert_field_type(non_none_args[0])       # Optional single type
-                    schema["nullable"] = True                                           # JSON Schema draft-07 style
+                    schema = {**self.convert_field_type__frozen(non_none_args[0]),      # Optional single type (copy, since nested schemas are shared)
+                              "nullable": True                                    }     # JSON Schema draft-07 style
                     return schema
 
-            return { "oneOf": [self.convert_field_type(arg) for arg in args] }          # General Union case
+            return { "oneOf": [self.convert_field_type__frozen(arg) for arg in args] }  # General Union case
 
         if isinstance(field_type, type) and issubclass(field_type, Type_Safe):          # This will register it in components_cache and return a $ref
-            return self.convert_class(field_type, is_nested=True)                       # Call convert_class with is_nested=True for nested objects
+            return self.convert_class__frozen(field_type, is_nested=True)               # Call convert_class with is_nested=True for nested objects
 
         return {"type": "object"}                                                       # Default fallback
 
+    def convert_app(self, app                                                   # FastAPI app (or Fast_API)
+                     ) -> dict:                                                 # Returns {Type_Safe class: schema (read-only and shared)} for all the classes reachable from the app routes
+        return {type_safe_class: self.convert_class__frozen(type_safe_class) for type_safe_class in self.app_classes(app)}
+
+    def app_classes(self, app                                                   # FastAPI app (or Fast_API)
+                     ) -> list:                                                 # Returns the Type_Safe classes used by the routes (params, return types and, recursively, their fields)
+        classes = {}                                                            # (dict as ordered set)
+        for _, _, type_hints in self.app_routes_type_hints(app):
+            for type_hint in type_hints.values():
+                self.collect_classes(type_hint, classes)
+        return list(classes)
+
+    def app_routes_type_hints(self, app                                         # FastAPI app (or Fast_API)
+                               ) -> list:                                       # Returns [(route, route's original function, its type hints)]
+        if not hasattr(app, 'router'):
+            app = app.app()
+        routes_type_hints = []
+        for route in app.router.routes:
+            function = self.route_function(route)
+            if function is None:
+                continue
+            try:
+                type_hints = get_type_hints(function)
+            except Exception:                                                   # (i.e. unresolvable forward references)
+                type_hints = getattr(function, '__annotations__', {})
+            routes_type_hints.append((route, function, type_hints))
+        return routes_type_hints
+
+    def route_function(self, route                                              # Route (APIRoute, Fast_API__Route__Lazy or other starlette route)
+                        ):                                                      # Returns route's original function (or None for routes without one, i.e. mounts)
+        function = getattr(route, 'function', None) or getattr(route, 'endpoint', None)         # (Fast_API__Route__Lazy has the route function, the other routes their wrapper)
+        if function is None:
+            return None
+        return inspect.unwrap(function)                                         # route wrappers keep the original function in __wrapped__
+
+    def collect_classes(self, type_hint : Any ,                                 # Type annotation to search
+                              classes   : dict                                  # Classes found so far
+                         ) -> None:
+        if isinstance(type_hint, type) and issubclass(type_hint, Type_Safe):
+            if type_hint in classes:
+                return
+            classes[type_hint] = True
+            for _, field_type in type_safe_cache.get_class_annotations(type_hint):
+                self.collect_classes(field_type, classes)
+            return
+        for arg in get_args(type_hint):                                         # List[...], Optional[...], Iterator[...], ...
+            self.collect_classes(arg, classes)
+
     @type_safe
     def extract_primitive_schema(self, primitive_class : Type[Type_Safe__Primitive]     # Primitive class to analyze
-                                  ) -> Dict[str, Any]:                                  # Returns schema with constraints
+                                  ) -> dict:                                            # Returns schema with constraints
 
         base_type = primitive_class.__primitive_base__
 
@@ -171,7 +248,7 @@ class Type_Safe__To__Json(Type_Safe):       # Converts Type_Safe classes to JSON
     def convert_to_json_schema_string(self, type_safe_class : Type[Type_Safe]   # Class to convert
                                       ) -> str:                                 # Returns JSON Schema as string
         import json
-        schema = self.convert_class(type_safe_class)
+        schema = self.convert_class__frozen(type_safe_class)
         return json.dumps(schema, indent=2)
 
     @type_safe
@@ -0,0 +1,55 @@
+import json
+from enum                                                               import Enum
+from typing                                                             import Type, Any, Callable
+from osbot_utils.type_safe.Type_Safe                                    import Type_Safe
+from osbot_utils.type_safe.Type_Safe__Primitive                         import Type_Safe__Primitive
+from osbot_utils.type_safe.type_safe_core.shared.Type_Safe__Cache       import type_safe_cache
+
+
+class Type_Safe__To__Json_Bytes(Type_Safe):                                             # Encodes Type_Safe instances straight to JSON bytes (no BaseModel round-trip)
+    encoder_cache : dict                                                                # Type_Safe class → compiled encoder (plain dict, so the cached functions are returned by identity)
+
+    def encoder_for_class(self, type_safe_class : Type[Type_Safe]                       # Class to compile encoder for
+                           ) -> Callable:                                               # Returns function(instance) -> dict with the class fields
+        encoder = self.encoder_cache.get(type_safe_class)
+        if encoder is None:
+            encoder = self.compile_encoder(type_safe_class)
+            self.encoder_cache[type_safe_class] = encoder
+        return encoder
+
+    def compile_encoder(self, type_safe_class : Type[Type_Safe]                         # Class to compile encoder for
+                         ) -> Callable:                                                 # Returns generated function with the field names baked in
+        field_names = [field_name for field_name, _ in type_safe_cache.get_class_annotations(type_safe_class)]
+        items       = ', '.join(f"{field_name!r}: instance.{field_name}" for field_name in field_names)
+        source      = f"def encode(instance):\n    return {{{items}}}\n"
+        namespace   = {}
+        exec(source, namespace)
+        encoder              = namespace['encode']
+        encoder.__qualname__ = f"encode__{type_safe_class.__name__}"
+        return encoder
+
+    def encode_default(self, value : Any                                                # Value the json encoder can't handle natively
+                        ) -> Any:                                                       # Returns json friendly value
+        if isinstance(value, Type_Safe):                                                # nested Type_Safe objects (at any depth) go through their compiled encoder
+            return self.encoder_for_class(type(value))(value)
+        if isinstance(value, (set, frozenset)):                                  # Type_Safe__Set and friends
+            return list(value)
+        if isinstance(value, Type_Safe__Primitive):                                     # primitives with a non str/int/float base
+            return str(value)
+        if isinstance(value, Enum):
+            return value.value
+        from fastapi.encoders import jsonable_encoder                                   # slow path, same rules FastAPI applies to the BaseModel output (Decimal, datetime, ...)
+        return jsonable_encoder(value)
+
+    def to_bytes(self, type_safe_instance : Type_Safe                                   # Instance to encode
+                  ) -> bytes:                                                           # Returns JSON bytes (same format as starlette's JSONResponse)
+        data = self.encoder_for_class(type(type_safe_instance))(type_safe_instance)
+        return json.dumps(data                       ,                                  # str/int/float subclasses (i.e. Safe_Str, Safe_Int, ...) and
+                          default     = self.encode_default ,                           # Type_Safe__List/Dict are encoded natively by the C encoder
+                          ensure_ascii= False               ,
+                          allow_nan   = False               ,
+                          indent      = None                ,
+                          separators  = (",", ":")          ).encode("utf-8")
+
+
+type_safe__to__json_bytes = Type_Safe__To__Json_Bytes()                                 # Singleton instance (shared encoder_cache)
@@ -1,8 +1,17 @@
+import copy
+import inspect
+import re
+import weakref
 from typing                                                             import Type, Dict, Any, List, Optional
 from osbot_utils.type_safe.Type_Safe                                    import Type_Safe
 from osbot_utils.type_safe.type_safe_core.decorators.type_safe          import type_safe
 from osbot_utils.type_safe.type_safe_core.shared.Type_Safe__Cache       import type_safe_cache
+from osbot_fast_api.api.routes.Fast_API__Routes                         import Fast_API__Routes
 from osbot_fast_api.api.transformers.Type_Safe__To__Json                import type_safe__to__json
+from osbot_fast_api.api.transformers.Type_Safe__To__OpenAPI             import type_safe__to__openapi
+from osbot_fast_api.utils.Frozen_Dict                                   import freeze
+
+LLM_TOOLS__PROVIDERS = ('openai', 'anthropic', 'langchain', 'gemini', 'bedrock')
 
 
 class Type_Safe__To__LLM_Tools(Type_Safe):  # Converts Type_Safe classes to LLM function/tool definitions for various platforms"""
@@ -10,6 +19,7 @@ class Type_Safe__To__LLM_Tools(Type_Safe):  # Converts Type_Safe classes to LLM
     include_descriptions : bool = True
     include_examples     : bool = True
     strict_validation    : bool = False                                        # Include all Type_Safe constraints
+    app_tools_cache      : weakref.WeakKeyDictionary                           # app → routes (weak refs, by identity), routes fingerprint and {provider: catalogue} (entries go away with their app)
 
     @type_safe
     def to_openai_function(self, type_safe_class : Type[Type_Safe]       ,     # Type_Safe class
@@ -231,5 +241,105 @@ class Type_Safe__To__LLM_Tools(Type_Safe):  # Converts Type_Safe classes to LLM
                 "version" : "1.0"                         ,
                 "count"   : len(tools)                    }
 
+    # ------------- app level tool catalogue -------------
+
+    def app_tools(self, app                       ,                            # FastAPI app (or Fast_API)
+                        provider : str = 'openai'                              # One of LLM_TOOLS__PROVIDERS
+                  ) -> dict:                                                   # Returns tool catalogue of all Fast_API__Routes routes (read-only and shared, until the routes change)
+        if not hasattr(app, 'router'):
+            app = app.app()
+        if provider not in LLM_TOOLS__PROVIDERS:
+            raise ValueError(f"Unsupported provider '{provider}', supported providers are: {', '.join(LLM_TOOLS__PROVIDERS)}")
+        cache  = self.app_tools_cache.setdefault(app, {})
+        routes = app.router.routes
+        if not self.same_routes(cache.get('routes', ()), routes):
+            fingerprint = self.routes_fingerprint(routes)
+            if cache.get('fingerprint') != fingerprint:                        # (lazy routes replaced by their real route keep the same fingerprint)
+                cache['fingerprint'] = fingerprint
+                cache['catalogues' ] = {}
+            cache['routes'] = tuple(weakref.ref(route) for route in routes)    # (weak refs: the routes' endpoints usually reference the app, which would keep the cache entry alive)
+        catalogue = cache['catalogues'].get(provider)
+        if catalogue is None:
+            catalogue = freeze(self.create_app_tools(app, provider))
+            cache['catalogues'][provider] = catalogue
+        return catalogue
+
+    def same_routes(self, route_refs : tuple ,                                  # weak refs to the routes of the cached catalogues
+                          routes     : list                                     # app.router.routes
+                     ) -> bool:                                                 # True when the routes are the same objects (cheap check, done on every call)
+        return len(route_refs) == len(routes) and all(route_ref() is route for route_ref, route in zip(route_refs, routes))
+
+    def routes_fingerprint(self, routes : list                                  # app.router.routes
+                            ) -> tuple:
+        return tuple((getattr(route, 'path', None), getattr(route, 'name', None), tuple(sorted(getattr(route, 'methods', None) or ())), self.function_identity(route))
+                     for route in routes)
+
+    def function_identity(self, route                                           # Route
+                           ) -> tuple:                                          # Returns (id of the route function's instance, id of its function): the same for a lazy route and the real route that replaces it
+        function = type_safe__to__json.route_function(route)
+        return id(getattr(function, '__self__', None)), id(getattr(function, '__func__', function))
+
+    def create_app_tools(self, app            ,                                # FastAPI app
+                               provider : str                                  # One of LLM_TOOLS__PROVIDERS
+                         ) -> dict:                                            # Returns new tool catalogue (tools, plus the method and path of each tool's route)
+        tools  = []
+        routes = {}
+        for route, function, type_hints in type_safe__to__json.app_routes_type_hints(app):
+            if not isinstance(getattr(function, '__self__', None), Fast_API__Routes) or not getattr(route, 'methods', None):
+                continue
+            method      = sorted(route.methods - {'HEAD'} or route.methods)[0]
+            tool_name   = self.route_tool_name(function)
+            description = inspect.getdoc(function) or f'{method} {route.path}'
+            parameters  = self.route_parameters(function, type_hints)
+            tools.append(self.to_provider_tool(provider, tool_name, description, parameters))
+            routes[tool_name] = dict(method=method, path=str(route.path))
+        return { "tools"    : tools       ,
+                 "version"  : "1.0"       ,
+                 "count"    : len(tools)  ,
+                 "provider" : provider    ,
+                 "routes"   : routes      }
+
+    def route_tool_name(self, function                                         # Route method (bound to its Fast_API__Routes)
+                         ) -> str:                                             # Returns {tag}__{method name} (with the chars and length allowed by the LLM providers)
+        tag       = function.__self__.tag
+        tool_name = f'{tag}__{function.__name__}' if tag else function.__name__
+        return re.sub(r'[^a-zA-Z0-9_-]', '_', tool_name)[:64]
+
+    def route_parameters(self, function            ,                           # Route method
+                               type_hints : dict                               # Its type hints
+                         ) -> Dict[str, Any]:                                  # Returns JSON Schema of the route's params
+        params = [(name, type_hints.get(name, Any), param) for name, param in inspect.signature(function).parameters.items()
+                  if not type_safe__to__openapi.is_framework_type(type_hints.get(name))]
+        if len(params) == 1 and isinstance(params[0][1], type) and issubclass(params[0][1], Type_Safe):  # single Type_Safe body: its fields are the tool's params
+            json_schema = type_safe__to__json.convert_class__frozen(params[0][1], is_nested=True)
+            return { "type"       : "object"                          ,
+                     "properties" : json_schema.get("properties", {}) ,
+                     "required"   : json_schema.get("required"  , []) }
+        properties = {}
+        required   = []
+        for name, type_hint, param in params:
+            properties[name] = type_safe__to__json.convert_field_type__frozen(type_hint)
+            if param.default is inspect.Parameter.empty:
+                required.append(name)
+        return { "type"       : "object"   ,
+                 "properties" : properties ,
+                 "required"   : required   }
+
+    def to_provider_tool(self, provider    : str ,                             # One of LLM_TOOLS__PROVIDERS
+                               name        : str ,                             # Tool name
+                               description : str ,                             # Tool description
+                               parameters  : dict                              # JSON Schema of the tool's params
+                         ) -> Dict[str, Any]:                                  # Returns the tool definition in the provider's format (same layout as the to_* methods)
+        if provider == 'anthropic':
+            return { "name": name, "description": description, "input_schema": parameters }
+        if provider == 'langchain':
+            return { "name": name, "description": description, "args_schema": parameters, "return_direct": False }
+        if provider == 'bedrock':
+            return { "toolSpec": { "name": name, "description": description, "inputSchema": { "json": parameters } } }
+        if provider == 'gemini':
+            parameters = copy.deepcopy(parameters)                              # (mutable copy: the cached schemas are shared and read-only)
+            self._convert_types_for_gemini(parameters["properties"])
+        return { "name": name, "description": description, "parameters": parameters }
+
 
 type_safe__to__llm_tools = Type_Safe__To__LLM_Tools()                         # Singleton instance
\ No newline at end of file
@@ -1,5 +1,9 @@
+import copy
+import inspect
 import json
-from typing                                                       import Type, Dict, Any, List, Optional
+import re
+from types                                                        import UnionType
+from typing                                                       import Type, Dict, Any, List, Optional, Union, ForwardRef, get_args, get_origin, get_type_hints
 from osbot_utils.type_safe.Type_Safe                              import Type_Safe
 from osbot_utils.type_safe.type_safe_core.decorators.type_safe    import type_safe
 from osbot_utils.type_safe.type_safe_core.shared.Type_Safe__Cache import type_safe_cache
@@ -9,9 +13,10 @@ from osbot_fast_api.api.transformers.Type_Safe__To__Json          import type_sa
 
 class Type_Safe__To__OpenAPI(Type_Safe):                        # Converts Type_Safe classes to OpenAPI 3.0 schema components
 
-    components_cache : Dict[str, Dict[str, Any]]
-    include_examples : bool = True
-    api_version      : str  = "3.0.0"                                          # OpenAPI version
+    components_cache  : Dict[str, Dict[str, Any]]
+    component_classes : dict                                                   # Type_Safe class → its name in components/schemas
+    include_examples  : bool = True
+    api_version       : str  = "3.0.0"                                         # OpenAPI version
 
     @type_safe
     def convert_class(self, type_safe_class : Type[Type_Safe]       ,          # Type_Safe class to convert
@@ -19,23 +24,31 @@ class Type_Safe__To__OpenAPI(Type_Safe):                        # Converts Type_
                             example         : Dict[str, Any]  = None            # Optional example
                       ) -> Dict[str, Any]:                                      # Returns OpenAPI schema
 
-        component_name = component_name or type_safe_class.__name__
+        component_name = component_name or self.component_name(type_safe_class)
 
         if component_name in self.components_cache:
-            return {"$ref": f"#/components/schemas/{component_name}"}
+            return self.component_ref(component_name)
 
         # Build OpenAPI schema with proper references
         annotations = type_safe_cache.get_class_annotations(type_safe_class)
         properties = {}
 
-        for field_name, field_type in annotations:
-            properties[field_name] = self.convert_field_type(field_type)
-
         openapi_schema = { "type"                 : "object"                           ,
                            "properties"            : properties                         ,
                            "required"              : []                                 ,  # Type_Safe doesn't have required fields
                            "additionalProperties"  : False                              }
 
+        self.components_cache [component_name ] = openapi_schema                        # registered before the fields are converted, so that recursive (and cyclic) classes become $refs
+        self.component_classes.setdefault(type_safe_class, component_name)
+
+        type_hints = None
+        for field_name, field_type in annotations:
+            if self.has_forward_ref(field_type):                                        # i.e. 'Node' or List['Node'] (self references)
+                if type_hints is None:
+                    type_hints = get_type_hints(type_safe_class, localns={type_safe_class.__name__: type_safe_class})
+                field_type = type_hints.get(field_name, field_type)
+            properties[field_name] = self.convert_field_type(field_type)
+
 
         # Add example if provided
         if example and self.include_examples:
@@ -44,9 +57,21 @@ class Type_Safe__To__OpenAPI(Type_Safe):                        # Converts Type_
         # Convert nullable fields (JSON Schema draft-07 to OpenAPI 3.0)
         self._convert_nullable_fields(openapi_schema)
 
-        # Store in cache
-        self.components_cache[component_name] = openapi_schema
-
+        return self.component_ref(component_name)
+
+    def component_name(self, type_safe_class : Type[Type_Safe]                 # Type_Safe class
+                        ) -> str:                                              # Returns its (unique) name in components/schemas
+        component_name = self.component_classes.get(type_safe_class)
+        if component_name is None:
+            component_name = type_safe_class.__name__
+            if component_name in self.components_cache:                        # a different class (not just a redefinition of this one) with the same name was already registered
+                owner = next((cls for cls, name in self.component_classes.items() if name == component_name), None)
+                if owner is not None and (owner.__module__, owner.__qualname__) != (type_safe_class.__module__, type_safe_class.__qualname__):
+                    component_name = re.sub(r'[^a-zA-Z0-9._-]', '_', f'{type_safe_class.__module__}.{type_safe_class.__qualname__}')
+        return component_name
+
+    def component_ref(self, component_name : str                               # Name in components/schemas
+                       ) -> Dict[str, Any]:
         return {"$ref": f"#/components/schemas/{component_name}"}
 
     def _convert_nullable_fields(self, schema : Dict[str, Any]                 # Schema to process
@@ -72,7 +97,41 @@ class Type_Safe__To__OpenAPI(Type_Safe):                        # Converts Type_
         if isinstance(field_type, type) and issubclass(field_type, Type_Safe):      # Handle nested Type_Safe classes
             return self.convert_class(field_type)                                   # Register as component and return ref , This adds to components_cache and returns $ref
 
-        return type_safe__to__json.convert_field_type(field_type)                   # For all other types, use the JSON converter
+        if not self.has_type_safe_class(field_type):
+            return type_safe__to__json.convert_field_type(field_type)               # For all other types, use the JSON converter
+
+        origin = type_safe_cache.get_origin(field_type)                             # Containers of Type_Safe classes: same schemas as the JSON converter, but with $refs (instead of inline copies)
+        args   = get_args(field_type)
+        if origin in (list, tuple, set):
+            schema = { "type"  : "array"                          ,
+                       "items" : self.convert_field_type(args[0]) }
+            if origin is set:
+                schema["uniqueItems"] = True
+            return schema
+        if origin is dict:
+            return { "type"                 : "object"                          ,
+                     "additionalProperties" : self.convert_field_type(args[1])  }
+        if origin is Union:
+            non_none_args = [arg for arg in args if arg is not type(None)]
+            if len(non_none_args) == 1:                                             # Optional[...]
+                schema = self.convert_field_type(non_none_args[0])
+                if "$ref" in schema:
+                    return { "allOf": [schema], "nullable": True }                  # (in OpenAPI 3.0 the siblings of a $ref are ignored)
+                return { **schema, "nullable": True }
+            return { "oneOf": [self.convert_field_type(arg) for arg in args] }
+        return type_safe__to__json.convert_field_type(field_type)
+
+    def has_forward_ref(self, type_hint : Any                                      # Type annotation to check
+                         ) -> bool:                                                # True if it is (or contains) a not yet resolved forward reference
+        if isinstance(type_hint, (str, ForwardRef)):
+            return True
+        return any(self.has_forward_ref(arg) for arg in get_args(type_hint))
+
+    def has_type_safe_class(self, type_hint : Any                                  # Type annotation to check
+                             ) -> bool:                                            # True if it is (or contains) a Type_Safe class
+        if isinstance(type_hint, type) and issubclass(type_hint, Type_Safe):
+            return True
+        return any(self.has_type_safe_class(arg) for arg in get_args(type_hint))
 
     @type_safe
     def create_operation(self, method_name  : str                        ,          # Operation ID
@@ -155,7 +214,7 @@ class Type_Safe__To__OpenAPI(Type_Safe):                        # Converts Type_
                 "info"    : { "title"   : title   ,
                              "version" : version }                ,
                 "paths"   : {}                                    ,
-                "components" : { "schemas": self.components_cache } }
+                "components" : { "schemas": copy.deepcopy(dict(self.components_cache)) } }   # (copy, later conversions and changes to the spec don't affect each other)
 
         if description:
             spec["info"]["description"] = description
@@ -227,5 +286,75 @@ class Type_Safe__To__OpenAPI(Type_Safe):                        # Converts Type_
 
         return spec
 
+    def generate_from_app(self, app                                            # FastAPI app (or Fast_API)
+                           ) -> Dict[str, Any]:                                # Returns OpenAPI spec, with each Type_Safe class once in components/schemas (and $refs everywhere else)
+        if not hasattr(app, 'router'):
+            app = app.app()
+        self.components_cache .clear()                                                  # each spec only has the components of its own app
+        self.component_classes.clear()
+        operations = []
+        for route, function, type_hints in type_safe__to__json.app_routes_type_hints(app):
+            if not getattr(route, 'include_in_schema', False) or not getattr(route, 'methods', None):
+                continue
+            operation = self.create_route_operation(route, function, type_hints)
+            for method in sorted(route.methods - {'HEAD'}):
+                operations.append((route.path_format, method, operation))
+        spec = self.create_openapi_spec(title       = app.title              ,          # (created after the operations, so that it has all their components)
+                                        version     = app.version            ,
+                                        description = app.description or None)
+        for path, method, operation in operations:
+            self.add_path(spec, path, method, operation)
+        return spec
+
+    def create_route_operation(self, route      : Any  ,                        # Route (APIRoute or Fast_API__Route__Lazy)
+                                     function   : Any  ,                        # Route's original function
+                                     type_hints : dict                          # Type hints of the route's function
+                                ) -> Dict[str, Any]:                            # Returns OpenAPI operation
+        path_params = set(re.findall(r'{(\w+)}', route.path_format))
+        signature   = inspect.signature(function).parameters
+        parameters  = []
+        body        = {}
+        for name, type_hint in type_hints.items():
+            if name == 'return' or self.is_framework_type(type_hint):
+                continue
+            if self.has_type_safe_class(type_hint):
+                body[name] = self.convert_field_type(type_hint)
+            else:
+                parameters.append({ "name"     : name                                                                ,
+                                    "in"       : "path" if name in path_params else "query"                          ,
+                                    "required" : name in path_params or self.is_required(signature.get(name), type_hint) ,
+                                    "schema"   : self.convert_field_type(type_hint)                                  })
+
+        tags      = getattr(route, 'tags', None) or [getattr(getattr(route, 'fast_api_routes', None), 'tag', None)]
+        operation = { "operationId" : route.name ,
+                      "summary"     : route.name }
+        if tags[0]:
+            operation["tags"] = list(tags)
+        if parameters:
+            operation["parameters"] = parameters
+        if body:
+            schema = body.popitem()[1] if len(body) == 1 else { "type": "object", "properties": body }
+            operation["requestBody"] = { "required" : True                                     ,
+                                         "content"  : { "application/json": { "schema": schema } } }
+
+        return_type = type_hints.get('return')
+        if return_type is None or return_type is type(None) or self.is_framework_type(return_type):
+            operation["responses"] = { "200": { "description": "Successful response" } }
+        else:
+            operation["responses"] = { "200": { "description" : "Successful response"                                                    ,
+                                                "content"     : { "application/json": { "schema": self.convert_field_type(return_type) } } } }
+        return operation
+
+    def is_required(self, param     : Optional[inspect.Parameter] ,             # Parameter in the route's signature
+                          type_hint : Any                                       # Its type annotation
+                     ) -> bool:                                                 # True when the param has no default value and is not Optional
+        if param is not None and param.default is not inspect.Parameter.empty:
+            return False
+        return not (get_origin(type_hint) in (Union, UnionType) and type(None) in get_args(type_hint))
+
+    def is_framework_type(self, type_hint : Any                                 # Type annotation to check
+                           ) -> bool:                                           # True for the request/response objects injected by FastAPI
+        return getattr(type_hint, '__module__', '').startswith(('starlette.', 'fastapi.'))
+
 
 type_safe__to__openapi = Type_Safe__To__OpenAPI()                             # Singleton instance
\ No newline at end of file
@@ -19,6 +19,7 @@ from starlette.routing
 from starlette.staticfiles                                                      import StaticFiles
 from osbot_fast_api.api.schemas.safe_str.Safe_Str__Fast_API__Route__Prefix      import Safe_Str__Fast_API__Route__Prefix
 from osbot_fast_api.api.schemas.enums.Enum__Fast_API__Route__Type               import Enum__Fast_API__Route__Type
+from osbot_fast_api.api.routes.Fast_API__Route__Lazy                            import Fast_API__Route__Lazy
 
 class Fast_API__Route__Extractor(Type_Safe):                              # Dedicated class for route extraction
     app               : FastAPI
@@ -102,6 +103,9 @@ class Fast_API__Route__Extractor(Type_Safe):                              # Dedi
 
             full_path = self.combine_paths(route_prefix, route.path)                                   # Build safe route path
 
+            if isinstance(route, Fast_API__Route__Lazy):                                                # lazy routes are built now (the extraction needs their wrappers)
+                route = route.materialize(router)
+
             if isinstance(route, Mount):                                                                # Extract based on route type
                 mount_routes = self.extract_mount_routes(route, full_path)
                 routes.extend(mount_routes)
@@ -7,6 +7,7 @@ from osbot_fast_api.events.schemas.Schema__Fast_API__Http_Event__Request    impo
 from osbot_fast_api.events.schemas.Schema__Fast_API__Http_Event__Response   import Schema__Fast_API__Http_Event__Response
 from osbot_fast_api.events.schemas.Schema__Fast_API__Http_Event__Traces     import Schema__Fast_API__Http_Event__Traces
 from osbot_utils.type_safe.Type_Safe                                        import Type_Safe
+from osbot_utils.type_safe.type_safe_core.config.Type_Safe__Config          import Type_Safe__Config
 from osbot_utils.type_safe.primitives.domains.identifiers.Random_Guid       import Random_Guid
 from osbot_utils.helpers.trace.Trace_Call                                   import Trace_Call
 from osbot_utils.utils.Misc                                                 import timestamp_utc_now, current_thread_id, str_to_bytes
@@ -26,17 +27,25 @@ class Fast_API__Http_Event(Type_Safe):
     http_event_request      : Schema__Fast_API__Http_Event__Request
     http_event_response     : Schema__Fast_API__Http_Event__Response
     http_event_traces       : Schema__Fast_API__Http_Event__Traces
-    event_id                : Random_Guid                                  # todo: rename to http_event_id
+    event_id                : Random_Guid = None                           # todo: rename to http_event_id
 
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
+        if self.event_id is None:                                           # only create a Random_Guid when the caller didn't provide the request's id
+            self.event_id = Random_Guid()
         self.set_ids()
 
     def set_ids(self):
-        self.http_event_info.event_id       = self.event_id
-        self.http_event_request.event_id    = self.event_id
-        self.http_event_response.event_id   = self.event_id
-        self.http_event_traces.event_id     = self.event_id
+        event_id = self.event_id                                            # all schema ids reuse the event's id (so that no extra Random_Guids are created per event)
+        with Type_Safe__Config(skip_validation=True):                      # event_id is already a (validated) Random_Guid (re-validating it in each schema was ~35µs per event)
+            self.http_event_info.event_id        = event_id
+            self.http_event_info.info_id         = event_id
+            self.http_event_request.event_id     = event_id
+            self.http_event_request.request_id   = event_id
+            self.http_event_response.event_id    = event_id
+            self.http_event_response.response_id = event_id
+            self.http_event_traces.event_id      = event_id
+            self.http_event_traces.traces_id     = event_id
 
     def add_log_message(self, message_text, level:int =  logging.INFO):
         timestamp_delta = timestamp_utc_now()  - self.http_event_info.timestamp
@@ -90,8 +90,9 @@ class Fast_API__Http_Events(Type_Safe):
         request.state.http_events      = self                               # store a copy of this object in the request (so that it is available durant the request handling)
         request.state.request_id       = event_id                           # store request_id in request.state
         request.state.request_data     = http_event                         # store request_data object in request.stat
+        if event_id not in self.requests_data:                              # (request ids sent by the client can be repeated, the new event replaces the previous one)
+            self.requests_order.append(event_id)                            # capture request order in self.requests_order
         self.requests_data[event_id]   = http_event                         # capture request_data in self.requests_data
-        self.requests_order.append(event_id)                                # capture request order in self.requests_order
 
         if len(self.requests_order) > self.max_requests_logged:             # remove oldest request if we have more than max_requests_logged
             request_id_to_remove = self.requests_order.popleft()            # todo: move this to a separate method that is responsible for the size
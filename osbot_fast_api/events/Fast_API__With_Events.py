@@ -10,6 +10,10 @@ class Fast_API__With_Events(Fast_API):
         self.http_events.fast_api_name = self.config.name                     # Wire up the name
 
     def setup_middlewares(self):                                              # Add event middleware    (NOTE: the middleware execution is the reverse of the order they are added)
+        if self.config.fused_middleware:
+            self.setup_middleware__rate_limit()
+            self.setup_middleware__fused(http_events=self.http_events)        # (events captured by the fused middleware)
+            return self.setup_middleware__compression()
         self.setup_middleware__http_events()                                  # This will make this middleware to be the last one executed
         super().setup_middlewares()                                           # Call parent middlewares first
 
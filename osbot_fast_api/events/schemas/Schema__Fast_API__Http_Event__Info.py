@@ -8,8 +8,8 @@ class Schema__Fast_API__Http_Event__Info(Type_Safe):
     client_city             : str           = None
     client_country          : str           = None
     client_ip               : str           = None
-    event_id                : Random_Guid
-    info_id                 : Random_Guid
+    event_id                : Random_Guid   = None                  # set by Fast_API__Http_Event.set_ids
+    info_id                 : Random_Guid   = None
     domain                  : str           = None
     timestamp               : int
     thread_id               : int
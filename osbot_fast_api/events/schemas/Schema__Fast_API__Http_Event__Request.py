@@ -5,11 +5,11 @@ from osbot_utils.type_safe.primitives.domains.identifiers.Random_Guid    import
 
 class Schema__Fast_API__Http_Event__Request(Type_Safe):
     duration        : Decimal       = None
-    event_id        : Random_Guid
+    event_id        : Random_Guid   = None                          # set by Fast_API__Http_Event.set_ids
     host_name       : str           = None
     headers         : dict
     method          : str           = None
     port            : int           = None
-    request_id      : Random_Guid
+    request_id      : Random_Guid   = None
     start_time      : Decimal       = None
     path            : str           = None
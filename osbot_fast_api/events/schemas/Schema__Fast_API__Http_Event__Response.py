@@ -7,7 +7,7 @@ class Schema__Fast_API__Http_Event__Response(Type_Safe):
     content_length  : str           = None
     content_type    : str           = None
     end_time        : Decimal       = None
-    event_id        : Random_Guid
-    response_id     : Random_Guid
+    event_id        : Random_Guid   = None                          # set by Fast_API__Http_Event.set_ids
+    response_id     : Random_Guid   = None
     status_code     : int           = None
     headers         : dict
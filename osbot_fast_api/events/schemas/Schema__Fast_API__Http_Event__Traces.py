@@ -2,7 +2,7 @@ from osbot_utils.type_safe.Type_Safe                                  import Typ
 from osbot_utils.type_safe.primitives.domains.identifiers.Random_Guid import Random_Guid
 
 class Schema__Fast_API__Http_Event__Traces(Type_Safe):
-    event_id    : Random_Guid
-    traces_id   : Random_Guid
+    event_id    : Random_Guid = None                                    # set by Fast_API__Http_Event.set_ids
+    traces_id   : Random_Guid = None
     traces      : list
     traces_count: int
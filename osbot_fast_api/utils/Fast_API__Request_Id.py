@@ -0,0 +1,81 @@
+import itertools
+import os
+import re
+import time
+import uuid
+from secrets                                                            import token_hex
+from osbot_utils.type_safe.Type_Safe                                    import Type_Safe
+from osbot_utils.type_safe.primitives.domains.identifiers.Random_Guid   import Random_Guid
+from osbot_fast_api.api.schemas.enums.Enum__Fast_API__Request_Id__Mode  import Enum__Fast_API__Request_Id__Mode
+
+HEADER_NAME__FAST_API_REQUEST_ID = b'fast-api-request-id'
+HEADER_NAME__TRACEPARENT         = b'traceparent'
+REGEX__TRACEPARENT               = re.compile(r'^([0-9a-f]{2})-([0-9a-f]{32})-([0-9a-f]{16})-([0-9a-f]{2})(-.*)?$')     # W3C trace context: version-trace_id-parent_id-flags
+
+
+class Fast_API__Request_Id(Type_Safe):                                                  # Request id for each request: reused from the inbound headers (when valid) or generated (see Enum__Fast_API__Request_Id__Mode)
+    mode          : Enum__Fast_API__Request_Id__Mode = Enum__Fast_API__Request_Id__Mode.RANDOM_GUID
+    reuse_inbound : bool                             = False                            # use the 'fast-api-request-id' or 'traceparent' (trace id) header sent by the client (only when the clients are trusted)
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        object.__setattr__(self, 'sequence_pid'   , None)                               # (not a Type_Safe field) process that created the prefix (a forked process gets a new one)
+        object.__setattr__(self, 'sequence_prefix', None)                               # (not a Type_Safe field) first 24 chars of the sequential ids
+        object.__setattr__(self, 'sequence_count' , None)                               # (not a Type_Safe field) itertools.count (thread safe under the GIL)
+
+    def request_id(self, headers: list                                                  # raw ASGI headers (list of (name, value) bytes tuples)
+                    ) -> Random_Guid:
+        if self.reuse_inbound:
+            request_id = self.inbound_request_id(headers)
+            if request_id:
+                return request_id
+        return self.new_request_id()
+
+    def new_request_id(self) -> Random_Guid:
+        if self.mode is Enum__Fast_API__Request_Id__Mode.SEQUENTIAL:
+            return self.sequential_id()
+        return Random_Guid()
+
+    def sequential_id(self) -> Random_Guid:                                             # i.e. '6a10e2f5-3c1d-9b0e-77aa-000000000001'
+        if self.sequence_pid != os.getpid():
+            self.reset_sequence()
+        return str.__new__(Random_Guid, f'{self.sequence_prefix}{next(self.sequence_count):012x}')     # (already in guid format, so Random_Guid's validation is skipped)
+
+    def reset_sequence(self):                                                           # prefix: process start time (seconds) + 48 random bits
+        object.__setattr__(self, 'sequence_pid'   , os.getpid())
+        object.__setattr__(self, 'sequence_prefix', f'{int(time.time()) & 0xffffffff:08x}-{token_hex(2)}-{token_hex(2)}-{token_hex(2)}-')
+        object.__setattr__(self, 'sequence_count' , itertools.count(1))
+        return self
+
+    def inbound_request_id(self, headers: list) -> Random_Guid:                         # Returns the request id sent by the client (None if missing or invalid)
+        request_id  = None
+        traceparent = None
+        for name, value in headers:
+            if name == HEADER_NAME__FAST_API_REQUEST_ID and request_id is None:
+                request_id  = value
+            elif name == HEADER_NAME__TRACEPARENT and traceparent is None:
+                traceparent = value
+        if request_id:
+            try:
+                return str.__new__(Random_Guid, str(uuid.UUID(request_id.decode('latin-1'))))     # (canonical form: uuid.UUID also accepts braces, upper case and no hyphens)
+            except ValueError:
+                pass
+        if traceparent:
+            return self.parse_traceparent(traceparent.decode('latin-1'))
+        return None
+
+    def parse_traceparent(self, traceparent: str) -> Random_Guid:                       # Returns the trace id (in guid format), None if traceparent is invalid
+        match = REGEX__TRACEPARENT.match(traceparent.strip())
+        if match is None:
+            return None
+        version, trace_id, parent_id, _, extra = match.groups()
+        if version == 'ff' or (version == '00' and extra):                              # (invalid version, and version 00 has no extra fields)
+            return None
+        if trace_id == '0' * 32 or parent_id == '0' * 16:
+            return None
+        return str.__new__(Random_Guid, f'{trace_id[:8]}-{trace_id[8:12]}-{trace_id[12:16]}-{trace_id[16:20]}-{trace_id[20:]}')
+
+    def with_request_id_header(self, headers: list, request_id: Random_Guid) -> list:  # Returns copy of headers with (only) this 'fast-api-request-id'
+        headers = [header for header in headers if header[0] != HEADER_NAME__FAST_API_REQUEST_ID]
+        headers.append((HEADER_NAME__FAST_API_REQUEST_ID, request_id.encode()))
+        return headers
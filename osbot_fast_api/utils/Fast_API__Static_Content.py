@@ -0,0 +1,60 @@
+import gzip
+import hashlib
+from starlette.requests                 import Request
+from starlette.responses                import Response
+from osbot_utils.type_safe.Type_Safe    import Type_Safe
+
+STATIC_CONTENT__CACHE_CONTROL  = 'no-cache'                                             # clients can keep a copy, but must revalidate it (cheap, via If-None-Match)
+STATIC_CONTENT__GZIP_LEVEL     = 9                                                      # compressed once, so we can afford the best ratio
+STATIC_CONTENT__GZIP_MIN_SIZE  = 1024                                                   # smaller bodies are not worth compressing
+
+
+def accepts_gzip(accept_encoding: str) -> bool:                                         # True if the Accept-Encoding header value has gzip (without q=0)
+    for encoding in accept_encoding.split(','):
+        name, _, params = encoding.strip().partition(';')
+        if name.strip().lower() == 'gzip':
+            return params.replace(' ', '') not in ('q=0', 'q=0.0', 'q=0.00', 'q=0.000')
+    return False
+
+
+class Fast_API__Static_Content(Type_Safe):                                              # Pre-built response body (plus its gzip version and strong ETag) for content that only changes when the app changes
+    content      : bytes
+    media_type   : str   = 'application/octet-stream'
+    etag         : str                                                                  # quoted strong ETag (computed from the content, if not provided)
+    content_gzip : bytes                                                                # empty when the content is too small to be worth compressing
+
+    def setup(self):
+        if not self.etag:
+            self.etag = hashlib.sha256(self.content).hexdigest()[:32]
+        if not self.etag.startswith('"'):
+            self.etag = f'"{self.etag}"'
+        if len(self.content) >= STATIC_CONTENT__GZIP_MIN_SIZE:
+            self.content_gzip = gzip.compress(self.content, compresslevel=STATIC_CONTENT__GZIP_LEVEL, mtime=0)    # (mtime=0 keeps the bytes deterministic)
+        return self
+
+    def headers(self) -> dict:
+        return {'etag'          : self.etag                   ,
+                'cache-control' : STATIC_CONTENT__CACHE_CONTROL,
+                'vary'          : 'accept-encoding'            }
+
+    def is_not_modified(self, request: Request) -> bool:                                # True when the client's If-None-Match already has our ETag
+        if_none_match = request.headers.get('if-none-match')
+        if not if_none_match:
+            return False
+        for etag in if_none_match.split(','):
+            etag = etag.strip()
+            if etag == '*' or etag.removeprefix('W/') == self.etag:                     # (weak comparison, as required for If-None-Match)
+                return True
+        return False
+
+    def accepts_gzip(self, request: Request) -> bool:
+        return accepts_gzip(request.headers.get('accept-encoding', ''))
+
+    def response(self, request: Request) -> Response:                                   # 304, gzip'd or plain response (no per-request serialisation or compression)
+        headers = self.headers()
+        if self.is_not_modified(request):
+            return Response(status_code=304, headers=headers)
+        if self.content_gzip and self.accepts_gzip(request):
+            headers['content-encoding'] = 'gzip'
+            return Response(content=self.content_gzip, media_type=self.media_type, headers=headers)
+        return Response(content=self.content, media_type=self.media_type, headers=headers)
@@ -0,0 +1,30 @@
+import copy
+from osbot_fast_api.utils.Frozen_List                                   import Frozen_List
+
+
+def frozen_dict__read_only(self, *args, **kwargs):
+    raise TypeError(f"{type(self).__name__} is read-only (use copy.deepcopy() to get a mutable copy)")
+
+
+class Frozen_Dict(dict):                                                                # Read-only dict (shared by caches, i.e. JSON schemas), json.dumps encodes it as a normal dict
+    __setitem__ = __delitem__ = __ior__ = frozen_dict__read_only
+    clear       = pop         = popitem = setdefault = update = frozen_dict__read_only
+
+    def __deepcopy__(self, memo):                                                       # mutable (plain dict) copy, at all depths
+        return {key: copy.deepcopy(value, memo) for key, value in self.items()}
+
+    def __reduce__(self):                                                               # (pickle and copy.copy) as plain dict
+        return dict, (dict(self),)
+
+    def copy(self) -> dict:                                                             # shallow mutable copy (same as dict.copy, which would return a plain dict anyway)
+        return dict(self)
+
+
+def freeze(value):                                                                      # Returns read-only version of value (dicts and lists at all depths, already frozen values are shared)
+    if isinstance(value, (Frozen_Dict, Frozen_List)):
+        return value
+    if isinstance(value, dict):
+        return Frozen_Dict({key: freeze(item) for key, item in value.items()})
+    if isinstance(value, list):
+        return Frozen_List(freeze(item) for item in value)
+    return value
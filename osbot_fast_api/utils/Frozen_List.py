@@ -0,0 +1,17 @@
+import copy
+
+
+def frozen_list__read_only(self, *args, **kwargs):
+    raise TypeError(f"{type(self).__name__} is read-only (use copy.deepcopy() to get a mutable copy)")
+
+
+class Frozen_List(list):                                                                # Read-only list (shared by caches, i.e. JSON schemas), json.dumps encodes it as a normal list
+    __setitem__ = __delitem__ = __iadd__ = __imul__                 = frozen_list__read_only
+    append      = extend      = insert   = pop      = remove = clear = frozen_list__read_only
+    sort        = reverse                                            = frozen_list__read_only
+
+    def __deepcopy__(self, memo):                                                       # mutable (plain list) copy, at all depths
+        return [copy.deepcopy(item, memo) for item in self]
+
+    def __reduce__(self):                                                               # (pickle and copy.copy) as plain list
+        return list, (list(self),)
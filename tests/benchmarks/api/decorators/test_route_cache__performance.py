@@ -0,0 +1,74 @@
+import asyncio
+from typing                                                             import List
+from unittest                                                           import TestCase
+from osbot_utils.helpers.performance.Performance_Measure__Session       import Performance_Measure__Session
+from osbot_utils.type_safe.Type_Safe                                    import Type_Safe
+from osbot_utils.type_safe.primitives.domains.identifiers.Safe_Id       import Safe_Id
+from osbot_fast_api.api.Fast_API                                        import Fast_API
+from osbot_fast_api.api.decorators.route_cache                          import route_cache
+from osbot_fast_api.api.routes.Fast_API__Routes                         import Fast_API__Routes
+from osbot_fast_api.api.schemas.Schema__Fast_API__Config                import Schema__Fast_API__Config
+
+
+class Perf__Entry(Type_Safe):
+    entry_id : Safe_Id
+    value    : int
+
+class Perf__Report(Type_Safe):
+    report_id : Safe_Id
+    entries   : List[Perf__Entry]
+
+def build_report(report_id):                                                            # deterministic (and not cheap) route result
+    return Perf__Report(report_id=report_id, entries=[Perf__Entry(entry_id=f'entry-{index}', value=index) for index in range(50)])
+
+class Routes__Reports(Fast_API__Routes):
+    tag = 'reports'
+
+    def report__report_id(self, report_id: Safe_Id) -> Perf__Report:
+        return build_report(report_id)
+
+    @route_cache()
+    def cached__report_id(self, report_id: Safe_Id) -> Perf__Report:
+        return build_report(report_id)
+
+    def setup_routes(self):
+        self.add_routes_get(self.report__report_id, self.cached__report_id)
+
+
+class test_route_cache__performance(TestCase):                                          # Request latency of a deterministic route: computed on every request vs served from @route_cache
+
+    @classmethod
+    def setUpClass(cls):
+        class An_Fast_API(Fast_API):
+            def setup_routes(self):
+                self.add_routes(Routes__Reports)
+        cls.app     = An_Fast_API(config=Schema__Fast_API__Config(default_routes=False)).setup().app()
+        cls.session = Performance_Measure__Session()
+        cls.loop    = asyncio.new_event_loop()
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.loop.close()
+
+    def request(self, path):                                                            # calls the ASGI app directly (no http client overhead in the measurement)
+        scope    = dict(type='http', asgi={'version': '3.0'}, http_version='1.1', method='GET', scheme='http',
+                        path=path, raw_path=path.encode(), root_path='', query_string=b'', headers=[],
+                        client=('127.0.0.1', 1234), server=('127.0.0.1', 80))
+        messages = []
+        async def receive():
+            return {'type': 'http.request', 'body': b'', 'more_body': False}
+        async def send(message):
+            messages.append(message)
+        self.loop.run_until_complete(self.app(scope, receive, send))
+        return messages
+
+    def test__cached_vs_uncached(self):
+        def uncached():
+            return self.request('/reports/report/report-1')
+        def cached():
+            return self.request('/reports/cached/report-1')
+
+        assert uncached()[1]['body'] == cached()[1]['body']
+        before = self.session.measure__quick(uncached).result.raw_score
+        after  = self.session.measure__quick(cached  ).result.raw_score
+        assert after * 2 < before
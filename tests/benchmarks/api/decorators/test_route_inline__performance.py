@@ -0,0 +1,60 @@
+import asyncio
+from unittest                                                           import TestCase
+from osbot_utils.helpers.performance.Performance_Measure__Session       import Performance_Measure__Session
+from osbot_fast_api.api.Fast_API                                        import Fast_API
+from osbot_fast_api.api.decorators.route_inline                         import route_inline
+from osbot_fast_api.api.routes.Fast_API__Routes                         import Fast_API__Routes
+from osbot_fast_api.api.schemas.Schema__Fast_API__Config                import Schema__Fast_API__Config
+
+
+class Routes__Ping(Fast_API__Routes):
+    tag = 'ping'
+
+    def in_threadpool(self) -> dict:
+        return dict(status='ok')
+
+    @route_inline
+    def inline(self) -> dict:
+        return dict(status='ok')
+
+    def setup_routes(self):
+        self.add_routes_get(self.in_threadpool, self.inline)
+
+
+class test_route_inline__performance(TestCase):                                         # Request latency of a CPU-light route: threadpool hop vs inline on the event loop
+
+    @classmethod
+    def setUpClass(cls):
+        class An_Fast_API(Fast_API):
+            def setup_routes(self):
+                self.add_routes(Routes__Ping)
+        cls.app     = An_Fast_API(config=Schema__Fast_API__Config(default_routes=False)).setup().app()
+        cls.session = Performance_Measure__Session()
+        cls.loop    = asyncio.new_event_loop()
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.loop.close()
+
+    def request(self, path):                                                            # calls the ASGI app directly (no http client overhead in the measurement)
+        scope    = dict(type='http', asgi={'version': '3.0'}, http_version='1.1', method='GET', scheme='http',
+                        path=path, raw_path=path.encode(), root_path='', query_string=b'', headers=[],
+                        client=('127.0.0.1', 1234), server=('127.0.0.1', 80))
+        messages = []
+        async def receive():
+            return {'type': 'http.request', 'body': b'', 'more_body': False}
+        async def send(message):
+            messages.append(message)
+        self.loop.run_until_complete(self.app(scope, receive, send))
+        return messages
+
+    def test__inline_vs_threadpool(self):
+        def in_threadpool():
+            return self.request('/ping/in-threadpool')
+        def inline():
+            return self.request('/ping/inline')
+
+        assert in_threadpool()[1]['body'] == inline()[1]['body'] == b'{"status":"ok"}'
+        before = self.session.measure__quick(in_threadpool).result.raw_score
+        after  = self.session.measure__quick(inline       ).result.raw_score
+        assert after < before
@@ -0,0 +1,63 @@
+import asyncio
+import json
+import time
+import zlib
+from unittest                                                                   import TestCase
+from osbot_utils.helpers.performance.Performance_Measure__Session               import Performance_Measure__Session
+from osbot_fast_api.api.middlewares.Middleware__Compression                     import Middleware__Compression, COMPRESSION__GZIP_WBITS
+from osbot_fast_api.schemas.core_routes.registry.Schema__Registry__Service__Info import Schema__Registry__Service__Info
+
+BANDWIDTH__BYTES_PER_SECOND = 100_000_000 / 8                                                   # (100 Mbit/s)
+
+
+class test_Middleware__Compression__performance(TestCase):                                      # CPU cost of the compression vs the bandwidth it saves, on Type_Safe json payloads
+
+    @classmethod
+    def setUpClass(cls):
+        cls.session  = Performance_Measure__Session()
+        services     = [Schema__Registry__Service__Info(service_name   = f'Service__{index}'                     ,
+                                                       service_module = f'an_package.services.service_{index}'  ,
+                                                       mode           = 'REMOTE'                                 ,
+                                                       base_url       = f'https://service-{index}.example.com'  ,
+                                                       has_api_key    = index % 2 == 0                           )
+                        for index in range(500)]
+        cls.payload  = json.dumps(dict(services=[service.json() for service in services])).encode()   # (~100KB)
+
+    def compress(self, level):
+        compressor = zlib.compressobj(level, zlib.DEFLATED, COMPRESSION__GZIP_WBITS)
+        return compressor.compress(self.payload) + compressor.flush(zlib.Z_FINISH)
+
+    def compress__seconds(self, level):                                                         # best of a few runs
+        durations = []
+        for _ in range(5):
+            start = time.perf_counter()
+            self.compress(level)
+            durations.append(time.perf_counter() - start)
+        return min(durations)
+
+    def test__levels(self):                                                                     # level 6 (the default) has most of level 9's ratio, and the saved transfer time is much bigger than the compression time
+        assert len(self.payload) > 90_000
+        sizes   = {level: len(self.compress(level))      for level in (1, 6, 9)}
+        seconds = {level: self.compress__seconds(level)  for level in (1, 6, 9)}
+        assert len(self.payload) > 5 * sizes[6]                                                 # (~20x on these payloads)
+        assert sizes[9]          <= sizes[6] <= sizes[1]
+        assert sizes[6]          <  sizes[9] * 1.1
+        for level in (1, 6, 9):
+            saved__seconds = (len(self.payload) - sizes[level]) / BANDWIDTH__BYTES_PER_SECOND   # (~7ms)
+            assert seconds[level] < saved__seconds                                              # (~0.3ms to ~1ms)
+
+    def test__request(self):                                                                    # whole middleware, on an app that returns the payload
+        payload = self.payload
+        async def app(scope, receive, send):
+            await send({'type': 'http.response.start', 'status': 200, 'headers': [(b'content-type', b'application/json')]})
+            await send({'type': 'http.response.body' , 'body'  : payload})
+        async def send(message):
+            pass
+        scope      = dict(type='http', method='GET', headers=[(b'accept-encoding', b'gzip')])
+        loop       = asyncio.new_event_loop()
+        middleware = Middleware__Compression(app)
+        try:
+            duration = self.session.measure__quick(lambda: loop.run_until_complete(middleware(scope, None, send))).result.raw_score
+        finally:
+            loop.close()
+        assert duration < 10_000_000                                                            # (ns) ~1ms for ~100KB
@@ -0,0 +1,60 @@
+import asyncio
+from unittest                                                         import TestCase
+from osbot_utils.helpers.duration.Duration                            import Duration
+from osbot_utils.testing.Temp_Env_Vars                                import Temp_Env_Vars
+from osbot_fast_api.api.schemas.Schema__Fast_API__Config              import Schema__Fast_API__Config
+from tests.unit.api.middlewares.test_Middleware__Fused                import An_Fast_API, An_Fast_API__With_Events, API_KEY__NAME, API_KEY__VALUE, TEMP_ENV_VARS
+
+REQUESTS_COUNT = 2000
+
+
+class test_Middleware__Fused__performance(TestCase):                                       # requests per second on a trivial route: BaseHTTPMiddleware stack vs fused pure ASGI middleware (request id, api key, disconnect and http events)
+
+    @classmethod
+    def setUpClass(cls):
+        cls.loop = asyncio.new_event_loop()
+        with Temp_Env_Vars(env_vars=TEMP_ENV_VARS):                                          # (api key values are read when the middleware stack is built, i.e. on the first request)
+            cls.app__default              = cls.create_app(An_Fast_API             , fused_middleware=False)
+            cls.app__fused                = cls.create_app(An_Fast_API             , fused_middleware=True )
+            cls.app__default__with_events = cls.create_app(An_Fast_API__With_Events, fused_middleware=False)
+            cls.app__fused__with_events   = cls.create_app(An_Fast_API__With_Events, fused_middleware=True )
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.loop.close()
+
+    @classmethod
+    def create_app(cls, fast_api_class, fused_middleware):
+        app = fast_api_class(config=Schema__Fast_API__Config(enable_api_key=True, fused_middleware=fused_middleware)).setup().app()
+        assert cls.request(app)[0]['status'] == 200
+        return app
+
+    @classmethod
+    def request(cls, app):                                                                  # calls the ASGI app directly (no http client overhead in the measurement)
+        scope    = dict(type='http', asgi={'version': '3.0'}, http_version='1.1', method='GET', scheme='http',
+                        path='/an-route/ping', raw_path=b'/an-route/ping', root_path='', query_string=b'',
+                        headers=[(API_KEY__NAME.encode(), API_KEY__VALUE.encode())], client=('127.0.0.1', 1234), server=('127.0.0.1', 80))
+        messages = []
+        async def receive():
+            return {'type': 'http.request', 'body': b'', 'more_body': False}
+        async def send(message):
+            messages.append(message)
+        cls.loop.run_until_complete(app(scope, receive, send))
+        return messages
+
+    def requests_per_second(self, app):
+        with Duration(print_result=False) as duration:
+            for _ in range(REQUESTS_COUNT):
+                self.request(app)
+        return REQUESTS_COUNT / duration.seconds()
+
+    def test__requests_per_second(self):
+        assert self.request(self.app__fused)[1]['body'] == self.request(self.app__default)[1]['body'] == b'{"ping":"pong"}'
+        default = self.requests_per_second(self.app__default)
+        fused   = self.requests_per_second(self.app__fused  )
+        assert fused > default * 1.8                                                        # (~2,500 vs ~6,000 req/s)
+
+    def test__requests_per_second__with_events(self):                                      # (the http events capture itself now dominates)
+        default = self.requests_per_second(self.app__default__with_events)
+        fused   = self.requests_per_second(self.app__fused__with_events  )
+        assert fused > default * 1.2                                                        # (~410 vs ~640 req/s)
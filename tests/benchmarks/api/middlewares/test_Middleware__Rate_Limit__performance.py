@@ -0,0 +1,52 @@
+import asyncio
+from unittest                                                           import TestCase
+from osbot_utils.helpers.performance.Performance_Measure__Session       import Performance_Measure__Session
+from osbot_utils.testing.Temp_Folder                                    import Temp_Folder
+from osbot_utils.utils.Files                                            import path_combine
+from osbot_fast_api.api.Fast_API__Rate_Limiter                          import Fast_API__Rate_Limiter
+from osbot_fast_api.api.Fast_API__Rate_Limit__Buckets__SQLite           import Fast_API__Rate_Limit__Buckets__SQLite
+from osbot_fast_api.api.schemas.Schema__Fast_API__Config                import Schema__Fast_API__Config
+from tests.unit.api.middlewares.test_Middleware__Fused                  import An_Fast_API
+
+
+class test_Middleware__Rate_Limit__performance(TestCase):                               # cost of the rate limit check, per request
+
+    @classmethod
+    def setUpClass(cls):
+        cls.session = Performance_Measure__Session()
+        cls.loop    = asyncio.new_event_loop()
+        cls.scope   = dict(type='http', path='/an-route/ping', headers=[(b'an-api-key', b'an-value')], client=('127.0.0.1', 1234))
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.loop.close()
+
+    def request(self, app):                                                             # calls the ASGI app directly (no http client overhead in the measurement)
+        scope    = dict(type='http', asgi={'version': '3.0'}, http_version='1.1', method='GET', scheme='http',
+                        path='/an-route/ping', raw_path=b'/an-route/ping', root_path='', query_string=b'', headers=[],
+                        client=('127.0.0.1', 1234), server=('127.0.0.1', 80))
+        messages = []
+        async def receive():
+            return {'type': 'http.request', 'body': b'', 'more_body': False}
+        async def send(message):
+            messages.append(message)
+        self.loop.run_until_complete(app(scope, receive, send))
+        return messages
+
+    def test__check(self):                                                              # in memory: a few µs (SQLite, shared by the processes: tens of µs)
+        rate_limiter = Fast_API__Rate_Limiter(rate=1_000_000, burst=1_000_000, api_key_check=True)
+        with Temp_Folder() as temp_folder:
+            buckets      = Fast_API__Rate_Limit__Buckets__SQLite(db_path=path_combine(temp_folder.full_path, 'rate-limit.sqlite'))
+            rate_limiter__sqlite = Fast_API__Rate_Limiter(rate=1_000_000, burst=1_000_000, api_key_check=True, buckets=buckets)
+            memory = self.session.measure__quick(lambda: rate_limiter        .check(self.scope)).result.raw_score
+            sqlite = self.session.measure__quick(lambda: rate_limiter__sqlite.check(self.scope)).result.raw_score
+        assert memory < 20_000                                                          # (~4µs)
+        assert memory < sqlite                                                          # (~20µs)
+
+    def test__request(self):                                                            # whole request (fused middleware), with and without the rate limit
+        app__default    = An_Fast_API(config=Schema__Fast_API__Config(fused_middleware=True                                                                  )).setup().app()
+        app__rate_limit = An_Fast_API(config=Schema__Fast_API__Config(fused_middleware=True, rate_limit=True, rate_limit_per_second=1_000_000, rate_limit_burst=1_000_000)).setup().app()
+        assert self.request(app__rate_limit)[0]['status'] == 200
+        before = self.session.measure__quick(lambda: self.request(app__default   )).result.raw_score
+        after  = self.session.measure__quick(lambda: self.request(app__rate_limit)).result.raw_score
+        assert after < before * 1.5                                                     # (~4µs more, on ~110µs)
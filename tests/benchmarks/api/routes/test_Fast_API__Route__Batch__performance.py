@@ -0,0 +1,54 @@
+from unittest                                                           import TestCase
+from osbot_utils.helpers.duration.Duration                              import Duration
+from osbot_utils.type_safe.Type_Safe                                    import Type_Safe
+from osbot_utils.type_safe.primitives.domains.identifiers.Safe_Id       import Safe_Id
+from osbot_fast_api.api.Fast_API                                        import Fast_API
+from osbot_fast_api.api.routes.Fast_API__Routes                         import Fast_API__Routes
+from osbot_fast_api.api.schemas.Schema__Fast_API__Config                import Schema__Fast_API__Config
+
+
+class Perf__Item(Type_Safe):
+    item_id : Safe_Id
+    name    : str
+
+class Routes__Perf(Fast_API__Routes):
+    tag = 'perf'
+
+    def item__item_id(self, item_id: Safe_Id) -> Perf__Item:
+        return Perf__Item(item_id=item_id, name='an item')
+
+    def setup_routes(self):
+        self.add_route_get(self.item__item_id)
+
+
+class test_Fast_API__Route__Batch__performance(TestCase):                          # Chatty client: N separate requests vs one /batch request with N calls
+
+    @classmethod
+    def setUpClass(cls):
+        class Perf__Fast_API(Fast_API):
+            def setup_routes(self):
+                self.add_routes(Routes__Perf)
+        cls.client = Perf__Fast_API(config=Schema__Fast_API__Config(batch_routes=True)).setup().client()      # (with the default middlewares)
+
+    def measure_calls(self, calls_count):
+        paths = [f'/perf/item/item-{index}' for index in range(calls_count)]
+        def separate_requests():
+            return [self.client.get(path).json() for path in paths]
+        def batch_request():
+            response = self.client.post('/perf/batch', json=dict(requests=[dict(path=path) for path in paths]))
+            return [result['body'] for result in response.json()['results']]
+
+        assert separate_requests() == batch_request()
+        with Duration(print_result=False) as duration__before:
+            separate_requests()
+        with Duration(print_result=False) as duration__after:
+            batch_request()
+        return duration__before.seconds(), duration__after.seconds()
+
+    def test__calls_10(self):
+        before, after = self.measure_calls(10)
+        assert after < before
+
+    def test__calls_50(self):
+        before, after = self.measure_calls(50)
+        assert after * 1.5 < before
@@ -0,0 +1,60 @@
+import asyncio
+from unittest                                                           import TestCase
+from osbot_utils.helpers.performance.Performance_Measure__Session       import Performance_Measure__Session
+from osbot_fast_api.api.Fast_API                                        import Fast_API
+from osbot_fast_api.api.schemas.Schema__Fast_API__Config                import Schema__Fast_API__Config
+from tests.benchmarks.routes__for_benchmarks                            import create_routes_class
+
+
+def create_routes_classes(classes_count, routes_count):                            # classes_count Fast_API__Routes classes (each with its own tag) with routes_count path param routes
+    routes = [(f'route_{index}__value', 'value: str', 'dict', f'return dict(route={index}, value=value)', 'get') for index in range(routes_count)]
+    return [create_routes_class(routes, tag=f'area_{class_index}') for class_index in range(classes_count)]
+
+
+class test_Fast_API__Route__Dispatcher__performance(TestCase):                      # Per request routing cost: linear scan of all routes vs prefix trie
+
+    @classmethod
+    def setUpClass(cls):
+        cls.session        = Performance_Measure__Session()
+        cls.loop           = asyncio.new_event_loop()
+        cls.routes_classes = create_routes_classes(100, 10)
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.loop.close()
+
+    def create_app(self, radix_router):
+        routes_classes = self.routes_classes
+        class Perf__Fast_API(Fast_API):
+            def setup_routes(self):
+                for routes_class in routes_classes:
+                    self.add_routes(routes_class)
+        return Perf__Fast_API(config=Schema__Fast_API__Config(default_routes=False, radix_router=radix_router)).setup().app()
+
+    def request(self, app, path):                                                   # calls the ASGI app directly (no http client overhead in the measurement)
+        scope    = dict(type='http', asgi={'version': '3.0'}, http_version='1.1', method='GET', scheme='http',
+                        path=path, raw_path=path.encode(), root_path='', query_string=b'', headers=[],
+                        client=('127.0.0.1', 1234), server=('127.0.0.1', 80))
+        messages = []
+        async def receive():
+            return {'type': 'http.request', 'body': b'', 'more_body': False}
+        async def send(message):
+            messages.append(message)
+        self.loop.run_until_complete(app(scope, receive, send))
+        return messages[0]['status'], messages[1]['body']
+
+    def measure_request(self, path):
+        app__default = self.create_app(radix_router=False)
+        app__radix   = self.create_app(radix_router=True )
+        assert self.request(app__default, path) == self.request(app__radix, path)
+        before = self.session.measure__quick(lambda: self.request(app__default, path)).result.raw_score
+        after  = self.session.measure__quick(lambda: self.request(app__radix  , path)).result.raw_score
+        return before, after
+
+    def test__routes_1000__last_route(self):
+        before, after = self.measure_request('/area_99/route-9/abc')
+        assert after * 2 < before
+
+    def test__routes_1000__not_found(self):
+        before, after = self.measure_request('/area_1000/route-0/abc')
+        assert after * 2 < before
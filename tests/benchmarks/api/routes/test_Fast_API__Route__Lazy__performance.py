@@ -0,0 +1,52 @@
+from unittest                                                           import TestCase
+from osbot_utils.helpers.duration.Duration                              import Duration
+from osbot_utils.type_safe.Type_Safe                                    import Type_Safe
+from osbot_utils.type_safe.primitives.core.Safe_Str                     import Safe_Str
+from osbot_utils.type_safe.primitives.domains.identifiers.Safe_Id       import Safe_Id
+from osbot_fast_api.api.Fast_API                                        import Fast_API
+from osbot_fast_api.api.schemas.Schema__Fast_API__Config                import Schema__Fast_API__Config
+from tests.benchmarks                                                   import routes__for_benchmarks
+
+
+class Perf__Request(Type_Safe):
+    request_id : Safe_Id
+    name       : Safe_Str
+
+class Perf__Response(Type_Safe):
+    response_id : Safe_Id
+    value       : Safe_Str
+
+
+def create_routes_class(routes_count):                                              # Fast_API__Routes class with routes_count Type_Safe body/return routes
+    routes = [(f'route_{index}', 'request: Perf__Request', 'Perf__Response', 'return Perf__Response(value=request.name)', 'post') for index in range(routes_count)]
+    return routes__for_benchmarks.create_routes_class(routes, dict(Perf__Request=Perf__Request, Perf__Response=Perf__Response))
+
+
+class test_Fast_API__Route__Lazy__performance(TestCase):                            # Startup cost: eager APIRoute creation vs lazy placeholders
+
+    def measure_setup(self, routes_count, lazy_routes):
+        routes_class = create_routes_class(routes_count)
+        class Perf__Fast_API(Fast_API):
+            def setup_routes(self):
+                self.add_routes(routes_class)
+        with Duration(print_result=False) as duration:
+            fast_api = Perf__Fast_API(config=Schema__Fast_API__Config(default_routes=False, lazy_routes=lazy_routes)).setup()
+        assert len(fast_api.routes_paths()) == routes_count
+        return duration.seconds()
+
+    def measure_startup(self, routes_count):
+        before = self.measure_setup(routes_count, lazy_routes=False)
+        after  = self.measure_setup(routes_count, lazy_routes=True )
+        return before, after
+
+    def test__routes_10(self):
+        before, after = self.measure_startup(10)
+        assert after < before
+
+    def test__routes_100(self):
+        before, after = self.measure_startup(100)
+        assert after * 2 < before
+
+    def test__routes_1000(self):
+        before, after = self.measure_startup(1000)
+        assert after * 2 < before
@@ -0,0 +1,80 @@
+import importlib
+import statistics
+import sys
+from unittest                                                           import TestCase
+from osbot_utils.helpers.duration.Duration                              import Duration
+from osbot_utils.testing.Temp_Folder                                    import Temp_Folder
+from osbot_utils.utils.Files                                            import path_combine, file_create
+from osbot_fast_api.api.Fast_API                                        import Fast_API
+from osbot_fast_api.api.schemas.Schema__Fast_API__Config                import Schema__Fast_API__Config
+from osbot_fast_api.api.transformers.Type_Safe__To__BaseModel           import type_safe__to__basemodel
+
+
+def create_routes_module_source(routes_count, classes_count):                      # module with routes_count routes, using classes_count Type_Safe body/return classes
+    lines = ["from osbot_utils.type_safe.Type_Safe                                    import Type_Safe"                  ,
+             "from osbot_utils.type_safe.primitives.core.Safe_Str                     import Safe_Str"                   ,
+             "from osbot_utils.type_safe.primitives.domains.identifiers.Safe_Id       import Safe_Id"                    ,
+             "from osbot_fast_api.api.routes.Fast_API__Routes                         import Fast_API__Routes"           ]
+    for index in range(classes_count):
+        lines += [f"class Perf__Request_{index}(Type_Safe):"   ,
+                  f"    request_id : Safe_Id"                  ,
+                  f"    name       : Safe_Str"                 ,
+                  f"    count      : int = {index}"            ,
+                  f"class Perf__Response_{index}(Type_Safe):"  ,
+                  f"    response_id : Safe_Id"                 ,
+                  f"    value       : Safe_Str"                ]
+    lines += ["class Perf__Routes(Fast_API__Routes):",
+              "    tag = 'perf'"]
+    for index in range(routes_count):
+        class_index = index % classes_count
+        lines += [f"    def route_{index}__item_id(self, item_id: Safe_Id, request: Perf__Request_{class_index}) -> Perf__Response_{class_index}:",
+                  f"        return Perf__Response_{class_index}(value=request.name)"]
+    lines += ["    def setup_routes(self):"]
+    lines += [f"        self.add_route_post(self.route_{index}__item_id)" for index in range(routes_count)]
+    return '\n'.join(lines)
+
+
+class test_Fast_API__Route__Manifest__performance(TestCase):                       # Boot cost: route analysis (and BaseModel creation) vs loading it from the manifest
+
+    @classmethod
+    def setUpClass(cls):
+        cls.temp_folder = Temp_Folder().__enter__()
+        sys.path.insert(0, cls.temp_folder.full_path)
+
+    @classmethod
+    def tearDownClass(cls):
+        sys.path.remove(cls.temp_folder.full_path)
+        cls.temp_folder.__exit__(None, None, None)
+
+    def measure_boot(self, routes_count, classes_count, repeats=1):
+        module_name   = f'perf__routes__{routes_count}'
+        manifest_path = path_combine(self.temp_folder.full_path, f'{module_name}.json')
+        file_create(path_combine(self.temp_folder.full_path, f'{module_name}.py'), create_routes_module_source(routes_count, classes_count))
+        module = importlib.import_module(module_name)
+
+        class Perf__Fast_API(Fast_API):
+            def setup_routes(self):
+                self.add_routes(module.Perf__Routes)
+
+        def boot(route_manifest):
+            for name, value in vars(module).items():                               # each boot has to create its BaseModels (like a new process would)
+                if name.startswith('Perf__Re'):
+                    type_safe__to__basemodel.model_cache.pop(value, None)
+            with Duration(print_result=False) as duration:
+                fast_api = Perf__Fast_API(config=Schema__Fast_API__Config(default_routes=False, route_manifest=route_manifest)).setup()
+            assert len(fast_api.routes_paths()) == routes_count
+            return duration.seconds()
+
+        boot(manifest_path)                                                         # cold boot: creates the manifest
+        timings = [(boot(None), boot(manifest_path)) for _ in range(repeats)]       # (no manifest, warm boot) pairs, interleaved so that load changes affect both
+        before  = statistics.median(timing[0] for timing in timings)
+        after   = statistics.median(timing[1] for timing in timings)
+        return before, after
+
+    def test__routes_100(self):                                                     # (~310ms -> ~200ms)
+        before, after = self.measure_boot(100, 10, repeats=5)
+        assert after < before * 1.1                                                 # (margin: single boots vary by 10-20% on loaded machines)
+
+    def test__routes_1000(self):                                                    # (~4.0s -> ~3.5s)
+        before, after = self.measure_boot(1000, 100, repeats=3)
+        assert after < before * 1.1
@@ -0,0 +1,54 @@
+from unittest                                                           import TestCase
+from osbot_utils.helpers.duration.Duration                              import Duration
+from osbot_utils.helpers.performance.Performance_Measure__Session       import Performance_Measure__Session
+from osbot_fast_api.api.routes.Routes__Config                           import Routes__Config
+from osbot_fast_api.api.transformers.OpenAPI__To__Python                import OpenAPI__To__Python
+from osbot_fast_api.api.transformers.Type_Safe__To__LLM_Tools           import Type_Safe__To__LLM_Tools
+from osbot_fast_api.api.transformers.Type_Safe__To__Json                import type_safe__to__json
+from osbot_fast_api.utils.Fast_API__Request                             import Fast_API__Request
+from tests.unit.fast_api__for_tests                                     import fast_api
+from tests.benchmarks.api.transformers.test_Type_Safe__To__OpenAPI__performance import create_app
+
+
+class test_Routes__Config__performance(TestCase):                                      # /config/openapi.py and /config/llm-tools: generated on every request vs served from their caches
+
+    @classmethod
+    def setUpClass(cls):
+        cls.routes_config = Routes__Config(app=fast_api.app())
+        cls.session       = Performance_Measure__Session()
+        cls.app__models   = create_app(levels=4, width=25)                               # (100 routes, one per model)
+
+    def test__openapi_python(self):
+        request       = Fast_API__Request(scope_headers={'accept-encoding': 'gzip'}).request()
+        request__etag = Fast_API__Request(scope_headers={'if-none-match'  : self.routes_config.openapi_python__content().etag}).request()
+        def generate():
+            return OpenAPI__To__Python().generate_from_app(app=self.routes_config.app)
+        def cached():
+            return self.routes_config.openapi_python(request)
+        def not_modified():
+            return self.routes_config.openapi_python(request__etag)
+
+        assert cached      ().status_code == 200
+        assert not_modified().status_code == 304
+        before = self.session.measure__quick(generate    ).result.raw_score
+        after  = self.session.measure__quick(cached      ).result.raw_score
+        etag   = self.session.measure__quick(not_modified).result.raw_score
+        assert after * 10 < before
+        assert etag  * 10 < before
+
+    def test__llm_tools(self):
+        routes_config = Routes__Config(app=self.app__models)
+        request       = Fast_API__Request(scope_headers={'accept-encoding': 'gzip'}).request()
+        content       = routes_config.llm_tools__content('anthropic')
+
+        with Duration(print_result=False) as duration__per_class:                      # one class at a time (each call re-converts, deep copies and edits the class schema)
+            converter = Type_Safe__To__LLM_Tools()
+            tools     = [converter.to_anthropic_tool(cls, cls.__name__, cls.__name__) for cls in type_safe__to__json.app_classes(self.app__models)]
+        with Duration(print_result=False) as duration__cached:                         # 100 requests to /config/llm-tools
+            for _ in range(100):
+                response = routes_config.llm_tools(request, provider='anthropic')
+
+        assert len(tools)                                         == 100
+        assert response.body                                      == content.content_gzip
+        assert len(content.content_gzip) * 20                     < len(content.content)            # (~330KB → ~7KB)
+        assert duration__cached.seconds() * 10                    < duration__per_class.seconds()  # (~10ms vs ~270ms)
@@ -0,0 +1,71 @@
+import asyncio
+import statistics
+from unittest                                                                   import TestCase
+from fastapi                                                                    import FastAPI
+from osbot_utils.helpers.performance.Performance_Measure__Session               import Performance_Measure__Session
+from osbot_utils.type_safe.primitives.domains.identifiers.Safe_Id               import Safe_Id
+from osbot_fast_api.api.routes.Fast_API__Routes                                 import Fast_API__Routes
+from osbot_fast_api.api.routes.type_safe.Type_Safe__Route__Primitive_Cache      import type_safe__route__primitive_cache
+
+
+class Routes__Orgs(Fast_API__Routes):
+    tag = 'orgs'
+
+    def member__org_id__team_id__user_id(self, org_id: Safe_Id, team_id: Safe_Id, user_id: Safe_Id) -> dict:
+        return dict(org_id=org_id, team_id=team_id, user_id=user_id)
+
+    def setup_routes(self):
+        self.add_route_get(self.member__org_id__team_id__user_id)
+
+
+class test_Type_Safe__Route__Primitive_Cache__performance(TestCase):                   # GET route with three Safe_Id path params: primitives validated per request vs interned
+
+    @classmethod
+    def setUpClass(cls):
+        cls.session = Performance_Measure__Session()
+        cls.loop    = asyncio.new_event_loop()
+        cls.path    = '/orgs/member/org-acme-001/team-platform-042/user-4f9c2e71-b3a0'
+        type_safe__route__primitive_cache.enabled = False                               # (the converters are compiled when the routes are registered)
+        cls.app__before = Routes__Orgs(app=FastAPI()).setup().app
+        type_safe__route__primitive_cache.enabled = True
+        cls.app__after  = Routes__Orgs(app=FastAPI()).setup().app
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.loop.close()
+
+    def wrapper(self, app):                                                             # the route's endpoint (i.e. param conversions + route)
+        return next(route.endpoint for route in app.router.routes if route.path.startswith('/orgs/member'))
+
+    def request(self, app):                                                             # calls the ASGI app directly (no http client overhead in the measurement)
+        path     = self.path
+        scope    = dict(type='http', asgi={'version': '3.0'}, http_version='1.1', method='GET', scheme='http',
+                        path=path, raw_path=path.encode(), root_path='', query_string=b'', headers=[],
+                        client=('127.0.0.1', 1234), server=('127.0.0.1', 80))
+        messages = []
+        async def receive():
+            return {'type': 'http.request', 'body': b'', 'more_body': False}
+        async def send(message):
+            messages.append(message)
+        self.loop.run_until_complete(app(scope, receive, send))
+        return messages
+
+    def test__params_conversion(self):
+        kwargs         = dict(org_id='org-acme-001', team_id='team-platform-042', user_id='user-4f9c2e71-b3a0')
+        wrapper_before = self.wrapper(self.app__before)
+        wrapper_after  = self.wrapper(self.app__after )
+        assert wrapper_before(**kwargs) == wrapper_after(**kwargs) == kwargs
+        timings = [(self.session.measure__quick(lambda: wrapper_before(**kwargs)).result.raw_score,          # (interleaved, so that load changes affect both)
+                    self.session.measure__quick(lambda: wrapper_after (**kwargs)).result.raw_score) for _ in range(3)]
+        before  = statistics.median(timing[0] for timing in timings)
+        after   = statistics.median(timing[1] for timing in timings)
+        assert after < before * 1.1                                                     # (~1.2x to ~2x faster, with a margin for noisy machines)
+
+    def test__request(self):
+        assert self.request(self.app__before)[1]['body'] == self.request(self.app__after)[1]['body']
+        stats__before = type_safe__route__primitive_cache.stats()['Safe_Id']
+        self.session.measure__quick(lambda: self.request(self.app__before))
+        self.session.measure__quick(lambda: self.request(self.app__after ))
+        stats__after  = type_safe__route__primitive_cache.stats()['Safe_Id']
+        assert stats__after['misses'] == stats__before['misses']                        # (the three ids were already interned)
+        assert stats__after['hits'  ]  > stats__before['hits'  ]
@@ -0,0 +1,57 @@
+from unittest                                                               import TestCase
+from osbot_utils.helpers.performance.Performance_Measure__Session           import Performance_Measure__Session
+from osbot_utils.type_safe.primitives.domains.identifiers.Safe_Id           import Safe_Id
+from osbot_fast_api.api.routes.type_safe.Type_Safe__Route__Analyzer         import Type_Safe__Route__Analyzer
+from osbot_fast_api.api.routes.type_safe.Type_Safe__Route__Converter        import Type_Safe__Route__Converter
+from osbot_fast_api.api.routes.type_safe.Type_Safe__Route__Wrapper          import Type_Safe__Route__Wrapper
+from tests.benchmarks.routes__for_benchmarks                                import exec_source
+
+
+class test_Type_Safe__Route__Wrapper__performance(TestCase):                        # Per-request overhead of the compiled conversion plan vs the per-param converter calls
+
+    @classmethod
+    def setUpClass(cls):
+        cls.analyzer  = Type_Safe__Route__Analyzer()
+        cls.converter = Type_Safe__Route__Converter()
+        cls.wrapper   = Type_Safe__Route__Wrapper(converter=cls.converter)
+        cls.session   = Performance_Measure__Session(assert_enabled=True)
+
+    def create_route(self, params_count):                                           # Creates a GET route with params_count Safe_Id parameters
+        param_names = [f'id_{index}' for index in range(params_count)]
+        lines       = [f"def route_{params_count}({', '.join(f'{name}: Safe_Id' for name in param_names)}) -> dict:",
+                       f"    return {{}}"]
+        route       = exec_source(lines, f'route_{params_count}', dict(Safe_Id=Safe_Id))
+        signature   = self.analyzer.analyze_function(route)
+        signature   = self.converter.enrich_signature_with_conversions(signature)
+        kwargs      = {name: f'value-{name}' for name in param_names}
+        return route, signature, kwargs
+
+    def measure_route(self, params_count):
+        route, signature, kwargs = self.create_route(params_count)
+        wrapper                  = self.wrapper.create_wrapper(route, signature)
+        converter                = self.converter
+
+        def per_param_converter_calls():                                            # what the wrappers did before: @type_safe call + find_parameter scan per param
+            converted_kwargs = {}
+            for param_name, param_value in kwargs.items():
+                converted_kwargs[param_name] = converter.convert_parameter_value(param_name, param_value, signature)
+            return route(**converted_kwargs)
+
+        def compiled_conversion_plan():
+            return wrapper(**kwargs)
+
+        before = self.session.measure__fast(per_param_converter_calls).result.raw_score
+        after  = self.session.measure__fast(compiled_conversion_plan ).result.raw_score
+        return before, after
+
+    def test__params_1(self):
+        before, after = self.measure_route(1)
+        assert after < before
+
+    def test__params_5(self):
+        before, after = self.measure_route(5)
+        assert after < before
+
+    def test__params_20(self):
+        before, after = self.measure_route(20)
+        assert after * 2 < before                                                   # the gain grows with the number of params
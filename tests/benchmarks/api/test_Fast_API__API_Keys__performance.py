@@ -0,0 +1,32 @@
+import hmac
+from unittest                                                           import TestCase
+from osbot_utils.helpers.performance.Performance_Measure__Session       import Performance_Measure__Session
+from osbot_utils.testing.Temp_File                                      import Temp_File
+from osbot_utils.utils.Json                                             import json_save_file
+from osbot_fast_api.api.Fast_API__API_Keys                              import Fast_API__API_Keys
+
+
+class test_Fast_API__API_Keys__performance(TestCase):                                  # 10,000 tenant keys: comparing each key vs one sha256 + dict lookup
+
+    @classmethod
+    def setUpClass(cls):
+        cls.session  = Performance_Measure__Session()
+        cls.api_keys = [f'an-api-key-{index:05}' for index in range(10_000)]
+
+    def test__api_key(self):
+        with Temp_File(file_name='api-keys.json', return_file_path=True) as keys_file:
+            store = Fast_API__API_Keys(keys_file=keys_file, reload_interval=60)
+            json_save_file(dict(keys=[dict(key_hash=store.hash_key(api_key), tenant=f'tenant-{index}') for index, api_key in enumerate(self.api_keys)]), keys_file)
+            api_key = self.api_keys[-1]
+            def linear_scan():                                                          # (constant time compare with each key)
+                for value in self.api_keys:
+                    if hmac.compare_digest(value, api_key):
+                        return value
+            def store_lookup():
+                return store.api_key(api_key)
+
+            assert store.keys_count()     == 10_000
+            assert store_lookup().tenant  == 'tenant-9999'
+            before = self.session.measure__quick(linear_scan ).result.raw_score
+            after  = self.session.measure__quick(store_lookup).result.raw_score
+            assert after * 50 < before                                                  # (~2.5µs vs ~600µs)
@@ -0,0 +1,60 @@
+import asyncio
+from unittest                                                           import TestCase
+from fastapi                                                            import FastAPI
+from osbot_utils.helpers.performance.Performance_Measure__Session       import Performance_Measure__Session
+from osbot_fast_api.api.Fast_API__OpenAPI__Cache                        import Fast_API__OpenAPI__Cache
+
+
+def create_app(routes_count):
+    app = FastAPI()
+    for index in range(routes_count):
+        def an_route(item_id: str, page: int = 0, size: int = 10) -> dict:
+            return {}
+        app.get(f'/items-{index}/{{item_id}}', summary=f'Route {index}')(an_route)
+    return app
+
+
+class test_Fast_API__OpenAPI__Cache__performance(TestCase):                            # /openapi.json of an app with 200 routes: re-encoded on every request vs pre-serialized bytes
+
+    @classmethod
+    def setUpClass(cls):
+        cls.app__default = create_app(200)
+        cls.app__cached  = create_app(200)
+        cls.session      = Performance_Measure__Session()
+        cls.loop         = asyncio.new_event_loop()
+        Fast_API__OpenAPI__Cache(app=cls.app__cached).setup()
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.loop.close()
+
+    def request(self, app, headers):                                                    # calls the ASGI app directly (no http client overhead in the measurement)
+        scope    = dict(type='http', asgi={'version': '3.0'}, http_version='1.1', method='GET', scheme='http',
+                        path='/openapi.json', raw_path=b'/openapi.json', root_path='', query_string=b'', headers=headers,
+                        client=('127.0.0.1', 1234), server=('127.0.0.1', 80))
+        messages = []
+        async def receive():
+            return {'type': 'http.request', 'body': b'', 'more_body': False}
+        async def send(message):
+            messages.append(message)
+        self.loop.run_until_complete(app(scope, receive, send))
+        return messages
+
+    def test__openapi_json(self):
+        def default():
+            return self.request(self.app__default, [(b'accept-encoding', b'gzip')])
+        def cached():
+            return self.request(self.app__cached , [(b'accept-encoding', b'gzip')])
+        def not_modified():
+            return self.request(self.app__cached , [(b'if-none-match', etag.encode())])
+
+        etag = Fast_API__OpenAPI__Cache(app=self.app__cached).content().etag
+        assert default()[1]['body'] == Fast_API__OpenAPI__Cache(app=self.app__cached).content().content
+        assert len(cached()[1]['body']) * 10 < len(default()[1]['body'])                # gzip'd
+        assert not_modified()[0]['status'] == 304
+
+        before = self.session.measure__quick(default     ).result.raw_score
+        after  = self.session.measure__quick(cached      ).result.raw_score
+        etag_  = self.session.measure__quick(not_modified).result.raw_score
+        assert after * 5 < before
+        assert etag_ * 5 < before
@@ -0,0 +1,65 @@
+from typing                                                             import List
+from unittest                                                           import TestCase
+from osbot_utils.helpers.duration.Duration                              import Duration
+from osbot_utils.helpers.performance.Performance_Measure__Session       import Performance_Measure__Session
+from osbot_utils.type_safe.Type_Safe                                    import Type_Safe
+from osbot_utils.type_safe.primitives.core.Safe_Str                     import Safe_Str
+from osbot_utils.type_safe.primitives.domains.identifiers.Safe_Id       import Safe_Id
+from osbot_fast_api.api.Fast_API                                        import Fast_API
+from osbot_fast_api.api.Fast_API__Production_Mode                       import fast_api__production_mode
+from osbot_fast_api.api.schemas.Schema__Fast_API__Config                import Schema__Fast_API__Config
+from osbot_fast_api.api.transformers.Type_Safe__To__BaseModel           import type_safe__to__basemodel
+from tests.benchmarks                                                   import routes__for_benchmarks
+
+
+class Perf__Item(Type_Safe):
+    item_id : Safe_Id
+    name    : Safe_Str
+
+class Perf__Items(Type_Safe):
+    items : List[Perf__Item]
+
+
+def create_routes_class(routes_count):                                              # Fast_API__Routes class with routes_count Type_Safe path/return routes
+    routes = [(f'item_{index}__item_id', 'item_id: Safe_Id', 'Perf__Item', 'return Perf__Item(item_id=item_id)', 'get') for index in range(routes_count)]
+    return routes__for_benchmarks.create_routes_class(routes, dict(Safe_Id=Safe_Id, Perf__Item=Perf__Item))
+
+
+class test_Fast_API__Production_Mode__performance(TestCase):                       # Startup and conversion cost with and without the @type_safe checks on the framework internals
+
+    @classmethod
+    def setUpClass(cls):
+        cls.session = Performance_Measure__Session()
+
+    def tearDown(self):
+        fast_api__production_mode.disable()
+
+    def create_fast_api(self, routes_class):
+        class Perf__Fast_API(Fast_API):
+            def setup_routes(self):
+                self.add_routes(routes_class)
+        return Perf__Fast_API(config=Schema__Fast_API__Config(default_routes=False)).setup()
+
+    def measure_setup(self, routes_class):
+        with Duration(print_result=False) as duration:
+            fast_api = self.create_fast_api(routes_class)
+        return fast_api.routes_paths(), duration.seconds()
+
+    def test__startup__routes_300(self):                                            # (~660ms -> ~470ms, not asserted: wall clock timings are not stable on loaded machines)
+        routes_class           = create_routes_class(300)
+        routes_paths      , _  = self.measure_setup(routes_class)
+        fast_api__production_mode.enable()
+        routes_paths__prod, _  = self.measure_setup(routes_class)
+        assert routes_paths__prod == routes_paths
+        assert len(routes_paths)  == 300
+
+    def test__convert_instance(self):                                               # (~5.9ms -> ~4.2ms for 20 nested items, not asserted)
+        items = Perf__Items(items=[Perf__Item(item_id='abc', name='an-item') for _ in range(20)]).items
+        def convert_items():
+            return [type_safe__to__basemodel.convert_instance(item) for item in items]
+
+        response = convert_items()
+        self.session.measure__quick(convert_items)
+        fast_api__production_mode.enable()
+        assert convert_items() == response
+        self.session.measure__quick(convert_items)
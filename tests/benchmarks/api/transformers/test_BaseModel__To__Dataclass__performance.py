@@ -0,0 +1,46 @@
+from typing                                                                 import List, Dict, Optional
+from unittest                                                               import TestCase
+from pydantic                                                               import BaseModel
+from osbot_utils.helpers.duration.Duration                                  import Duration
+from osbot_fast_api.api.transformers.BaseModel__To__Dataclass               import BaseModel__To__Dataclass
+
+
+class Perf__Address(BaseModel):
+    street : str
+    city   : str = 'London'
+
+class Perf__Row(BaseModel):                                                         # typical row from an upstream service
+    row_id   : int
+    name     : str
+    price    : float                    = 0.0
+    active   : bool                     = True
+    tags     : List[str]                = []
+    attrs    : Dict[str, int]           = {}
+    address  : Optional[Perf__Address]  = None
+    history  : List[Perf__Address]      = []
+
+
+def create_rows(count):
+    return [Perf__Row(row_id=index, name=f'row-{index}', price=index * 1.5, tags=['a', 'b'], attrs={'index': index},
+                      address=Perf__Address(street=f'street-{index}'), history=[Perf__Address(street='previous')]) for index in range(count)]
+
+
+class test_BaseModel__To__Dataclass__performance(TestCase):                        # 100k rows: convert_instance per row (field by field introspection) vs convert_instances (compiled per class converter)
+
+    @classmethod
+    def setUpClass(cls):
+        cls.rows = create_rows(100_000)
+
+    def test__convert_instances(self):
+        converter = BaseModel__To__Dataclass()
+        sample    = self.rows[:2_000]                                               # (per row path is too slow to run on all the rows)
+        with Duration(print_result=False) as duration__per_row:
+            dataclasses__per_row = [converter.convert_instance(row) for row in sample]
+        with Duration(print_result=False) as duration__bulk:
+            dataclasses__bulk    = converter.convert_instances(self.rows)
+
+        assert len(dataclasses__bulk)                     == 100_000
+        assert dataclasses__bulk[:2_000]                  == dataclasses__per_row
+        per_row = duration__per_row.seconds() / 2_000
+        bulk    = duration__bulk   .seconds() / 100_000
+        assert bulk * 10 < per_row                                                  # (~260µs vs ~11µs per row, i.e. ~26s vs ~1.1s for the 100k rows)
@@ -0,0 +1,25 @@
+from unittest                                                               import TestCase
+from osbot_utils.helpers.duration.Duration                                  import Duration
+from osbot_fast_api.api.transformers.BaseModel__To__Type_Safe               import BaseModel__To__Type_Safe
+from tests.benchmarks.api.transformers.test_BaseModel__To__Dataclass__performance import create_rows
+
+
+class test_BaseModel__To__Type_Safe__performance(TestCase):                        # convert_instance per row (model_dump + field by field introspection) vs convert_instances (compiled per class converter)
+
+    @classmethod
+    def setUpClass(cls):
+        cls.rows = create_rows(4_000)                                               # (Type_Safe.__init__ dominates both paths, so 100k rows take ~30s even in bulk)
+
+    def test__convert_instances(self):
+        converter = BaseModel__To__Type_Safe()
+        sample    = self.rows[:2_000]
+        with Duration(print_result=False) as duration__per_row:
+            type_safes__per_row = [converter.convert_instance(row) for row in sample]
+        with Duration(print_result=False) as duration__bulk:
+            type_safes__bulk    = converter.convert_instances(self.rows)
+
+        assert len(type_safes__bulk) == 4_000
+        assert [type_safe.json() for type_safe in type_safes__bulk[:2_000]] == [type_safe.json() for type_safe in type_safes__per_row]
+        per_row = duration__per_row.seconds() / 2_000
+        bulk    = duration__bulk   .seconds() / 4_000
+        assert bulk * 1.5 < per_row                                                 # (~600µs vs ~280µs per row)
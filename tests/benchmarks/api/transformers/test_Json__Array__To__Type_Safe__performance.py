@@ -0,0 +1,101 @@
+import asyncio
+import json
+import tracemalloc
+from typing                                                                 import Iterator, List
+from unittest                                                               import TestCase
+from osbot_utils.type_safe.Type_Safe                                        import Type_Safe
+from osbot_utils.type_safe.primitives.core.Safe_Str                         import Safe_Str
+from osbot_utils.type_safe.primitives.domains.identifiers.Safe_Id           import Safe_Id
+from osbot_fast_api.api.Fast_API                                            import Fast_API
+from osbot_fast_api.api.routes.Fast_API__Routes                             import Fast_API__Routes
+from osbot_fast_api.api.schemas.Schema__Fast_API__Config                    import Schema__Fast_API__Config
+
+CHUNK_SIZE = 65536                                                                  # same size as the chunks uvicorn passes to the app
+
+
+class Perf__Record(Type_Safe):
+    record_id : Safe_Id
+    name      : Safe_Str
+    value     : int
+    tags      : List[str]
+
+class Perf__Records(Type_Safe):
+    records : List[Perf__Record]
+
+class Routes__Bulk(Fast_API__Routes):
+    tag = 'bulk'
+
+    def import_buffered(self, records: Perf__Records) -> dict:                      # whole body validated as one BaseModel, then converted to Type_Safe
+        return dict(count=len(records.records), total=sum(record.value for record in records.records))
+
+    def import_streamed(self, records: Iterator[Perf__Record]) -> dict:             # body decoded item by item
+        count, total = 0, 0
+        for record in records:
+            count += 1
+            total += record.value
+        return dict(count=count, total=total)
+
+    def setup_routes(self):
+        self.add_route_post(self.import_buffered)
+        self.add_route_post(self.import_streamed)
+
+
+class test_Json__Array__To__Type_Safe__performance(TestCase):                      # Peak memory of bulk imports: buffered List[Type_Safe] body vs Iterator[Type_Safe] body
+
+    @classmethod
+    def setUpClass(cls):
+        class Perf__Fast_API(Fast_API):
+            def setup_routes(self):
+                self.add_routes(Routes__Bulk)
+        cls.app  = Perf__Fast_API(config=Schema__Fast_API__Config(default_routes=False)).setup().app()
+        cls.loop = asyncio.new_event_loop()
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.loop.close()
+
+    def request(self, path, body):                                                  # calls the ASGI app directly, sending the body in chunks (like uvicorn)
+        scope    = dict(type='http', asgi={'version': '3.0'}, http_version='1.1', method='POST', scheme='http',
+                        path=path, raw_path=path.encode(), root_path='', query_string=b'',
+                        headers=[(b'content-type', b'application/json'), (b'content-length', str(len(body)).encode())],
+                        client=('127.0.0.1', 1234), server=('127.0.0.1', 80))
+        offsets  = iter(range(0, len(body), CHUNK_SIZE))
+        messages = []
+        async def receive():
+            offset = next(offsets, None)
+            if offset is None:
+                return {'type': 'http.disconnect'}
+            return {'type': 'http.request', 'body': body[offset:offset + CHUNK_SIZE], 'more_body': offset + CHUNK_SIZE < len(body)}
+        async def send(message):
+            messages.append(message)
+        self.loop.run_until_complete(self.app(scope, receive, send))
+        return json.loads(messages[1]['body'])
+
+    def measure_request(self, path, body):                                          # Returns (response, peak memory in bytes)
+        tracemalloc.start()
+        try:
+            response = self.request(path, body)
+            _, peak  = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+        return response, peak
+
+    def measure_import(self, records_count):
+        records         = [dict(record_id=f'record-{index}', name=f'a name {index}', value=index, tags=['a', 'b']) for index in range(records_count)]
+        body__buffered  = json.dumps(dict(records=records)).encode()
+        body__streamed  = json.dumps(records).encode()
+        records         = None
+        self.request('/bulk/import-streamed', b'[]')                                 # warm up (thread pool and compiled decoders)
+        response__buffered, peak__buffered = self.measure_request('/bulk/import-buffered', body__buffered)
+        response__streamed, peak__streamed = self.measure_request('/bulk/import-streamed', body__streamed)
+        assert response__buffered == response__streamed == dict(count=records_count, total=records_count * (records_count - 1) // 2)
+        return peak__buffered, peak__streamed, len(body__streamed)
+
+    def test__records_1000(self):
+        peak__buffered, peak__streamed, body_size = self.measure_import(1000)
+        assert peak__streamed < peak__buffered
+
+    def test__records_20000(self):
+        peak__buffered, peak__streamed, body_size = self.measure_import(20000)
+        assert peak__streamed      < body_size                                      # less memory than the payload itself
+        assert peak__streamed * 20 < peak__buffered
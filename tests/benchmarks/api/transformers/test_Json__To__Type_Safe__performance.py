@@ -0,0 +1,59 @@
+import json
+from typing                                                                 import List
+from unittest                                                               import TestCase
+from osbot_utils.helpers.performance.Performance_Measure__Session           import Performance_Measure__Session
+from osbot_utils.type_safe.Type_Safe                                        import Type_Safe
+from osbot_fast_api.api.routes.type_safe.Type_Safe__Route__Converter        import Type_Safe__Route__Converter
+from osbot_fast_api.api.transformers.Type_Safe__To__BaseModel               import type_safe__to__basemodel
+from osbot_fast_api.client.testing.Test__Fast_API__With_Routes              import Schema__User, Schema__Product
+
+
+class Perf__Order(Type_Safe):                                                       # Test__Fast_API__With_Routes schemas, nested and scaled up
+    user     : Schema__User
+    products : List[Schema__Product]
+
+class Perf__Orders(Type_Safe):
+    orders : List[Perf__Order]
+
+
+class test_Json__To__Type_Safe__performance(TestCase):                              # Body decoding cost: BaseModel validation + model_dump + Type_Safe(**data) vs compiled decoder
+
+    @classmethod
+    def setUpClass(cls):
+        cls.session   = Performance_Measure__Session()
+        cls.converter = Type_Safe__Route__Converter()
+
+    def create_body(self, orders_count, products_count):
+        user     = dict(id=1, name='a user', email='user@test.com')
+        products = [dict(id=index, name=f'product {index}', price=index + 0.5) for index in range(products_count)]
+        orders   = [dict(user=user, products=products) for _ in range(orders_count)]
+        return json.dumps(dict(orders=orders)).encode()
+
+    def measure_body(self, orders_count, products_count):
+        body             = self.create_body(orders_count, products_count)
+        basemodel_class  = type_safe__to__basemodel.convert_class(Perf__Orders)
+        type_safe_to_obj = self.converter.compile_type_safe_converter(Perf__Orders, None)
+        decoder          = self.converter.compile_type_safe_decoder  (Perf__Orders, type_safe_to_obj)
+
+        def basemodel_body():                                                       # what the BASEMODEL body mode does for each request
+            return type_safe_to_obj(basemodel_class.model_validate(json.loads(body)))
+
+        def type_safe_body():                                                       # what the TYPE_SAFE body mode does for each request
+            return decoder(json.loads(body))
+
+        assert basemodel_body().json() == type_safe_body().json()
+        before = self.session.measure__quick(basemodel_body).result.raw_score
+        after  = self.session.measure__quick(type_safe_body).result.raw_score
+        return before, after
+
+    def test__orders_1__products_10(self):
+        before, after = self.measure_body(1, 10)
+        assert after * 5 < before
+
+    def test__orders_1__products_1000(self):
+        before, after = self.measure_body(1, 1000)
+        assert after * 5 < before
+
+    def test__orders_10__products_100(self):
+        before, after = self.measure_body(10, 100)
+        assert after * 5 < before
@@ -0,0 +1,95 @@
+from typing                                                                 import List, Dict
+from unittest                                                               import TestCase
+from osbot_utils.helpers.performance.Performance_Measure__Session           import Performance_Measure__Session
+from osbot_utils.type_safe.Type_Safe                                        import Type_Safe
+from osbot_utils.type_safe.Type_Safe__Primitive                             import Type_Safe__Primitive
+from osbot_utils.type_safe.primitives.core.Safe_Int                         import Safe_Int
+from osbot_utils.type_safe.primitives.core.Safe_Str                         import Safe_Str
+from osbot_utils.type_safe.primitives.domains.identifiers.Safe_Id           import Safe_Id
+from osbot_utils.type_safe.type_safe_core.collections.Type_Safe__Dict       import Type_Safe__Dict
+from osbot_utils.type_safe.type_safe_core.collections.Type_Safe__List       import Type_Safe__List
+from osbot_fast_api.api.transformers.Type_Safe__To__BaseModel               import type_safe__to__basemodel
+
+
+class Perf__Level_5(Type_Safe):
+    level_id : Safe_Id
+    value    : Safe_Int
+    tags     : List[Safe_Str]
+
+class Perf__Level_4(Type_Safe):
+    level_id : Safe_Id
+    children : List[Perf__Level_5]
+
+class Perf__Level_3(Type_Safe):
+    level_id : Safe_Id
+    children : List[Perf__Level_4]
+    index    : Dict[Safe_Id, Safe_Int]
+
+class Perf__Level_2(Type_Safe):
+    level_id : Safe_Id
+    children : List[Perf__Level_3]
+
+class Perf__Level_1(Type_Safe):
+    level_id : Safe_Id
+    name     : Safe_Str
+    children : List[Perf__Level_2]
+
+
+def create_tree(width):                                                             # 5 levels, width children per list
+    def level_5(index): return Perf__Level_5(level_id=f'l5-{index}', value=index, tags=['a', 'b'])
+    def level_4(index): return Perf__Level_4(level_id=f'l4-{index}', children=[level_5(i) for i in range(width)])
+    def level_3(index): return Perf__Level_3(level_id=f'l3-{index}', children=[level_4(i) for i in range(width)], index={f'k-{i}': i for i in range(width)})
+    def level_2(index): return Perf__Level_2(level_id=f'l2-{index}', children=[level_3(i) for i in range(width)])
+    return Perf__Level_1(level_id='l1', name='tree', children=[level_2(i) for i in range(width)])
+
+
+def recursive_extract(instance):                                                    # the previous extract_instance_data: BaseModel instance + model_dump at every nested level
+    data = {}
+    for field_name, field_value in instance.__locals__().items():
+        if isinstance(field_value, Type_Safe__Primitive):
+            data[field_name] = field_value.__primitive_base__(field_value)
+        elif isinstance(field_value, Type_Safe__List):
+            data[field_name] = [recursive_convert(item).dict() if isinstance(item, Type_Safe) else item for item in field_value]
+        elif isinstance(field_value, Type_Safe__Dict):
+            data[field_name] = {key: recursive_convert(value).model_dump() if isinstance(value, Type_Safe) else value for key, value in field_value.items()}
+        elif isinstance(field_value, Type_Safe):
+            data[field_name] = recursive_convert(field_value).model_dump()
+        else:
+            data[field_name] = field_value
+    return data
+
+def recursive_convert(instance):
+    return type_safe__to__basemodel.convert_class(type(instance))(**recursive_extract(instance))
+
+
+class test_Type_Safe__To__BaseModel__performance(TestCase):                        # Serialization of 5-level nested schemas: BaseModel per nested level vs compiled single pass to_dict
+
+    @classmethod
+    def setUpClass(cls):
+        cls.session = Performance_Measure__Session()
+
+    def measure_tree(self, width):
+        tree = create_tree(width)
+
+        def before__convert_instance():
+            return recursive_convert(tree).model_dump()
+        def after__convert_instance():
+            return type_safe__to__basemodel.convert_instance(tree).model_dump()
+        def after__to_dict():                                                       # (what the BASEMODEL response mode now returns to FastAPI)
+            return type_safe__to__basemodel.to_dict(tree)
+
+        assert before__convert_instance() == after__convert_instance() == after__to_dict()
+        before         = self.session.measure__quick(before__convert_instance).result.raw_score
+        after          = self.session.measure__quick(after__convert_instance ).result.raw_score
+        after__to_dict = self.session.measure__quick(after__to_dict          ).result.raw_score
+        return before, after, after__to_dict
+
+    def test__width_2(self):                                                        # 31 nested objects
+        before, after, after__to_dict = self.measure_tree(2)
+        assert after          < before
+        assert after__to_dict < after
+
+    def test__width_4(self):                                                        # 341 nested objects
+        before, after, after__to_dict = self.measure_tree(4)
+        assert after      * 4 < before
+        assert after__to_dict < after
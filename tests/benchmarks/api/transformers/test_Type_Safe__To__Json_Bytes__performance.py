@@ -0,0 +1,56 @@
+from typing                                                                 import List
+from unittest                                                               import TestCase
+from fastapi.encoders                                                       import jsonable_encoder
+from starlette.responses                                                    import JSONResponse
+from osbot_utils.helpers.performance.Performance_Measure__Session           import Performance_Measure__Session
+from osbot_utils.type_safe.Type_Safe                                        import Type_Safe
+from osbot_utils.type_safe.primitives.core.Safe_Str                         import Safe_Str
+from osbot_utils.type_safe.primitives.core.Safe_Int                         import Safe_Int
+from osbot_utils.type_safe.primitives.domains.identifiers.Safe_Id           import Safe_Id
+from osbot_fast_api.api.transformers.Type_Safe__To__BaseModel               import type_safe__to__basemodel
+from osbot_fast_api.api.transformers.Type_Safe__To__Json_Bytes              import type_safe__to__json_bytes
+
+
+class Perf__Item(Type_Safe):
+    item_id  : Safe_Id
+    name     : Safe_Str
+    quantity : Safe_Int
+    tags     : List[Safe_Str]
+
+class Perf__Payload(Type_Safe):
+    payload_id : Safe_Id
+    items      : List[Perf__Item]
+
+
+class test_Type_Safe__To__Json_Bytes__performance(TestCase):                        # Response encoding cost: BaseModel round-trip + FastAPI encoding vs compiled encoder
+
+    @classmethod
+    def setUpClass(cls):
+        cls.session = Performance_Measure__Session()
+
+    def create_payload(self, items_count):
+        items = [Perf__Item(item_id=f'item-{index}', name=f'name {index}', quantity=index, tags=['a', 'b']) for index in range(items_count)]
+        return Perf__Payload(payload_id='payload', items=items)
+
+    def measure_payload(self, items_count):
+        payload = self.create_payload(items_count)
+
+        def basemodel_round_trip():                                                 # what the BASEMODEL response mode does for each response
+            data = type_safe__to__basemodel.convert_instance(payload).model_dump()
+            return JSONResponse(jsonable_encoder(data)).body
+
+        def json_bytes():                                                           # what the JSON_BYTES response mode does for each response
+            return type_safe__to__json_bytes.to_bytes(payload)
+
+        assert basemodel_round_trip() == json_bytes()
+        before = self.session.measure__quick(basemodel_round_trip).result.raw_score
+        after  = self.session.measure__quick(json_bytes          ).result.raw_score
+        return before, after
+
+    def test__items_10(self):
+        before, after = self.measure_payload(10)
+        assert after * 5 < before
+
+    def test__items_1000(self):
+        before, after = self.measure_payload(1000)
+        assert after * 5 < before
@@ -0,0 +1,50 @@
+from typing                                                                 import List, Optional
+from unittest                                                               import TestCase
+from fastapi                                                                import FastAPI
+from osbot_utils.helpers.duration.Duration                                  import Duration
+from osbot_utils.type_safe.Type_Safe                                        import Type_Safe
+from osbot_utils.type_safe.primitives.core.Safe_Int                         import Safe_Int
+from osbot_utils.type_safe.primitives.core.Safe_Str                         import Safe_Str
+from osbot_utils.type_safe.primitives.domains.identifiers.Safe_Id           import Safe_Id
+from osbot_fast_api.api.transformers.Type_Safe__To__Json                    import Type_Safe__To__Json
+from tests.benchmarks.routes__for_benchmarks                                import create_routes_class
+
+
+def create_app(models_count):                                                       # app with one route per model (each model uses the previous two)
+    namespace = dict(Type_Safe=Type_Safe, List=List, Optional=Optional, Safe_Id=Safe_Id, Safe_Str=Safe_Str, Safe_Int=Safe_Int)
+    lines     = []
+    for index in range(models_count):
+        lines += [f"class Perf__Model_{index}(Type_Safe):",
+                  f"    model_id : Safe_Id"                ,
+                  f"    name     : Safe_Str"               ,
+                  f"    count    : Safe_Int"               ,
+                  f"    tags     : List[str]"              ]
+        if index > 1:
+            lines += [f"    parent   : Optional[Perf__Model_{index - 1}]",
+                      f"    children : List[Perf__Model_{index - 2}]"   ]
+    routes = [(f'model_{index}', f'model: Perf__Model_{index}', f'Perf__Model_{index}', 'return model', 'post') for index in range(models_count)]
+    return create_routes_class(routes, namespace, lines_head=lines)(app=FastAPI(), lazy_routes=True).setup().app
+
+
+class test_Type_Safe__To__Json__performance(TestCase):                             # Schemas of all the models used by an app: first build vs rebuilds (i.e. OpenAPI and LLM tools exports)
+
+    @classmethod
+    def setUpClass(cls):
+        cls.app = create_app(300)
+
+    def test__convert_app(self):
+        def first_build():                                                          # (new converter: empty caches)
+            return Type_Safe__To__Json().convert_app(self.app)
+        converter = Type_Safe__To__Json()
+        converter.convert_app(self.app)
+        def rebuild():
+            return converter.convert_app(self.app)
+
+        with Duration(print_result=False) as duration__before:
+            schemas = first_build()
+        with Duration(print_result=False) as duration__after:
+            schemas__rebuild = rebuild()
+        assert len(schemas)                                    == 300
+        assert list(schemas__rebuild)                          == list(schemas)                     # (full values differ: Safe_Id defaults are random)
+        assert [schema['title'] for schema in schemas.values()] == [cls.__name__ for cls in schemas]
+        assert duration__after.seconds() * 5 < duration__before.seconds()
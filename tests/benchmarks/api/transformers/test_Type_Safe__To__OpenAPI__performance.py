@@ -0,0 +1,55 @@
+import json
+from typing                                                                 import List, Optional
+from unittest                                                               import TestCase
+from fastapi                                                                import FastAPI
+from osbot_utils.helpers.duration.Duration                                  import Duration
+from osbot_utils.type_safe.Type_Safe                                        import Type_Safe
+from osbot_utils.type_safe.primitives.core.Safe_Str                         import Safe_Str
+from osbot_utils.type_safe.primitives.domains.identifiers.Safe_Id           import Safe_Id
+from osbot_fast_api.api.transformers.Type_Safe__To__Json                    import Type_Safe__To__Json
+from osbot_fast_api.api.transformers.Type_Safe__To__OpenAPI                 import Type_Safe__To__OpenAPI
+from tests.benchmarks.routes__for_benchmarks                                import create_routes_class
+
+
+def create_app(levels, width):                                                      # model graph: each model uses three models of the level below (so inlined schemas grow 3x per level)
+    namespace = dict(Type_Safe=Type_Safe, List=List, Optional=Optional, Safe_Id=Safe_Id, Safe_Str=Safe_Str)
+    lines     = []
+    models    = []
+    for level in range(levels):
+        for index in range(width):
+            model = f'Perf__Model_{level}_{index}'
+            lines += [f"class {model}(Type_Safe):",
+                      f"    model_id : Safe_Id"   ,
+                      f"    name     : Safe_Str"  ]
+            if level:
+                below  = [f'Perf__Model_{level - 1}_{(index + offset) % width}' for offset in range(3)]
+                lines += [f"    main     : {below[0]}"               ,
+                          f"    items    : List[{below[1]}]"         ,
+                          f"    parent   : Optional[{below[2]}]"     ]
+            models.append(model)
+    routes = [(model.lower(), f'model: {model}', model, 'return model', 'post') for model in models]
+    return create_routes_class(routes, namespace, lines_head=lines)(app=FastAPI(), lazy_routes=True).setup().app
+
+
+class test_Type_Safe__To__OpenAPI__performance(TestCase):                          # Whole app spec: schemas inlined for each route (Type_Safe__To__Json) vs each class once in components ($refs)
+
+    @classmethod
+    def setUpClass(cls):
+        cls.app = create_app(levels=7, width=4)
+
+    def test__generate_from_app(self):
+        def inlined():                                                              # request and response schemas of each route
+            converter = Type_Safe__To__Json()
+            schemas   = [converter.convert_class(cls) for cls in converter.app_classes(self.app)]
+            return json.dumps(dict(requests=schemas, responses=schemas))
+        def with_refs():
+            return json.dumps(Type_Safe__To__OpenAPI().generate_from_app(self.app))
+
+        with Duration(print_result=False) as duration__inlined:
+            spec__inlined = inlined()
+        with Duration(print_result=False) as duration__with_refs:
+            spec__with_refs = with_refs()
+
+        assert len(json.loads(spec__with_refs)['components']['schemas']) == 7 * 4
+        assert len(spec__with_refs) * 50 < len(spec__inlined)                       # (~22KB vs ~3MB)
+        assert duration__with_refs.seconds() * 2 < duration__inlined.seconds()          # (~30ms vs ~125ms)
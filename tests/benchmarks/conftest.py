@@ -0,0 +1,8 @@
+import pytest
+from osbot_utils.utils.Env                                              import get_env
+
+ENV_NAME__RUN_BENCHMARKS = 'RUN_BENCHMARKS'                                         # the benchmarks (timings compared across implementations) are not part of the unit tests
+
+def pytest_runtest_setup(item):                                                     # (only called for the tests in this folder)
+    if not get_env(ENV_NAME__RUN_BENCHMARKS):
+        pytest.skip(f"benchmark (set {ENV_NAME__RUN_BENCHMARKS}=1 to run it)")
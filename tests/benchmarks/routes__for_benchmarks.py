@@ -0,0 +1,28 @@
+from osbot_fast_api.api.routes.Fast_API__Routes                         import Fast_API__Routes
+
+# helpers to create the (large) classes and route functions used by the benchmarks, from generated source code
+
+
+def exec_source(lines     : list ,                                                  # Source code lines
+                name      : str  ,                                                  # Name of the class or function (defined in lines) to return
+                namespace : dict                                                    # Globals used by the source code
+                ):
+    namespace = dict(namespace)
+    exec('\n'.join(lines), namespace)
+    return namespace[name]
+
+
+def create_routes_class(routes     : list        ,                                  # [(method name, params, return type, body, 'get' or 'post')]
+                        namespace  : dict = None ,                                  # Classes used by the routes (i.e. their Type_Safe params)
+                        tag        : str  = 'perf',
+                        lines_head : list = ()                                      # Source code before the routes class (i.e. generated models)
+                        ):                                                          # Returns Fast_API__Routes class (named Perf__Routes) with the routes
+    lines  = list(lines_head)
+    lines += ["class Perf__Routes(Fast_API__Routes):",
+              f"    tag = '{tag}'"]
+    for method_name, params, return_type, body, _ in routes:
+        lines += [f"    def {method_name}(self{', ' + params if params else ''}) -> {return_type}:",
+                  f"        {body}"]
+    lines += ["    def setup_routes(self):"]
+    lines += [f"        self.add_route_{http_method}(self.{method_name})" for method_name, _, _, _, http_method in routes]
+    return exec_source(lines, 'Perf__Routes', dict(namespace or {}, Fast_API__Routes=Fast_API__Routes))
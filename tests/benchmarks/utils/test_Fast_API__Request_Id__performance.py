@@ -0,0 +1,34 @@
+from unittest                                                           import TestCase
+from osbot_utils.helpers.performance.Performance_Measure__Session       import Performance_Measure__Session
+from osbot_utils.type_safe.primitives.domains.identifiers.Random_Guid   import Random_Guid
+from osbot_fast_api.api.schemas.enums.Enum__Fast_API__Request_Id__Mode  import Enum__Fast_API__Request_Id__Mode
+from osbot_fast_api.events.Fast_API__Http_Event                         import Fast_API__Http_Event
+from osbot_fast_api.utils.Fast_API__Request_Id                          import Fast_API__Request_Id
+
+
+class test_Fast_API__Request_Id__performance(TestCase):                                 # request id per request: uuid4 (+ Random_Guid validation) vs per-process prefix + counter
+
+    @classmethod
+    def setUpClass(cls):
+        cls.session = Performance_Measure__Session()
+
+    def test__new_request_id(self):
+        request_id__random     = Fast_API__Request_Id(mode=Enum__Fast_API__Request_Id__Mode.RANDOM_GUID)
+        request_id__sequential = Fast_API__Request_Id(mode=Enum__Fast_API__Request_Id__Mode.SEQUENTIAL )
+        headers                = [(b'host', b'testserver'), (b'accept', b'*/*'), (b'user-agent', b'testclient')]
+
+        before = self.session.measure__quick(lambda: request_id__random    .request_id(headers)).result.raw_score
+        after  = self.session.measure__quick(lambda: request_id__sequential.request_id(headers)).result.raw_score
+        assert after * 3 < before                                                       # (~3µs vs ~17µs)
+
+    def test__http_event__set_ids(self):                                                # event_id is no longer re-validated by each of the 4 schemas
+        http_event = Fast_API__Http_Event()
+        def set_ids__validated():
+            http_event.http_event_info    .event_id = http_event.event_id
+            http_event.http_event_request .event_id = http_event.event_id
+            http_event.http_event_response.event_id = http_event.event_id
+            http_event.http_event_traces  .event_id = http_event.event_id
+        before = self.session.measure__quick(set_ids__validated ).result.raw_score
+        after  = self.session.measure__quick(http_event.set_ids ).result.raw_score
+        assert type(http_event.http_event_info.event_id) is Random_Guid
+        assert after * 5 < before                                                       # (~2µs vs ~35µs)
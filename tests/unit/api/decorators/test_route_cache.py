@@ -0,0 +1,149 @@
+import time
+from unittest                                                           import TestCase
+from unittest.mock                                                      import patch
+from fastapi                                                            import FastAPI, HTTPException, Request
+from pydantic                                                           import BaseModel
+from fastapi.testclient                                                 import TestClient
+from osbot_utils.type_safe.Type_Safe                                    import Type_Safe
+from osbot_utils.type_safe.primitives.domains.identifiers.Safe_Id       import Safe_Id
+from osbot_fast_api.api.decorators.route_cache                          import route_cache
+from osbot_fast_api.api.decorators.route_path                           import route_path
+from osbot_fast_api.api.routes.Fast_API__Routes                         import Fast_API__Routes
+
+
+class An_Item(Type_Safe):
+    item_id : Safe_Id
+    name    : str
+
+class An_Public_Item(BaseModel):
+    name : str
+
+class Routes__Cached(Fast_API__Routes):
+    tag   = 'cached'
+    calls : list
+
+    @route_cache(ttl_seconds=0.2, max_entries=2)
+    def item__item_id(self, item_id: Safe_Id) -> An_Item:
+        self.calls.append(item_id)
+        return An_Item(item_id=item_id, name='an item')
+
+    @route_cache()
+    async def total(self, a: int = 1, b: int = 2) -> dict:
+        self.calls.append(a + b)
+        return dict(total=a + b)
+
+    @route_cache()
+    @route_path('/status/{code}')
+    def status(self, code: int):
+        self.calls.append(code)
+        if code >= 400:
+            raise HTTPException(status_code=code, detail='an error')
+        return dict(code=code)
+
+    @route_cache()
+    def public_item(self) -> An_Public_Item:                                            # (response_model filters out the extra fields)
+        self.calls.append('public_item')
+        return dict(name='an item', secret='a secret')
+
+    def not_cached(self) -> dict:
+        self.calls.append('not_cached')
+        return dict(ok=True)
+
+    def setup_routes(self):
+        self.add_routes_get(self.item__item_id, self.total, self.status, self.public_item, self.not_cached)
+
+
+class test_route_cache(TestCase):
+
+    def create_client(self, **kwargs):
+        routes = Routes__Cached(app=FastAPI(), **kwargs).setup()
+        return routes, TestClient(routes.app)
+
+    def test_route_cache(self):
+        def an_function(): pass
+        assert route_cache()(an_function)                 is an_function
+        assert an_function.__route_cache__                == dict(ttl_seconds=60.0, max_entries=1000)
+        assert route_cache(ttl_seconds=5)(an_function).__route_cache__ == dict(ttl_seconds=5.0, max_entries=1000)
+
+    def test__cached_routes(self):
+        routes, client = self.create_client()
+
+        for _ in range(3):
+            response = client.get('/cached/item/abc')
+            assert response.status_code             == 200
+            assert response.json()                  == dict(item_id='abc', name='an item')
+            assert response.headers['content-type'] == 'application/json'
+            assert client.get('/cached/total', params=dict(a=3)).json() == dict(total=5)
+            assert client.get('/cached/not-cached').json()              == dict(ok=True)
+        assert routes.calls == [Safe_Id('abc'), 5, 'not_cached', 'not_cached', 'not_cached']
+
+        assert client.get('/cached/status/200').json() == dict(code=200)
+        assert client.get('/cached/status/200').json() == dict(code=200)
+        assert client.get('/cached/status/404').status_code == 404                       # errors are not cached
+        assert client.get('/cached/status/404').status_code == 404
+        assert routes.calls[-3:]                            == [200, 404, 404]
+        assert client.get('/cached/item/a b').status_code   == 200                       # (invalid chars converted by Safe_Id before the cache lookup)
+
+        assert routes.cache_stats()['item__item_id'] == dict(hits=2, misses=2, evictions=0, entries=2, ttl_seconds=0.2, max_entries=2)
+        assert routes.cache_stats()['total'        ]['hits'] == 2
+
+    def test__cached_routes__response_model(self):                                       # cached responses are serialized by FastAPI (with the response_model) like the uncached ones
+        routes, client = self.create_client()
+        assert client.get('/cached/public-item').json() == dict(name='an item')
+        assert client.get('/cached/public-item').json() == dict(name='an item')
+        assert routes.calls                             == ['public_item']
+
+    def test__cached_routes__encoded_once(self):                                         # hits send the cached bytes (no response_model validation or serialization by FastAPI)
+        routes, client = self.create_client()
+        response = client.get('/cached/item/abc')
+        with patch('fastapi.routing.serialize_response', side_effect=AssertionError('not used on hits')):
+            for _ in range(2):
+                cached = client.get('/cached/item/abc')
+                assert cached.content                   == response.content
+                assert cached.headers['content-length'] == response.headers['content-length']
+        assert routes.calls == [Safe_Id('abc')]
+
+    def test__cached_routes__request_param(self):                                        # routes with a Request param can't be cached (the key only has the params)
+        class Routes__Request(Fast_API__Routes):
+            @route_cache()
+            def an_route(self, request: Request) -> dict:
+                return dict(path=request.url.path)
+            def setup_routes(self):
+                self.add_route_get(self.an_route)
+        with self.assertRaises(ValueError):
+            Routes__Request(app=FastAPI()).setup()
+
+    def test__cached_routes__invalidate(self):
+        routes, client = self.create_client()
+
+        client.get('/cached/item/abc')
+        client.get('/cached/total')
+        assert routes.cache_invalidate(routes.item__item_id, item_id='abc') is True
+        assert routes.cache_invalidate(routes.item__item_id, item_id='abc') is False
+        assert routes.cache_invalidate(routes.not_cached)                   is False
+        client.get('/cached/item/abc')
+        assert routes.calls == [Safe_Id('abc'), 3, Safe_Id('abc')]
+
+        routes.cache_clear(routes.total)
+        assert routes.cache_stats()['total'        ]['entries'] == 0
+        assert routes.cache_stats()['item__item_id']['entries'] == 1
+        routes.cache_clear()
+        assert routes.cache_stats()['item__item_id']['entries'] == 0
+
+        client.get('/cached/item/xyz')
+        time.sleep(0.25)                                                                 # ttl expired
+        client.get('/cached/item/xyz')
+        assert routes.calls[-2:] == [Safe_Id('xyz'), Safe_Id('xyz')]
+
+    def test__cached_routes__openapi(self):                                              # response schemas are the same as without the cache
+        routes, client = self.create_client()
+        openapi        = routes.app.openapi()
+        assert list(openapi['paths']) == ['/cached/item/{item_id}', '/cached/total', '/cached/status/{code}', '/cached/public-item', '/cached/not-cached']
+        assert [param['name'] for param in openapi['paths']['/cached/total']['get']['parameters']] == ['a', 'b']
+
+    def test__cached_routes__response_modes(self):
+        for config_kwargs in (dict(response_mode='json_bytes'), dict(lazy_routes=True)):
+            routes, client = self.create_client(**config_kwargs)
+            assert client.get('/cached/item/abc').json() == dict(item_id='abc', name='an item')
+            assert client.get('/cached/item/abc').json() == dict(item_id='abc', name='an item')
+            assert routes.calls                          == [Safe_Id('abc')]
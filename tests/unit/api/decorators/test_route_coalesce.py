@@ -0,0 +1,95 @@
+import asyncio
+import time
+import httpx
+from unittest                                                           import TestCase
+from fastapi                                                            import FastAPI, HTTPException
+from osbot_utils.type_safe.Type_Safe                                    import Type_Safe
+from osbot_utils.type_safe.primitives.domains.identifiers.Safe_Id       import Safe_Id
+from osbot_fast_api.api.decorators.route_cache                          import route_cache
+from osbot_fast_api.api.decorators.route_coalesce                       import route_coalesce
+from osbot_fast_api.api.routes.Fast_API__Routes                         import Fast_API__Routes
+
+
+class An_Item(Type_Safe):
+    item_id : Safe_Id
+    name    : str
+
+class Routes__Coalesced(Fast_API__Routes):
+    tag   = 'coalesced'
+    calls : list
+
+    @route_coalesce
+    def item__item_id(self, item_id: Safe_Id) -> An_Item:                               # def route (threadpool)
+        self.calls.append(item_id)
+        time.sleep(0.2)
+        return An_Item(item_id=item_id, name='an item')
+
+    @route_coalesce
+    async def total(self, a: int = 1, b: int = 2) -> dict:                              # async route (event loop)
+        self.calls.append(a + b)
+        await asyncio.sleep(0.2)
+        return dict(total=a + b)
+
+    @route_coalesce
+    def error(self, code: int):
+        self.calls.append(code)
+        time.sleep(0.2)
+        raise HTTPException(status_code=code, detail='an error')
+
+    @route_cache()
+    @route_coalesce
+    async def cached(self) -> dict:
+        self.calls.append('cached')
+        await asyncio.sleep(0.2)
+        return dict(cached=True)
+
+    def setup_routes(self):
+        self.add_routes_get(self.item__item_id, self.total, self.error, self.cached)
+
+
+class test_route_coalesce(TestCase):
+
+    def get_concurrently(self, routes, paths):                                          # sends all the requests at the same time (same event loop as the async routes)
+        async def get_all():
+            transport = httpx.ASGITransport(app=routes.app)
+            async with httpx.AsyncClient(transport=transport, base_url='http://test') as client:
+                return await asyncio.gather(*[client.get(path) for path in paths])
+        return asyncio.run(get_all())
+
+    def test_route_coalesce(self):
+        def an_function(): pass
+        assert route_coalesce(an_function)     is an_function
+        assert an_function.__route_coalesce__ is True
+
+    def test__coalesced__def_route(self):
+        routes    = Routes__Coalesced(app=FastAPI()).setup()
+        responses = self.get_concurrently(routes, ['/coalesced/item/abc'] * 10 + ['/coalesced/item/xyz'] * 5)
+        assert [response.json()['item_id'] for response in responses] == ['abc'] * 10 + ['xyz'] * 5
+        assert sorted(routes.calls)                                   == ['abc', 'xyz']
+        assert routes.coalesce_stats()['item__item_id']               == dict(executions=2, collapsed=13, in_flight=0)
+
+        self.get_concurrently(routes, ['/coalesced/item/abc'])                            # not cached: later calls run the route again
+        assert routes.coalesce_stats()['item__item_id']['executions'] == 3
+
+    def test__coalesced__async_route(self):
+        routes    = Routes__Coalesced(app=FastAPI()).setup()
+        responses = self.get_concurrently(routes, ['/coalesced/total?a=5'] * 10 + ['/coalesced/total'] * 10)
+        assert [response.json() for response in responses] == [dict(total=7)] * 10 + [dict(total=3)] * 10
+        assert sorted(routes.calls)                        == [3, 7]
+        assert routes.coalesce_stats()['total']            == dict(executions=2, collapsed=18, in_flight=0)
+
+    def test__coalesced__errors(self):                                                  # errors are shared too
+        routes    = Routes__Coalesced(app=FastAPI()).setup()
+        responses = self.get_concurrently(routes, ['/coalesced/error?code=409'] * 5)
+        assert [response.status_code for response in responses] == [409] * 5
+        assert routes.calls                                      == [409]
+
+    def test__coalesced__with_cache(self):                                              # cache misses for the same params only run the route once
+        routes    = Routes__Coalesced(app=FastAPI()).setup()
+        responses = self.get_concurrently(routes, ['/coalesced/cached'] * 10)
+        assert [response.json() for response in responses] == [dict(cached=True)] * 10
+        assert routes.calls                                 == ['cached']
+        assert routes.coalesce_stats()['cached']            == dict(executions=1, collapsed=9, in_flight=0)
+        assert routes.cache_stats()['cached']['misses']     == 10
+        self.get_concurrently(routes, ['/coalesced/cached'])
+        assert routes.cache_stats()['cached']['hits']       == 1
@@ -0,0 +1,76 @@
+import asyncio
+import inspect
+import threading
+from unittest                                                           import TestCase
+from osbot_utils.type_safe.Type_Safe                                    import Type_Safe
+from osbot_utils.type_safe.primitives.core.Safe_Str                     import Safe_Str
+from osbot_utils.type_safe.primitives.domains.identifiers.Safe_Id       import Safe_Id
+from osbot_fast_api.api.Fast_API                                        import Fast_API
+from osbot_fast_api.api.decorators.route_inline                         import route_inline
+from osbot_fast_api.api.decorators.route_path                           import route_path
+from osbot_fast_api.api.routes.Fast_API__Routes                         import Fast_API__Routes
+from osbot_fast_api.api.schemas.Schema__Fast_API__Config                import Schema__Fast_API__Config
+
+
+class An_User(Type_Safe):
+    user_id : Safe_Id
+    name    : Safe_Str
+
+class Routes__Threads(Fast_API__Routes):
+    tag = 'threads'
+
+    def in_threadpool(self) -> dict:                                                    # default: sync routes run in the anyio threadpool
+        return dict(thread=threading.current_thread().name)
+
+    @route_inline
+    def inline(self) -> dict:                                                           # runs directly on the event loop
+        return dict(thread=threading.current_thread().name)
+
+    @route_inline
+    @route_path('/inline/{user_id}')
+    def inline_user(self, user_id: Safe_Id) -> An_User:
+        return An_User(user_id=user_id, name='inline')
+
+    async def async_user(self, user: An_User) -> An_User:                               # native async route
+        await asyncio.sleep(0)
+        return An_User(user_id=user.user_id, name=f'async_{user.name}')
+
+    def setup_routes(self):
+        self.add_routes_get (self.in_threadpool, self.inline, self.inline_user)
+        self.add_route_post (self.async_user)
+
+
+class test_route_inline(TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        class An_Fast_API(Fast_API):
+            def setup_routes(self):
+                self.add_routes(Routes__Threads)
+        cls.fast_api = An_Fast_API(config=Schema__Fast_API__Config(default_routes=False)).setup()
+        cls.client   = cls.fast_api.client()
+
+    def test_route_inline(self):
+        @route_inline
+        def an_function(): pass
+
+        def another_function(): pass
+
+        assert an_function.__route_inline__                 is True
+        assert hasattr(another_function, '__route_inline__') is False
+
+    def test__endpoints_types(self):
+        endpoints = {str(route.path): route.endpoint for route in self.fast_api.app().routes if hasattr(route, 'endpoint')}
+        assert inspect.iscoroutinefunction(endpoints['/threads/in-threadpool'    ]) is False
+        assert inspect.iscoroutinefunction(endpoints['/threads/inline'           ]) is True
+        assert inspect.iscoroutinefunction(endpoints['/threads/inline/{user_id}' ]) is True
+        assert inspect.iscoroutinefunction(endpoints['/threads/async-user'       ]) is True
+
+    def test__requests(self):
+        assert self.client.get('/threads/in-threadpool').json()['thread'] == 'AnyIO worker thread'
+        assert self.client.get('/threads/inline'       ).json()['thread'] != 'AnyIO worker thread'
+        assert self.client.get('/threads/inline/user-1').json()           == {'user_id': 'user-1', 'name': 'inline'}
+
+        response = self.client.post('/threads/async-user', json={'user_id': 'user-2', 'name': 'abc'})
+        assert response.status_code == 200
+        assert response.json()      == {'user_id': 'user-2', 'name': 'async_abc'}
@@ -3,6 +3,7 @@ import pytest
 from collections                                  import deque
 from decimal                                      import Decimal
 from unittest                                     import TestCase
+from unittest.mock                                import patch
 from fastapi                                      import Request
 from starlette.responses                          import Response
 from starlette.datastructures                     import MutableHeaders, Address
@@ -13,6 +14,7 @@ from osbot_utils.testing.Stdout                   import Stdout
 from osbot_utils.utils.Env                        import in_pytest_with_coverage
 from osbot_utils.utils.Misc                       import list_set, is_guid, wait_for
 from osbot_utils.utils.Dev                        import pprint
+from osbot_utils.type_safe.primitives.domains.identifiers.Random_Guid import Random_Guid
 
 
 class test_Fast_API__Http_Events(TestCase):
@@ -51,6 +53,23 @@ class test_Fast_API__Http_Events(TestCase):
             assert self.request_data              == _.request_data(self.request)
             assert _.requests_data[self.event_id] == self.request_data
 
+    def test_event_id__schema_ids(self):                                              # the http event schemas reuse the request's event id (no new Random_Guids per event)
+        self.request.state.request_id = Random_Guid()
+        with patch('osbot_utils.utils.Misc.random_guid') as random_guid:
+            http_event = self.http_events.create_request_data(self.request)
+            assert random_guid.call_count == 0
+        event_id = self.request.state.request_id
+        with http_event as _:
+            assert _.event_id                         == event_id
+            assert _.http_event_info    .event_id     == event_id
+            assert _.http_event_info    .info_id      == event_id
+            assert _.http_event_request .event_id     == event_id
+            assert _.http_event_request .request_id   == event_id
+            assert _.http_event_response.event_id     == event_id
+            assert _.http_event_response.response_id  == event_id
+            assert _.http_event_traces  .event_id     == event_id
+            assert _.http_event_traces  .traces_id    == event_id
+
     def test_on_http_request(self):
         with self.http_events as _:
             _.on_http_request(self.request)
@@ -1,9 +1,13 @@
+import hashlib
 from unittest                                                   import TestCase
 from osbot_fast_api.api.Fast_API                                import Fast_API, ENV_VAR__FAST_API__AUTH__API_KEY__NAME, ENV_VAR__FAST_API__AUTH__API_KEY__VALUE
-from osbot_fast_api.api.middlewares.Middleware__Check_API_Key   import ERROR_MESSAGE__NO_KEY_NAME_SETUP, ERROR_MESSAGE__NO_KEY_VALUE_SETUP, ERROR_MESSAGE__API_KEY_MISSING
+from osbot_fast_api.api.middlewares.Middleware__Check_API_Key   import Middleware__Check_API_Key, ERROR_MESSAGE__NO_KEY_NAME_SETUP, ERROR_MESSAGE__NO_KEY_VALUE_SETUP, ERROR_MESSAGE__API_KEY_MISSING, ERROR_MESSAGE__API_KEY_INVALID
+from osbot_fast_api.api.schemas.Schema__Fast_API__Config        import Schema__Fast_API__Config
 from osbot_fast_api.api.schemas.consts.consts__Fast_API             import AUTH__EXCLUDED_PATHS
 from osbot_fast_api.utils.Fast_API__Server_Info                 import fast_api__server_info
 from osbot_utils.testing.Temp_Env_Vars                          import Temp_Env_Vars
+from osbot_utils.testing.Temp_File                              import Temp_File
+from osbot_utils.utils.Json                                     import json_save_file
 from osbot_utils.utils.Status                                   import status_error
 
 
@@ -28,6 +32,7 @@ class test_Middleware__Check_API_Key(TestCase):
     def test__init__(self):
         expected_middleware = { 'function_name': None                                                          ,
                                 'params'       : { 'allow_cors'             : False                            ,
+                                                   'api_keys_file'          : None                             ,
                                                    'env_var__api_key__name' : 'FAST_API__AUTH__API_KEY__NAME'  ,
                                                    'env_var__api_key__value': 'FAST_API__AUTH__API_KEY__VALUE'},
                                  'type'        : 'Middleware__Check_API_Key'}
@@ -101,4 +106,25 @@ class test_Middleware__Check_API_Key(TestCase):
                 for path in AUTH__EXCLUDED_PATHS:
                     if path in ['/auth/set-cookie-form', '/docs', '/openapi.json']:  # Existing paths
                         response = client.get(path)
-                        assert response.status_code in [200, 307]                    # Should be accessible
\ No newline at end of file
+                        assert response.status_code in [200, 307]                    # Should be accessible
+
+    def test_is_excluded_path(self):                                                  # exact paths, and prefixes (entries ending in '/')
+        middleware = Middleware__Check_API_Key(None, ENV_VAR__FAST_API__AUTH__API_KEY__NAME, ENV_VAR__FAST_API__AUTH__API_KEY__VALUE, excluded_paths=['/docs', '/public/'])
+        assert middleware.excluded_paths    == frozenset(['/docs'])
+        assert middleware.excluded_prefixes == ('/public/',)
+        assert middleware.is_excluded_path('/docs'             ) is True
+        assert middleware.is_excluded_path('/public/'          ) is True
+        assert middleware.is_excluded_path('/public/a/b'       ) is True
+        assert middleware.is_excluded_path('/docs/a'           ) is False
+        assert middleware.is_excluded_path('/public'           ) is False
+        assert middleware.is_excluded_path('/config/info'      ) is False
+        assert Middleware__Check_API_Key(None, ENV_VAR__FAST_API__AUTH__API_KEY__NAME, ENV_VAR__FAST_API__AUTH__API_KEY__VALUE).excluded_paths == frozenset(AUTH__EXCLUDED_PATHS)
+
+    def test_api_keys_file(self):
+        with Temp_File(file_name='api-keys.json', return_file_path=True) as keys_file:
+            json_save_file(dict(keys=[dict(key_hash=hashlib.sha256(b'an-tenant-key').hexdigest(), tenant='an-tenant')]), keys_file)
+            with Temp_Env_Vars(env_vars={ENV_VAR__FAST_API__AUTH__API_KEY__NAME: self.env_name__api_key_name}):   # (no env var key value)
+                with With_API_Key(config=Schema__Fast_API__Config(api_keys_file=keys_file)).setup() as _:
+                    client = _.client()
+                    assert client.get('/config/info', headers={self.env_name__api_key_name: 'an-tenant-key'}).status_code == 200
+                    assert client.get('/config/info', headers={self.env_name__api_key_name: 'an-other-key' }).json()      == status_error(ERROR_MESSAGE__API_KEY_INVALID)
@@ -0,0 +1,128 @@
+import asyncio
+import gzip
+import json
+import zlib
+from unittest                                                         import TestCase
+from fastapi                                                          import Response
+from osbot_utils.utils.Misc                                           import is_guid
+from starlette.responses                                              import StreamingResponse, PlainTextResponse
+from osbot_fast_api.api.Fast_API                                      import Fast_API
+from osbot_fast_api.api.middlewares.Middleware__Compression           import Middleware__Compression, COMPRESSION__CONTENT_TYPES
+from osbot_fast_api.api.schemas.Schema__Fast_API__Config              import Schema__Fast_API__Config
+
+AN_TEXT = 'an text that compresses well ' * 100                                                 # (~3KB)
+
+
+class An_Fast_API(Fast_API):
+    def setup_routes(self):
+        def json(size: int = 100):
+            return dict(items=[dict(index=index, name=f'item-{index}') for index in range(size)])
+        def stream():
+            async def chunks():
+                for index in range(3):
+                    yield f'chunk {index} '.encode() * 10
+            return StreamingResponse(chunks(), media_type='text/plain')
+        self.app().get('/an-route/json'        )(json)
+        self.app().get('/an-route/stream'      )(stream)
+        self.app().get('/an-route/text'        )(lambda: PlainTextResponse(AN_TEXT, headers={'etag': '"an-etag"', 'vary': 'origin'}))
+        self.app().get('/an-route/png'         )(lambda: Response(AN_TEXT.encode(), media_type='image/png'))
+        self.app().get('/an-route/no-transform')(lambda: PlainTextResponse(AN_TEXT, headers={'cache-control': 'no-transform'}))
+
+
+class test_Middleware__Compression(TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.clients = [An_Fast_API(config=Schema__Fast_API__Config(compression=True, openapi_cache=True, fused_middleware=fused)).setup().client() for fused in (False, True)]
+
+    def get(self, path, accept_encoding='gzip', **kwargs):                              # (raw body, i.e. not decoded by the client)
+        responses = []
+        for client in self.clients:
+            with client.stream('GET', path, headers={'accept-encoding': accept_encoding}, **kwargs) as response:
+                response.raw_body = b''.join(response.iter_raw())
+                responses.append(response)
+        assert responses[0].headers.get('content-encoding') == responses[1].headers.get('content-encoding')     # (same on both stacks)
+        return responses
+
+    def test_setup_middleware__compression(self):
+        for client in self.clients:
+            assert client.app.user_middleware[0].cls is Middleware__Compression            # (added last, so it runs first)
+        assert Middleware__Compression not in [middleware.cls for middleware in An_Fast_API().setup().app().user_middleware]
+
+    def test__content_types(self):                                                      # config.compression_content_types replaces the default content types
+        for fused in (False, True):
+            client = An_Fast_API(config=Schema__Fast_API__Config(compression=True, compression_content_types=['image/png'], fused_middleware=fused)).setup().client()
+            assert client.app.user_middleware[0].kwargs['content_types'] == ('image/png',)
+            assert client.get('/an-route/png' , headers={'accept-encoding': 'gzip'}).headers.get('content-encoding') == 'gzip'
+            assert client.get('/an-route/text', headers={'accept-encoding': 'gzip'}).headers.get('content-encoding') is None
+        for client in self.clients:
+            assert client.app.user_middleware[0].kwargs['content_types'] == COMPRESSION__CONTENT_TYPES
+
+    def test__json(self):
+        response__default, response__fused = self.get('/an-route/json')
+        assert 'content-length' not in response__default.headers                       # (BaseHTTPMiddleware streams the body, so its size is only known at the end)
+        assert response__fused.headers['content-length']      == str(len(response__fused.raw_body))
+        for response in (response__default, response__fused):
+            assert response.headers['content-encoding']       == 'gzip'
+            assert response.headers['vary']                   == 'accept-encoding'
+            assert json.loads(gzip.decompress(response.raw_body)) == dict(items=[dict(index=index, name=f'item-{index}') for index in range(100)])
+            assert len(gzip.decompress(response.raw_body)) > 5 * len(response.raw_body)
+            assert is_guid(response.headers['fast-api-request-id'])
+
+    def test__not_compressed(self):
+        for path, accept_encoding in [('/an-route/json?size=2'  , 'gzip'         ),         # smaller than minimum_size
+                                      ('/an-route/json'         , 'identity'     ),         # client doesn't accept gzip
+                                      ('/an-route/json'         , 'gzip;q=0, br' ),
+                                      ('/an-route/png'          , 'gzip'         ),         # content type not in the allow list
+                                      ('/an-route/no-transform' , 'gzip'         ),
+                                      ('/openapi.json'          , 'identity'     )]:
+            for response in self.get(path, accept_encoding):
+                assert 'content-encoding' not in response.headers
+                assert response.raw_body                  != b""
+
+    def test__already_compressed(self):                                                 # /openapi.json is served gzip'd (by Fast_API__OpenAPI__Cache), and is not compressed again
+        for response in self.get('/openapi.json'):
+            assert response.headers['content-encoding'] == 'gzip'
+            assert gzip.decompress(response.raw_body).startswith(b'{')
+
+    def test__headers(self):                                                            # weak ETag (the bytes are not the same as the uncompressed ones) and vary extended
+        for response in self.get('/an-route/text'):
+            assert response.headers['etag']                   == 'W/"an-etag"'
+            assert response.headers['vary']                   == 'origin, accept-encoding'
+            assert gzip.decompress(response.raw_body).decode() == AN_TEXT
+
+    def test__stream(self):                                                             # each chunk is flushed (and can be decompressed) as it is received
+        messages = []
+        async def app(scope, receive, send):
+            await send({'type': 'http.response.start', 'status': 200, 'headers': [(b'content-type', b'text/plain')]})
+            for index in range(3):
+                await send({'type': 'http.response.body', 'body': f'chunk {index} '.encode(), 'more_body': True})
+            await send({'type': 'http.response.body', 'body': b'', 'more_body': False})
+        async def send(message):
+            messages.append(message)
+        scope = dict(type='http', method='GET', headers=[(b'accept-encoding', b'gzip')])
+        asyncio.run(Middleware__Compression(app)(scope, None, send))
+
+        decompressor = zlib.decompressobj(16 + zlib.MAX_WBITS)
+        assert dict(messages[0]['headers']) == {b'content-encoding': b'gzip', b'content-type': b'text/plain', b'vary': b'accept-encoding'}     # (no content-length)
+        assert [decompressor.decompress(message['body']) for message in messages[1:]] == [b'chunk 0 ', b'chunk 1 ', b'chunk 2 ', b'']
+        assert decompressor.eof is True
+
+        for response in self.get('/an-route/stream'):
+            assert response.headers['content-encoding'] == 'gzip'
+            assert 'content-length' not in response.headers
+            assert gzip.decompress(response.raw_body) == b''.join(f'chunk {index} '.encode() * 10 for index in range(3))
+
+    def test_is_compressible(self):
+        middleware = Middleware__Compression(None, minimum_size=10)
+        def start(status=200, **headers):
+            return dict(type='http.response.start', status=status, headers=[(name.replace('_', '-').encode(), value.encode()) for name, value in headers.items()])
+        assert middleware.is_compressible(start(content_type='application/json'                        )) is True
+        assert middleware.is_compressible(start(content_type='Text/HTML; charset=utf-8'                )) is True
+        assert middleware.is_compressible(start(content_type='application/json', content_length='100'  )) is True
+        assert middleware.is_compressible(start(content_type='application/json', content_length='9'    )) is False
+        assert middleware.is_compressible(start(content_type='application/json', content_encoding='br' )) is False
+        assert middleware.is_compressible(start(content_type='application/zip'                         )) is False
+        assert middleware.is_compressible(start(                                                        )) is False
+        assert middleware.is_compressible(start(304, content_type='application/json'                   )) is False
+        assert middleware.is_compressible(start(204, content_type='application/json'                   )) is False
@@ -0,0 +1,182 @@
+import hashlib
+from unittest                                                         import TestCase
+from fastapi                                                          import Request
+from starlette.responses                                              import PlainTextResponse
+from osbot_utils.testing.Temp_Env_Vars                                import Temp_Env_Vars
+from osbot_utils.testing.Temp_File                                    import Temp_File
+from osbot_utils.utils.Json                                           import json_save_file
+from osbot_utils.utils.Misc                                           import is_guid
+from osbot_utils.utils.Status                                         import status_error
+from osbot_utils.type_safe.primitives.domains.identifiers.Random_Guid import Random_Guid
+from osbot_fast_api.api.Fast_API                                      import Fast_API
+from osbot_fast_api.api.middlewares.Middleware__Check_API_Key         import ERROR_MESSAGE__NO_KEY_NAME_SETUP, ERROR_MESSAGE__API_KEY_MISSING, ERROR_MESSAGE__API_KEY_INVALID
+from osbot_fast_api.api.middlewares.Middleware__Fused                 import Middleware__Fused
+from osbot_fast_api.api.schemas.Schema__Fast_API__Config              import Schema__Fast_API__Config
+from osbot_fast_api.api.schemas.enums.Enum__Fast_API__Request_Id__Mode import Enum__Fast_API__Request_Id__Mode
+from osbot_fast_api.api.schemas.consts.consts__Fast_API               import ENV_VAR__FAST_API__AUTH__API_KEY__NAME, ENV_VAR__FAST_API__AUTH__API_KEY__VALUE
+from osbot_fast_api.events.Fast_API__With_Events                      import Fast_API__With_Events
+
+API_KEY__NAME  = 'an-api-key-name'
+API_KEY__VALUE = 'an-api-key-value'
+TEMP_ENV_VARS  = { ENV_VAR__FAST_API__AUTH__API_KEY__NAME : API_KEY__NAME  ,
+                   ENV_VAR__FAST_API__AUTH__API_KEY__VALUE: API_KEY__VALUE }
+
+
+class An_Fast_API(Fast_API):
+    def setup_routes(self):
+        def request_info(request: Request):
+            return dict(request_id      = str(request.state.request_id)            ,
+                        header          = request.headers.get('fast-api-request-id'),
+                        is_disconnected = request.state.is_disconnected            )
+        def api_key(request: Request):
+            return request.state.api_key.json()
+        async def ping():                                                                   # (async, so that the benchmark doesn't measure the threadpool)
+            return dict(ping='pong')
+        self.app().get('/an-route/request-info')(request_info)
+        self.app().get('/an-route/ping'        )(ping)
+        self.app().get('/an-route/text'        )(lambda: PlainTextResponse('an text'))
+        self.app().get('/an-route/api-key'     )(api_key)
+
+class An_Fast_API__With_Events(Fast_API__With_Events, An_Fast_API):
+    pass
+
+
+class test_Middleware__Fused(TestCase):                                                    # the fused middleware must behave like the default stack, so each check runs against both
+
+    def clients(self, fast_api_class=An_Fast_API, **config_kwargs):
+        default = fast_api_class(config=Schema__Fast_API__Config(fused_middleware=False, **config_kwargs)).setup()
+        fused   = fast_api_class(config=Schema__Fast_API__Config(fused_middleware=True , **config_kwargs)).setup()
+        return dict(default=default.client(), fused=fused.client())
+
+    def responses(self, clients, method, path, **kwargs):
+        return {name: client.request(method, path, **kwargs) for name, client in clients.items()}
+
+    def assert_same(self, responses, excluded_headers=('fast-api-request-id', 'date'), same_content=True):
+        default, fused = responses['default'], responses['fused']
+        assert fused.status_code == default.status_code
+        if same_content:
+            assert fused.content == default.content
+        assert {key: value for key, value in fused  .headers.items() if key not in excluded_headers} == \
+               {key: value for key, value in default.headers.items() if key not in excluded_headers}
+        assert is_guid(fused.headers.get('fast-api-request-id')) is True
+        return fused
+
+    def test_setup_middlewares(self):
+        fast_api = An_Fast_API(config=Schema__Fast_API__Config(fused_middleware=True)).setup()
+        assert [middleware['type'] for middleware in fast_api.user_middlewares()] == ['Middleware__Fused']
+        assert type(fast_api.app().middleware_stack) is not Middleware__Fused                   # (built on first request)
+        with fast_api.client() as _:
+            assert _.get('/an-route/ping').status_code == 200
+
+    def test__request_id(self):
+        clients  = self.clients()
+        response = self.assert_same(self.responses(clients, 'GET', '/an-route/request-info'), same_content=False)
+        data     = response.json()
+        assert data['request_id']       == response.headers['fast-api-request-id']             # same id in state, request headers and response headers
+        assert data['header'    ]       == response.headers['fast-api-request-id']
+        assert data['is_disconnected']  is False
+        assert self.responses(clients, 'GET', '/an-route/request-info')['fused'].headers['fast-api-request-id'] != response.headers['fast-api-request-id']
+
+    def test__request_id__inbound(self):                                                    # valid inbound ids are reused (on both stacks)
+        trace_id = '4bf92f35-77b3-4da6-a3ce-929d0e0e4736'
+        an_guid  = str(Random_Guid())
+        clients  = self.clients(request_id_inbound=True)
+        for headers, expected in [({'fast-api-request-id': an_guid                                                    }, an_guid ),
+                                  ({'traceparent'        : f'00-{trace_id.replace("-", "")}-00f067aa0ba902b7-01'      }, trace_id),
+                                  ({'fast-api-request-id': 'not-a-guid'                                               }, None    )]:
+            for response in self.responses(clients, 'GET', '/an-route/request-info', headers=headers).values():
+                data = response.json()
+                assert data['request_id'] == data['header'] == response.headers['fast-api-request-id']     # (the inbound header is replaced, not duplicated)
+                assert is_guid(data['request_id'])
+                if expected:
+                    assert data['request_id'] == expected
+                else:
+                    assert data['request_id'] != 'not-a-guid'
+
+        clients = self.clients()                                                        # (default: inbound ids are ignored)
+        for response in self.responses(clients, 'GET', '/an-route/request-info', headers={'fast-api-request-id': an_guid}).values():
+            assert response.headers['fast-api-request-id'] != an_guid
+
+    def test__request_id__sequential(self):
+        clients = self.clients(request_id_mode=Enum__Fast_API__Request_Id__Mode.SEQUENTIAL)
+        for name in ('default', 'fused'):
+            request_ids = [clients[name].get('/an-route/request-info').headers['fast-api-request-id'] for _ in range(3)]
+            assert [is_guid(request_id) for request_id in request_ids] == [True] * 3
+            assert [request_id[24:] for request_id in request_ids] == ['000000000001', '000000000002', '000000000003']
+
+    def test__not_found(self):
+        self.assert_same(self.responses(self.clients(), 'GET', '/an-route/not-found'))
+
+    def test__api_key(self):
+        response = self.assert_same(self.responses(self.clients(enable_api_key=True), 'GET', '/an-route/ping'))
+        assert response.json() == status_error(ERROR_MESSAGE__NO_KEY_NAME_SETUP)
+
+        with Temp_Env_Vars(env_vars=TEMP_ENV_VARS):
+            clients = self.clients(enable_api_key=True)
+            assert self.assert_same(self.responses(clients, 'GET', '/an-route/ping'                                             )).json() == status_error(ERROR_MESSAGE__API_KEY_MISSING)
+            assert self.assert_same(self.responses(clients, 'GET', '/an-route/ping', headers={API_KEY__NAME: 'bad'}             )).json() == status_error(ERROR_MESSAGE__API_KEY_INVALID)
+            assert self.assert_same(self.responses(clients, 'GET', '/an-route/ping', headers={API_KEY__NAME: API_KEY__VALUE}    )).status_code == 200
+            assert self.assert_same(self.responses(clients, 'GET', '/an-route/ping', headers={'cookie': f'{API_KEY__NAME}={API_KEY__VALUE}'})).status_code == 200
+            assert self.assert_same(self.responses(clients, 'GET', '/config/status'                                             )).status_code == 200   # excluded path
+
+    def test__api_keys_file(self):                                                            # keys from the (hot reloaded) file, with their metadata in request.state.api_key
+        with Temp_File(file_name='api-keys.json', return_file_path=True) as keys_file:
+            key_data = dict(key_hash=hashlib.sha256(b'an-tenant-key').hexdigest(), name='an-name', tenant='an-tenant', scopes=['read'])
+            json_save_file(dict(keys=[key_data]), keys_file)
+            with Temp_Env_Vars(env_vars=TEMP_ENV_VARS):
+                clients = self.clients(enable_api_key=True, api_keys_file=keys_file)
+                assert self.assert_same(self.responses(clients, 'GET', '/an-route/api-key', headers={API_KEY__NAME: 'an-tenant-key'})).json() == key_data
+                assert self.assert_same(self.responses(clients, 'GET', '/an-route/api-key', headers={API_KEY__NAME: API_KEY__VALUE })).json()['tenant'] is None     # (env var key is still valid)
+                assert self.assert_same(self.responses(clients, 'GET', '/an-route/api-key', headers={API_KEY__NAME: 'bad'           })).json() == status_error(ERROR_MESSAGE__API_KEY_INVALID)
+
+    def test__cors(self):
+        with Temp_Env_Vars(env_vars=TEMP_ENV_VARS):
+            clients  = self.clients(enable_api_key=True, enable_cors=True)
+            preflight = self.assert_same(self.responses(clients, 'OPTIONS', '/an-route/ping', headers={'origin': 'https://an-site.com', 'access-control-request-method': 'GET'}))
+            assert preflight.status_code                                == 204                   # (from the api key check)
+            assert preflight.headers['access-control-allow-origin']     == 'https://an-site.com'
+            response  = self.assert_same(self.responses(clients, 'GET', '/an-route/ping', headers={'origin': 'https://an-site.com', API_KEY__NAME: API_KEY__VALUE}))
+            assert response.headers['access-control-allow-origin']      == '*'                   # (from CORSMiddleware)
+
+        clients  = self.clients(enable_cors=True)
+        response = self.assert_same(self.responses(clients, 'OPTIONS', '/an-route/ping', headers={'origin': 'https://an-site.com', 'access-control-request-method': 'GET'}))
+        assert response.status_code == 200                                                       # (CORSMiddleware preflight)
+
+    def test__http_events(self):
+        clients  = self.clients(fast_api_class=An_Fast_API__With_Events)
+        response = self.assert_same(self.responses(clients, 'GET', '/an-route/request-info'), same_content=False)
+        fused    = clients['fused'].app
+        http_events = [middleware.kwargs['http_events'] for middleware in fused.user_middleware][0]
+        request_id  = response.headers['fast-api-request-id']
+        http_event  = http_events.requests_data.get(Random_Guid(request_id))
+        assert response.json()['request_id']              == request_id                         # the event id is the request id
+        assert http_event.http_event_request .path        == '/an-route/request-info'
+        assert http_event.http_event_request .method      == 'GET'
+        assert http_event.http_event_response.status_code == 200
+        assert http_event.http_event_response.content_type == 'application/json'
+
+    def test__http_events__inbound_request_id(self):                                         # the event is stored under the client's request id (also when repeated)
+        an_guid = str(Random_Guid())
+        clients = self.clients(fast_api_class=An_Fast_API__With_Events, request_id_inbound=True)
+        for client in clients.values():
+            http_events = [middleware.kwargs['http_events'] for middleware in client.app.user_middleware if 'http_events' in middleware.kwargs][0]
+            http_events.max_requests_logged = 2
+            for _ in range(3):
+                assert client.get('/an-route/request-info', headers={'fast-api-request-id': an_guid}).json()['request_id'] == an_guid
+            assert http_events.requests_data[Random_Guid(an_guid)].http_event_request.path == '/an-route/request-info'
+
+    def test__http_events__background_tasks(self):
+        calls    = []
+        fast_api = An_Fast_API__With_Events(config=Schema__Fast_API__Config(fused_middleware=True)).setup()
+        fast_api.add_background_task(lambda request, response: calls.append((request.url.path, response.status_code)))
+        fast_api.client().get('/an-route/ping')
+        assert calls == [('/an-route/ping', 200)]
+
+    def test__http_events__response_headers(self):                                          # changes made to the response (by the http events) are sent
+        def on_response(response, http_event):
+            response.headers['x-an-header'] = 'an-value'
+        clients = self.clients(fast_api_class=An_Fast_API__With_Events)
+        for client in clients.values():
+            [middleware.kwargs['http_events'] for middleware in client.app.user_middleware if 'http_events' in middleware.kwargs][0].callback_on_response = on_response
+        response = self.assert_same(self.responses(clients, 'GET', '/an-route/text'))
+        assert response.headers['x-an-header'] == 'an-value'
@@ -0,0 +1,89 @@
+import asyncio
+from unittest                                                           import TestCase
+from unittest.mock                                                      import patch
+from osbot_utils.testing.Temp_Env_Vars                                  import Temp_Env_Vars
+from osbot_utils.testing.Temp_Folder                                    import Temp_Folder
+from osbot_utils.utils.Files                                            import path_combine
+from osbot_utils.utils.Misc                                             import is_guid
+from osbot_utils.utils.Status                                           import status_error
+from osbot_fast_api.api.Fast_API__Rate_Limit__Buckets__SQLite           import Fast_API__Rate_Limit__Buckets__SQLite
+from osbot_fast_api.api.Fast_API__Rate_Limiter                          import Fast_API__Rate_Limiter
+from osbot_fast_api.api.middlewares.Middleware__Rate_Limit              import ERROR_MESSAGE__RATE_LIMIT_EXCEEDED
+from osbot_fast_api.api.schemas.Schema__Fast_API__Config                import Schema__Fast_API__Config
+from tests.unit.api.middlewares.test_Middleware__Fused                  import An_Fast_API, An_Fast_API__With_Events, API_KEY__NAME, API_KEY__VALUE, TEMP_ENV_VARS
+
+
+class test_Middleware__Rate_Limit(TestCase):
+
+    def fast_apis(self, fast_api_class=An_Fast_API, **config_kwargs):                  # default and fused middlewares
+        return {fused: fast_api_class(config=Schema__Fast_API__Config(rate_limit=True, fused_middleware=fused, **config_kwargs)).setup()
+                for fused in (False, True)}
+
+    def test_setup_middleware__rate_limit(self):
+        for fused, fast_api in self.fast_apis().items():
+            middleware_types = [middleware['type'] for middleware in fast_api.user_middlewares()]
+            assert middleware_types[-1] == 'Middleware__Rate_Limit'                     # (added first, so it runs after the others)
+        assert 'Middleware__Rate_Limit' not in [middleware['type'] for middleware in An_Fast_API().setup().user_middlewares()]
+
+    def test__429(self):
+        for fused, fast_api in self.fast_apis(rate_limit_per_second=0.001, rate_limit_burst=2).items():
+            client    = fast_api.client()
+            responses = [client.get('/an-route/ping') for _ in range(3)]
+            assert [response.status_code for response in responses] == [200, 200, 429]
+            assert responses[2].json()                               == status_error(ERROR_MESSAGE__RATE_LIMIT_EXCEEDED)
+            assert responses[2].headers['retry-after']               == '1000'
+            assert is_guid(responses[2].headers['fast-api-request-id'])                 # (request id is set before the rate limit check)
+            assert fast_api.rate_limiter().stats()                   == dict(requests_allowed=2, requests_limited=1, buckets=1)
+
+    def test__per_api_key(self):
+        with Temp_Env_Vars(env_vars=TEMP_ENV_VARS):
+            for fused, fast_api in self.fast_apis(enable_api_key=True, rate_limit_per_second=0.001, rate_limit_burst=1).items():
+                client = fast_api.client()
+                assert client.get('/an-route/ping', headers={API_KEY__NAME: API_KEY__VALUE}).status_code == 200
+                assert client.get('/an-route/ping', headers={API_KEY__NAME: API_KEY__VALUE}).status_code == 429
+                assert client.get('/an-route/ping', headers={API_KEY__NAME: 'bad'         }).status_code == 401     # (invalid keys are rejected by the api key check)
+                assert fast_api.rate_limiter().stats()['requests_limited'] == 1
+
+    def test__api_key_header__without_api_key_check(self):                               # without the api key check, rotating the api key header doesn't give new buckets
+        with Temp_Env_Vars(env_vars=TEMP_ENV_VARS):
+            for fused, fast_api in self.fast_apis(rate_limit_per_second=0.001, rate_limit_burst=2).items():
+                client = fast_api.client()
+                assert [client.get('/an-route/ping', headers={API_KEY__NAME: f'an-key-{index}'}).status_code for index in range(3)] == [200, 200, 429]
+                assert fast_api.rate_limiter().stats() == dict(requests_allowed=2, requests_limited=1, buckets=1)
+
+    def test__http_events(self):                                                        # the 429 responses are captured by the fused middleware
+        fast_api = An_Fast_API__With_Events(config=Schema__Fast_API__Config(rate_limit=True, fused_middleware=True, rate_limit_per_second=0.001, rate_limit_burst=1)).setup()
+        client   = fast_api.client()
+        client.get('/an-route/ping')
+        client.get('/an-route/ping')
+        assert [http_event.http_event_response.status_code for http_event in fast_api.get_recent_requests()] == [200, 429]
+
+    def test__rate_limit_sqlite(self):                                                  # buckets shared by the apps (i.e. worker processes) using the same file
+        with Temp_Folder() as temp_folder:
+            db_path   = path_combine(temp_folder.full_path, 'rate-limit.sqlite')
+            fast_apis = self.fast_apis(rate_limit_per_second=0.001, rate_limit_burst=2, rate_limit_sqlite=db_path)
+            assert type(fast_apis[False].rate_limiter().buckets) is Fast_API__Rate_Limit__Buckets__SQLite
+            assert fast_apis[False].client().get('/an-route/ping').status_code == 200
+            assert fast_apis[True ].client().get('/an-route/ping').status_code == 200
+            assert fast_apis[False].client().get('/an-route/ping').status_code == 429
+            assert fast_apis[True ].client().get('/an-route/ping').status_code == 429
+            assert fast_apis[True ].rate_limiter().stats() == dict(requests_allowed=1, requests_limited=1, buckets=1)
+
+    def test__rate_limit_sqlite__threadpool(self):                                      # SQLite buckets (which can wait on the file lock) are checked off the event loop
+        in_event_loop = []
+        check         = Fast_API__Rate_Limiter.check
+        def check__recorded(rate_limiter, scope):
+            try:
+                asyncio.get_running_loop()
+                in_event_loop.append(True)
+            except RuntimeError:
+                in_event_loop.append(False)
+            return check(rate_limiter, scope)
+
+        with Temp_Folder() as temp_folder:
+            fast_api__memory = An_Fast_API(config=Schema__Fast_API__Config(rate_limit=True)).setup()
+            fast_api__sqlite = An_Fast_API(config=Schema__Fast_API__Config(rate_limit=True, rate_limit_sqlite=path_combine(temp_folder.full_path, 'rate-limit.sqlite'))).setup()
+            with patch.object(Fast_API__Rate_Limiter, 'check', check__recorded):
+                assert fast_api__memory.client().get('/an-route/ping').status_code == 200
+                assert fast_api__sqlite.client().get('/an-route/ping').status_code == 200
+            assert in_event_loop == [True, False]
@@ -0,0 +1,152 @@
+import threading
+import time
+from unittest                                                           import TestCase
+from fastapi                                                            import HTTPException
+from osbot_utils.testing.__                                             import __
+from osbot_utils.type_safe.Type_Safe                                    import Type_Safe
+from osbot_utils.type_safe.primitives.domains.identifiers.Safe_Id       import Safe_Id
+from osbot_fast_api.api.Fast_API                                        import Fast_API
+from osbot_fast_api.api.routes.Fast_API__Route__Batch                   import Fast_API__Route__Batch, BATCH__MAX_REQUESTS, BATCH__MAX_CONCURRENCY
+from osbot_fast_api.api.routes.Fast_API__Routes                         import Fast_API__Routes
+from osbot_fast_api.api.schemas.Schema__Fast_API__Config                import Schema__Fast_API__Config
+from osbot_fast_api.api.schemas.routes.Schema__Route__Batch__Item       import Schema__Route__Batch__Item
+
+
+WAIT_CALLS = dict(in_flight=0, max_in_flight=0, lock=threading.Lock())              # calls of /items/wait running at the same time (the sync routes run in the thread pool)
+
+class An_Item(Type_Safe):
+    item_id : Safe_Id
+    name    : str
+
+class Routes__Items(Fast_API__Routes):
+    tag = 'items'
+
+    def item__item_id(self, item_id: Safe_Id) -> An_Item:
+        return An_Item(item_id=item_id, name='an item')
+
+    def create(self, item: An_Item) -> An_Item:
+        return item
+
+    def wait(self, seconds: float) -> dict:
+        with WAIT_CALLS['lock']:
+            WAIT_CALLS['in_flight']    += 1
+            WAIT_CALLS['max_in_flight'] = max(WAIT_CALLS['max_in_flight'], WAIT_CALLS['in_flight'])
+        time.sleep(seconds)
+        with WAIT_CALLS['lock']:
+            WAIT_CALLS['in_flight']    -= 1
+        return dict(seconds=seconds)
+
+    def text(self) -> str:
+        return 'some text'
+
+    def missing(self):
+        raise HTTPException(status_code=404, detail='item not found')
+
+    def error(self):
+        raise ValueError('an error')
+
+    def setup_routes(self):
+        self.add_routes_get (self.item__item_id, self.wait, self.text, self.missing, self.error)
+        self.add_route_post (self.create)
+
+class Routes__Other(Fast_API__Routes):
+    tag = 'other'
+
+    def ping(self):
+        return 'pong'
+
+    def setup_routes(self):
+        self.add_route_get(self.ping)
+
+
+class test_Fast_API__Route__Batch(TestCase):
+
+    def create_fast_api(self, **config_kwargs):
+        class An_Fast_API(Fast_API):
+            def setup_routes(self):
+                self.add_routes(Routes__Items)
+                self.add_routes(Routes__Other)
+        return An_Fast_API(config=Schema__Fast_API__Config(default_routes=False, **config_kwargs)).setup()
+
+    def test__init__(self):
+        with Fast_API__Route__Batch() as _:
+            assert _.obj() == __(fast_api_routes=None, max_requests=BATCH__MAX_REQUESTS, max_concurrency=BATCH__MAX_CONCURRENCY)
+
+    def test_item_scope(self):
+        scope = dict(type='http', method='POST', path='/api/items/batch', root_path='/api', query_string=b'', app='an_app', route='batch_route',
+                     headers=[(b'authorization', b'an-key'), (b'content-type', b'application/json'), (b'content-length', b'123')])
+        with Fast_API__Route__Batch() as _:
+            item_scope, body = _.item_scope(scope, Schema__Route__Batch__Item(method='post', path='/items/create', params=dict(a=1, b=[2, 3]), body=dict(name='abc')))
+            assert body       == b'{"name": "abc"}'
+            assert item_scope == dict(type         = 'http'                                                                  ,
+                                      root_path    = '/api'                                                                  ,
+                                      app          = 'an_app'                                                                ,
+                                      method       = 'POST'                                                                  ,
+                                      path         = '/api/items/create'                                                     ,
+                                      raw_path     = b'/api/items/create'                                                    ,
+                                      query_string = b'a=1&b=2&b=3'                                                          ,
+                                      headers      = [(b'authorization' , b'an-key'          ),                              # request headers are kept (i.e. auth)
+                                                      (b'content-type'  , b'application/json'),
+                                                      (b'content-length', b'15'              )])
+
+            item_scope, body = _.item_scope(scope, Schema__Route__Batch__Item(path='/items/text'))
+            assert body                 == b''
+            assert item_scope['headers'] == [(b'authorization', b'an-key')]
+
+    def test__fast_api__batch_routes(self):
+        for config_kwargs in (dict(), dict(lazy_routes=True), dict(radix_router=True)):
+            fast_api = self.create_fast_api(batch_routes=True, **config_kwargs)
+            assert '/items/batch' in fast_api.routes_paths()
+            assert '/other/batch' in fast_api.routes_paths()
+
+            requests = [dict(                path='/items/item/abc'                                       ),
+                        dict(method='post' , path='/items/create' , body=dict(item_id='item-1', name='abc')),
+                        dict(                path='/items/text'                                           ),
+                        dict(                path='/items/missing'                                        ),
+                        dict(                path='/items/error'                                          ),
+                        dict(                path='/items/create'                                         ),   # wrong method
+                        dict(method='POST' , path='/items/create' , body=dict(item_id=123))                ,   # invalid body
+                        dict(                path='/other/ping'                                           ),   # other classes' routes can't be called
+                        dict(method='POST' , path='/items/batch'                                          )]   # and neither can /batch itself
+            with self.assertLogs('osbot_fast_api.api.routes.Fast_API__Route__Batch', level='ERROR') as logs:
+                response = fast_api.client().post('/items/batch', json=dict(requests=requests))
+            assert logs.output[0].splitlines()[0] == 'ERROR:osbot_fast_api.api.routes.Fast_API__Route__Batch:batch call failed: GET /items/error'
+            assert 'ValueError: an error' in logs.output[0]                                         # (the exception is logged server-side)
+            assert response.status_code == 200
+            assert response.json()      == {'results': [{'status_code': 200, 'body': {'item_id': 'abc'   , 'name': 'an item'}}                           ,
+                                                        {'status_code': 200, 'body': {'item_id': 'item-1', 'name': 'abc'    }}                           ,
+                                                        {'status_code': 200, 'body': 'some text'                              }                           ,
+                                                        {'status_code': 404, 'body': {'detail': 'item not found'}             }                           ,
+                                                        {'status_code': 500, 'body': {'detail': 'An unexpected error occurred.'}}                       ,
+                                                        {'status_code': 405, 'body': {'detail': 'Method Not Allowed'}         }                           ,
+                                                        {'status_code': 400, 'body': {'detail': [{'type' : 'string_type'                   ,
+                                                                                                  'loc'  : ['body', 'item_id']             ,
+                                                                                                  'msg'  : 'Input should be a valid string',
+                                                                                                  'input': 123                             }]}}        ,
+                                                        {'status_code': 404, 'body': {'detail': 'Not Found'}                  }                           ,
+                                                        {'status_code': 404, 'body': {'detail': 'Not Found'}                  }                           ]}
+
+    def max_in_flight(self, client, requests, concurrent):                                # most /items/wait calls running at the same time
+        WAIT_CALLS['max_in_flight'] = 0
+        response = client.post('/items/batch', json=dict(requests=requests, concurrent=concurrent))
+        assert response.json() == {'results': [{'status_code': 200, 'body': {'seconds': 0.05}}] * len(requests)}
+        return WAIT_CALLS['max_in_flight']
+
+    def test__fast_api__batch_routes__concurrent(self):
+        client   = self.create_fast_api(batch_routes=True, batch_concurrency=3).client()
+        requests = [dict(path='/items/wait', params=dict(seconds=0.05)) for _ in range(6)]
+        assert 1 < self.max_in_flight(client, requests, concurrent=True ) <= 3            # bounded by batch_concurrency
+        assert     self.max_in_flight(client, requests, concurrent=False) == 1
+
+    def test__fast_api__batch_routes__max_requests(self):
+        client   = self.create_fast_api(batch_routes=True, batch_max_requests=3).client()
+        requests = [dict(path='/items/text')]
+        assert client.post('/items/batch', json=dict(requests=requests * 3)).status_code == 200
+        response = client.post('/items/batch', json=dict(requests=requests * 4))
+        assert response.status_code == 413
+        assert response.json()      == {'detail': 'too many calls in batch: 4 (max 3)'}
+
+    def test__fast_api__batch_routes__not_enabled(self):
+        fast_api = self.create_fast_api()
+        assert '/items/batch' not in fast_api.routes_paths()
+        assert fast_api.client().post('/items/batch', json=dict(requests=[])).status_code == 404
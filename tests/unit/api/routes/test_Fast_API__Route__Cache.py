@@ -0,0 +1,167 @@
+import asyncio
+import json
+import threading
+import time
+from typing                                                             import List
+from unittest                                                           import TestCase
+from pydantic                                                           import BaseModel, ValidationError
+from starlette.background                                               import BackgroundTask
+from fastapi                                                            import Request
+from starlette.responses                                                import Response, JSONResponse, StreamingResponse
+from osbot_utils.type_safe.Type_Safe                                    import Type_Safe
+from osbot_utils.type_safe.primitives.domains.identifiers.Safe_Id       import Safe_Id
+from osbot_fast_api.api.routes.Fast_API__Route__Cache                   import Fast_API__Route__Cache, ROUTE_CACHE__MISS
+
+
+class An_Item(Type_Safe):
+    item_id : Safe_Id
+    name    : str
+
+
+class test_Fast_API__Route__Cache(TestCase):
+
+    def test__init__(self):
+        with Fast_API__Route__Cache() as _:
+            assert _.ttl_seconds == 60.0
+            assert _.max_entries == 1000
+            assert _.entries     == {}
+            assert _.info()      == dict(hits=0, misses=0, evictions=0, entries=0, ttl_seconds=60.0, max_entries=1000)
+
+    def test_cache_key(self):
+        with Fast_API__Route__Cache() as _:
+            assert _.cache_key((), dict(item_id=Safe_Id('abc')))          == _.cache_key((), dict(item_id='abc'))          # primitives use their base value
+            assert _.cache_key((), dict(a=1, b=2))                        == _.cache_key((), dict(b=2, a=1))               # (params order doesn't matter)
+            assert _.cache_key((), dict(a=1))                             != _.cache_key((), dict(a='1'))
+            assert _.cache_key((), dict(item=An_Item(item_id='a')))       == _.cache_key((), dict(item=An_Item(item_id='a')))
+            assert _.cache_key((), dict(item=An_Item(item_id='a')))       != _.cache_key((), dict(item=An_Item(item_id='b')))
+            assert _.cache_key((), dict(data={'a': [1, 2]}))              == _.cache_key((), dict(data={'a': [1, 2]}))
+            assert _.cache_key(('x',), {})                                == ('x',)
+
+    def test_get__store(self):                                                          # values are encoded once, and each hit gets a new Response with the cached bytes
+        with Fast_API__Route__Cache() as _:
+            key      = _.cache_key((), dict(item_id='a'))
+            result   = dict(item_id='a')
+            assert _.get(key)                       is ROUTE_CACHE__MISS
+            response = _.store(key, result)
+            assert type(response)                   is Response
+            assert response.body                    == b'{"item_id":"a"}'
+            cached   = _.get(key)
+            assert cached                           is not _.get(key)
+            assert cached.body                      == b'{"item_id":"a"}'
+            assert cached.headers['content-type']   == 'application/json'
+            assert cached.headers['content-length'] == '15'
+            result['item_id'] = 'changed'                                               # (later changes to the result don't change the cached response)
+            assert _.get(key).body                  == b'{"item_id":"a"}'
+            assert _.store(('none',), None).body    == b'null'                          # (None is a valid result)
+            assert _.get(('none',)).body            == b'null'
+            assert _.info()                         == dict(hits=4, misses=1, evictions=0, entries=2, ttl_seconds=60.0, max_entries=1000)
+
+    def test_compile_encoder(self):                                                     # results are validated and serialized with the response_model (as FastAPI does)
+        class An_Public_Item(BaseModel):
+            name : str
+        with Fast_API__Route__Cache() as _:
+            encoder = _.compile_encoder(An_Public_Item)
+            assert encoder(dict(name='a', secret='b'))                     == b'{"name":"a"}'
+            assert _.compile_encoder(List[An_Public_Item])([An_Public_Item(name='a')]) == b'[{"name":"a"}]'
+            assert _.compile_encoder(None)(dict(name='a', secret='b'))    == b'{"name":"a","secret":"b"}'
+            with self.assertRaises(ValidationError):
+                encoder(dict(secret='b'))
+            _.wrap(lambda: None, return_converter=None, is_async=False, response_type=An_Public_Item)
+            assert _.store(('invalid',), dict(secret='b'))                == dict(secret='b')      # (not cached: FastAPI reports the validation error)
+            assert _.entries                                               == {}
+
+    def test_get__store__response(self):                                                # Responses (i.e. JSON_BYTES mode) are cached as bytes, and a new Response is created for each hit
+        with Fast_API__Route__Cache() as _:
+            response = JSONResponse(content=dict(item_id='a'))
+            assert _.store(('a',), response) is response
+            cached = _.get(('a',))
+            assert type(cached)                     is Response
+            assert cached                           is not _.get(('a',))
+            assert cached.status_code               == 200
+            assert cached.body                      == b'{"item_id":"a"}'
+            assert cached.headers['content-type']   == 'application/json'
+            assert cached.headers['content-length'] == '15'
+
+    def test_store__not_cached(self):                                                   # errors, streams and responses with background tasks are sent but not cached
+        with Fast_API__Route__Cache() as _:
+            error_response  = Response(content=b'error', status_code=500)
+            stream_response = StreamingResponse(iter([b'a', b'b']))
+            task_response   = JSONResponse(content={}, background=BackgroundTask(lambda: None))
+            assert _.store(('error' ,), error_response ) is error_response
+            assert _.store(('stream',), stream_response) is stream_response
+            assert _.store(('task'  ,), task_response  ) is task_response
+            assert _.entries == {}
+
+    def test_get__ttl(self):
+        with Fast_API__Route__Cache(ttl_seconds=0.05) as _:
+            _.store(('a',), 'value')
+            assert _.get(('a',)).body == b'"value"'
+            time.sleep(0.06)
+            assert _.get(('a',))      is ROUTE_CACHE__MISS                               # expired entries are removed
+            assert _.entries          == {}
+
+    def test_store__lru_eviction(self):
+        with Fast_API__Route__Cache(max_entries=2) as _:
+            _.store(('a',), 'a')
+            _.store(('b',), 'b')
+            _.get  (('a',))                                                              # 'a' is now the most recently used
+            _.store(('c',), 'c')
+            assert list(_.entries)    == [('a',), ('c',)]
+            assert _.stats            == dict(hits=1, misses=0, evictions=1)
+
+    def test_invalidate__clear(self):
+        with Fast_API__Route__Cache() as _:
+            _.store(_.cache_key((), dict(item_id='a')), 'a')
+            _.store(_.cache_key((), dict(item_id='b')), 'b')
+            assert _.invalidate(item_id=Safe_Id('a')) is True
+            assert _.invalidate(item_id='a'         ) is False
+            assert len(_.entries)                     == 1
+            assert _.clear()                          is _
+            assert _.entries                          == {}
+
+    def test_wrap(self):
+        calls = []
+        def an_function(item_id):
+            calls.append(item_id)
+            return An_Item(item_id=item_id, name='an item')
+        async def an_async_function(item_id):
+            calls.append(item_id)
+            return dict(item_id=item_id)
+
+        with Fast_API__Route__Cache() as _:
+            cached_function = _.wrap(an_function, return_converter=lambda item: item.json(), is_async=False)
+            assert cached_function.__name__                     == 'an_function'
+            assert cached_function(item_id='a').body            == b'{"item_id":"a","name":"an item"}'
+            assert cached_function(item_id='a').body            == b'{"item_id":"a","name":"an item"}'
+            assert calls                                        == ['a']
+
+        with Fast_API__Route__Cache() as _:
+            cached_function = _.wrap(an_async_function, return_converter=None, is_async=True)
+            assert asyncio.run(cached_function(item_id='b')).body == b'{"item_id":"b"}'
+            assert asyncio.run(cached_function(item_id='b')).body == b'{"item_id":"b"}'
+            assert calls                                     == ['a', 'b']
+
+    def test_wrap__not_cacheable_params(self):                                          # the response of routes with Request / Response params depends on (or changes) more than the params
+        def an_function(item_id: str, request: Request):
+            pass
+        def an_other_function(item_id: str, response: Response):
+            pass
+        with Fast_API__Route__Cache() as _:
+            with self.assertRaises(ValueError) as context:
+                _.wrap(an_function, return_converter=None, is_async=False)
+            assert str(context.exception) == "@route_cache can't be used on route 'an_function', since its 'request' param (Request) is not part of the cache key"
+            with self.assertRaises(ValueError):
+                _.wrap(an_other_function, return_converter=None, is_async=False)
+
+    def test_wrap__threads(self):                                                       # def routes call the cache from many threadpool threads
+        with Fast_API__Route__Cache(max_entries=10) as _:
+            cached_function = _.wrap(lambda value: dict(value=value), return_converter=None, is_async=False)
+            def worker():
+                for index in range(200):
+                    assert json.loads(cached_function(value=index % 20).body) == dict(value=index % 20)
+            threads = [threading.Thread(target=worker) for _index in range(8)]
+            for thread in threads: thread.start()
+            for thread in threads: thread.join()
+            info = _.info()
+            assert info['hits'] + info['misses'] == 8 * 200
+            assert info['entries']               == 10
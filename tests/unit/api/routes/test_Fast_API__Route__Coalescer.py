@@ -0,0 +1,98 @@
+import asyncio
+import threading
+import time
+import pytest
+from unittest                                                           import TestCase
+from starlette.responses                                                import StreamingResponse
+from osbot_fast_api.api.routes.Fast_API__Route__Coalescer               import Fast_API__Route__Coalescer
+
+
+class test_Fast_API__Route__Coalescer(TestCase):
+
+    def test__init__(self):
+        with Fast_API__Route__Coalescer() as _:
+            assert _.in_flight == {}
+            assert _.info()    == dict(executions=0, collapsed=0, in_flight=0)
+            assert _.cache_key((), dict(a=1)) == (('a', 1),)
+
+    def test_shared(self):
+        with Fast_API__Route__Coalescer() as _:
+            assert _.shared((True , dict(a=1)                      )) is True
+            assert _.shared((False, ValueError('an error')         )) is True
+            assert _.shared((True , StreamingResponse(iter([b'a'])))) is False           # followers run the route themselves
+            assert _.shared((False, asyncio.CancelledError()       )) is False
+
+    def test_wrap__threads(self):                                                       # def routes are called from many threadpool threads
+        calls = []
+        def an_function(value):
+            calls.append(value)
+            time.sleep(0.1)
+            if value == 'error':
+                raise ValueError('an error')
+            return dict(value=value)
+
+        with Fast_API__Route__Coalescer() as _:
+            coalesced_function = _.wrap(an_function, return_converter=lambda result: result['value'], is_async=False)
+            results            = []
+            def worker(value):
+                try:
+                    results.append(coalesced_function(value=value))
+                except ValueError as error:
+                    results.append(str(error))
+            threads = [threading.Thread(target=worker, args=(value,)) for value in ['a'] * 8 + ['error'] * 4]
+            for thread in threads: thread.start()
+            for thread in threads: thread.join()
+            assert sorted(results) == ['a'] * 8 + ['an error'] * 4
+            assert sorted(calls)   == ['a', 'error']
+            assert _.info()        == dict(executions=2, collapsed=10, in_flight=0)
+
+    def test_wrap__async__cancelled_leader(self):                                       # when the leader's request is cancelled, one of the followers runs the route
+        calls = []
+        async def an_function(value):
+            calls.append(value)
+            await asyncio.sleep(0.05)
+            return value
+        async def run():
+            with Fast_API__Route__Coalescer() as _:
+                coalesced_function = _.wrap(an_function, return_converter=None, is_async=True)
+                leader             = asyncio.create_task(coalesced_function(value=1))
+                await asyncio.sleep(0)
+                followers          = [asyncio.create_task(coalesced_function(value=1)) for _index in range(3)]
+                await asyncio.sleep(0)
+                leader.cancel()
+                with pytest.raises(asyncio.CancelledError):
+                    await leader
+                return await asyncio.gather(*followers), _.info()
+        results, info = asyncio.run(run())
+        assert results == [1, 1, 1]
+        assert info    == dict(executions=2, collapsed=5, in_flight=0)
+
+    def test_wrap__async__followers_get_copies(self):                                   # followers can't change (or re-raise) the leader's objects
+        async def an_function(value):
+            await asyncio.sleep(0.05)
+            if value == 'error':
+                raise ValueError('an error')
+            return dict(items=[value])
+        async def run(value):
+            with Fast_API__Route__Coalescer() as _:
+                coalesced_function = _.wrap(an_function, return_converter=None, is_async=True)
+                return await asyncio.gather(*[coalesced_function(value=value) for _index in range(3)], return_exceptions=True)
+        results = asyncio.run(run('a'))
+        assert results                        == [dict(items=['a'])] * 3
+        assert len(set(map(id, results)))     == 3
+        results[1]['items'].append('b')
+        assert results[0]                     == dict(items=['a'])
+
+        errors = asyncio.run(run('error'))
+        assert [str(error) for error in errors] == ['an error'] * 3
+        assert len(set(map(id, errors)))        == 3
+        assert errors[1].__traceback__ is not errors[0].__traceback__
+
+    def test_follower_value(self):
+        with Fast_API__Route__Coalescer() as _:
+            lock = threading.Lock()
+            assert _.follower_value((True, lock)) is lock                               # (results that can't be copied are shared)
+            error = ValueError('an error')
+            with pytest.raises(ValueError, match='an error') as raised:
+                _.follower_value((False, error))
+            assert raised.value is not error
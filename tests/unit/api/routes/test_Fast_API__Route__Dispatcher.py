@@ -0,0 +1,115 @@
+from unittest                                                           import TestCase
+from fastapi                                                            import FastAPI
+from osbot_utils.type_safe.primitives.domains.identifiers.Safe_Id       import Safe_Id
+from osbot_fast_api.api.Fast_API                                        import Fast_API
+from osbot_fast_api.api.decorators.route_path                           import route_path
+from osbot_fast_api.api.routes.Fast_API__Route__Dispatcher              import Fast_API__Route__Dispatcher, Routes__List
+from osbot_fast_api.api.routes.Fast_API__Routes                         import Fast_API__Routes
+from osbot_fast_api.api.schemas.Schema__Fast_API__Config                import Schema__Fast_API__Config
+
+
+class Routes__Items(Fast_API__Routes):
+    tag = 'items'
+
+    def item__item_id(self, item_id: Safe_Id):
+        return dict(item_id=item_id)
+
+    def item__item_id__details(self, item_id: Safe_Id):
+        return dict(item_id=item_id, details=True)
+
+    def item__latest(self):                                                         # same shape as /item/{item_id}, but registered after it
+        return dict(latest=True)
+
+    @route_path('/custom/path/{value}')
+    def custom(self, value: str):
+        return dict(value=value)
+
+    def setup_routes(self):
+        self.add_route_get (self.item__item_id         )
+        self.add_route_get (self.item__item_id__details)
+        self.add_route_get (self.item__latest          )
+        self.add_route_post(self.custom                )
+
+
+class Child_API(Fast_API):
+    def setup_routes(self):
+        self.add_routes(Routes__Items)
+
+
+class test_Fast_API__Route__Dispatcher(TestCase):
+
+    def create_fast_api(self, radix_router, lazy_routes=False):
+        class An_Fast_API(Fast_API):
+            def setup_routes(self):
+                self.add_routes(Routes__Items)
+                self.mount_fast_api(Child_API, base_path='/child', radix_router=radix_router)
+        return An_Fast_API(config=Schema__Fast_API__Config(radix_router=radix_router, lazy_routes=lazy_routes)).setup()
+
+    def test_build(self):
+        app = FastAPI()
+        app.get('/a/b'      )(lambda: 'a-b' )
+        app.get('/a/{x}'    )(lambda x: x   )
+        app.get('/{x}/b'    )(lambda x: x   )
+        app.get('/a/b/c.{e}')(lambda e: e   )
+        with Fast_API__Route__Dispatcher(router=app.router).build() as _:
+            root_indexes, root_children = _.trie
+            assert _.routes is app.router.routes
+            assert [app.routes[index].path for index in root_indexes]                        == ['/{x}/b']                  # parameter in the first segment: always a candidate
+            assert [app.routes[index].path for index in root_children['a'][0]]               == ['/a/{x}']
+            assert [app.routes[index].path for index in root_children['a'][1]['b'][0]]       == ['/a/b', '/a/b/c.{e}']
+            assert [route.path for route in _.candidate_routes('/a/b'  )]                    == ['/a/b', '/a/{x}', '/{x}/b', '/a/b/c.{e}']     # in the router's order
+            assert [route.path for route in _.candidate_routes('/a/zzz')]                    == ['/a/{x}', '/{x}/b']
+            assert [route.path for route in _.candidate_routes('/zzz'  )]                    == ['/{x}/b']
+            assert 'openapi.json' in root_children
+
+    def test_candidate_routes__rebuild(self):                                                 # routes added, removed or replaced after the trie was built
+        app = FastAPI(openapi_url=None)
+        app.get('/a')(lambda: 'a')
+        with Fast_API__Route__Dispatcher(router=app.router) as _:
+            assert [route.path for route in _.candidate_routes('/b')] == []
+            app.get('/b')(lambda: 'b')
+            assert [route.path for route in _.candidate_routes('/b')] == ['/b']
+            assert type(app.router.routes)                            is Routes__List
+            app.router.routes[1] = app.router.routes[0]
+            assert [route.path for route in _.candidate_routes('/a')] == ['/a', '/a']
+            assert [route.path for route in _.candidate_routes('/b')] == []
+            app.router.routes.remove(app.router.routes[0])
+            app.get('/b')(lambda: 'b')
+            assert [route.path for route in _.candidate_routes('/b')] == ['/b']
+            app.router.routes = list(app.router.routes)
+            assert [route.path for route in _.candidate_routes('/a')] == ['/a']
+            assert type(app.router.routes)                            is Routes__List
+
+    def test__fast_api__radix_router(self):                                                   # same responses as the default (starlette) dispatch
+        fast_api__default = self.create_fast_api(radix_router=False)
+        fast_api__radix   = self.create_fast_api(radix_router=True )
+        fast_api__lazy    = self.create_fast_api(radix_router=True , lazy_routes=True)
+        assert type(fast_api__radix  .app().router.middleware_stack) is Fast_API__Route__Dispatcher
+        assert type(fast_api__default.app().router.middleware_stack) is not Fast_API__Route__Dispatcher
+
+        requests = [('get' , '/items/item/abc'                ),
+                    ('get' , '/items/item/abc/details'        ),
+                    ('get' , '/items/item/latest'             ),                            # first match wins (/item/{item_id})
+                    ('post', '/items/custom/path/42'          ),                            # @route_path override
+                    ('get' , '/items/custom/path/42'          ),                            # 405
+                    ('get' , '/items/item'                    ),                            # 404
+                    ('get' , '/child/items/item/abc'          ),                            # mounted Fast_API
+                    ('get' , '/child/items/item/abc/'         ),                            # redirect slashes (in the mounted app)
+                    ('get' , '/config/status'                 ),
+                    ('get' , '/static-docs/swagger-ui/abc.css'),                            # static files mount (404 from the mount)
+                    ('get' , '/openapi.json'                  ),
+                    ('get' , '/'                              )]
+        clients = [fast_api.client(follow_redirects=False) for fast_api in (fast_api__default, fast_api__radix, fast_api__lazy)]
+        for method, path in requests:
+            responses = [getattr(client, method)(path) for client in clients]
+            for response in responses[1:]:
+                assert (response.status_code, response.content, response.headers.get('location')) == \
+                       (responses[0].status_code, responses[0].content, responses[0].headers.get('location')), (method, path)
+        assert clients[1].get('/items/item/latest').json() == {'item_id': 'latest'}
+        assert clients[1].get('/items/custom/path/42').status_code == 405
+
+    def test__fast_api__radix_router__routes_added_after_setup(self):
+        fast_api = self.create_fast_api(radix_router=True)
+        assert fast_api.client().get('/extra/route').status_code == 404
+        fast_api.app().get('/extra/route')(lambda: 'extra')
+        assert fast_api.client().get('/extra/route').json() == 'extra'
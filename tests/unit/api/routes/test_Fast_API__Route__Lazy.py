@@ -0,0 +1,98 @@
+from unittest                                                           import TestCase
+from fastapi.routing                                                    import APIRoute
+from osbot_utils.type_safe.Type_Safe                                    import Type_Safe
+from osbot_utils.type_safe.primitives.core.Safe_Str                     import Safe_Str
+from osbot_utils.type_safe.primitives.domains.identifiers.Safe_Id       import Safe_Id
+from osbot_fast_api.api.Fast_API                                        import Fast_API
+from osbot_fast_api.api.routes.Fast_API__Route__Lazy                    import Fast_API__Route__Lazy, materialize_lazy_routes
+from osbot_fast_api.api.routes.Fast_API__Routes                         import Fast_API__Routes
+from osbot_fast_api.api.schemas.Schema__Fast_API__Config                import Schema__Fast_API__Config
+
+
+class An_Item(Type_Safe):
+    item_id : Safe_Id
+    name    : Safe_Str
+
+class Routes__Items(Fast_API__Routes):
+    tag = 'items'
+
+    def item__item_id(self, item_id: Safe_Id) -> An_Item:
+        return An_Item(item_id=item_id, name='an item')
+
+    def create_item(self, item: An_Item) -> An_Item:
+        return item
+
+    def ping(self):
+        return 'pong'
+
+    def setup_routes(self):
+        self.add_route_get (self.item__item_id)
+        self.add_route_post(self.create_item  )
+        self.add_route_get (self.ping         )
+
+
+class test_Fast_API__Route__Lazy(TestCase):
+
+    def create_fast_api(self, lazy_routes):
+        class An_Fast_API(Fast_API):
+            def setup_routes(self):
+                self.add_routes(Routes__Items)
+        return An_Fast_API(config=Schema__Fast_API__Config(lazy_routes=lazy_routes)).setup()
+
+    def routes_types(self, fast_api):
+        return {str(route.path): type(route) for route in fast_api.app().routes if str(route.path).startswith('/items')}
+
+    def test__setup(self):
+        fast_api__eager = self.create_fast_api(lazy_routes=False)
+        fast_api__lazy  = self.create_fast_api(lazy_routes=True )
+
+        assert self.routes_types(fast_api__eager) == { '/items/item/{item_id}' : APIRoute              ,
+                                                       '/items/create-item'    : APIRoute              ,
+                                                       '/items/ping'           : APIRoute              }
+        assert self.routes_types(fast_api__lazy ) == { '/items/item/{item_id}' : Fast_API__Route__Lazy ,
+                                                       '/items/create-item'    : Fast_API__Route__Lazy ,
+                                                       '/items/ping'           : Fast_API__Route__Lazy }
+        assert fast_api__lazy.routes(include_default=True) == fast_api__eager.routes(include_default=True)     # same paths, names and methods
+        assert fast_api__lazy.routes_paths_all()           == fast_api__eager.routes_paths_all()
+
+    def test__requests(self):                                                           # routes are built on first hit and then replace the placeholder
+        fast_api__eager = self.create_fast_api(lazy_routes=False)
+        fast_api__lazy  = self.create_fast_api(lazy_routes=True )
+        client__eager   = fast_api__eager.client()
+        client__lazy    = fast_api__lazy .client()
+
+        def both(method, path, **kwargs):
+            response__eager = getattr(client__eager, method)(path, **kwargs)
+            response__lazy  = getattr(client__lazy , method)(path, **kwargs)
+            assert response__lazy.status_code == response__eager.status_code
+            assert response__lazy.content     == response__eager.content
+            return response__lazy
+
+        assert both('get' , '/items/item/abc'                                          ).json() == {'item_id': 'abc', 'name': 'an_item'}
+        assert both('post', '/items/create-item', json={'item_id': 'xyz', 'name': 'b'} ).json() == {'item_id': 'xyz', 'name': 'b'}
+        assert both('post', '/items/create-item', json={'item_id': 123  }              ).status_code == 400
+        assert both('post', '/items/ping'                                              ).status_code == 405
+        assert both('get' , '/items/not-a-route'                                       ).status_code == 404
+
+        assert set(self.routes_types(fast_api__lazy).values()) == {APIRoute}            # the 405 also builds the route (so that its response comes from the APIRoute)
+
+    def test__openapi(self):                                                            # generating the OpenAPI schema builds all routes
+        fast_api__eager = self.create_fast_api(lazy_routes=False)
+        fast_api__lazy  = self.create_fast_api(lazy_routes=True )
+
+        assert fast_api__lazy.open_api_json() == fast_api__eager.open_api_json()
+        assert set(self.routes_types(fast_api__lazy).values()) == {APIRoute}
+        assert fast_api__lazy.client().get('/openapi.json').json() == fast_api__eager.client().get('/openapi.json').json()
+
+    def test_materialize_lazy_routes(self):
+        fast_api = self.create_fast_api(lazy_routes=True)
+        app      = fast_api.app()
+        routes   = list(app.routes)
+        materialize_lazy_routes(app)
+        assert len(app.routes) == len(routes)                                           # replaced in place (same order)
+        for before, after in zip(routes, app.routes):
+            assert before.path == after.path
+            if type(before) is Fast_API__Route__Lazy:
+                assert type(after)          is APIRoute
+                assert before.api_route     is after
+                assert before.materialize() is after                                    # only built once
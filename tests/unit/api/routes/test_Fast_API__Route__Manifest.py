@@ -0,0 +1,231 @@
+import importlib
+import sys
+from enum                                                               import Enum
+from typing                                                             import List, Dict, Optional, Iterator
+from unittest                                                           import TestCase
+from osbot_utils.testing.Temp_Folder                                    import Temp_Folder
+from osbot_utils.type_safe.Type_Safe                                    import Type_Safe
+from osbot_utils.type_safe.primitives.core.Safe_Str                     import Safe_Str
+from osbot_utils.type_safe.primitives.core.Safe_Int                     import Safe_Int
+from osbot_utils.type_safe.primitives.domains.identifiers.Safe_Id       import Safe_Id
+from osbot_utils.utils.Files                                            import path_combine, file_exists, file_create, folder_create
+from osbot_utils.utils.Json                                             import json_load_file, json_save_file
+from osbot_fast_api.api.Fast_API                                        import Fast_API
+from osbot_fast_api.api.routes.Fast_API__Route__Manifest                import Fast_API__Route__Manifest
+from osbot_fast_api.api.routes.Fast_API__Routes                         import Fast_API__Routes
+from osbot_fast_api.api.routes.type_safe.Type_Safe__Route__Analyzer     import Type_Safe__Route__Analyzer
+from osbot_fast_api.api.schemas.Schema__Fast_API__Config                import Schema__Fast_API__Config
+from osbot_fast_api.api.transformers.Type_Safe__To__BaseModel           import type_safe__to__basemodel
+from osbot_fast_api.utils.Version                                       import version__osbot_fast_api
+
+
+class An_Enum(str, Enum):
+    VALUE_A = 'value_a'
+    VALUE_B = 'value_b'
+
+class An_Item(Type_Safe):
+    item_id : Safe_Id
+    name    : Safe_Str  = 'an item'
+    tags    : List[Safe_Str]
+
+class An_Order(Type_Safe):
+    order_id : Safe_Id
+    quantity : Safe_Int
+    status   : An_Enum            = An_Enum.VALUE_A
+    items    : List[An_Item]
+    by_id    : Dict[str, An_Item]
+    parent   : Optional[An_Item]  = None
+
+class Routes__Orders(Fast_API__Routes):
+    tag = 'orders'
+
+    def order__order_id(self, order_id: Safe_Id, limit: int = 10) -> An_Order:
+        return An_Order(order_id=order_id, quantity=limit)
+
+    def create_order(self, order: An_Order) -> An_Order:
+        return order
+
+    def ping(self):
+        return 'pong'
+
+    def setup_routes(self):
+        self.add_route_get (self.order__order_id)
+        self.add_route_post(self.create_order   )
+        self.add_route_get (self.ping           )
+
+class Routes__Stream(Fast_API__Routes):
+    tag = 'stream'
+
+    def import_items(self, items: Iterator[An_Item]) -> dict:
+        return dict(item_ids=[str(item.item_id) for item in items])
+
+    def setup_routes(self):
+        self.add_route_post(self.import_items)
+
+class An_Fast_API(Fast_API):
+    def setup_routes(self):
+        self.add_routes(Routes__Orders)
+
+class An_Fast_API__Stream(Fast_API):
+    def setup_routes(self):
+        self.add_routes(Routes__Stream)
+
+
+class test_Fast_API__Route__Manifest(TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.temp_folder   = Temp_Folder().__enter__()
+        cls.manifest_path = path_combine(cls.temp_folder.full_path, 'route-manifest.json')
+        cls.route_key     = f'{__name__}.Routes__Orders.create_order'
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.temp_folder.__exit__(None, None, None)
+
+    def create_fast_api(self, route_manifest=None):
+        return An_Fast_API(config=Schema__Fast_API__Config(route_manifest=route_manifest)).setup()
+
+    def test__init__(self):
+        with Fast_API__Route__Manifest() as _:
+            assert _.path  is None
+            assert _.dirty is False
+            assert _.data  == dict(version=version__osbot_fast_api, modules={}, routes={}, models={})
+
+    def test__fast_api__route_manifest(self):
+        fast_api__no_manifest = self.create_fast_api()
+        fast_api__cold        = self.create_fast_api(self.manifest_path)                # first boot: analyses the routes and saves the manifest
+        assert fast_api__no_manifest.route_manifest() is None
+        assert file_exists(self.manifest_path)
+
+        data = json_load_file(self.manifest_path)
+        assert data['version']                    == version__osbot_fast_api
+        assert data['routes'][self.route_key]['path'] == '/create-order'
+        assert __name__                           in data['modules']
+        assert f'{__name__}:An_Order'             in data['models']
+        assert f'{__name__}:An_Item'              in data['models']                      # nested models too
+
+        fast_api__warm = self.create_fast_api(self.manifest_path)                       # second boot: uses the manifest
+        assert fast_api__warm.route_manifest().dirty is False
+        assert fast_api__warm.route_manifest().data  == data
+
+        openapi = fast_api__no_manifest.open_api_json()
+        assert fast_api__cold.open_api_json() == openapi
+        assert fast_api__warm.open_api_json() == openapi
+
+        order = dict(order_id='abc', quantity=2, items=[dict(item_id='i-1', tags=['a'])], by_id={}, status='value_b')
+        for fast_api in (fast_api__no_manifest, fast_api__cold, fast_api__warm):
+            client = fast_api.client()
+            assert client.get ('/orders/order/xyz?limit=3'      ).json()['quantity'] == 3
+            assert client.post('/orders/create-order', json=order).json()['items']   == [dict(item_id='i-1', name='an_item', tags=['a'])]
+            assert client.get ('/orders/ping'                   ).json()             == 'pong'
+
+    def test__fast_api__route_manifest__stream(self):                                   # streamed params (Iterator[Type_Safe]) survive the manifest round trip
+        manifest_path = path_combine(self.temp_folder.full_path, 'stream.json')
+        items         = [dict(item_id='i-1'), dict(item_id='i-2')]
+        for _ in range(2):                                                              # cold boot, then warm boot (from the manifest)
+            fast_api = An_Fast_API__Stream(config=Schema__Fast_API__Config(route_manifest=manifest_path)).setup()
+            assert fast_api.client().post('/stream/import-items', json=items).json() == dict(item_ids=['i-1', 'i-2'])
+
+        stored = json_load_file(manifest_path)['routes'][f'{__name__}.Routes__Stream.import_items']['signature']['parameters']
+        assert stored[0]['is_stream']        is True
+        assert stored[0]['stream_item_type'] == f'{__name__}:An_Item'
+
+        with Fast_API__Route__Manifest() as _:
+            function  = Routes__Stream().import_items
+            signature = Type_Safe__Route__Analyzer().analyze_function(function)
+            _.record_route_signature(function, signature)
+            assert _.route_signature(function).json() == signature.json()
+
+    def test_route_signature(self):                                                     # cached signatures are the same as the analysed ones
+        with Fast_API__Route__Manifest() as _:
+            routes = Routes__Orders()
+            for function in (routes.order__order_id, routes.create_order, routes.ping):
+                signature = Type_Safe__Route__Analyzer().analyze_function(function)
+                _.record_route_signature(function, signature)
+                cached = _.route_signature(function)
+                assert cached.json() == signature.json()
+                assert cached.primitive_conversions == signature.primitive_conversions
+                assert [param.param_type for param in cached.parameters] == [param.param_type for param in signature.parameters]
+            assert _.dirty is True
+
+    def test_load_model(self):                                                          # BaseModels rebuilt from the field specs have the same schema
+        with Fast_API__Route__Manifest() as _:
+            model_cache = type_safe__to__basemodel.model_cache
+            model       = type_safe__to__basemodel.convert_class(An_Order)
+            _.record_model(An_Order, {model_cache[An_Item]: An_Item, model: An_Order})
+            del model_cache[An_Order]
+            del model_cache[An_Item ]
+            loaded = _.load_model(An_Order)
+            assert loaded                        is model_cache[An_Order]
+            assert loaded                        is not model
+            assert loaded.model_json_schema()    == model.model_json_schema()
+            assert loaded(order_id='a', quantity=1).model_dump()['status'] is An_Enum.VALUE_A
+
+    def test_load__fingerprint(self):                                                   # manifests from other sources or versions are ignored
+        manifest_path = path_combine(self.temp_folder.full_path, 'fingerprint.json')
+        Fast_API__Route__Manifest(path=manifest_path).load()
+        self.create_fast_api(manifest_path)
+        data = json_load_file(manifest_path)
+        assert Fast_API__Route__Manifest(path=manifest_path).load().data == data
+
+        json_save_file(data | dict(modules=data['modules'] | {__name__: 'changed'}), manifest_path)
+        assert Fast_API__Route__Manifest(path=manifest_path).load().data['routes'] == {}
+
+        json_save_file(data | dict(version='v0.0.0'), manifest_path)
+        assert Fast_API__Route__Manifest(path=manifest_path).load().data['routes'] == {}
+
+    def test_load__fingerprint__base_class(self):                                       # a change to a base class (in another module) also invalidates the manifest
+        source__base   = "from osbot_utils.type_safe.Type_Safe import Type_Safe\nclass Base(Type_Safe):\n    a : str = 'a'\n"
+        source__schema = "from manifest__base_mod import Base\nclass An_Schema(Base):\n    b : str = 'b'\n"
+        source__routes = ("from osbot_fast_api.api.Fast_API               import Fast_API\n"
+                          "from osbot_fast_api.api.routes.Fast_API__Routes import Fast_API__Routes\n"
+                          "from manifest__schema_mod                       import An_Schema\n"
+                          "class Routes__Schema(Fast_API__Routes):\n"
+                          "    tag = 'schema'\n"
+                          "    def an_schema(self) -> An_Schema:\n"
+                          "        return An_Schema()\n"
+                          "    def setup_routes(self):\n"
+                          "        self.add_route_get(self.an_schema)\n"
+                          "class An_Fast_API(Fast_API):\n"
+                          "    def setup_routes(self):\n"
+                          "        self.add_routes(Routes__Schema)\n")
+        modules_names  = ['manifest__base_mod', 'manifest__schema_mod', 'manifest__routes_mod']
+        manifest_path  = path_combine(self.temp_folder.full_path, 'base-class.json')
+        modules_folder = path_combine(self.temp_folder.full_path, 'modules')
+
+        def boot():                                                                     # (fresh import of the modules, as in a new process)
+            for module_name in modules_names:
+                sys.modules.pop(module_name, None)
+            importlib.invalidate_caches()
+            fast_api_class = importlib.import_module('manifest__routes_mod').An_Fast_API
+            fast_api       = fast_api_class(config=Schema__Fast_API__Config(default_routes=False, route_manifest=manifest_path)).setup()
+            return fast_api, fast_api.client().get('/schema/an-schema').json()
+
+        folder_create(modules_folder)
+        file_create(path_combine(modules_folder, 'manifest__base_mod.py'  ), source__base  )
+        file_create(path_combine(modules_folder, 'manifest__schema_mod.py'), source__schema)
+        file_create(path_combine(modules_folder, 'manifest__routes_mod.py'), source__routes)
+        sys.path.insert(0, modules_folder)
+        try:
+            fast_api, response = boot()
+            assert response == dict(a='a', b='b')
+            assert set(modules_names) <= set(json_load_file(manifest_path)['modules'])
+
+            file_create(path_combine(modules_folder, 'manifest__base_mod.py'), source__base + "    c : str = 'c'\n")
+            fast_api, response = boot()
+            assert response                              == dict(a='a', c='c', b='b')      # (stale manifest not used)
+            assert fast_api.route_manifest().dirty       is False                          # (rebuilt and saved)
+            assert Fast_API__Route__Manifest(path=manifest_path).load().data['routes'] != {}
+        finally:
+            sys.path.remove(modules_folder)
+            for module_name in modules_names:
+                sys.modules.pop(module_name, None)
+
+    def test_route_key(self):                                                           # functions created at runtime are not cached
+        def an_local_function(): pass
+        with Fast_API__Route__Manifest() as _:
+            assert _.route_key(Routes__Orders().ping) == f'{__name__}.Routes__Orders.ping'
+            assert _.route_key(an_local_function    ) is None
+            _.record_route_path(an_local_function, '/an-local-function')
+            assert _.data['routes'] == {}
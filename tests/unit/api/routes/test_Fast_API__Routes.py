@@ -163,10 +163,18 @@ class test_Fast_API__Routes(TestCase):
                                  prefix             = '/test_tag'                            ,
                                  tag                = 'test_tag'                             ,
                                  filter_tag         = True                                   ,
-                                 route_registration = __(analyzer        =__()              ,
-                                                         converter       =__()              ,
-                                                         wrapper_creator =__(converter=__()),
-                                                         route_parser    =__()              ))
+                                 response_mode      = 'basemodel'                            ,
+                                 body_mode          = 'basemodel'                            ,
+                                 lazy_routes        = False                                  ,
+                                 route_manifest     = None                                   ,
+                                 batch_route        = False                                  ,
+                                 batch_max_requests = 100                                    ,
+                                 batch_concurrency  = 10                                     ,
+                                 route_registration = __(analyzer        =__()                                                                  ,
+                                                         converter       =__()                                                                  ,
+                                                         wrapper_creator =__(converter=__(), response_mode='basemodel', body_mode='basemodel', route_caches=__(), route_coalescers=__()),
+                                                         route_parser    =__()                                                                  ,
+                                                         route_manifest  = None                                                                 ))
 
     def test__init__prefix_auto_generation(self):                                  # Test prefix auto-generated from tag
         with Fast_API__Routes(tag='abc') as _:
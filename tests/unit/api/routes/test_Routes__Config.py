@@ -36,3 +36,60 @@ class test_Routes__Config(TestCase):
                            #{'http_methods': ['GET'], 'http_path': '/routes/html', 'method_name': 'routes__html'  },
                            {'http_methods': ['GET'], 'http_path': '/openapi.py' , 'method_name': 'openapi_python'}]
         assert self.routes_config.routes() == expected_routes
+        assert self.client.get('/config/llm-tools').status_code == 404                    # (only added when llm_tools_route is set)
+
+    def test_client__openapi_python(self):
+        response = self.client.get('/config/openapi.py')
+        etag     = response.headers['etag']
+        assert response.status_code              == 200
+        assert response.headers['content-type' ] == 'text/x-python; charset=utf-8'
+        assert response.headers['cache-control'] == 'no-cache'
+        assert 'class Client__FastAPI'           in response.text
+        assert etag                              == f'"{self.routes_config.openapi_python__cache["spec_hash"]}-{Version().value()}"'
+
+        content = self.routes_config.openapi_python__content()
+        assert self.client.get('/config/openapi.py').text == response.text                  # cached: same body (including the generated_at header)
+        assert self.routes_config.openapi_python__content() is content
+
+        response = self.client.get('/config/openapi.py', headers={'if-none-match': etag})
+        assert response.status_code == 304
+        assert response.content     == b''
+
+        response = self.client.get('/config/openapi.py', headers={'accept-encoding': 'gzip'})
+        assert response.headers['content-encoding'] == 'gzip'
+        assert int(response.headers['content-length']) == len(content.content_gzip)
+
+    def test_client__openapi_python__spec_changed(self):
+        etag = self.client.get('/config/openapi.py').headers['etag']
+        self.app.openapi_schema = None                                                       # same spec rebuilt (new dict): content and etag are reused
+        assert self.client.get('/config/openapi.py').headers['etag'] == etag
+        self.app.add_api_route('/an-route', lambda: None)                                    # new route → new spec
+        self.app.openapi_schema = None
+        response = self.client.get('/config/openapi.py', headers={'if-none-match': etag})
+        assert response.status_code     == 200
+        assert response.headers['etag'] != etag
+        assert 'get_an_route'           in response.text
+
+    def test_client__llm_tools(self):
+        self.app           = FastAPI()
+        self.routes_config = Routes__Config(app=self.app, llm_tools_route=True).setup()
+        self.client        = TestClient(self.app)
+        response = self.client.get('/config/llm-tools', params=dict(provider='anthropic'))
+        tools    = response.json()
+        assert response.status_code             == 200
+        assert response.headers['content-type'] == 'application/json'
+        assert tools['provider']                == 'anthropic'
+        assert tools['count']                   == len(tools['tools']) == 5
+        assert tools['routes']['config__llm_tools'] == {'method': 'GET', 'path': '/config/llm-tools'}
+        assert tools['tools'][4]                == {'name'        : 'config__llm_tools'                                                  ,
+                                                    'description' : 'GET /config/llm-tools'                                              ,
+                                                    'input_schema': {'type': 'object', 'properties': {'provider': {'type': 'string'}}, 'required': []}}
+
+        content = self.routes_config.llm_tools__content('anthropic')
+        assert self.routes_config.llm_tools__content('anthropic') is content                # cached
+        assert self.client.get('/config/llm-tools', params=dict(provider='anthropic'), headers={'if-none-match': response.headers['etag']}).status_code == 304
+        assert self.client.get('/config/llm-tools').json()['provider'] == 'openai'
+
+        response = self.client.get('/config/llm-tools', params=dict(provider='an-provider'))
+        assert response.status_code == 400
+        assert response.json()       == {'detail': "Unsupported provider 'an-provider', supported providers are: openai, anthropic, langchain, gemini, bedrock"}
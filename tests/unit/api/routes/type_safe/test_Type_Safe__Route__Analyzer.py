@@ -47,6 +47,8 @@ class test_Type_Safe__Route__Analyzer(TestCase):
                                          has_body_params         = False                                              ,
                                          has_path_params         = False                                              ,
                                          has_query_params        = False                                              ,
+                                         is_async                = False                                              ,
+                                         is_inline               = False                                              ,
                                          function_name           = 'get_user'                                        ,
                                          parameters              = [__(converted_type          = None                ,
                                                                        is_primitive            = True                ,
@@ -55,6 +57,9 @@ class test_Type_Safe__Route__Analyzer(TestCase):
                                                                        requires_conversion     = True                ,
                                                                        default_value           = None                ,
                                                                        has_default             = False               ,
+                                                                       is_stream               = False               ,
+                                                                       is_async_stream         = False               ,
+                                                                       stream_item_type        = None                ,
                                                                        nested_primitive_fields = None                ,
                                                                        name                    = 'user_id'           ,
                                                                        param_type              = 'osbot_utils.type_safe.primitives.domains.identifiers.Safe_Id.Safe_Id'),
@@ -65,12 +70,16 @@ class test_Type_Safe__Route__Analyzer(TestCase):
                                                                        requires_conversion     = True                ,
                                                                        default_value           = None                ,
                                                                        has_default             = False               ,
+                                                                       is_stream               = False               ,
+                                                                       is_async_stream         = False               ,
+                                                                       stream_item_type        = None                ,
                                                                        nested_primitive_fields = None                ,
                                                                        name                    = 'name'              ,
                                                                        param_type              = 'osbot_utils.type_safe.primitives.core.Safe_Str.Safe_Str')],
                                          primitive_conversions   = __(user_id = ('osbot_utils.type_safe.primitives.domains.identifiers.Safe_Id.Safe_Id' , 'builtins.str'),
                                                                       name    = ('osbot_utils.type_safe.primitives.core.Safe_Str.Safe_Str'              , 'builtins.str')),
                                          type_safe_conversions   = __()                                               ,
+                                         stream_conversions      = __()                                               ,
                                          primitive_field_types   = __()                                               )
 
 
@@ -268,4 +277,58 @@ class test_Type_Safe__Route__Analyzer(TestCase):
             signature = _.analyze_function(routes.endpoint)
 
             assert len(signature.parameters)    == 1                                # Only user_id, not self
-            assert signature.parameters[0].name == Safe_Str__Id('user_id')
\ No newline at end of file
+            assert signature.parameters[0].name == Safe_Str__Id('user_id')
+    def test_analyze_function__async_and_inline(self):                              # Test coroutine and @route_inline detection
+        from osbot_fast_api.api.decorators.route_inline import route_inline
+
+        async def async_endpoint(user_id: Safe_Id):
+            return user_id
+
+        @route_inline
+        def inline_endpoint(user_id: Safe_Id):
+            return user_id
+
+        def sync_endpoint(user_id: Safe_Id):
+            return user_id
+
+        with self.analyzer as _:
+            assert _.analyze_function(async_endpoint ).is_async  is True
+            assert _.analyze_function(async_endpoint ).is_inline is False
+            assert _.analyze_function(inline_endpoint).is_async  is False
+            assert _.analyze_function(inline_endpoint).is_inline is True
+            assert _.analyze_function(sync_endpoint  ).is_async  is False
+            assert _.analyze_function(sync_endpoint  ).is_inline is False
+
+    def test_analyze_function__stream_params(self):                                 # Test Iterator / AsyncIterator of Type_Safe items
+        from typing import Iterator, AsyncIterator, Iterable
+
+        class An_Item(Type_Safe):
+            item_id : Safe_Id
+            name    : str
+
+        def import_items(items: Iterator[An_Item]):
+            return None
+
+        async def import_items_async(items: AsyncIterator[An_Item]):
+            return None
+
+        def not_a_stream(values: Iterable[int], ids: Iterator[Safe_Id]):
+            return None
+
+        with self.analyzer as _:
+            signature  = _.analyze_function(import_items)
+            param_info = signature.parameters[0]
+            assert signature.has_body_params          is True
+            assert param_info.is_stream               is True
+            assert param_info.is_async_stream         is False
+            assert param_info.is_type_safe            is False
+            assert param_info.stream_item_type        is An_Item
+            assert param_info.nested_primitive_fields == dict(item_id=Safe_Id)
+
+            param_info = _.analyze_function(import_items_async).parameters[0]
+            assert param_info.is_stream               is True
+            assert param_info.is_async_stream         is True
+
+            signature = _.analyze_function(not_a_stream)                            # only Type_Safe items are streamed
+            assert signature.has_body_params                       is False
+            assert [param.is_stream for param in signature.parameters] == [False, False]
@@ -133,6 +133,8 @@ class test_Type_Safe__Route__Converter(TestCase):
                                          has_body_params         = True                                            ,
                                          has_path_params         = False                                           ,
                                          has_query_params        = False                                           ,
+                                         is_async                = False                                           ,
+                                         is_inline               = False                                           ,
                                          function_name           = 'create_order'                                  ,
                                          parameters              = [__(converted_type          = None              ,
                                                                        is_primitive           = False             ,
@@ -141,6 +143,9 @@ class test_Type_Safe__Route__Converter(TestCase):
                                                                        requires_conversion    = True              ,
                                                                        default_value          = None              ,
                                                                        has_default            = False             ,
+                                                                       is_stream              = False             ,
+                                                                       is_async_stream        = False             ,
+                                                                       stream_item_type       = None              ,
                                                                        nested_primitive_fields = __(order_id = 'osbot_utils.type_safe.primitives.domains.identifiers.Safe_Id.Safe_Id' ,
                                                                                                      quantity = 'osbot_utils.type_safe.primitives.core.Safe_Int.Safe_Int'             ,
                                                                                                      price    = 'osbot_utils.type_safe.primitives.core.Safe_Float.Safe_Float'         ),
@@ -148,6 +153,7 @@ class test_Type_Safe__Route__Converter(TestCase):
                                                                        param_type             = 'test_Type_Safe__Route__Converter.Order_Data')],
                                          primitive_conversions   = __()                                           ,
                                          type_safe_conversions   = __()                                           ,
+                                         stream_conversions      = __()                                           ,
                                          primitive_field_types   = __()                                           )
 
             signature = self.converter.enrich_signature_with_conversions(signature)
@@ -159,6 +165,8 @@ class test_Type_Safe__Route__Converter(TestCase):
                                          has_body_params         = True                                            ,
                                          has_path_params         = False                                           ,
                                          has_query_params        = False                                           ,
+                                         is_async                = False                                           ,
+                                         is_inline               = False                                           ,
                                          function_name           = 'create_order'                                  ,
                                          parameters              = [__(converted_type          = 'osbot_fast_api.api.transformers.Type_Safe__To__BaseModel.Order_Data__BaseModel',
                                                                        is_primitive           = False             ,
@@ -167,6 +175,9 @@ class test_Type_Safe__Route__Converter(TestCase):
                                                                        requires_conversion    = True              ,
                                                                        default_value          = None              ,
                                                                        has_default            = False             ,
+                                                                       is_stream              = False             ,
+                                                                       is_async_stream        = False             ,
+                                                                       stream_item_type       = None              ,
                                                                        nested_primitive_fields = __(order_id = 'osbot_utils.type_safe.primitives.domains.identifiers.Safe_Id.Safe_Id' ,
                                                                                                      quantity = 'osbot_utils.type_safe.primitives.core.Safe_Int.Safe_Int'             ,
                                                                                                      price    = 'osbot_utils.type_safe.primitives.core.Safe_Float.Safe_Float'         ),
@@ -175,6 +186,7 @@ class test_Type_Safe__Route__Converter(TestCase):
                                          primitive_conversions   = __()                                           ,
                                          type_safe_conversions   = __(order = ('test_Type_Safe__Route__Converter.Order_Data'                                  ,
                                                                                'osbot_fast_api.api.transformers.Type_Safe__To__BaseModel.Order_Data__BaseModel')),
+                                         stream_conversions      = __()                                           ,
                                          primitive_field_types   = __()                                           )
 
 
@@ -327,4 +339,60 @@ class test_Type_Safe__Route__Converter(TestCase):
             assert type(converted.name)  is Safe_Str__Display_Name
             assert type(converted.email) is Safe_Str__Email
             assert converted.name        == 'Alice'
-            assert converted.email       == 'alice@test.com'
\ No newline at end of file
+            assert converted.email       == 'alice@test.com'
+
+    def test_compile_param_converters(self):                                        # Test compiled per-route conversion plan
+        class Product_Data(Type_Safe):
+            name     : Safe_Str
+            category : Safe_Id
+
+        def create_product(store_id: Safe_Id, product_data: Product_Data, notify: bool = False):
+            return product_data
+
+        with self.analyzer as analyzer:
+            signature = analyzer.analyze_function(create_product)
+            signature = self.converter.enrich_signature_with_conversions(signature)
+
+        with self.converter as _:
+            param_converters = _.compile_param_converters(signature)
+
+            assert type(param_converters)                 is tuple
+            assert [name for name, _ in param_converters] == ['store_id', 'product_data']  # 'notify' needs no conversion, so has no slot
+            convert_store_id = param_converters[0][1]                                       # primitives go through the interning cache
+            assert type(convert_store_id('store-1'))       is Safe_Id
+            assert convert_store_id('store-1')             is convert_store_id('store-1')
+
+            convert_product = param_converters[1][1]
+            from_dict       = convert_product({'name': 'Widget', 'category': 'CAT-1'})
+            _, basemodel    = signature.type_safe_conversions['product_data']
+            from_basemodel  = convert_product(basemodel(name='Widget', category='CAT-1'))
+
+            for converted in (from_dict, from_basemodel):
+                assert type(converted)          is Product_Data
+                assert type(converted.category) is Safe_Id
+                assert converted.obj()          == __(name='Widget', category='CAT-1')
+
+    def test_compile_return_converter(self):                                        # Test compiled return value converter
+        class Response_Data(Type_Safe):
+            message : Safe_Str
+            code    : Safe_Int
+
+        def endpoint_type_safe() -> Response_Data:
+            return Response_Data()
+
+        def endpoint_dict() -> dict:
+            return {}
+
+        with self.analyzer as analyzer:
+            signature_type_safe = self.converter.enrich_signature_with_conversions(analyzer.analyze_function(endpoint_type_safe))
+            signature_dict      = analyzer.analyze_function(endpoint_dict)
+
+        with self.converter as _:
+            convert_type_safe = _.compile_return_converter(signature_type_safe)
+            convert_dict      = _.compile_return_converter(signature_dict)
+            result            = {"status": "ok"}
+
+            assert convert_type_safe(Response_Data(message='ok', code=200)) == {'message': 'ok', 'code': 200}
+            assert convert_type_safe(Safe_Id('an-id'))                        == 'an-id'
+            assert type(convert_dict(Safe_Id('an-id')))                        is str
+            assert convert_dict(result)                                        is result
@@ -0,0 +1,88 @@
+import threading
+import pytest
+from unittest                                                                   import TestCase
+from fastapi                                                                    import FastAPI
+from fastapi.testclient                                                         import TestClient
+from osbot_utils.type_safe.primitives.core.Safe_Int                             import Safe_Int
+from osbot_utils.type_safe.primitives.core.Safe_Str                             import Safe_Str
+from osbot_utils.type_safe.primitives.domains.identifiers.Safe_Id               import Safe_Id
+from osbot_fast_api.api.routes.Fast_API__Routes                                 import Fast_API__Routes
+from osbot_fast_api.api.routes.type_safe.Type_Safe__Route__Primitive_Cache      import Type_Safe__Route__Primitive_Cache, type_safe__route__primitive_cache
+
+
+class test_Type_Safe__Route__Primitive_Cache(TestCase):
+
+    def test__init__(self):
+        with Type_Safe__Route__Primitive_Cache() as _:
+            assert _.enabled        is True
+            assert _.max_entries    == 1024
+            assert _.max_value_size == 256
+            assert _.entries        == {}
+            assert _.stats()        == {}
+        assert type(type_safe__route__primitive_cache) is Type_Safe__Route__Primitive_Cache
+
+    def test_converter(self):
+        with Type_Safe__Route__Primitive_Cache() as _:
+            convert_id = _.converter(Safe_Id)
+            value      = convert_id('an id!')
+            assert type(value)            is Safe_Id
+            assert value                  == 'an_id_'
+            assert convert_id('an id!')   is value                                      # same (interned) instance
+            assert _.convert(Safe_Id, 'an id!') is value
+            assert _.stats()              == {'Safe_Id': dict(hits=2, misses=1, evictions=0, entries=1, hit_ratio=0.6667)}
+
+            convert_int = _.converter(Safe_Int)
+            assert convert_int(0)         == 0                                          # (falsy values are cached too)
+            assert convert_int(0)         is convert_int(0)
+            assert convert_int('0')       is not convert_int(0)                         # the raw type is part of the key
+            assert _.stats()['Safe_Int']  == dict(hits=3, misses=2, evictions=0, entries=2, hit_ratio=0.6)
+
+    def test_converter__errors(self):                                                   # invalid values raise (every time) and are not cached
+        with Type_Safe__Route__Primitive_Cache() as _:
+            convert_int = _.converter(Safe_Int)
+            for _index in range(2):
+                with pytest.raises(ValueError):
+                    convert_int('abc')
+            assert _.stats()['Safe_Int'] == dict(hits=0, misses=2, evictions=0, entries=0, hit_ratio=0.0)
+
+    def test_converter__bounds(self):
+        with Type_Safe__Route__Primitive_Cache(max_entries=2, max_value_size=10) as _:
+            convert_str = _.converter(Safe_Str)
+            convert_str('a'); convert_str('b')
+            convert_str('a')                                                            # 'a' is now the most recently used
+            convert_str('c')
+            assert list(_.entries[Safe_Str]) == [(str, 'a'), (str, 'c')]
+            convert_str('x' * 11)                                                       # too long to be cached
+            assert len(_.entries[Safe_Str])  == 2
+            assert _.stats()['Safe_Str']     == dict(hits=1, misses=4, evictions=1, entries=2, hit_ratio=0.2)
+            assert _.clear().stats()['Safe_Str']['entries'] == 0
+
+    def test_converter__disabled(self):
+        with Type_Safe__Route__Primitive_Cache(enabled=False) as _:
+            assert _.converter(Safe_Id) is Safe_Id
+
+    def test_converter__threads(self):
+        with Type_Safe__Route__Primitive_Cache(max_entries=50) as _:
+            convert_id = _.converter(Safe_Id)
+            def worker():
+                for index in range(500):
+                    assert convert_id(f'id-{index % 100}') == f'id-{index % 100}'
+            threads = [threading.Thread(target=worker) for _index in range(8)]
+            for thread in threads: thread.start()
+            for thread in threads: thread.join()
+            stats = _.stats()['Safe_Id']
+            assert stats['hits'] + stats['misses'] == 8 * 500
+            assert stats['entries']                == 50
+
+    def test__fast_api__path_params(self):
+        class Routes__Users(Fast_API__Routes):
+            tag = 'users'
+            def user__user_id(self, user_id: Safe_Id) -> dict:
+                return dict(user_id=user_id, user_id_type=type(user_id).__name__)
+            def setup_routes(self):
+                self.add_route_get(self.user__user_id)
+        client = TestClient(Routes__Users(app=FastAPI()).setup().app)
+        before = type_safe__route__primitive_cache.stats().get('Safe_Id', dict(hits=0))['hits']
+        for _index in range(3):
+            assert client.get('/users/user/user-abc').json() == dict(user_id='user-abc', user_id_type='Safe_Id')
+        assert type_safe__route__primitive_cache.stats()['Safe_Id']['hits'] >= before + 2
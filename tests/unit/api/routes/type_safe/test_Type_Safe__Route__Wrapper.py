@@ -857,3 +857,51 @@ class Schema__Test_User(Type_Safe):                                  # Test sche
     user_id : Safe_Id
     name    : str
     age     : int
+
+    def test__create_wrapper__async_function(self):                                     # Test that coroutine functions get async wrappers
+        import asyncio
+
+        class User_Data(Type_Safe):
+            name: Safe_Str
+
+        async def create_user(user_data: User_Data, user_id: Safe_Id) -> User_Data:
+            await asyncio.sleep(0)
+            assert type(user_data) is User_Data
+            assert type(user_id)   is Safe_Id
+            return user_data
+
+        async def raises_error(user_data: User_Data):
+            raise ValueError("Invalid data")
+
+        with self.wrapper as _:
+            wrapper = _.create_wrapper(create_user, self.converter.enrich_signature_with_conversions(self.analyzer.analyze_function(create_user)))
+            assert inspect.iscoroutinefunction(wrapper) is True
+            assert asyncio.run(wrapper(user_data={'name': 'test'}, user_id='id-1')) == {'name': 'test'}
+
+            wrapper = _.create_wrapper(raises_error, self.converter.enrich_signature_with_conversions(self.analyzer.analyze_function(raises_error)))
+            with self.assertRaises(HTTPException) as context:                            # same error mapping as the sync body wrapper
+                asyncio.run(wrapper(user_data={'name': 'test'}))
+            assert context.exception.status_code == 400
+            assert context.exception.detail      == "ValueError: Invalid data"
+
+    def test__create_wrapper__inline_function(self):                                    # Test that @route_inline sync functions get async wrappers
+        import asyncio
+        from osbot_fast_api.api.decorators.route_inline import route_inline
+
+        @route_inline
+        def get_user(user_id: Safe_Id):
+            return {"user_id": user_id}
+
+        @route_inline
+        def no_conversions():
+            return 42
+
+        with self.wrapper as _:
+            wrapper = _.create_wrapper(get_user, self.converter.enrich_signature_with_conversions(self.analyzer.analyze_function(get_user)))
+            assert inspect.iscoroutinefunction(wrapper) is True
+            assert asyncio.run(wrapper(user_id='id-1')) == {"user_id": Safe_Id('id-1')}
+
+            wrapper = _.create_wrapper(no_conversions, self.analyzer.analyze_function(no_conversions))
+            assert wrapper                              is not no_conversions               # no return type, but still needs the async wrapper
+            assert inspect.iscoroutinefunction(wrapper) is True
+            assert asyncio.run(wrapper())               == 42
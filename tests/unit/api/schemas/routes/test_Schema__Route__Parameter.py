@@ -20,6 +20,9 @@ class test_Schema__Route__Parameter(TestCase):
                                  requires_conversion     = False                    ,
                                  default_value           = None                     ,
                                  has_default             = False                    ,
+                                 is_stream               = False                    ,
+                                 is_async_stream         = False                    ,
+                                 stream_item_type        = None                     ,
                                  nested_primitive_fields = None                     )
 
     def test__init__with_name(self):                                                # Test initialization with parameter name
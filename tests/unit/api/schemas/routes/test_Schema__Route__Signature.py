@@ -21,8 +21,11 @@ class test_Schema__Route__Signature(TestCase):
                                  has_body_params         = False                    ,
                                  has_path_params         = False                    ,
                                  has_query_params        = False                    ,
+                                 is_async                = False                    ,
+                                 is_inline               = False                    ,
                                  primitive_conversions   = __()                     ,
                                  type_safe_conversions   = __()                     ,
+                                 stream_conversions      = __()                     ,
                                  primitive_field_types   = __()                     )
 
     def test__init__with_function_name(self):                                       # Test initialization with function name
@@ -22,6 +22,8 @@ from osbot_fast_api.api.schemas.safe_str.Safe_Str__Fast_API__Name
 from osbot_fast_api.api.schemas.safe_str.Safe_Str__Fast_API__Route__Prefix      import Safe_Str__Fast_API__Route__Prefix
 from osbot_fast_api.api.schemas.consts.consts__Fast_API                         import EXPECTED_ROUTES_PATHS, EXPECTED_ROUTES_METHODS, EXPECTED_DEFAULT_ROUTES, ROUTES__CONFIG, ROUTES__STATIC_DOCS, FAST_API_DEFAULT_ROUTES, ENV_VAR__FAST_API__AUTH__API_KEY__NAME, ENV_VAR__FAST_API__AUTH__API_KEY__VALUE
 from osbot_fast_api.utils.Fast_API_Utils                                        import Fast_API_Utils
+from osbot_fast_api.utils.Fast_API__Request_Id                                  import Fast_API__Request_Id
+from osbot_fast_api.api.schemas.enums.Enum__Fast_API__Request_Id__Mode          import Enum__Fast_API__Request_Id__Mode
 from osbot_fast_api.utils.Version                                               import version__osbot_fast_api
 from tests.unit.fast_api__for_tests                                             import fast_api, fast_api_client
 
@@ -103,8 +105,13 @@ class test_Fast_API(TestCase):
         assert self.fast_api.setup_routes() == self.fast_api
 
     def test_user_middleware(self):
-        assert self.fast_api.user_middlewares() == [{'function_name': None, 'params': {}, 'type': 'Middleware__Request_ID'       },
-                                                    {'function_name': None, 'params': {}, 'type': 'Middleware__Detect_Disconnect'}]
+        middlewares = self.fast_api.user_middlewares()
+        request_id  = middlewares[0]['params']['request_id']
+        assert middlewares == [{'function_name': None, 'params': {'request_id': request_id}, 'type': 'Middleware__Request_ID'       },
+                               {'function_name': None, 'params': {}                        , 'type': 'Middleware__Detect_Disconnect'}]
+        assert type(request_id) is Fast_API__Request_Id
+        assert request_id.mode          == Enum__Fast_API__Request_Id__Mode.RANDOM_GUID
+        assert request_id.reuse_inbound is False
 
     def test__verify__title_description_version(self):
         app = self.fast_api.app()
@@ -417,6 +424,15 @@ class test_Fast_API(TestCase):
             assert '/docs'   not in _.routes_paths()
             assert '/config' not in _.routes_paths()
 
+    def test_setup_default_routes__llm_tools_route(self):                           # /config/llm-tools is opt-in
+        assert '/config/llm-tools' not in Fast_API().setup().routes_paths()
+        config = Schema__Fast_API__Config(llm_tools_route=True)
+        with Fast_API(config=config).setup() as _:
+            assert '/config/llm-tools' in _.routes_paths()
+            response = _.client().get('/config/llm-tools', params=dict(provider='anthropic'))
+            assert response.status_code        == 200
+            assert response.json()['provider'] == 'anthropic'
+
     # Middleware tests
 
     def test_setup_middleware_cors_enabled(self):                                   # Test CORS middleware
@@ -0,0 +1,89 @@
+import hashlib
+import os
+from unittest                                                   import TestCase
+from osbot_utils.testing.Temp_File                              import Temp_File
+from osbot_utils.utils.Files                                    import file_create
+from osbot_utils.utils.Json                                     import json_save_file
+from osbot_fast_api.api.Fast_API__API_Keys                      import Fast_API__API_Keys
+from osbot_fast_api.api.schemas.auth.Schema__Fast_API__API_Key  import Schema__Fast_API__API_Key
+
+
+def key_hash(api_key):
+    return hashlib.sha256(api_key.encode()).hexdigest()
+
+def save_keys(path, *keys, mtime_offset=0):                                             # (mtime_offset: so that the change is detected in the same mtime tick)
+    json_save_file(dict(keys=list(keys)), path)
+    stat = os.stat(path)
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + mtime_offset))
+
+
+class test_Fast_API__API_Keys(TestCase):
+
+    def test__init__(self):
+        with Fast_API__API_Keys() as _:
+            assert _.keys_file       is None
+            assert _.reload_interval == 1.0
+            assert _.keys            == {}
+            assert _.keys_count()    == 0
+            assert _.api_key('an-key') is None
+
+    def test_add_key(self):
+        with Fast_API__API_Keys() as _:
+            key_data = _.add_key('an-key', name='an-name', tenant='an-tenant', scopes=['read'])
+            assert type(key_data)          is Schema__Fast_API__API_Key
+            assert key_data.json()         == dict(key_hash=key_hash('an-key'), name='an-name', tenant='an-tenant', scopes=['read'])
+            assert _.keys                  == {key_hash('an-key'): key_data}                  # (only the hash is stored)
+            assert _.api_key('an-key')     is key_data
+            assert _.api_key('an-key ')    is None
+            assert _.api_key('')           is None
+            assert _.api_key(None)         is None
+            assert _.keys_count()          == 1
+
+    def test_api_key__keys_file(self):
+        with Temp_File(file_name='api-keys.json', return_file_path=True) as keys_file:
+            save_keys(keys_file, dict(key_hash=key_hash('key-1'), tenant='tenant-1', scopes=['read']),
+                                 dict(key_hash=key_hash('key-2').upper(), tenant='tenant-2'          ),        # (hashes are normalised to lower case)
+                                 dict(key_hash='not-a-sha256'         , tenant='tenant-3'          ),        # (ignored)
+                                 dict(key_hash=key_hash('key-4')      , tenant=['not-a-str']       ),        # (ignored)
+                                 'not-a-dict'                                                     )        # (ignored)
+            with Fast_API__API_Keys(keys_file=keys_file, reload_interval=0) as _:
+                _.add_key('env-key')
+                assert _.api_key('key-1').tenant  == 'tenant-1'
+                assert _.api_key('key-1').scopes  == ['read']
+                assert _.api_key('key-2').tenant  == 'tenant-2'
+                assert _.api_key('key-2').scopes  == []
+                assert _.api_key('key-4')         is None
+                assert _.api_key('env-key')       is not None
+                assert _.keys_count()             == 3
+
+                save_keys(keys_file, dict(key_hash=key_hash('key-5'), tenant='tenant-5'), mtime_offset=1_000_000)     # hot reload (key-1 and key-2 revoked, key-5 added)
+                assert _.api_key('key-1')         is None
+                assert _.api_key('key-5').tenant  == 'tenant-5'
+                assert _.api_key('env-key')       is not None                                   # (added keys are kept)
+                assert _.keys_count()             == 2
+
+                file_create(keys_file, '{"keys": [')                                           # invalid file (i.e. while being written): current keys are kept
+                assert _.api_key('key-5').tenant  == 'tenant-5'
+
+                os.remove(keys_file)                                                            # (and when the file is missing)
+                assert _.api_key('key-5').tenant  == 'tenant-5'
+
+    def test_reload_if_changed__interval(self):
+        with Temp_File(file_name='api-keys.json', return_file_path=True) as keys_file:
+            save_keys(keys_file, dict(key_hash=key_hash('key-1')))
+            with Fast_API__API_Keys(keys_file=keys_file, reload_interval=60) as _:
+                assert _.api_key('key-1')  is not None                                          # (first lookup loads the file)
+                save_keys(keys_file, dict(key_hash=key_hash('key-2')), mtime_offset=1_000_000)
+                assert _.api_key('key-2')  is None                                              # (not checked again until reload_interval passed)
+                object.__setattr__(_, 'next_check', 0.0)
+                assert _.api_key('key-2')  is not None
+                assert _.api_key('key-1')  is None
+
+    def test_load_keys(self):
+        with Temp_File(file_name='api-keys.json', return_file_path=True) as keys_file:
+            with Fast_API__API_Keys(keys_file=keys_file) as _:
+                for contents in ['', '{"keys": [', '[]', '{"keys": {}}', '{"an-key": []}']:
+                    file_create(keys_file, contents)
+                    assert _.load_keys() is None
+                file_create(keys_file, '{"keys": []}')
+                assert _.load_keys() == {}
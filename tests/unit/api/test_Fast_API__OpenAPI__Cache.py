@@ -0,0 +1,76 @@
+import gzip
+import json
+from unittest                                               import TestCase
+from fastapi                                                import FastAPI
+from starlette.testclient                                   import TestClient
+from osbot_fast_api.api.Fast_API                            import Fast_API
+from osbot_fast_api.api.Fast_API__OpenAPI__Cache            import Fast_API__OpenAPI__Cache
+from osbot_fast_api.api.schemas.Schema__Fast_API__Config    import Schema__Fast_API__Config
+
+
+class test_Fast_API__OpenAPI__Cache(TestCase):
+
+    def setUp(self):
+        self.app           = FastAPI()
+        self.app.get('/an-route')(lambda: None)
+        self.openapi_cache = Fast_API__OpenAPI__Cache(app=self.app).setup()
+        self.client        = TestClient(self.app)
+
+    def test_setup(self):
+        route = self.app.router.routes[0]
+        assert route.path     == '/openapi.json'
+        assert route.name     == 'openapi'                                              # (same name as FastAPI's route)
+        assert route.endpoint == self.openapi_cache.openapi_json
+        assert len([route for route in self.app.router.routes if route.path == '/openapi.json']) == 1
+
+    def test_openapi_json(self):
+        response = self.client.get('/openapi.json')
+        assert response.status_code             == 200
+        assert response.headers['content-type'] == 'application/json'
+        assert response.json()                  == self.app.openapi()
+        assert response.content                 == json.dumps(self.app.openapi(), separators=(',', ':')).encode()
+
+        etag     = response.headers['etag']
+        response = self.client.get('/openapi.json', headers={'if-none-match': etag})
+        assert response.status_code == 304
+
+        response = self.client.get('/openapi.json', headers={'accept-encoding': 'gzip'})
+        assert self.openapi_cache.content().content_gzip == b''                        # small spec: not worth compressing
+        assert 'content-encoding' not in response.headers
+
+    def test_content(self):
+        content = self.openapi_cache.content()
+        assert self.openapi_cache.content() is content                                 # same routes, same spec: nothing rebuilt
+
+        self.app.post('/another-route')(lambda: None)                                  # new route → new spec (FastAPI alone would keep serving the old one)
+        new_content = self.openapi_cache.content()
+        assert new_content      is not content
+        assert new_content.etag != content.etag
+        assert '/another-route' in json.loads(new_content.content)['paths']
+
+        assert self.openapi_cache.invalidate().content() is not new_content
+        assert self.openapi_cache.content().etag         == new_content.etag
+
+    def test_content__gzip(self):
+        for index in range(20):
+            self.app.get(f'/route-{index}')(lambda: None)
+        content  = self.openapi_cache.content()
+        response = self.client.get('/openapi.json', headers={'accept-encoding': 'gzip, deflate'})
+        assert response.headers['content-encoding']            == 'gzip'
+        assert response.json()                                 == self.app.openapi()
+        assert gzip.decompress(content.content_gzip)           == content.content
+        assert len(content.content_gzip) * 5                   < len(content.content)
+
+    def test_openapi_json__root_path(self):
+        client = TestClient(self.app, root_path='/an-prefix')
+        assert client.get('/openapi.json').json()['servers'] == [{'url': '/an-prefix'}]
+
+    def test__fast_api(self):
+        fast_api = Fast_API(config=Schema__Fast_API__Config(openapi_cache=True)).setup()
+        route    = [route for route in fast_api.app().router.routes if route.path == '/openapi.json'][0]
+        assert type(route.endpoint.__self__) is Fast_API__OpenAPI__Cache
+        assert fast_api.client().get('/openapi.json').json() == fast_api.open_api_json()
+
+        fast_api = Fast_API().setup()                                                   # (opt-in)
+        route    = [route for route in fast_api.app().router.routes if route.path == '/openapi.json'][0]
+        assert route.endpoint.__name__ == 'openapi'
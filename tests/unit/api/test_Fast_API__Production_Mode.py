@@ -0,0 +1,82 @@
+import importlib
+import sys
+import unittest
+from unittest                                                           import TestCase
+from osbot_utils.utils.Files                                            import path_combine, parent_folder, files_recursive
+from osbot_fast_api.api.Fast_API                                        import Fast_API
+from osbot_fast_api.api.Fast_API__Production_Mode                       import Fast_API__Production_Mode, fast_api__production_mode
+from osbot_fast_api.api.routes.Fast_API__Route__Parser                  import Fast_API__Route__Parser
+from osbot_fast_api.api.routes.Fast_API__Routes                         import Fast_API__Routes
+from osbot_fast_api.api.schemas.Schema__Fast_API__Config                import Schema__Fast_API__Config
+from osbot_fast_api.api.transformers.Type_Safe__To__BaseModel           import Type_Safe__To__BaseModel
+
+PATH__TESTS__UNIT       = parent_folder(parent_folder(__file__))
+PARITY__TESTS__FOLDERS  = ['api/routes', 'api/transformers', 'client']                 # tests of the code that production mode changes
+PARITY__TESTS__EXCLUDED = ('check_type_validation'     ,                               # tests of the @type_safe checks that production mode removes
+                           'check_type_safe_attribute' )
+
+
+class test_Fast_API__Production_Mode(TestCase):
+
+    def tearDown(self):
+        fast_api__production_mode.disable()
+
+    def test__init__(self):
+        with Fast_API__Production_Mode() as _:
+            assert _.unwrapped == {}
+            assert _.enabled() is False
+
+    def test_enable__disable(self):
+        parse_route_path = vars(Fast_API__Route__Parser )['parse_route_path']
+        convert_class    = vars(Type_Safe__To__BaseModel)['convert_class'   ]
+        add_route        = vars(Fast_API__Routes        )['add_route'       ]
+        with fast_api__production_mode as _:
+            assert _.is_type_safe_wrapper(parse_route_path) is True
+            _.enable()
+            assert _.enabled() is True
+            assert vars(Fast_API__Route__Parser )['parse_route_path'] is parse_route_path.__wrapped__
+            assert vars(Type_Safe__To__BaseModel)['convert_class'   ] is convert_class   .__wrapped__
+            assert vars(Fast_API__Routes        )['add_route'       ] is add_route                      # user facing methods keep their checks
+            assert (Fast_API__Route__Parser, 'parse_route_path') in _.unwrapped
+            _.disable()
+            assert _.enabled() is False
+            assert vars(Fast_API__Route__Parser )['parse_route_path'] is parse_route_path
+            assert vars(Type_Safe__To__BaseModel)['convert_class'   ] is convert_class
+
+    def test__fast_api(self):                                                           # creating apps doesn't change the (shared) classes, the mode is only enabled explicitly
+        convert_class = vars(Type_Safe__To__BaseModel)['convert_class']
+        Fast_API(config=Schema__Fast_API__Config(name='an-app')).setup()
+        assert fast_api__production_mode.enabled()              is False
+        assert vars(Type_Safe__To__BaseModel)['convert_class']  is convert_class
+
+        fast_api__production_mode.enable()
+        fast_api = Fast_API().setup()
+        assert fast_api.client().get('/config/status').json() == {'status': 'ok'}
+
+    def import_test_module(self, file_path):                                          # same module names as pytest's (default) 'prepend' import mode
+        folder = parent_folder(file_path)
+        if folder not in sys.path:
+            sys.path.insert(0, folder)
+        return importlib.import_module(file_path.split('/')[-1][:-3])
+
+    def test__parity(self):                                                             # the existing unit tests also pass in production mode
+        def parity_tests(suite):
+            for test in suite:
+                if isinstance(test, unittest.TestSuite):
+                    yield from parity_tests(test)
+                elif not any(excluded in test.id() for excluded in PARITY__TESTS__EXCLUDED):
+                    yield test
+
+        loader = unittest.TestLoader()
+        suite  = unittest.TestSuite()
+        for folder in PARITY__TESTS__FOLDERS:
+            for file_path in sorted(files_recursive(path_combine(PATH__TESTS__UNIT, folder), include_folders=False)):
+                file_name = file_path.split('/')[-1]
+                if file_name.startswith('test_') and file_name.endswith('.py'):
+                    suite.addTests(parity_tests(loader.loadTestsFromModule(self.import_test_module(file_path))))
+
+        fast_api__production_mode.enable()
+        result = unittest.TestResult()
+        suite.run(result)
+        assert result.testsRun > 500
+        assert [test.id() for test, _ in result.errors + result.failures] == []
@@ -0,0 +1,85 @@
+from unittest                                                           import TestCase
+from unittest.mock                                                      import patch
+from osbot_utils.testing.Temp_Folder                                    import Temp_Folder
+from osbot_utils.utils.Files                                            import path_combine
+from osbot_fast_api.api.Fast_API__Rate_Limit__Buckets                   import Fast_API__Rate_Limit__Buckets
+from osbot_fast_api.api.Fast_API__Rate_Limit__Buckets__SQLite           import Fast_API__Rate_Limit__Buckets__SQLite
+
+
+class test_Fast_API__Rate_Limit__Buckets(TestCase):
+
+    def assert_token_bucket(self, buckets, clock_name):                                 # same behaviour for both backends (with the clock they use patched)
+        now = [1000.0]
+        with patch(clock_name, side_effect=lambda: now[0]):
+            assert [buckets.take('a', rate=2, burst=3) for _ in range(3)] == [0.0, 0.0, 0.0]       # burst
+            assert buckets.take('a', rate=2, burst=3)                     == 0.5                   # empty: one token every 0.5s
+            assert buckets.take('b', rate=2, burst=3)                     == 0.0                   # (other bucket)
+            now[0] += 0.25
+            assert buckets.take('a', rate=2, burst=3)                     == 0.25
+            now[0] += 0.25
+            assert buckets.take('a', rate=2, burst=3)                     == 0.0
+            assert buckets.take('a', rate=2, burst=3)                     == 0.5
+            now[0] += 100                                                                          # (refill is capped at burst)
+            assert [buckets.take('a', rate=2, burst=3) for _ in range(4)] == [0.0, 0.0, 0.0, 0.5]
+            assert buckets.buckets_count()                                == 2
+
+    def test_take(self):
+        self.assert_token_bucket(Fast_API__Rate_Limit__Buckets(), 'osbot_fast_api.api.Fast_API__Rate_Limit__Buckets.time.monotonic')
+
+    def test_take__remove_least_recently_used(self):
+        with Fast_API__Rate_Limit__Buckets(shards_count=1, max_buckets=2) as _:
+            _.take('a', rate=1, burst=2)
+            _.take('b', rate=1, burst=2)
+            _.take('a', rate=1, burst=2)                                                # 'b' is now the least recently used
+            _.take('c', rate=1, burst=2)
+            assert list(_.shards[0]) == ['a', 'c']
+            assert _.buckets_count() == 2
+            for index in range(1000):                                                   # new keys (i.e. rotated by a client) take the same time, and keep the size bounded
+                _.take(f'key-{index}', rate=1, burst=2)
+            assert list(_.shards[0]) == ['key-998', 'key-999']
+            assert _.clear().buckets_count() == 0
+
+    def assert_refund(self, buckets):
+        assert [buckets.take('a', rate=0.001, burst=2) for _ in range(2)] == [0.0, 0.0]
+        assert buckets.refund('a', burst=2).take('a', rate=0.001, burst=2) == 0.0
+        assert buckets.take('a', rate=0.001, burst=2)                       > 0
+        assert buckets.refund('a', burst=2).refund('a', burst=2).refund('a', burst=2).refund('b', burst=2).buckets_count() == 1    # (capped at burst, and unknown keys are ignored)
+        assert [buckets.take('a', rate=0.001, burst=2) > 0 for _ in range(3)] == [False, False, True]
+
+    def test_refund(self):
+        self.assert_refund(Fast_API__Rate_Limit__Buckets())
+
+    def test_refund__sqlite(self):
+        with Temp_Folder() as temp_folder:
+            self.assert_refund(Fast_API__Rate_Limit__Buckets__SQLite(db_path=path_combine(temp_folder.full_path, 'rate-limit.sqlite')))
+
+    def test_take__sqlite(self):
+        with Temp_Folder() as temp_folder:
+            buckets = Fast_API__Rate_Limit__Buckets__SQLite(db_path=path_combine(temp_folder.full_path, 'rate-limit.sqlite'))
+            self.assert_token_bucket(buckets, 'osbot_fast_api.api.Fast_API__Rate_Limit__Buckets__SQLite.time.time')
+
+    def test_take__sqlite__shared(self):                                                # two instances (i.e. in two worker processes) use the same buckets
+        with Temp_Folder() as temp_folder:
+            db_path   = path_combine(temp_folder.full_path, 'rate-limit.sqlite')
+            buckets_1 = Fast_API__Rate_Limit__Buckets__SQLite(db_path=db_path)
+            buckets_2 = Fast_API__Rate_Limit__Buckets__SQLite(db_path=db_path)
+            assert buckets_1.take('a', rate=0.001, burst=2)     == 0.0
+            assert buckets_2.take('a', rate=0.001, burst=2)     == 0.0
+            assert buckets_1.take('a', rate=0.001, burst=2)      > 0
+            assert buckets_2.take('a', rate=0.001, burst=2)      > 0
+            assert buckets_2.buckets_count()                    == 1
+            assert buckets_1.clear().buckets_count()            == 0
+            assert buckets_2.take('a', rate=0.001, burst=2)     == 0.0
+
+    def test_remove_idle_buckets__sqlite(self):
+        with Temp_Folder() as temp_folder:
+            buckets = Fast_API__Rate_Limit__Buckets__SQLite(db_path=path_combine(temp_folder.full_path, 'rate-limit.sqlite'), cleanup_every=3, idle_seconds=60)
+            now     = [1000.0]
+            with patch('osbot_fast_api.api.Fast_API__Rate_Limit__Buckets__SQLite.time.time', side_effect=lambda: now[0]):
+                buckets.take('a', rate=1, burst=2)
+                now[0] += 61
+                buckets.take('b', rate=1, burst=2)
+                assert buckets.buckets_count() == 2
+                buckets.take('b', rate=1, burst=2)                                      # (3rd take: idle buckets are removed)
+                assert buckets.buckets_count() == 1
+                assert buckets.takes_count     == 0
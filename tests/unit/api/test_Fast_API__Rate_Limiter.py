@@ -0,0 +1,63 @@
+from unittest                                                           import TestCase
+from osbot_fast_api.api.Fast_API__API_Keys                              import Fast_API__API_Keys
+from osbot_fast_api.api.Fast_API__Rate_Limiter                          import Fast_API__Rate_Limiter
+from osbot_fast_api.api.Fast_API__Rate_Limit__Buckets                   import Fast_API__Rate_Limit__Buckets
+
+
+def an_scope(path='/an-path', headers=(), client=('10.0.0.1', 1234), api_key=None):
+    scope = dict(type='http', path=path, headers=list(headers), client=client)
+    if api_key:                                                                         # (as set by the api key check)
+        scope['state'] = dict(api_key=Fast_API__API_Keys().add_key(api_key))
+    return scope
+
+
+class test_Fast_API__Rate_Limiter(TestCase):
+
+    def test__init__(self):
+        with Fast_API__Rate_Limiter() as _:
+            assert _.rate                   == 10.0
+            assert _.burst                  == 20
+            assert _.route_limits           == {}
+            assert _.api_key_check          is False
+            assert type(_.buckets)          is Fast_API__Rate_Limit__Buckets
+            assert _.stats()                == dict(requests_allowed=0, requests_limited=0, buckets=0)
+
+    def test_client_key(self):
+        key_hash = Fast_API__API_Keys().hash_key('an-api-key')
+        with Fast_API__Rate_Limiter(api_key_check=True) as _:
+            assert _.client_key(an_scope(api_key='an-api-key'))                        == 'key:' + key_hash[:32]    # (the key itself is not stored)
+            assert _.client_key(an_scope(headers=[(b'an-key-name', b'an-api-key')]))  == 'ip:10.0.0.1'             # (header values not validated by the api key check are ignored)
+            assert _.client_key(an_scope())                                            == 'ip:10.0.0.1'
+            assert _.client_key(an_scope(client=None))                                 == 'ip:'
+        with Fast_API__Rate_Limiter() as _:
+            assert _.client_key(an_scope(api_key='an-api-key'))                        == 'ip:10.0.0.1'
+
+    def test_route_limit(self):
+        with Fast_API__Rate_Limiter(route_limits={'/an-route': (1, 2)}) as _:
+            _.add_route_limit('/an-prefix/', 3, 4)
+            assert _.route_limit('/an-route'        ) == ('/an-route'  , (1, 2))
+            assert _.route_limit('/an-prefix/a/b'   ) == ('/an-prefix/', (3, 4))
+            assert _.route_limit('/an-route/a'      ) is None
+            assert _.route_limit('/an-prefix'       ) is None
+
+    def test_check(self):
+        with Fast_API__Rate_Limiter(rate=0.001, burst=2, api_key_check=True) as _:
+            assert [round(_.check(an_scope()))                                      for _index in range(3)] == [0, 0, 1000]
+            assert [round(_.check(an_scope(client=('10.0.0.2', 1))))                for _index in range(2)] == [0, 0]          # per client
+            assert [round(_.check(an_scope(api_key='an-key')))                     for _index in range(3)] == [0, 0, 1000]    # (api key has priority over the ip)
+            assert _.stats() == dict(requests_allowed=6, requests_limited=2, buckets=3)
+
+    def test_check__route_limits(self):
+        with Fast_API__Rate_Limiter(rate=0.001, burst=3, route_limits={'/an-route': (0.001, 1)}) as _:
+            assert round(_.check(an_scope('/an-route'))) == 0
+            assert round(_.check(an_scope('/an-route'))) == 1000                                                           # route bucket is empty
+            assert round(_.check(an_scope('/an-other'))) == 0                                                              # (client bucket had 2 tokens)
+            assert round(_.check(an_scope('/an-other'))) == 0
+            assert round(_.check(an_scope('/an-other'))) == 1000                                                           # client bucket is empty
+            assert _.stats() == dict(requests_allowed=3, requests_limited=2, buckets=2)
+
+    def test_check__route_limits__refund(self):                                         # requests rejected by the client bucket give the route token back
+        with Fast_API__Rate_Limiter(rate=0.001, burst=1, route_limits={'/an-route': (0.001, 2)}) as _:
+            assert round(_.check(an_scope('/an-other'))) == 0
+            assert round(_.check(an_scope('/an-route'))) == 1000                                                           # client bucket is empty
+            assert [round(_.buckets.take('ip:10.0.0.1|/an-route', 0.001, 2)) for _index in range(3)] == [0, 0, 1000]       # (both route tokens are still there)
@@ -457,4 +457,48 @@ class test_BaseModel__To__Dataclass(TestCase):
         model = ContainerModel(mapping={"key": ValueModel(data="test")})
         dc = self.converter.convert_instance(model)
         assert is_dataclass(dc.mapping["key"])
-        assert dc.mapping["key"].data == "test"
\ No newline at end of file
+        assert dc.mapping["key"].data == "test"
+
+    def test__convert_instances(self):                                                   # Test bulk conversion (compiled per class converter)
+        class AddressModel(BaseModel):
+            street : str
+            city   : str = 'London'
+
+        class RowModel(BaseModel):
+            row_id  : int
+            name    : str
+            tags    : List[str]               = []
+            labels  : Set[str]                = set()
+            attrs   : Dict[str, int]          = {}
+            address : Optional[AddressModel]  = None
+            history : List[AddressModel]      = []
+            by_key  : Dict[str, AddressModel] = {}
+
+        rows = [RowModel(row_id=1, name='first' , tags=['a'], labels={'b'}, attrs={'c': 1}, address=AddressModel(street='s1'),
+                         history=[AddressModel(street='h1')], by_key={'k': AddressModel(street='k1', city='Paris')}),
+                RowModel(row_id=2, name='second'),
+                AddressModel(street='s2')]                                                # (mixed classes are supported)
+        dcs  = self.converter.convert_instances(rows)
+
+        assert dcs == [self.converter.convert_instance(row) for row in rows]
+        assert asdict(dcs[0]) == rows[0].model_dump()
+        assert is_dataclass(dcs[0].address) and is_dataclass(dcs[0].history[0]) and is_dataclass(dcs[0].by_key['k'])
+        assert dcs[0].tags   is not rows[0].tags                                          # typed collections are copied (like convert_instance)
+        assert dcs[0].attrs  is not rows[0].attrs
+        assert dcs[1].address is None
+        assert self.converter.convert_instances([]) == []
+
+    def test__convert_instances__check_type_validation(self):
+        expected_error = "Items of 'basemodel_instances' expected type <class 'pydantic.main.BaseModel'>, but got <class 'int'>"
+        with pytest.raises(ValueError, match=re.escape(expected_error)):
+            self.converter.convert_instances([42])
+
+    def test__compile_converter(self):
+        class SimpleModel(BaseModel):
+            name : str
+            age  : int = 0
+
+        converter = self.converter.converter_for_class(SimpleModel)
+        assert converter              is self.converter.converter_for_class(SimpleModel)  # compiled once per class
+        assert converter.__qualname__ == 'convert__SimpleModel'
+        assert asdict(converter(SimpleModel(name='abc'))) == {'name': 'abc', 'age': 0}
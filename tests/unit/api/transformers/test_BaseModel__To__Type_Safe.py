@@ -310,4 +310,55 @@ class test_BaseModel__To__Type_Safe(TestCase):
 
         assert type_safe.empty_list == []
         assert type_safe.empty_dict == {}
-        assert type_safe.empty_set  == set()
\ No newline at end of file
+        assert type_safe.empty_set  == set()
+
+    def test__convert_instances(self):                                                    # Test bulk conversion (compiled per class converter)
+        class AddressModel(BaseModel):
+            street : str
+            city   : str = 'London'
+
+        class RowModel(BaseModel):
+            row_id  : int
+            name    : str
+            tags    : List[str]               = []
+            labels  : Set[str]                = set()
+            attrs   : Dict[str, int]          = {}
+            address : Optional[AddressModel]  = None
+            history : List[AddressModel]      = []
+            by_key  : Dict[str, AddressModel] = {}
+
+        rows       = [RowModel(row_id=1, name='first' , tags=['a'], labels={'b'}, attrs={'c': 1}, address=AddressModel(street='s1'),
+                               history=[AddressModel(street='h1')], by_key={'k': AddressModel(street='k1', city='Paris')}),
+                      RowModel(row_id=2, name='second'),
+                      AddressModel(street='s2')]                                          # (mixed classes are supported)
+        type_safes = self.converter.convert_instances(rows)
+
+        assert [type(type_safe) for type_safe in type_safes] == [self.converter.convert_class(RowModel), self.converter.convert_class(RowModel), self.converter.convert_class(AddressModel)]
+        assert [type_safe.json() for type_safe in type_safes] == [self.converter.convert_instance(row).json() for row in rows]
+        assert type(type_safes[0].address      ) is self.converter.convert_class(AddressModel)
+        assert type(type_safes[0].history[0]   ) is self.converter.convert_class(AddressModel)
+        assert type(type_safes[0].by_key['k']  ) is self.converter.convert_class(AddressModel)
+        assert type_safes[0].tags               == ['a']
+        assert type_safes[0].tags               is not rows[0].tags                       # (Type_Safe collections, not the BaseModel's)
+        assert type_safes[1].address            is None
+        assert self.converter.convert_instances([]) == []
+
+        with pytest.raises(ValueError, match="invalid type for attribute 'name'"):         # validation is only skipped during the conversion
+            type_safes[0].name = 123
+        with pytest.raises(TypeError):
+            type_safes[0].tags.append(123)
+
+    def test__convert_instances__check_type_validation(self):
+        expected_error = "Items of 'basemodel_instances' expected type <class 'pydantic.main.BaseModel'>, but got <class 'str'>"
+        with pytest.raises(ValueError, match=re.escape(expected_error)):
+            self.converter.convert_instances(['not_a_model'])
+
+    def test__compile_converter(self):
+        class SimpleModel(BaseModel):
+            name : str
+            age  : int = 0
+
+        converter = self.converter.converter_for_class(SimpleModel)
+        assert converter              is self.converter.converter_for_class(SimpleModel)   # compiled once per class
+        assert converter.__qualname__ == 'convert__SimpleModel'
+        assert converter(SimpleModel(name='abc')).json() == {'name': 'abc', 'age': 0}
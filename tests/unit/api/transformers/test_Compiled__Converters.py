@@ -0,0 +1,56 @@
+import pytest
+from typing                                                      import Dict, List, Optional
+from unittest                                                    import TestCase
+from pydantic                                                    import BaseModel
+from osbot_fast_api.api.transformers.BaseModel__Converters       import BaseModel__Converters
+from osbot_fast_api.api.transformers.BaseModel__To__Dataclass    import BaseModel__To__Dataclass
+from osbot_fast_api.api.transformers.BaseModel__To__Type_Safe    import BaseModel__To__Type_Safe
+from osbot_fast_api.api.transformers.Compiled__Converters        import Compiled__Converters
+from osbot_fast_api.api.transformers.Type_Safe__To__BaseModel    import Type_Safe__To__BaseModel
+
+
+class An_Address(BaseModel):
+    city : str
+
+class An_User(BaseModel):
+    name      : str
+    addresses : List[An_Address]
+    tags      : Dict[str, str]
+
+
+class test_Compiled__Converters(TestCase):
+
+    def test__init__(self):
+        with Compiled__Converters() as _:
+            assert _.converter_cache == {}
+            assert _.value_cache     == {}
+            assert _.to_value('abc') == 'abc'                                           # (no value converters in the base class)
+            with pytest.raises(NotImplementedError):
+                _.converter_for_class(An_User)
+
+    def test__subclasses(self):                                                         # the compiled converters are shared by the BaseModel and Type_Safe transformers
+        assert issubclass(BaseModel__Converters   , Compiled__Converters )
+        assert issubclass(Type_Safe__To__BaseModel, Compiled__Converters )
+        assert issubclass(BaseModel__To__Type_Safe, BaseModel__Converters)
+        assert issubclass(BaseModel__To__Dataclass, BaseModel__Converters)
+
+    def test_compile_function(self):
+        function = Compiled__Converters().compile_function("def an_function(value):\n    return prefix + value\n", 'an_function', 'an_qualname', prefix='a-')
+        assert function('b')           == 'a-b'
+        assert function.__qualname__   == 'an_qualname'
+
+    def test_field_uses_to_value(self):
+        assert BaseModel__To__Type_Safe().field_uses_to_value(List[An_Address]     ) is True
+        assert BaseModel__To__Type_Safe().field_uses_to_value(Optional[An_Address] ) is True
+        assert BaseModel__To__Type_Safe().field_uses_to_value(Dict[str, str]       ) is False      # (Type_Safe converts its collections)
+        assert BaseModel__To__Dataclass().field_uses_to_value(Dict[str, str]       ) is True       # (dataclasses get a copy)
+        assert BaseModel__To__Dataclass().field_uses_to_value(str                  ) is False
+
+    def test_convert_instances(self):                                                   # same compiled converters, for both targets
+        users = [An_User(name='a', addresses=[An_Address(city='c')], tags={'k': 'v'})]
+        for converter in (BaseModel__To__Type_Safe(), BaseModel__To__Dataclass()):
+            user = converter.convert_instances(users)[0]
+            assert user.name               == 'a'
+            assert user.addresses[0].city  == 'c'
+            assert dict(user.tags)         == {'k': 'v'}
+            assert converter.converter_for_class(An_User) is converter.converter_cache[An_User]
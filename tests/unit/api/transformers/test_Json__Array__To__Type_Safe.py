@@ -0,0 +1,150 @@
+import asyncio
+import json
+import pytest
+from typing                                                                 import Iterator, AsyncIterator, List
+from unittest                                                               import TestCase
+from osbot_utils.type_safe.Type_Safe                                        import Type_Safe
+from osbot_utils.type_safe.primitives.domains.identifiers.Safe_Id           import Safe_Id
+from osbot_fast_api.api.Fast_API                                            import Fast_API
+from osbot_fast_api.api.routes.Fast_API__Routes                             import Fast_API__Routes
+from osbot_fast_api.api.schemas.Schema__Fast_API__Config                    import Schema__Fast_API__Config
+from osbot_fast_api.api.transformers.Json__Array__To__Type_Safe             import Json__Array__To__Type_Safe, STATE__START, STATE__END
+
+
+class An_Record(Type_Safe):
+    record_id : Safe_Id
+    value     : int
+    tags      : List[str]
+
+class Routes__Import(Fast_API__Routes):
+    tag = 'import'
+
+    def records(self, records: Iterator[An_Record]) -> dict:                        # def route: items pulled from the event loop (route runs in the threadpool)
+        count, total = 0, 0
+        for record in records:
+            assert type(record)           is An_Record
+            assert type(record.record_id) is Safe_Id
+            count += 1
+            total += record.value
+        return dict(count=count, total=total)
+
+    async def records_async__source(self, source: str, records: AsyncIterator[An_Record]) -> dict:
+        record_ids = [str(record.record_id) async for record in records]
+        return dict(source=source, record_ids=record_ids[:2], count=len(record_ids))
+
+    def setup_routes(self):
+        self.add_route_post(self.records              )
+        self.add_route_post(self.records_async__source)
+
+
+class test_Json__Array__To__Type_Safe(TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.items = [dict(record_id=f'record-{index}', value=index, tags=['é', 'b']) for index in range(20)] + [42, 'text', None, [1, {}]]
+        cls.body  = json.dumps(cls.items).encode()
+
+    def test__init__(self):
+        with Json__Array__To__Type_Safe() as _:
+            assert _.item_decoder is None
+            assert _.buffer       == ''
+            assert _.state        == STATE__START
+            assert _.items_count  == 0
+
+    def test_items(self):                                                           # same values, wherever the chunks are split (including inside multi-byte chars and numbers)
+        for chunk_size in (1, 2, 3, 7, 64, len(self.body)):
+            chunks = [self.body[index:index + chunk_size] for index in range(0, len(self.body), chunk_size)]
+            with Json__Array__To__Type_Safe() as _:
+                assert list(_.items(chunks)) == self.items
+                assert _.state               == STATE__END
+                assert _.items_count         == len(self.items)
+                assert _.buffer              == ''
+
+        assert list(Json__Array__To__Type_Safe().items([b' [ ] \n'])) == []
+
+    def test_feed(self):                                                            # items are returned as soon as they are complete
+        with Json__Array__To__Type_Safe(item_decoder=lambda value: An_Record(**value)) as _:
+            records = _.feed(b'[{"value": 1}, {"val')
+            assert [record.value for record in records] == [1]
+            assert _.items_count                        == 1
+            assert _.buffer                             == '{"val'
+            records = _.feed(b'ue": 2}, {"value": 3}]')
+            assert [record.value for record in records] == [2, 3]
+            assert _.close()                            == []
+
+    def test_async_items(self):
+        async def chunks():
+            for index in range(0, len(self.body), 10):
+                yield self.body[index:index + 10]
+        async def read_items():
+            return [item async for item in Json__Array__To__Type_Safe().async_items(chunks())]
+        assert asyncio.run(read_items()) == self.items
+
+    def test_items__errors(self):
+        for body, error_message in [(b''           , 'Expecting value'        ),
+                                    (b'{"a": 1}'   , 'Expecting array'        ),
+                                    (b'[1, 2'      , "Expecting ',' delimiter"),
+                                    (b'[1 2]'      , "Expecting ',' delimiter"),
+                                    (b'[1, ]'      , 'Expecting value'        ),
+                                    (b'[1] [2]'    , 'Extra data'             ),
+                                    (b'[{"a": 1]'  , "Expecting ',' delimiter")]:
+            with pytest.raises(json.JSONDecodeError, match=error_message):
+                list(Json__Array__To__Type_Safe().items([body]))
+
+        with Json__Array__To__Type_Safe(item_decoder=lambda value: An_Record(**value)) as _:      # errors raised by the item_decoder leave items_count at the index of that item
+            with pytest.raises(ValueError, match="invalid type for attribute 'value'"):
+                list(_.items([b'[{"value": 1}, {"value": "2"}]']))
+            assert _.items_count == 1
+
+    def test__fast_api__stream_routes(self):
+        class An_Fast_API(Fast_API):
+            def setup_routes(self):
+                self.add_routes(Routes__Import)
+        for config in (Schema__Fast_API__Config(default_routes=False                  ),
+                       Schema__Fast_API__Config(default_routes=False, lazy_routes=True)):
+            client  = An_Fast_API(config=config).setup().client()
+            records = [dict(record_id=f'record-{index}', value=index) for index in range(1000)]
+            assert client.post('/import/records'                 , json=records).json() == dict(count=1000, total=499500)
+            assert client.post('/import/records-async/a-source' , json=records).json() == dict(source='a-source', record_ids=['record-0', 'record-1'], count=1000)
+            assert client.post('/import/records'                 , json=[]     ).json() == dict(count=0, total=0)
+
+            response = client.post('/import/records', json=[dict(value=1), dict(value='abc')])                # errors use the same 400 validation formats
+            assert response.status_code == 400
+            assert response.json()      == {'detail': [{'type' : 'value_error'                                                                                         ,
+                                                        'loc'  : ['body', 'records', 1]                                                                                ,
+                                                        'msg'  : "On An_Record, invalid type for attribute 'value'. Expected '<class 'int'>' but got '<class 'str'>'" ,
+                                                        'input': None                                                                                                  }]}
+            response = client.post('/import/records-async/a-source', json=[dict(value=1), 2])
+            assert response.status_code == 400
+            assert response.json()['detail'][0]['msg'] == "expected a An_Record object but got 'int'"
+
+            response = client.post('/import/records', content=b'[{"value": 1},')
+            assert response.status_code == 400
+            assert response.json()      == {'detail': [{'type': 'json_invalid', 'loc': ['body', 0], 'msg': 'JSON decode error', 'input': {}, 'ctx': {'error': 'Expecting value'}}]}
+
+    def test__fast_api__stream_routes__openapi(self):
+        class An_Fast_API(Fast_API):
+            def setup_routes(self):
+                self.add_routes(Routes__Import)
+        openapi      = An_Fast_API(config=Schema__Fast_API__Config(default_routes=False)).setup().open_api_json()
+        operation    = openapi['paths']['/import/records-async/{source}']['post']
+        request_body = operation['requestBody']['content']['application/json']['schema']
+        assert request_body['type']                     == 'array'
+        assert list(request_body['items']['properties']) == ['record_id', 'value', 'tags']
+        assert [param['name'] for param in operation['parameters']] == ['source']            # the Request param used by the wrapper is not published
+
+    def test__fast_api__stream_routes__invalid(self):
+        class Routes__Invalid(Fast_API__Routes):
+            def sync_route(self, records: AsyncIterator[An_Record]):
+                return None
+            async def async_route(self, records: Iterator[An_Record]):
+                return None
+            def two_streams(self, records: Iterator[An_Record], others: Iterator[An_Record]):
+                return None
+        with Routes__Invalid() as _:
+            with pytest.raises(ValueError, match="AsyncIterator parameter 'records' needs an async def route"):
+                _.add_route_post(_.sync_route)
+            with pytest.raises(ValueError, match="Iterator parameter 'records' needs a def route"):
+                _.add_route_post(_.async_route)
+            with pytest.raises(ValueError, match="route 'two_streams' can only have one streamed body parameter"):
+                _.add_route_post(_.two_streams)
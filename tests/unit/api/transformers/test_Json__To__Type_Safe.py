@@ -0,0 +1,189 @@
+import json
+import pytest
+from enum                                                                   import Enum
+from typing                                                                 import List, Dict, Optional, Set
+from unittest                                                               import TestCase
+from osbot_utils.type_safe.Type_Safe                                        import Type_Safe
+from osbot_utils.type_safe.primitives.core.Safe_Str                         import Safe_Str
+from osbot_utils.type_safe.primitives.core.Safe_Int                         import Safe_Int
+from osbot_utils.type_safe.primitives.core.Safe_Float                       import Safe_Float
+from osbot_utils.type_safe.primitives.domains.identifiers.Safe_Id           import Safe_Id
+from osbot_fast_api.api.Fast_API                                            import Fast_API
+from osbot_fast_api.api.schemas.Schema__Fast_API__Config                    import Schema__Fast_API__Config
+from osbot_fast_api.api.schemas.enums.Enum__Fast_API__Body__Mode            import Enum__Fast_API__Body__Mode
+from osbot_fast_api.api.transformers.Json__To__Type_Safe                    import Json__To__Type_Safe, json__to__type_safe
+from osbot_fast_api.client.testing.Test__Fast_API__With_Routes              import Routes__Users
+
+
+class An_Enum(str, Enum):
+    VALUE_A = 'value_a'
+    VALUE_B = 'value_b'
+
+class An_Item(Type_Safe):
+    item_id : Safe_Id
+    price   : Safe_Float
+    tags    : List[Safe_Str]
+    items   : List['An_Item']
+
+class An_Order(Type_Safe):
+    order_id : Safe_Id
+    quantity : Safe_Int
+    status   : An_Enum           = An_Enum.VALUE_A
+    items    : List[An_Item]
+    by_id    : Dict[Safe_Id, An_Item]
+    parent   : Optional[An_Item] = None
+    note     : str               = 'a note'
+    weight   : float
+
+class An_Base__With_Defaults(Type_Safe):
+    name     : str               = 'a name'
+    count    : int               = 42
+
+class An_Order__With_Defaults(An_Base__With_Defaults):                              # every field has a default (class level or created per instance)
+    name                         = 'an order'                                       # (overrides the base class default)
+    order_id : Safe_Id           = Safe_Id('order-default')
+    status   : An_Enum           = An_Enum.VALUE_B
+    ratio    : float             = 0.5
+    enabled  : bool              = True
+    base     : An_Base__With_Defaults
+    tags     : List[Safe_Str]
+
+class An_Order__With_Set(Type_Safe):                                                # Set[...] is not supported by the compiled decoder
+    order_id : Safe_Id
+    codes    : Set[int]
+
+
+class test_Json__To__Type_Safe(TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        item      = dict(item_id='item-1', price=12.5, tags=['a', 'b'], items=[dict(item_id='child-1', price=1.0)])
+        cls.data  = dict(order_id = 'order-1'        ,
+                         quantity = 3                ,
+                         status   = 'value_b'        ,
+                         items    = [item, item]     ,
+                         by_id    = {'item-1': item} ,
+                         parent   = item             ,
+                         weight   = 2                )
+
+    def test__init__(self):
+        with Json__To__Type_Safe() as _:
+            assert type(_)               is Json__To__Type_Safe
+            assert type(_.decoder_cache) is dict
+
+    def test_decoder_for_class(self):
+        with json__to__type_safe as _:
+            decoder = _.decoder_for_class(An_Order)
+            assert _.decoder_for_class(An_Order)            is decoder              # compiled once, returned by identity
+            assert decoder.__qualname__                     == 'decode__An_Order'
+            assert _.decoder_for_class(An_Item).__qualname__ == 'decode__An_Item'   # nested (and self referencing) classes are compiled too
+            assert _.decoder_for_class(An_Order__With_Set)  is None
+
+    def test_decode(self):
+        with json__to__type_safe as _:
+            order = _.decode(An_Order, self.data)
+            assert type(order)             is An_Order
+            assert type(order.order_id)    is Safe_Id
+            assert type(order.quantity)    is Safe_Int
+            assert order.status            is An_Enum.VALUE_B
+            assert type(order.items[0])    is An_Item
+            assert type(order.items[0].items[0]) is An_Item
+            assert type(order.by_id['item-1'])   is An_Item
+            assert order.note              == 'a note'
+            assert order.json()            == An_Order(**self.data).json()
+
+    def test_decode__same_as_type_safe(self):                                       # same values, types and field order as type_safe_class(**data)
+        via_decoder   = json__to__type_safe.decoder_for_class(An_Order)(self.data)
+        via_type_safe = An_Order(**self.data)
+        assert list(via_decoder.__dict__) == list(via_type_safe.__dict__)
+        for field_name, value in via_type_safe.__dict__.items():
+            assert type(via_decoder.__dict__[field_name]) is type(value)
+        assert via_decoder.json()              == via_type_safe.json()
+        assert via_decoder.items.expected_type is via_type_safe.items.expected_type
+
+    def test_decode__defaults(self):                                                # missing (and None) fields get the class defaults, same as type_safe_class(**data)
+        decoder = json__to__type_safe.decoder_for_class(An_Order__With_Defaults)
+        assert decoder is not None
+        for data in (dict(), dict(count=1), dict(name=None, tags=['a']), dict(base=dict(count=2), status='value_a')):
+            via_decoder   = decoder(data)
+            via_type_safe = An_Order__With_Defaults(**data)
+            assert list(via_decoder.__dict__) == list(via_type_safe.__dict__)
+            for field_name, value in via_type_safe.__dict__.items():
+                assert type(via_decoder.__dict__[field_name]) is type(value)
+            assert via_decoder.json() == via_type_safe.json()
+
+        order = decoder(dict(count=1))
+        assert order.name     == 'an order'
+        assert order.count    == 1
+        assert order.order_id == 'order-default'
+        assert order.status   is An_Enum.VALUE_B
+        assert order.ratio    == 0.5
+        assert order.enabled  is True
+        assert order.base.json() == dict(name='a name', count=42)
+        assert decoder(dict()).base is not decoder(dict()).base                     # per instance defaults are not shared
+        assert decoder(dict()).tags is not decoder(dict()).tags
+
+        An_Order__With_Defaults.count = 7                                           # class defaults are read when decoding
+        try:
+            assert decoder(dict()).count == An_Order__With_Defaults().count == 7
+        finally:
+            An_Order__With_Defaults.count = 42
+
+    def test_decode__fallback(self):                                                # anything the compiled decoder doesn't map 1:1 is handled (and reported) by Type_Safe
+        with json__to__type_safe as _:
+            assert _.decode(An_Order__With_Set, dict(order_id='abc', codes=[1])).json() == An_Order__With_Set(order_id='abc', codes=[1]).json()
+            assert type(_.decode(An_Order, dict(quantity='42')).quantity) is Safe_Int  # str into Safe_Int is converted by Type_Safe
+
+            error_message = "An_Order has no attribute 'an_extra' and cannot be assigned the value '1'"
+            with pytest.raises(ValueError, match=error_message):
+                _.decode(An_Order, dict(an_extra=1))
+
+            with pytest.raises(ValueError, match="invalid type for attribute 'note'"):
+                _.decode(An_Order, dict(note=42))
+
+    def test_from_bytes(self):
+        with json__to__type_safe as _:
+            order = _.from_bytes(An_Order, json.dumps(self.data).encode())
+            assert order.json() == An_Order(**self.data).json()
+
+    def test__fast_api__body_mode__type_safe(self):
+        def create_fast_api(body_mode):
+            class An_Fast_API(Fast_API):
+                def setup_routes(self):
+                    self.add_routes(Routes__Users)
+            config = Schema__Fast_API__Config(default_routes=False, body_mode=body_mode)
+            return An_Fast_API(config=config).setup()
+
+        fast_api__basemodel = create_fast_api(Enum__Fast_API__Body__Mode.BASEMODEL)
+        fast_api__type_safe = create_fast_api(Enum__Fast_API__Body__Mode.TYPE_SAFE)
+        user                = dict(id=1, name='a name', email='an@email.com')
+
+        response__basemodel = fast_api__basemodel.client().post('/users/create-user', json=user)
+        response__type_safe = fast_api__type_safe.client().post('/users/create-user', json=user)
+        assert response__type_safe.status_code == 200
+        assert response__type_safe.json()      == response__basemodel.json() == user
+
+        response = fast_api__type_safe.client().post('/users/create-user', json=user | dict(id='abc'))  # errors use the same 400 validation format
+        assert response.status_code == 400
+        assert response.json()      == {'detail': [{'type' : 'value_error'                                                                                      ,
+                                                    'loc'  : ['body', 'user']                                                                                   ,
+                                                    'msg'  : "On Schema__User, invalid type for attribute 'id'. Expected '<class 'int'>' but got '<class 'str'>'",
+                                                    'input': user | dict(id='abc')                                                                              }]}
+
+        for body in ([1, 2], 'a string', 42):                                                                           # valid JSON, but not an object: 400 (as in BASEMODEL mode)
+            response__basemodel = fast_api__basemodel.client().post('/users/create-user', json=body)
+            response__type_safe = fast_api__type_safe.client().post('/users/create-user', json=body)
+            assert response__basemodel.status_code == 400
+            assert response__type_safe.status_code == 400
+            assert response__type_safe.json()      == {'detail': [{'type' : 'value_error'                                                      ,
+                                                                   'loc'  : ['body', 'user']                                                   ,
+                                                                   'msg'  : f"expected a Schema__User object but got '{type(body).__name__}'",
+                                                                   'input': body                                                               }]}
+
+        response = fast_api__type_safe.client().post('/users/create-user', content=b'{not json')                       # malformed JSON is still rejected by FastAPI
+        assert response.status_code                == 400
+        assert response.json()['detail'][0]['type'] == 'json_invalid'
+
+        openapi      = fast_api__type_safe.open_api_json()                                                             # the body schema is still published
+        request_body = openapi['paths']['/users/create-user']['post']['requestBody']['content']['application/json']['schema']
+        assert list(request_body['properties']) == ['id', 'name', 'email']
@@ -1,10 +1,13 @@
 import re
 import sys
 import pytest
+from decimal                                                         import Decimal
 from typing                                                          import List, Dict, Optional, Union, Set
 from unittest                                                        import TestCase
 from osbot_utils.testing.__                                          import __
 from osbot_utils.type_safe.type_safe_core.collections.Type_Safe__Set import Type_Safe__Set
+from osbot_utils.type_safe.type_safe_core.collections.Type_Safe__List import Type_Safe__List
+from osbot_utils.type_safe.Type_Safe__Primitive                      import Type_Safe__Primitive
 from pydantic                                                        import BaseModel, ValidationError
 from osbot_utils.testing.__helpers                                   import obj
 from osbot_utils.type_safe.Type_Safe                                 import Type_Safe
@@ -388,3 +391,58 @@ class test_Type_Safe__To__BaseModel(TestCase):
 
 
 
+
+    def test_to_dict(self):                                                                   # Test compiled single pass to_dict
+        class An_Leaf(Type_Safe):
+            leaf_id : Safe_Str
+            count   : Safe_Int
+            tags    : Set[Safe_Str]
+
+        class An_Branch(Type_Safe):
+            name   : str
+            leaves : List[An_Leaf]
+            index  : Dict[Safe_Str, An_Leaf]
+            main   : An_Leaf = None
+
+        leaf      = An_Leaf(leaf_id='leaf_1', count=2, tags={'a'})
+        branch    = An_Branch(name='branch', leaves=[leaf, leaf], index={'leaf_1': leaf}, main=leaf)
+        data      = self.converter.to_dict(branch)
+        leaf_data = dict(leaf_id='leaf_1', count=2, tags=['a'])
+        assert data == dict(name='branch', leaves=[leaf_data, leaf_data], index={'leaf_1': leaf_data}, main=leaf_data)
+        assert type(data['leaves'][0]['leaf_id'])   is str                                     # primitives mapped to their base types
+        assert type(data['leaves'][0]['count'  ])   is int
+        assert type(data['leaves'])                 is list                                    # Type_Safe collections mapped to plain containers
+        assert type(list(data['index'])[0])         is str
+        assert self.converter.to_dict(An_Branch())  == dict(name='', leaves=[], index={}, main=None)
+        assert self.converter.extract_instance_data(branch) == data
+        assert self.converter.convert_instance(branch).model_dump() == data                    # same data as the BaseModel round trip
+
+    def test_converter_for_class(self):                                                       # Test to_dict functions are compiled once per class
+        class An_Item(Type_Safe):
+            name : str
+
+        to_dict = self.converter.converter_for_class(An_Item)
+        assert to_dict                                     is self.converter.converter_for_class(An_Item)
+        assert to_dict.__qualname__                        == 'to_dict__An_Item'
+        assert self.converter.converter_cache[An_Item]     is to_dict
+        assert to_dict(An_Item(name='abc'))                == dict(name='abc')
+
+    def test_to_value__primitive__other_base(self):                                           # Test primitives of other base types (i.e. Decimal) are left to Pydantic
+        class Safe_Decimal(Type_Safe__Primitive, Decimal):
+            pass
+
+        value = Safe_Decimal('1.50')
+        assert Safe_Decimal.__primitive_base__                            is None
+        assert self.converter.compile_value_converter(Safe_Decimal)        is None
+        assert self.converter.to_value(value)                              is value
+        assert self.converter.to_value(Type_Safe__List(Safe_Decimal, [value])) == [value]
+
+    def test_to_key(self):                                                                    # Test dict keys stay hashable
+        class An_Key(Type_Safe):
+            name : str
+            def __str__(self):
+                return self.name
+
+        assert self.converter.to_key(Safe_Int(1))                == 1
+        assert type(self.converter.to_key(Safe_Str('abc')))      is str
+        assert self.converter.to_key(An_Key(name='key'))         == 'key'
@@ -1,3 +1,4 @@
+import copy
 import json
 import pytest
 from typing                                                           import List, Dict, Optional, Union
@@ -8,6 +9,7 @@ from osbot_utils.type_safe.primitives.core.Safe_Int                   import Saf
 from osbot_utils.type_safe.primitives.core.Safe_Float                 import Safe_Float
 from osbot_fast_api.api.transformers.Type_Safe__To__Json              import Type_Safe__To__Json, type_safe__to__json
 from osbot_utils.type_safe.type_safe_core.collections.Type_Safe__Dict import Type_Safe__Dict
+from osbot_fast_api.utils.Frozen_Dict                                 import Frozen_Dict
 
 
 class test_Type_Safe__To__Json(TestCase):
@@ -198,17 +200,82 @@ class test_Type_Safe__To__Json(TestCase):
         class CachedClass(Type_Safe):
             value : str
 
-        schema1 = self.converter.convert_class(CachedClass)                              # First conversion
-        schema2 = self.converter.convert_class(CachedClass)                              # Second should return cached
+        schema1 = self.converter.convert_class__frozen(CachedClass)                      # First conversion
+        schema2 = self.converter.convert_class__frozen(CachedClass)                      # Second should return cached
 
-        assert type(schema1) is Type_Safe__Dict
-        assert type(schema2) is Type_Safe__Dict
+        assert type(schema1) is Frozen_Dict
+        assert schema1       is schema2                                                  # cached schemas are returned by identity
+        assert self.converter.schema_cache[(CachedClass, False, None, None, True, False)] is schema1
 
-        assert schema1 is not schema2                                                    # objects are not exactly the same because of the @type_safe conversion from Dict to Type_Safe__Dict
-        assert schema1 == schema2                                                        # values are the same
-        assert (CachedClass, False) in self.converter.schema_cache                       # Verify cache contains class
-        assert self.converter.schema_cache[(CachedClass, False)] == schema1              # confirm cache entries
-        assert self.converter.schema_cache[(CachedClass, False)] == schema2
+        schema3 = self.converter.convert_class(CachedClass, title='Other', description='an description')    # title and description are part of the key
+        assert schema3['title']       == 'Other'
+        assert schema3['description'] == 'an description'
+        assert schema1['title']       == 'CachedClass'
+        assert 'description' not in schema1
+        assert self.converter.convert_class__frozen(CachedClass, is_nested=True) is not schema1
+        assert '$schema' not in self.converter.convert_class(CachedClass, is_nested=True)
+
+        self.converter.strict_mode = True                                                # so are the settings
+        assert self.converter.convert_class__frozen(CachedClass) is not schema1
+
+    def test__caching__public_methods_return_mutable_copies(self):                       # Test convert_class and convert_field_type return (mutable) copies of the cached schemas
+        class An_Child(Type_Safe):
+            value : int
+
+        class An_Parent(Type_Safe):
+            child    : An_Child
+            children : List[An_Child]
+
+        schema = self.converter.convert_class(An_Parent)
+        assert type(schema)                                     is dict
+        assert type(schema['properties']['children'])           is dict
+        assert type(schema['properties']['children']['items'])  is dict
+        assert schema                                           == self.converter.convert_class__frozen(An_Parent)
+        assert schema                                           is not self.converter.convert_class(An_Parent)
+
+        schema['title'] = 'changed'                                                      # callers can change their copy ...
+        schema['properties']['child']['properties']['value']['type'] = 'string'
+        schema['properties']['other'] = {'type': 'string'}
+        assert self.converter.convert_class(An_Parent)['title'] == 'An_Parent'           # ... without changing the cached schemas
+        assert self.converter.convert_class(An_Child, is_nested=True)['properties']['value']['type'] == 'integer'
+        assert list(self.converter.convert_class(An_Parent)['properties'])               == ['child', 'children']
+
+        field_schema = self.converter.convert_field_type(Optional[An_Child])
+        field_schema['nullable'] = False
+        assert type(field_schema)                                                   is dict
+        assert self.converter.convert_field_type(Optional[An_Child])['nullable']   is True
+        assert self.converter.convert_field_type__frozen(List[int])                is self.converter.convert_field_type__frozen(List[int])
+
+    def test__caching__read_only_and_shared(self):                                       # Test cached schemas can't be changed by callers, and nested schemas are shared
+        class An_Child(Type_Safe):
+            value : int
+
+        class An_Parent(Type_Safe):
+            child          : An_Child
+            optional_child : Optional[An_Child]
+            children       : List[An_Child]
+            value_or_text  : Union[int, str]
+
+        schema       = self.converter.convert_class__frozen(An_Parent)
+        child_schema = self.converter.convert_class__frozen(An_Child, is_nested=True)
+        properties   = schema['properties']
+        assert properties['child']             is child_schema                            # shared sub-schemas
+        assert properties['children']['items'] is child_schema
+        assert properties['optional_child']    == {**child_schema, 'nullable': True}
+        assert 'nullable' not in child_schema                                             # (Optional doesn't change the shared schema)
+
+        with pytest.raises(TypeError, match='Frozen_Dict is read-only'):
+            schema['title'] = 'changed'
+        with pytest.raises(TypeError, match='Frozen_Dict is read-only'):
+            properties['child']['properties']['value']['type'] = 'string'
+        with pytest.raises(TypeError, match='Frozen_List is read-only'):
+            properties['value_or_text']['oneOf'].append({'type': 'null'})
+
+        mutable_schema = copy.deepcopy(schema)
+        mutable_schema['properties']['child']['title'] = 'changed'
+        assert type(mutable_schema)      is dict
+        assert child_schema['title']     == 'An_Child'
+        assert json.loads(json.dumps(schema)) == copy.deepcopy(schema)                    # (encoded as normal dicts and lists)
 
     def test__with_title_and_description(self):                                          # Test custom title and description
         class DocumentedClass(Type_Safe):
@@ -300,4 +367,38 @@ class test_Type_Safe__To__Json(TestCase):
             custom : object                                                                 # unknown type
 
         schema = self.converter.convert_class(UnknownTypeClass)
-        assert schema['properties']['custom'] == {'type': 'object'}                         # defaults to object                                                           # validation should fail
\ No newline at end of file
+        assert schema['properties']['custom'] == {'type': 'object'}                         # defaults to object                                                           # validation should fail
+    def test_convert_app(self):                                                             # Test bulk schemas for all the classes used by an app's routes
+        from fastapi                                    import FastAPI
+        from osbot_fast_api.api.routes.Fast_API__Routes import Fast_API__Routes
+
+        class An_Address(Type_Safe):
+            city : Safe_Str
+
+        class An_User(Type_Safe):
+            name      : Safe_Str
+            addresses : List[An_Address]
+
+        class An_Team(Type_Safe):
+            members : Dict[Safe_Str, An_User]
+
+        class Routes__Teams(Fast_API__Routes):
+            tag = 'teams'
+            def team(self, team: An_Team) -> An_User:
+                return An_User()
+            def user(self, limit: int = 10) -> An_User:
+                return An_User()
+            def setup_routes(self):
+                self.add_route_post(self.team )
+                self.add_route_get (self.user )
+
+        for lazy_routes in (False, True):
+            app = Routes__Teams(app=FastAPI(), lazy_routes=lazy_routes).setup().app
+            with Type_Safe__To__Json() as _:
+                assert _.app_classes(app) == [An_Team, An_User, An_Address]
+                schemas = _.convert_app(app)
+                assert list(schemas)                                                   == [An_Team, An_User, An_Address]
+                assert schemas[An_User]['$schema']                                     == 'http://json-schema.org/draft-07/schema#'
+                assert schemas[An_Team]['properties']['members']['additionalProperties'] is _.convert_class__frozen(An_User   , is_nested=True)   # shared sub-schemas
+                assert schemas[An_User]['properties']['addresses']['items']            is _.convert_class__frozen(An_Address, is_nested=True)
+                assert _.convert_app(app)[An_Team]                                     is schemas[An_Team]                                # rebuilds come from the cache
@@ -0,0 +1,114 @@
+import json
+from decimal                                                                import Decimal
+from enum                                                                   import Enum
+from typing                                                                 import List, Dict, Set, Optional
+from unittest                                                               import TestCase
+from fastapi.encoders                                                       import jsonable_encoder
+from osbot_utils.type_safe.Type_Safe                                        import Type_Safe
+from osbot_utils.type_safe.primitives.core.Safe_Str                         import Safe_Str
+from osbot_utils.type_safe.primitives.core.Safe_Int                         import Safe_Int
+from osbot_utils.type_safe.primitives.core.Safe_Float                       import Safe_Float
+from osbot_utils.type_safe.primitives.domains.identifiers.Safe_Id           import Safe_Id
+from osbot_fast_api.api.Fast_API                                            import Fast_API
+from osbot_fast_api.api.routes.Fast_API__Routes                             import Fast_API__Routes
+from osbot_fast_api.api.schemas.Schema__Fast_API__Config                    import Schema__Fast_API__Config
+from osbot_fast_api.api.schemas.enums.Enum__Fast_API__Response__Mode        import Enum__Fast_API__Response__Mode
+from osbot_fast_api.api.transformers.Type_Safe__To__BaseModel               import type_safe__to__basemodel
+from osbot_fast_api.api.transformers.Type_Safe__To__Json_Bytes              import Type_Safe__To__Json_Bytes, type_safe__to__json_bytes
+
+
+class An_Enum(str, Enum):
+    VALUE_A = 'value_a'
+    VALUE_B = 'value_b'
+
+class An_Item(Type_Safe):
+    item_id : Safe_Id
+    price   : Safe_Float
+    tags    : List[Safe_Str]
+
+class An_Order(Type_Safe):
+    order_id : Safe_Id
+    quantity : Safe_Int
+    status   : An_Enum         = An_Enum.VALUE_A
+    items    : List[An_Item]
+    by_id    : Dict[Safe_Id, An_Item]
+    codes    : Set[int]
+    total    : Decimal         = None
+    parent   : Optional[An_Item] = None
+    note     : str             = None
+
+
+class test_Type_Safe__To__Json_Bytes(TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        item      = An_Item(item_id='item-1', price=12.5, tags=['a', 'b'])
+        cls.order = An_Order(order_id = 'order-1'         ,
+                             quantity = 3                 ,
+                             status   = An_Enum.VALUE_B   ,
+                             items    = [item, item]      ,
+                             by_id    = {'item-1': item}  ,
+                             codes    = {42}              ,
+                             total    = Decimal('10.25')  ,
+                             parent   = item              )
+
+    def test__init__(self):
+        with Type_Safe__To__Json_Bytes() as _:
+            assert type(_)               is Type_Safe__To__Json_Bytes
+            assert type(_.encoder_cache) is dict
+
+    def test_encoder_for_class(self):
+        with type_safe__to__json_bytes as _:
+            encoder = _.encoder_for_class(An_Item)
+            assert _.encoder_for_class(An_Item) is encoder                          # compiled once, returned by identity
+            assert encoder.__qualname__          == 'encode__An_Item'
+            assert list(encoder(An_Item()))      == ['item_id', 'price', 'tags']
+
+    def test_to_bytes(self):
+        with type_safe__to__json_bytes as _:
+            order_bytes = _.to_bytes(self.order)
+            assert type(order_bytes)     is bytes
+            assert json.loads(order_bytes) == { 'order_id': 'order-1'                                           ,
+                                                'quantity': 3                                                   ,
+                                                'status'  : 'value_b'                                           ,
+                                                'items'   : [ {'item_id': 'item-1', 'price': 12.5, 'tags': ['a', 'b']},
+                                                              {'item_id': 'item-1', 'price': 12.5, 'tags': ['a', 'b']}],
+                                                'by_id'   : {'item-1': {'item_id': 'item-1', 'price': 12.5, 'tags': ['a', 'b']}},
+                                                'codes'   : [42]                                                ,
+                                                'total'   : 10.25                                               ,
+                                                'parent'  : {'item_id': 'item-1', 'price': 12.5, 'tags': ['a', 'b']},
+                                                'note'    : None                                                }
+
+    def test_to_bytes__same_as_basemodel_round_trip(self):                          # the output must match what FastAPI sends for the BaseModel path
+        via_basemodel = jsonable_encoder(type_safe__to__basemodel.convert_instance(self.order).model_dump())
+        assert json.loads(type_safe__to__json_bytes.to_bytes(self.order)) == via_basemodel
+
+    def test__fast_api__response_mode__json_bytes(self):
+        class Routes__Orders(Fast_API__Routes):
+            tag = 'orders'
+            def order(self) -> An_Order:
+                return test_Type_Safe__To__Json_Bytes.order
+            def setup_routes(self):
+                self.add_route_get(self.order)
+
+        def create_fast_api(response_mode):
+            class An_Fast_API(Fast_API):
+                def setup_routes(self):
+                    self.add_routes(Routes__Orders)
+            config = Schema__Fast_API__Config(default_routes=False, response_mode=response_mode)
+            return An_Fast_API(config=config).setup()
+
+        fast_api__basemodel  = create_fast_api(Enum__Fast_API__Response__Mode.BASEMODEL )
+        fast_api__json_bytes = create_fast_api(Enum__Fast_API__Response__Mode.JSON_BYTES)
+        response__basemodel  = fast_api__basemodel .client().get('/orders/order')
+        response__json_bytes = fast_api__json_bytes.client().get('/orders/order')
+
+        assert response__json_bytes.status_code             == 200
+        assert response__json_bytes.headers['content-type'] == 'application/json'
+        assert response__json_bytes.json()                  == response__basemodel.json()
+        assert response__json_bytes.content                 == response__basemodel.content     # byte for byte the same as FastAPI's JSONResponse
+
+        openapi  = fast_api__json_bytes.open_api_json()                                     # OpenAPI has the BaseModel derived response schema
+        response = openapi['paths']['/orders/order']['get']['responses']['200']
+        assert response['content']['application/json']['schema'] == {'$ref': '#/components/schemas/An_Order__BaseModel'}
+        assert 'An_Order__BaseModel' in openapi['components']['schemas']
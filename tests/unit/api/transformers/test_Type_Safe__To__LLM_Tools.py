@@ -1,9 +1,31 @@
 from typing                                                      import List, Dict, Optional
 from unittest                                                    import TestCase
+from fastapi                                                     import FastAPI, Request
 from osbot_utils.type_safe.Type_Safe                             import Type_Safe
+from osbot_utils.type_safe.primitives.domains.identifiers.Safe_Id import Safe_Id
+from osbot_fast_api.api.routes.Fast_API__Routes                  import Fast_API__Routes
 from osbot_fast_api.api.transformers.Type_Safe__To__LLM_Tools    import Type_Safe__To__LLM_Tools, type_safe__to__llm_tools
 
 
+class An_Order(Type_Safe):
+    order_id : Safe_Id
+    quantity : int
+
+class Routes__Orders(Fast_API__Routes):
+    tag = 'orders'
+
+    def order__order_id(self, order_id: Safe_Id, request: Request, details: bool = False) -> An_Order:
+        """Returns the order"""
+        return An_Order(order_id=order_id)
+
+    def add_order(self, order: An_Order) -> An_Order:
+        return order
+
+    def setup_routes(self):
+        self.add_route_get (self.order__order_id)
+        self.add_route_post(self.add_order      )
+
+
 class test_Type_Safe__To__LLM_Tools(TestCase):
 
     def setUp(self):                                                                      # Initialize test environment
@@ -328,4 +350,78 @@ class test_Type_Safe__To__LLM_Tools(TestCase):
             custom_type : object = None                                                     # type with no example generation
 
         example = self.converter.create_example_call(DefaultsOnly, 'test')
-        assert example['args']['custom_type'] is None                                       # uses default value
\ No newline at end of file
+        assert example['args']['custom_type'] is None                                       # uses default value
+
+    def test_app_tools(self):
+        for lazy_routes in (False, True):
+            app      = Routes__Orders(app=FastAPI(), lazy_routes=lazy_routes).setup().app
+            app.get('/not-a-fast-api-route')(lambda: None)                                     # (only Fast_API__Routes routes become tools)
+            catalogue = self.converter.app_tools(app, 'anthropic')
+            assert catalogue == {'tools'   : [{'name'        : 'orders__order__order_id',
+                                               'description' : 'Returns the order'      ,
+                                               'input_schema': {'type'      : 'object'                                    ,
+                                                                'properties': {'order_id': {'type': 'string'}             ,
+                                                                               'details' : {'type': 'boolean'}}           ,
+                                                                'required'  : ['order_id']                                }},
+                                              {'name'        : 'orders__add_order'      ,
+                                               'description' : 'POST /orders/add-order' ,
+                                               'input_schema': {'type'      : 'object'                                    ,
+                                                                'properties': {'order_id': {'type': 'string' , 'default': catalogue['tools'][1]['input_schema']['properties']['order_id']['default']},
+                                                                               'quantity': {'type': 'integer', 'default': 0}},
+                                                                'required'  : []                                          }}],
+                                 'version' : '1.0'                                                                         ,
+                                 'count'   : 2                                                                             ,
+                                 'provider': 'anthropic'                                                                   ,
+                                 'routes'  : {'orders__order__order_id': {'method': 'GET' , 'path': '/orders/order/{order_id}'},
+                                              'orders__add_order'      : {'method': 'POST', 'path': '/orders/add-order'       }}}
+
+    def test_app_tools__providers(self):
+        app = Routes__Orders(app=FastAPI()).setup().app
+        assert list(self.converter.app_tools(app, 'openai'   )['tools'][0]            ) == ['name', 'description', 'parameters'  ]
+        assert list(self.converter.app_tools(app, 'langchain')['tools'][0]            ) == ['name', 'description', 'args_schema', 'return_direct']
+        assert list(self.converter.app_tools(app, 'bedrock'  )['tools'][0]['toolSpec']) == ['name', 'description', 'inputSchema' ]
+        assert self.converter.app_tools(app, 'gemini')['tools'][1]['parameters']['properties']['quantity']['type'] == 'number'
+        assert self.converter.app_tools(app, 'openai')['tools'][1]['parameters']['properties']['quantity']['type'] == 'integer'
+        with self.assertRaises(ValueError) as context:
+            self.converter.app_tools(app, 'an-provider')
+        assert str(context.exception) == "Unsupported provider 'an-provider', supported providers are: openai, anthropic, langchain, gemini, bedrock"
+
+    def test_app_tools__cache(self):
+        app       = Routes__Orders(app=FastAPI(), lazy_routes=True).setup().app
+        catalogue = self.converter.app_tools(app)
+        assert self.converter.app_tools(app) is catalogue                                        # cached (and shared, so read-only)
+        with self.assertRaises(TypeError):
+            catalogue['tools'].append({})
+
+        app.router.routes[-1].materialize(app.router)                                            # lazy route replaced by its real route: same tools
+        assert self.converter.app_tools(app) is catalogue
+
+        app.get('/an-route')(lambda: None)                                                       # routes changed: rebuilt
+        new_catalogue = self.converter.app_tools(app)
+        assert new_catalogue          is not catalogue
+        assert new_catalogue          == catalogue
+
+
+    def test_app_tools__cache__endpoint_changed(self):                                           # same path, name and methods, but a different endpoint: rebuilt
+        app         = Routes__Orders(app=FastAPI()).setup().app
+        other_app   = Routes__Orders(app=FastAPI()).setup().app
+        catalogue   = self.converter.app_tools(app)
+        index       = next(index for index, route in enumerate(app.router.routes) if route.name == 'add_order')
+        route       = app.router.routes[index]
+        other_route = other_app.router.routes[index]                                             # (the add_order route of another Routes__Orders)
+        assert (other_route.path, other_route.name, other_route.methods) == (route.path, route.name, route.methods)
+
+        app.router.routes[index] = other_route
+        assert self.converter.routes_fingerprint(app.router.routes) != self.converter.app_tools_cache[app]['fingerprint']
+        new_catalogue = self.converter.app_tools(app)
+        assert new_catalogue is not catalogue
+        assert new_catalogue == catalogue
+
+    def test_app_tools__cache__weak_keys(self):                                                  # the cache doesn't keep the apps alive
+        import gc
+        app = Routes__Orders(app=FastAPI(), lazy_routes=True).setup().app
+        self.converter.app_tools(app)
+        assert len(self.converter.app_tools_cache) == 1
+        del app
+        gc.collect()
+        assert len(self.converter.app_tools_cache) == 0
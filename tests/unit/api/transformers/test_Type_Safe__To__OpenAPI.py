@@ -1,3 +1,4 @@
+import inspect
 import json
 import re
 import sys
@@ -7,11 +8,14 @@ from unittest                                                 import TestCase
 
 import pytest
 from osbot_utils.testing.Temp_File                            import Temp_File
+from fastapi                                                  import FastAPI
 from osbot_utils.type_safe.Type_Safe                          import Type_Safe
+from osbot_utils.type_safe.primitives.domains.identifiers.Safe_Id import Safe_Id
 from osbot_utils.utils.Files                                  import file_contents
 from osbot_utils.utils.Json                                   import json_load_file
 from osbot_utils.utils.Toml                                   import toml_dict_from_file
 from osbot_fast_api.api.Fast_API                              import Fast_API
+from osbot_fast_api.api.routes.Fast_API__Routes               import Fast_API__Routes
 from osbot_fast_api.api.transformers.Type_Safe__To__OpenAPI   import Type_Safe__To__OpenAPI, type_safe__to__openapi
 
 
@@ -333,4 +337,130 @@ openapi = '3.0.0'
 
         schema = self.converter.components_cache['NullableClass']
         assert schema['properties']['optional']['nullable'] == True                      # Verify nullable preserved
-        assert 'nullable' not in schema['properties']['required']                        # Required not nullable
\ No newline at end of file
+        assert 'nullable' not in schema['properties']['required']                        # Required not nullable
+
+    def test__containers_of_classes__use_refs(self):                                      # List/Dict/Optional of Type_Safe classes reference the component (instead of inlining a copy)
+        class An_Item(Type_Safe):
+            name : str
+
+        class An_Order(Type_Safe):
+            items    : List[An_Item]
+            by_name  : Dict[str, An_Item]
+            main     : Optional[An_Item]
+            tags     : List[str]
+
+        self.converter.convert_class(An_Order)
+        ref = {'$ref': '#/components/schemas/An_Item'}
+        assert list(self.converter.components_cache) == ['An_Order', 'An_Item']
+        assert self.converter.components_cache['An_Order']['properties'] == { 'items'  : {'type': 'array' , 'items'               : ref},
+                                                                             'by_name': {'type': 'object', 'additionalProperties': ref},
+                                                                             'main'   : {'allOf': [ref], 'nullable': True}             ,
+                                                                             'tags'   : {'type': 'array' , 'items': {'type': 'string'}}}
+
+    def test__recursive_classes(self):
+        class An_Node(Type_Safe):
+            name     : str
+            children : List['An_Node']
+
+        assert self.converter.convert_class(An_Node) == {'$ref': '#/components/schemas/An_Node'}
+        assert self.converter.components_cache['An_Node']['properties']['children'] == {'type': 'array', 'items': {'$ref': '#/components/schemas/An_Node'}}
+
+    def test__same_class_name(self):
+        def create_class():
+            class An_Class(Type_Safe):
+                value : int
+            return An_Class
+        class An_Class(Type_Safe):
+            value : str
+        class_1, class_2 = create_class(), create_class()
+        assert self.converter.convert_class(class_1 ) == {'$ref': '#/components/schemas/An_Class'}
+        assert self.converter.convert_class(class_1 ) == {'$ref': '#/components/schemas/An_Class'}
+        assert self.converter.convert_class(class_2 ) == {'$ref': '#/components/schemas/An_Class'}                # (redefinition of the same class)
+        assert self.converter.convert_class(An_Class) == {'$ref': f'#/components/schemas/{__name__}.test_Type_Safe__To__OpenAPI.test__same_class_name._locals_.An_Class'}
+        assert len(self.converter.components_cache)  == 2
+
+    def test_generate_from_app(self):
+        class An_Address(Type_Safe):
+            city : str
+
+        class An_User(Type_Safe):
+            name    : str
+            address : An_Address
+
+        class Routes__Users(Fast_API__Routes):
+            tag = 'users'
+            def user__user_id(self, user_id: Safe_Id, details: bool = False) -> An_User:
+                return An_User()
+            def add_user(self, user: An_User) -> List[An_Address]:
+                return []
+            def setup_routes(self):
+                self.add_route_get (self.user__user_id)
+                self.add_route_post(self.add_user     )
+
+        for lazy_routes in (False, True):
+            app  = Routes__Users(app=FastAPI(title='An API'), lazy_routes=lazy_routes).setup().app
+            spec = Type_Safe__To__OpenAPI().generate_from_app(app)
+            assert spec['info']                           == {'title': 'An API', 'version': '0.1.0'}
+            assert list(spec['paths'])                    == ['/users/user/{user_id}', '/users/add-user']
+            assert list(spec['components']['schemas'])    == ['An_User', 'An_Address']
+            assert spec['paths']['/users/user/{user_id}'] == {'get': {'operationId': 'user__user_id',
+                                                                      'summary'    : 'user__user_id',
+                                                                      'tags'       : ['users']      ,
+                                                                      'parameters' : [{'name': 'user_id', 'in': 'path' , 'required': True , 'schema': {'type': 'string'}} ,
+                                                                                      {'name': 'details', 'in': 'query', 'required': False, 'schema': {'type': 'boolean'}}],
+                                                                      'responses'  : {'200': {'description': 'Successful response',
+                                                                                              'content'    : {'application/json': {'schema': {'$ref': '#/components/schemas/An_User'}}}}}}}
+            operation = spec['paths']['/users/add-user']['post']
+            assert operation['requestBody']['content']['application/json']['schema']       == {'$ref': '#/components/schemas/An_User'}
+            assert operation['responses']['200']['content']['application/json']['schema'] == {'type': 'array', 'items': {'$ref': '#/components/schemas/An_Address'}}
+            assert json.loads(json.dumps(spec))                                            == spec
+
+    def test_generate_from_app__two_apps(self):                                           # each spec only has its own app's components, and specs don't share state
+        class An_Cat(Type_Safe):
+            name : str
+        class An_Dog(Type_Safe):
+            name : str
+        class Routes__Cats(Fast_API__Routes):
+            tag = 'cats'
+            def cat(self) -> An_Cat:
+                return An_Cat()
+            def setup_routes(self):
+                self.add_route_get(self.cat)
+        class Routes__Dogs(Fast_API__Routes):
+            tag = 'dogs'
+            def dog(self) -> An_Dog:
+                return An_Dog()
+            def setup_routes(self):
+                self.add_route_get(self.dog)
+
+        spec__cats = type_safe__to__openapi.generate_from_app(Routes__Cats(app=FastAPI()).setup().app)
+        spec__dogs = type_safe__to__openapi.generate_from_app(Routes__Dogs(app=FastAPI()).setup().app)
+        assert list(spec__cats['components']['schemas']) == ['An_Cat']
+        assert list(spec__dogs['components']['schemas']) == ['An_Dog']
+
+        spec__dogs['components']['schemas']['An_Dog']['properties']['name']['type'] = 'integer'
+        assert spec__cats['components']['schemas']['An_Cat']['properties']['name'] == {'type': 'string'}
+        assert type_safe__to__openapi.components_cache['An_Dog']['properties']['name'] == {'type': 'string'}
+
+    def test_generate_from_app__query_params__required(self):                            # query params are required when they have no default value and are not Optional
+        class Routes__Search(Fast_API__Routes):
+            tag = 'search'
+            def search(self, text: str, limit: int = 10, page: int = None, strict: bool = False) -> dict:
+                return {}
+            def setup_routes(self):
+                self.add_route_get(self.search)
+
+        for lazy_routes in (False, True):
+            app        = Routes__Search(app=FastAPI(), lazy_routes=lazy_routes).setup().app
+            spec       = Type_Safe__To__OpenAPI().generate_from_app(app)
+            parameters = spec['paths']['/search/search']['get']['parameters']
+            assert {param['name']: param['required'] for param in parameters} == {'text': True   , 'limit': False  , 'page': False  , 'strict': False  }
+            assert {param['name']: param['in']       for param in parameters} == {'text': 'query', 'limit': 'query', 'page': 'query', 'strict': 'query'}
+
+        converter = Type_Safe__To__OpenAPI()
+        signature = inspect.signature(Routes__Search.search).parameters
+        assert converter.is_required(signature['text' ], str          ) is True
+        assert converter.is_required(signature['limit'], int          ) is False
+        assert converter.is_required(None            , Optional[str] ) is False               # (no default, but Optional)
+        assert converter.is_required(None            , int | None    ) is False
+        assert converter.is_required(None            , str           ) is True
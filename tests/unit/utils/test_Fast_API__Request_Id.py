@@ -0,0 +1,85 @@
+import os
+from unittest                                                           import TestCase
+from unittest.mock                                                      import patch
+from osbot_utils.type_safe.primitives.domains.identifiers.Random_Guid   import Random_Guid
+from osbot_utils.utils.Misc                                             import is_guid
+from osbot_fast_api.api.schemas.enums.Enum__Fast_API__Request_Id__Mode  import Enum__Fast_API__Request_Id__Mode
+from osbot_fast_api.utils.Fast_API__Request_Id                          import Fast_API__Request_Id
+
+TRACEPARENT  = '00-4bf92f3577b34da6a3ce929d0e0e4736-00f067aa0ba902b7-01'
+TRACE_ID     = '4bf92f35-77b3-4da6-a3ce-929d0e0e4736'
+AN_GUID      = 'c1b2a3f4-0d9e-4c8b-a7f6-e5d4c3b2a190'
+
+
+class test_Fast_API__Request_Id(TestCase):
+
+    def test__init__(self):
+        with Fast_API__Request_Id() as _:
+            assert _.mode          == Enum__Fast_API__Request_Id__Mode.RANDOM_GUID
+            assert _.reuse_inbound is False                                             # (opt-in)
+            assert _.sequence_pid  is None                                              # (created on first sequential id)
+
+    def test_new_request_id(self):
+        request_id = Fast_API__Request_Id().new_request_id()
+        assert type(request_id) is Random_Guid
+        assert is_guid(request_id)
+
+    def test_sequential_id(self):
+        with Fast_API__Request_Id(mode=Enum__Fast_API__Request_Id__Mode.SEQUENTIAL) as _:
+            ids = [_.new_request_id() for _index in range(3)]
+            assert [type(request_id) for request_id in ids] == [Random_Guid] * 3
+            assert [is_guid(request_id) for request_id in ids] == [True] * 3
+            assert ids                                  == sorted(ids)                  # time ordered (within the process)
+            assert len(set(ids))                        == 3
+            assert {request_id[:24] for request_id in ids} == {_.sequence_prefix}
+            assert [request_id[24:] for request_id in ids] == ['000000000001', '000000000002', '000000000003']
+            assert Random_Guid(ids[0])                  == ids[0]                       # (valid Random_Guid value)
+
+    def test_sequential_id__fork(self):                                                 # a forked process (same prefix and counter) gets a new prefix
+        with Fast_API__Request_Id(mode=Enum__Fast_API__Request_Id__Mode.SEQUENTIAL) as _:
+            request_id = _.new_request_id()
+            with patch.object(os, 'getpid', return_value=_.sequence_pid + 1):
+                request_id__fork = _.new_request_id()
+            assert request_id__fork[:24] != request_id[:24]
+            assert request_id__fork[24:] == '000000000001'
+
+    def test_request_id(self):
+        with Fast_API__Request_Id(reuse_inbound=True) as _:
+            assert _.request_id([(b'fast-api-request-id', AN_GUID.encode())]) == AN_GUID
+            assert _.request_id([(b'traceparent'        , TRACEPARENT.encode())]) == TRACE_ID
+            assert _.request_id([(b'traceparent'        , TRACEPARENT.encode()),                           # fast-api-request-id has priority
+                                 (b'fast-api-request-id', AN_GUID.encode())]) == AN_GUID
+            assert _.request_id([]) not in (AN_GUID, TRACE_ID)
+            assert is_guid(_.request_id([(b'fast-api-request-id', b'not-a-guid')]))
+            assert type(_.request_id([(b'fast-api-request-id', AN_GUID.encode())])) is Random_Guid
+
+        with Fast_API__Request_Id() as _:                                               # (default: inbound ids are ignored)
+            assert _.request_id([(b'fast-api-request-id', AN_GUID.encode())]) != AN_GUID
+            assert _.request_id([(b'traceparent'        , TRACEPARENT.encode())]) != TRACE_ID
+
+    def test_inbound_request_id(self):
+        with Fast_API__Request_Id() as _:
+            assert _.inbound_request_id([(b'fast-api-request-id', AN_GUID.upper().encode())          ]) == AN_GUID      # canonical form
+            assert _.inbound_request_id([(b'fast-api-request-id', AN_GUID.replace('-', '').encode()) ]) == AN_GUID
+            assert _.inbound_request_id([(b'fast-api-request-id', b'not-a-guid'                      ),
+                                         (b'traceparent'        , TRACEPARENT.encode()               )]) == TRACE_ID     # invalid id: traceparent is used
+            assert _.inbound_request_id([(b'fast-api-request-id', b''                                )]) is None
+            assert _.inbound_request_id([(b'an-header'          , AN_GUID.encode()                   )]) is None
+
+    def test_parse_traceparent(self):
+        with Fast_API__Request_Id() as _:
+            assert _.parse_traceparent(TRACEPARENT                                                         ) == TRACE_ID
+            assert _.parse_traceparent('01-4bf92f3577b34da6a3ce929d0e0e4736-00f067aa0ba902b7-01-future'   ) == TRACE_ID   # (future versions can have extra fields)
+            assert _.parse_traceparent('00-4bf92f3577b34da6a3ce929d0e0e4736-00f067aa0ba902b7-01-extra'    ) is None
+            assert _.parse_traceparent('ff-4bf92f3577b34da6a3ce929d0e0e4736-00f067aa0ba902b7-01'          ) is None
+            assert _.parse_traceparent('00-00000000000000000000000000000000-00f067aa0ba902b7-01'          ) is None
+            assert _.parse_traceparent('00-4bf92f3577b34da6a3ce929d0e0e4736-0000000000000000-01'          ) is None
+            assert _.parse_traceparent('00-4BF92F3577B34DA6A3CE929D0E0E4736-00f067aa0ba902b7-01'          ) is None   # (upper case is not valid)
+            assert _.parse_traceparent('00-4bf92f35-00f067aa0ba902b7-01'                                  ) is None
+            assert _.parse_traceparent(''                                                                 ) is None
+
+    def test_with_request_id_header(self):
+        with Fast_API__Request_Id() as _:
+            headers = [(b'host', b'testserver'), (b'fast-api-request-id', b'an-old-id')]
+            assert _.with_request_id_header(headers, Random_Guid(AN_GUID)) == [(b'host', b'testserver'), (b'fast-api-request-id', AN_GUID.encode())]
+            assert headers == [(b'host', b'testserver'), (b'fast-api-request-id', b'an-old-id')]                     # (returns a copy)
@@ -0,0 +1,42 @@
+import gzip
+from unittest                                       import TestCase
+from osbot_fast_api.utils.Fast_API__Request         import Fast_API__Request
+from osbot_fast_api.utils.Fast_API__Static_Content  import Fast_API__Static_Content
+
+
+class test_Fast_API__Static_Content(TestCase):
+
+    def request(self, **headers):
+        return Fast_API__Request(scope_headers=headers).request()
+
+    def test_setup(self):
+        with Fast_API__Static_Content(content=b'abc').setup() as _:
+            assert _.etag         == '"ba7816bf8f01cfea414140de5dae2223"'
+            assert _.content_gzip == b''                                                # too small to compress
+        with Fast_API__Static_Content(content=b'a' * 2000, etag='an-etag').setup() as _:
+            assert _.etag                          == '"an-etag"'
+            assert gzip.decompress(_.content_gzip) == b'a' * 2000
+            assert _.content_gzip                  == Fast_API__Static_Content(content=b'a' * 2000).setup().content_gzip  # deterministic
+
+    def test_response(self):
+        with Fast_API__Static_Content(content=b'a' * 2000, media_type='text/x-python', etag='v1').setup() as _:
+            response = _.response(self.request())
+            assert response.status_code              == 200
+            assert response.body                     == b'a' * 2000
+            assert response.headers['etag'         ] == '"v1"'
+            assert response.headers['cache-control'] == 'no-cache'
+            assert response.headers['content-type' ] == 'text/x-python; charset=utf-8'
+            assert 'content-encoding' not in response.headers
+
+            response = _.response(self.request(**{'accept-encoding': 'br, gzip'}))
+            assert response.headers['content-encoding'] == 'gzip'
+            assert response.headers['content-length'  ] == str(len(_.content_gzip))
+            assert response.body                        == _.content_gzip
+            assert 'content-encoding' not in _.response(self.request(**{'accept-encoding': 'gzip;q=0'})).headers
+
+            for if_none_match in ('"v1"', 'W/"v1"', '"v0", "v1"', '*'):
+                response = _.response(self.request(**{'if-none-match': if_none_match}))
+                assert response.status_code     == 304
+                assert response.body            == b''
+                assert response.headers['etag'] == '"v1"'
+            assert _.response(self.request(**{'if-none-match': '"v0"'})).status_code == 200
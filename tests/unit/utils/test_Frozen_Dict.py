@@ -0,0 +1,47 @@
+import copy
+import json
+import pickle
+import pytest
+from unittest                                                           import TestCase
+from osbot_fast_api.utils.Frozen_Dict                                   import Frozen_Dict, freeze
+from osbot_fast_api.utils.Frozen_List                                   import Frozen_List
+
+
+class test_Frozen_Dict(TestCase):
+
+    def test_freeze(self):
+        value  = {'a': [1, {'b': 2}], 'c': 'text'}
+        frozen = freeze(value)
+        assert type(frozen)          is Frozen_Dict
+        assert type(frozen['a'])     is Frozen_List
+        assert type(frozen['a'][1])  is Frozen_Dict
+        assert frozen                == value
+        assert freeze(frozen)        is frozen                                          # already frozen values are shared
+        assert freeze({'x': frozen})['x'] is frozen
+        assert freeze('text')        == 'text'
+
+    def test__read_only(self):
+        frozen = freeze({'a': [1, 2], 'b': {}})
+        for action in (lambda: frozen.__setitem__('x', 1), lambda: frozen.__delitem__('a'), lambda: frozen.update(x=1),
+                       lambda: frozen.pop('a')           , lambda: frozen.setdefault('x', 1), lambda: frozen.clear()  ,
+                       lambda: frozen.popitem()          ):
+            with pytest.raises(TypeError, match='Frozen_Dict is read-only'):
+                action()
+        for action in (lambda: frozen['a'].append(3), lambda: frozen['a'].extend([3]), lambda: frozen['a'].__setitem__(0, 3),
+                       lambda: frozen['a'].pop()    , lambda: frozen['a'].sort()     , lambda: frozen['a'].insert(0, 3)     ):
+            with pytest.raises(TypeError, match='Frozen_List is read-only'):
+                action()
+        assert frozen == {'a': [1, 2], 'b': {}}
+
+    def test__copies(self):                                                             # copies are plain (mutable) dicts and lists
+        frozen = freeze({'a': [1, {'b': 2}]})
+        copied = copy.deepcopy(frozen)
+        copied['a'][1]['b'] = 3
+        assert type(copied)                               is dict
+        assert type(copied['a'])                          is list
+        assert frozen                                     == {'a': [1, {'b': 2}]}
+        assert type(frozen.copy())                        is dict
+        assert type(copy.copy(frozen))                    is dict
+        assert pickle.loads(pickle.dumps(frozen))         == frozen
+        assert json.dumps(frozen)                         == '{"a": [1, {"b": 2}]}'
+        assert {**frozen, 'c': 1}                         == {'a': [1, {'b': 2}], 'c': 1}